@@ -0,0 +1,100 @@
+from typing import Iterable, Mapping, Sequence, Set, TypeVar
+
+from eth_typing import Hash32
+from pyrsistent import pvector
+from ssz.constants import ZERO_HASHES
+from ssz.hash import hash_eth2
+from ssz.hash_tree import HashTree, RawHashTree
+from ssz.hashable_structure import BaseHashableStructure, get_updated_chunks
+
+TElement = TypeVar("TElement")
+TStructure = TypeVar("TStructure", bound=BaseHashableStructure)
+
+# Rebuild the whole tree when more than 1 / REBUILD_DIVISOR of the elements are updated.
+REBUILD_DIVISOR = 4
+
+
+def _set_chunks(
+    raw_hash_tree: RawHashTree, updated_chunks: Mapping[int, Hash32]
+) -> RawHashTree:
+    """
+    Replace ``updated_chunks`` and recompute their ancestors one layer at a time, so
+    that a node shared by several updated chunks is only hashed once.
+    """
+    layers = list(raw_hash_tree)
+    layers[0] = layers[0].mset(*_flatten_items(updated_chunks))
+    dirty_indices: Set[int] = set(updated_chunks.keys())
+    for layer_index in range(1, len(layers)):
+        child_layer = layers[layer_index - 1]
+        dirty_indices = {index // 2 for index in dirty_indices}
+        updated_hashes = {}
+        for index in dirty_indices:
+            left_child = child_layer[index * 2]
+            if index * 2 + 1 < len(child_layer):
+                right_child = child_layer[index * 2 + 1]
+            else:
+                right_child = ZERO_HASHES[layer_index - 1]
+            updated_hashes[index] = hash_eth2(left_child + right_child)
+        layers[layer_index] = layers[layer_index].mset(
+            *_flatten_items(updated_hashes)
+        )
+    return pvector(layers)
+
+
+def update_elements(
+    structure: TStructure, updated_elements: Mapping[int, TElement]
+) -> TStructure:
+    """
+    Return a copy of the hashable ``structure`` (e.g. the balances or the validators of
+    a state) with the elements at the given indices replaced.
+
+    Only the branches of the updated chunks are rehashed, each shared node once, whereas
+    an evolver rehashes the whole branch of every chunk up to the root. Once a sizeable
+    share of the elements is updated, rebuilding the tree in one go is cheaper.
+    """
+    if not updated_elements:
+        return structure
+    elif len(updated_elements) * REBUILD_DIVISOR > len(structure):
+        elements = structure.elements.mset(*_flatten_items(updated_elements))
+        return structure.from_iterable_and_sedes(
+            elements, structure.sedes, structure.max_length
+        )
+
+    sedes = structure.sedes
+    updated_chunks = get_updated_chunks(
+        updated_elements={
+            index: sedes.serialize_element_for_tree(index, element)
+            for index, element in updated_elements.items()
+        },
+        appended_elements=(),
+        original_chunks=structure.chunks,
+        element_size=sedes.element_size_in_tree,
+        num_original_elements=len(structure),
+        num_padding_elements=0,
+    )
+
+    hash_tree = structure.hash_tree
+    raw_hash_tree = _set_chunks(hash_tree.raw_hash_tree, updated_chunks)
+
+    return structure.__class__(
+        structure.elements.mset(*_flatten_items(updated_elements)),
+        HashTree(raw_hash_tree, hash_tree.chunk_count),
+        sedes,
+        structure.max_length,
+    )
+
+
+def get_subtree_roots(structure: BaseHashableStructure, depth: int) -> Sequence[Hash32]:
+    """
+    Return the roots of the subtrees of ``2 ** depth`` chunks that cover the chunks of
+    ``structure``, with the last one padded with zero chunks.
+    """
+    layers = structure.hash_tree.raw_hash_tree
+    num_subtrees = (len(structure.chunks) + 2 ** depth - 1) >> depth
+    return tuple(layers[depth][:num_subtrees])
+
+
+def _flatten_items(mapping: Mapping[int, object]) -> Iterable[object]:
+    for index, value in mapping.items():
+        yield index
+        yield value
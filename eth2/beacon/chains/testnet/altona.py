@@ -11,6 +11,7 @@ from eth2.beacon.chains.exceptions import ParentNotFoundError, SlashableBlockErr
 from eth2.beacon.constants import FAR_FUTURE_SLOT, GENESIS_SLOT
 from eth2.beacon.db.abc import BaseBeaconChainDB
 from eth2.beacon.db.chain2 import BeaconChainDB, StateNotFound
+from eth2.beacon.db.state_cache import HEAD_STATE, JUSTIFIED_STATE
 from eth2.beacon.fork_choice.abc import BaseForkChoice, BlockSink
 from eth2.beacon.state_machines.forks.altona.eth2fastspec import get_attesting_indices
 from eth2.beacon.state_machines.forks.altona.state_machine import (
@@ -97,6 +98,7 @@ class BeaconChain(BaseBeaconChain):
 
         self._fork_choice = fork_choice
         self._current_head = fork_choice.find_head()
+        self._chain_db.state_cache.pin(HEAD_STATE, self._current_head.state_root)
         head_state = self._chain_db.get_state_by_root(
             self._current_head.state_root, BeaconState
         )
@@ -266,6 +268,10 @@ class BeaconChain(BaseBeaconChain):
         if justified_checkpoint.epoch > self._justified_checkpoint.epoch:
             self._justified_checkpoint = justified_checkpoint
             self._fork_choice.update_justified(state)
+            justified_head = self._chain_db.get_block_by_root(
+                self._justified_checkpoint.root, BeaconBlock
+            )
+            self._chain_db.state_cache.pin(JUSTIFIED_STATE, justified_head.state_root)
 
         if finalized_checkpoint.epoch > self._finalized_checkpoint.epoch:
             self._finalized_checkpoint = finalized_checkpoint
@@ -277,6 +283,7 @@ class BeaconChain(BaseBeaconChain):
     def _update_head_if_new(self, block: BeaconBlock) -> None:
         if block != self._current_head:
             self._current_head = block
+            self._chain_db.state_cache.pin(HEAD_STATE, block.state_root)
             self.logger.debug("new head of chain: %s", block)
 
     def _update_fork_choice_with_block(self, block: BeaconBlock) -> None:
@@ -3,7 +3,7 @@ import logging
 from typing import Iterable, Sequence, Tuple
 
 from eth_typing import Hash32
-from eth_utils import ValidationError, to_tuple
+from eth_utils import ValidationError
 
 from eth2._utils.hash import hash_eth2
 from eth2.beacon.constants import MAX_INDEX_COUNT, MAX_RANDOM_BYTE
@@ -14,6 +14,7 @@ from eth2.beacon.helpers import (
     get_seed,
     signature_domain_to_domain_type,
 )
+from eth2.beacon.shuffling import get_shuffling
 from eth2.beacon.signature_domain import SignatureDomain
 from eth2.beacon.types.states import BeaconState
 from eth2.beacon.types.validators import Validator
@@ -157,23 +158,6 @@ def compute_shuffled_index(
     return new_index
 
 
-@to_tuple
-def _compute_committee(
-    indices: Sequence[ValidatorIndex],
-    seed: Hash32,
-    index: int,
-    count: int,
-    shuffle_round_count: int,
-) -> Iterable[ValidatorIndex]:
-    start = (len(indices) * index) // count
-    end = (len(indices) * (index + 1)) // count
-    for i in range(start, end):
-        shuffled_index = compute_shuffled_index(
-            i, len(indices), seed, shuffle_round_count
-        )
-        yield indices[shuffled_index]
-
-
 # NOTE: cache of 1024 covers "worst case" of every committee
 # getting an attestation on-chain at 4mm ETH at stake.
 @lru_cache(maxsize=1024)
@@ -195,13 +179,17 @@ def get_beacon_committee(
         SignatureDomain.DOMAIN_BEACON_ATTESTER
     )
 
-    return _compute_committee(
-        indices=active_validator_indices,
-        seed=get_seed(state, epoch, domain_type, config),
-        index=(slot % config.SLOTS_PER_EPOCH) * committees_per_slot + index,
-        count=committees_per_slot * config.SLOTS_PER_EPOCH,
-        shuffle_round_count=config.SHUFFLE_ROUND_COUNT,
+    # The whole epoch is shuffled at once and shared with the fast state transition.
+    shuffling = get_shuffling(
+        get_seed(state, epoch, domain_type, config),
+        active_validator_indices,
+        config.SHUFFLE_ROUND_COUNT,
+    )
+    committee = shuffling.get_committee(
+        (slot % config.SLOTS_PER_EPOCH) * committees_per_slot + index,
+        committees_per_slot * config.SLOTS_PER_EPOCH,
     )
+    return tuple(ValidatorIndex(validator_index) for validator_index in committee)
 
 
 def iterate_committees_at_epoch(
@@ -3,6 +3,7 @@ from typing import Optional, Type
 
 from eth.abc import AtomicDatabaseAPI
 
+from eth2.beacon.db.state_cache import StateCache
 from eth2.beacon.types.blocks import BaseBeaconBlock, BaseSignedBeaconBlock
 from eth2.beacon.types.states import BeaconState
 from eth2.beacon.typing import BLSSignature, Root, Slot
@@ -20,8 +21,13 @@ class BaseBeaconChainDB(ABC):
     as "canonical" and is available to be queried by "canonical" slot.
     NOTE: Blocks and states are not stored by slot until they have
     been finalized. To get data for non-finalized slots, defer to the fork choice computation.
+
+    Recently used states are kept in ``state_cache``; callers tracking the head or the
+    checkpoints can pin their states there to keep them from being evicted.
     """
 
+    state_cache: StateCache
+
     @abstractmethod
     def __init__(self, db: AtomicDatabaseAPI) -> None:
         ...
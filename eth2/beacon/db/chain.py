@@ -22,6 +22,12 @@ from eth2.beacon.db.exceptions import (
     StateNotFound,
 )
 from eth2.beacon.db.schema import SchemaV1
+from eth2.beacon.db.state_cache import (
+    FINALIZED_STATE,
+    HEAD_STATE,
+    JUSTIFIED_STATE,
+    StateCache,
+)
 from eth2.beacon.fork_choice.scoring import BaseForkChoiceScoring, BaseScore
 from eth2.beacon.genesis import get_genesis_block
 from eth2.beacon.types.blocks import BaseBeaconBlock, BaseSignedBeaconBlock
@@ -34,9 +40,40 @@ from eth2.beacon.typing import Epoch, Root, Slot
 # relatively expensive so we cache that here, but use a small cache because we *should* only
 # be looking up recent blocks. We cache by root instead of ssz representation as ssz
 # representation is not unique if different length configs are considered
-state_cache = LRU(128)
 block_cache = LRU(128)
 
+# States are far larger than blocks and are cached per ``BeaconChainDB`` so that a hit
+# never has to be checked against the underlying database.
+STATE_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+
+def get_slot_and_parent_root_from_ssz(signed_block_ssz: bytes) -> Tuple[Slot, Root]:
+    """
+    Read the slot and the parent root of an SSZ encoded signed block without decoding it.
+
+    The message is the only variable size field of a signed block, so its encoding starts
+    at the offset in the first four bytes, with the slot, the proposer index and the
+    parent root up front.
+    """
+    message_offset = int.from_bytes(signed_block_ssz[:4], "little")
+    slot = int.from_bytes(
+        signed_block_ssz[message_offset : message_offset + 8], "little"
+    )
+    parent_root = signed_block_ssz[message_offset + 16 : message_offset + 48]
+    return Slot(slot), Root(Hash32(parent_root))
+
+
+def get_state_root_from_ssz(signed_block_ssz: bytes) -> Root:
+    """
+    Read the state root of an SSZ encoded signed block without decoding it.
+
+    The state root follows the parent root in the message, see
+    ``get_slot_and_parent_root_from_ssz``.
+    """
+    message_offset = int.from_bytes(signed_block_ssz[:4], "little")
+    state_root = signed_block_ssz[message_offset + 48 : message_offset + 80]
+    return Root(Hash32(state_root))
+
 
 class AttestationKey(ssz.Serializable):
     fields = [("block_root", ssz.sedes.bytes32), ("index", ssz.sedes.uint8)]
@@ -44,6 +81,8 @@ class AttestationKey(ssz.Serializable):
 
 class BaseBeaconChainDB(ABC):
     db: AtomicDatabaseAPI = None
+    # recently used states, see ``StateCache``
+    state_cache: StateCache
 
     @abstractmethod
     def __init__(self, db: AtomicDatabaseAPI) -> None:
@@ -112,6 +151,14 @@ class BaseBeaconChainDB(ABC):
     ) -> BaseBeaconBlock:
         ...
 
+    @abstractmethod
+    def get_block_ssz_by_root(self, block_root: Root) -> bytes:
+        ...
+
+    @abstractmethod
+    def get_canonical_block_ssz_by_slot(self, slot: Slot) -> bytes:
+        ...
+
     @abstractmethod
     def get_slot_by_root(self, block_root: Root) -> Slot:
         ...
@@ -203,6 +250,7 @@ class BaseBeaconChainDB(ABC):
 class BeaconChainDB(BaseBeaconChainDB):
     def __init__(self, db: AtomicDatabaseAPI) -> None:
         self.db = db
+        self.state_cache = StateCache(STATE_CACHE_MAX_BYTES)
 
         self._load_finalized_head()
         self._load_justified_head()
@@ -398,9 +446,12 @@ class BeaconChainDB(BaseBeaconChainDB):
     ) -> BaseBeaconBlock:
         return self._get_block_by_root(self.db, block_root, block_class)
 
-    @staticmethod
+    @classmethod
     def _get_block_by_root(
-        db: DatabaseAPI, block_root: Root, block_class: Type[BaseSignedBeaconBlock]
+        cls,
+        db: DatabaseAPI,
+        block_root: Root,
+        block_class: Type[BaseSignedBeaconBlock],
     ) -> BaseBeaconBlock:
         """
         Return the requested block header as specified by block root.
@@ -412,16 +463,39 @@ class BeaconChainDB(BaseBeaconChainDB):
         if block_root in block_cache and block_root in db:
             return block_cache[block_root]
 
+        block_ssz = cls._get_block_ssz_by_root(db, block_root)
+        block = ssz.decode(block_ssz, block_class)
+        block_cache[block_root] = block
+        return block
+
+    def get_block_ssz_by_root(self, block_root: Root) -> bytes:
+        """
+        Return the signed block with the given root as it is stored, SSZ encoded.
+
+        Raise BlockNotFound if it is not present in the db.
+        """
+        return self._get_block_ssz_by_root(self.db, block_root)
+
+    @staticmethod
+    def _get_block_ssz_by_root(db: DatabaseAPI, block_root: Root) -> bytes:
+        validate_word(block_root, title="block root")
         try:
-            block_ssz = db[block_root]
+            return db[block_root]
         except KeyError:
             raise BlockNotFound(
                 "No block with root {0} found".format(encode_hex(block_root))
             )
 
-        block = ssz.decode(block_ssz, block_class)
-        block_cache[block_root] = block
-        return block
+    def get_canonical_block_ssz_by_slot(self, slot: Slot) -> bytes:
+        """
+        Return the signed block with the given slot in the canonical chain as it is
+        stored, SSZ encoded.
+
+        Raise BlockNotFound if there's no block with the given slot in the
+        canonical chain.
+        """
+        canonical_block_root = self._get_canonical_block_root(self.db, slot)
+        return self._get_block_ssz_by_root(self.db, canonical_block_root)
 
     def get_slot_by_root(self, block_root: Root) -> Slot:
         """
@@ -714,6 +788,7 @@ class BeaconChainDB(BaseBeaconChainDB):
         """
         self._add_head_state_slot_lookup(slot)
         self._add_head_state_root_lookup(root)
+        self.state_cache.pin(HEAD_STATE, Root(root))
 
     def get_head_state_slot(self) -> Slot:
         return self._get_head_state_slot(self.db)
@@ -742,30 +817,31 @@ class BeaconChainDB(BaseBeaconChainDB):
 
     def get_state_by_root(
         self, state_root: Hash32, state_class: Type[BeaconState]
-    ) -> BeaconState:
-        return self._get_state_by_root(self.db, state_root, state_class)
-
-    @staticmethod
-    def _get_state_by_root(
-        db: DatabaseAPI, state_root: Hash32, state_class: Type[BeaconState]
     ) -> BeaconState:
         """
         Return the requested beacon state as specified by state hash.
 
         Raises StateNotFound if it is not present in the db.
         """
-        # TODO: validate_state_root
-        if state_root in state_cache and state_root in db:
-            return state_cache[state_root]
+        state = self.state_cache.get(Root(state_root))
+        if state is not None:
+            return state
+
+        state = self._get_state_by_root(self.db, state_root, state_class)
+        self.state_cache.add(Root(state_root), state)
+        return state
 
+    @staticmethod
+    def _get_state_by_root(
+        db: DatabaseAPI, state_root: Hash32, state_class: Type[BeaconState]
+    ) -> BeaconState:
+        # TODO: validate_state_root
         try:
             state_ssz = db[state_root]
         except KeyError:
             raise StateNotFound(f"No state with root {encode_hex(state_root)} found")
 
-        state = ssz.decode(state_ssz, state_class)
-        state_cache[state] = state
-        return state
+        return ssz.decode(state_ssz, state_class)
 
     def persist_state(self, state: BeaconState) -> None:
         """
@@ -777,7 +853,9 @@ class BeaconChainDB(BaseBeaconChainDB):
 
     def _persist_state(self, state: BeaconState) -> None:
         # TODO schema for state?
-        self.db.set(state.hash_tree_root, ssz.encode(state))
+        state_root = Root(Hash32(state.hash_tree_root))
+        self.db.set(state_root, ssz.encode(state))
+        self.state_cache.add(state_root, state)
 
         self._persist_finalized_head(state)
         self._persist_justified_head(state)
@@ -794,10 +872,11 @@ class BeaconChainDB(BaseBeaconChainDB):
         self._persist_canonical_epoch_info(self.db, state)
 
     def _load_finalized_head(self) -> None:
-        finalized_root = self.db.get(
-            SchemaV1.make_finalized_head_root_lookup_key(), ZERO_ROOT
+        finalized_root = Root(
+            Hash32(self.db.get(SchemaV1.make_finalized_head_root_lookup_key(), ZERO_ROOT))
         )
         self._finalized_root = finalized_root
+        self._pin_checkpoint_state(FINALIZED_STATE, finalized_root)
 
     def _update_finalized_head(self, finalized_root: Root) -> None:
         """
@@ -820,6 +899,11 @@ class BeaconChainDB(BaseBeaconChainDB):
             self._update_finalized_head(state.finalized_checkpoint.root)
 
     def _load_justified_head(self) -> None:
+        justified_root = Root(
+            Hash32(self.db.get(SchemaV1.make_justified_head_root_lookup_key(), ZERO_ROOT))
+        )
+        self._pin_checkpoint_state(JUSTIFIED_STATE, justified_root)
+
         encoded_epoch = self.db.get(SchemaV1.make_justified_head_epoch_lookup_key())
         if not encoded_epoch:
             self._highest_justified_epoch = GENESIS_EPOCH
@@ -837,6 +921,20 @@ class BeaconChainDB(BaseBeaconChainDB):
             SchemaV1.make_justified_head_epoch_lookup_key(),
             ssz.encode(epoch, ssz.uint64),
         )
+        self._pin_checkpoint_state(JUSTIFIED_STATE, justified_root)
+
+    def _pin_checkpoint_state(self, label: str, block_root: Root) -> None:
+        """
+        Keep the post-state of the checkpoint block at ``block_root`` in the state
+        cache, under ``label``.
+        """
+        try:
+            block_ssz = self._get_block_ssz_by_root(self.db, block_root)
+        except BlockNotFound:
+            # Nothing is justified or finalized yet, or the block was never stored.
+            self.state_cache.unpin(label)
+        else:
+            self.state_cache.pin(label, get_state_root_from_ssz(block_ssz))
 
     def _find_updated_justified_root(
         self, state: BeaconState
@@ -1,6 +1,6 @@
-from typing import Optional, Sequence, Tuple, Type
+from typing import Dict, Optional, Sequence, Tuple, Type
 
-from eth.abc import AtomicDatabaseAPI
+from eth.abc import AtomicDatabaseAPI, DatabaseAPI
 from eth.exceptions import BlockNotFound
 from eth.typing import Hash32
 from lru import LRU
@@ -9,9 +9,11 @@ from ssz.hashable_list import HashableList
 from ssz.hashable_vector import HashableVector
 from ssz.sedes import Bitvector
 
+from eth2._utils.hash_tree import get_subtree_roots
 from eth2.beacon.constants import JUSTIFICATION_BITS_LENGTH
 from eth2.beacon.db.abc import BaseBeaconChainDB
 import eth2.beacon.db.schema2 as SchemaV1
+from eth2.beacon.db.state_cache import FINALIZED_STATE, StateCache
 from eth2.beacon.genesis import get_genesis_block
 from eth2.beacon.types.block_headers import BeaconBlockHeader
 from eth2.beacon.types.blocks import BaseBeaconBlock, BaseSignedBeaconBlock
@@ -41,16 +43,22 @@ class StateNotFound(Exception):
 
 # two epochs of blocks
 BLOCK_CACHE_SIZE = 64
-# two epochs of states
-STATE_CACHE_SIZE = 64
+# about two epochs of states at 100k validators
+STATE_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+# The large lists of a state (the validators and the balances) are stored in pages of
+# ``2 ** LIST_PAGE_DEPTH`` chunks keyed by the root of their subtree, so that a state only
+# writes the pages that changed since the previous one.
+LIST_PAGE_DEPTH = 6
 
 
 class BeaconChainDB(BaseBeaconChainDB):
     def __init__(self, db: AtomicDatabaseAPI) -> None:
         self.db = db
         self._block_cache = LRU(BLOCK_CACHE_SIZE)
-        self._state_cache = LRU(STATE_CACHE_SIZE)
+        self.state_cache = StateCache(STATE_CACHE_MAX_BYTES)
         self._state_bytes_written = 0
+        # page roots of the last list written per state field
+        self._last_page_roots: Dict[str, Tuple[Root, ...]] = {}
 
         self._genesis_time, self._genesis_validators_root = self._get_genesis_data()
 
@@ -134,6 +142,7 @@ class BeaconChainDB(BaseBeaconChainDB):
     def mark_finalized_head(self, block: BaseBeaconBlock) -> None:
         finalized_head_root = SchemaV1.finalized_head_root()
         self.db[finalized_head_root] = block.hash_tree_root
+        self.state_cache.pin(FINALIZED_STATE, block.state_root)
 
     def get_finalized_head(self, block_class: Type[BaseBeaconBlock]) -> BaseBeaconBlock:
         finalized_head_root_key = SchemaV1.finalized_head_root()
@@ -153,8 +162,9 @@ class BeaconChainDB(BaseBeaconChainDB):
     def get_state_by_root(
         self, state_root: Root, state_class: Type[BeaconState]
     ) -> BeaconState:
-        if state_root in self._state_cache:
-            return self._state_cache[state_root]
+        state = self.state_cache.get(state_root)
+        if state is not None:
+            return state
 
         raise NotImplementedError("need to implement state reads...")
         # key = SchemaV1.state_root_to_state(state_root)
@@ -165,38 +175,39 @@ class BeaconChainDB(BaseBeaconChainDB):
         # state = ssz.decode(state_data, state_class)
         # return state
 
-    def _write_state_slot(self, state_root: Root, slot: Slot) -> None:
+    def _write_state_slot(self, db: DatabaseAPI, state_root: Root, slot: Slot) -> None:
         key = SchemaV1.state_root_to_slot(state_root)
         encoding = ssz.encode(slot, ssz.uint64)
         self._state_bytes_written += len(encoding)
-        self.db[key] = encoding
+        db[key] = encoding
 
-    def _write_state_fork(self, state_root: Root, fork: Fork) -> None:
+    def _write_state_fork(self, db: DatabaseAPI, state_root: Root, fork: Fork) -> None:
         fork_root = fork.hash_tree_root
-        if fork_root not in self.db:
+        if fork_root not in db:
             encoding = ssz.encode(fork)
             self._state_bytes_written += len(encoding)
-            self.db[fork_root] = encoding
+            db[fork_root] = encoding
 
         key = SchemaV1.state_root_to_fork_root(state_root)
-        self.db[key] = fork_root
+        db[key] = fork_root
 
     def _write_state_block_header(
-        self, state_root: Root, block_header: BeaconBlockHeader
+        self, db: DatabaseAPI, state_root: Root, block_header: BeaconBlockHeader
     ) -> None:
         # NOTE: can further optimize by filling state_root into block_header
         # and skipping encoding if block is present (it likely will be...)
         block_header_root = block_header.hash_tree_root
-        if block_header_root not in self.db:
+        if block_header_root not in db:
             encoding = ssz.encode(block_header)
             self._state_bytes_written += len(encoding)
-            self.db[block_header_root] = encoding
+            db[block_header_root] = encoding
 
         key = SchemaV1.state_root_to_block_header_root(state_root)
-        self.db[key] = block_header_root
+        db[key] = block_header_root
 
     def _write_state_block_roots(
         self,
+        db: DatabaseAPI,
         state_root: Root,
         slot: Slot,
         block_roots: Sequence[Root],
@@ -209,10 +220,11 @@ class BeaconChainDB(BaseBeaconChainDB):
         key = SchemaV1.state_root_to_block_root(state_root)
         encoding = block_roots[slot % SLOTS_PER_HISTORICAL_ROOT]
         self._state_bytes_written += len(encoding)
-        self.db[key] = encoding
+        db[key] = encoding
 
     def _write_state_state_roots(
         self,
+        db: DatabaseAPI,
         state_root: Root,
         slot: Slot,
         state_roots: Sequence[Root],
@@ -225,103 +237,150 @@ class BeaconChainDB(BaseBeaconChainDB):
         key = SchemaV1.state_root_to_state_root(state_root)
         encoding = state_roots[slot % SLOTS_PER_HISTORICAL_ROOT]
         self._state_bytes_written += len(encoding)
-        self.db[key] = encoding
+        db[key] = encoding
 
     def _write_state_historical_roots(
-        self, state_root: Root, historical_roots: HashableList[Root]
+        self, db: DatabaseAPI, state_root: Root, historical_roots: HashableList[Root]
     ) -> None:
         root = historical_roots.hash_tree_root
-        if root not in self.db:
+        if root not in db:
             encoding = ssz.encode(historical_roots)
             self._state_bytes_written += len(encoding)
-            self.db[root] = encoding
+            db[root] = encoding
 
         key = SchemaV1.state_root_to_historical_roots_root(state_root)
-        self.db[key] = root
+        db[key] = root
 
-    def _write_state_eth1_data(self, state_root: Root, eth1_data: Eth1Data) -> None:
+    def _write_state_eth1_data(
+        self, db: DatabaseAPI, state_root: Root, eth1_data: Eth1Data
+    ) -> None:
         eth1_data_root = eth1_data.hash_tree_root
-        if eth1_data_root not in self.db:
+        if eth1_data_root not in db:
             encoding = ssz.encode(eth1_data)
             self._state_bytes_written += len(encoding)
-            self.db[eth1_data_root] = encoding
+            db[eth1_data_root] = encoding
 
         key = SchemaV1.state_root_to_eth1_data_root(state_root)
-        self.db[key] = eth1_data_root
+        db[key] = eth1_data_root
 
     def _write_state_eth1_data_votes(
-        self, state_root: Root, eth1_data_votes: Sequence[Eth1Data]
+        self, db: DatabaseAPI, state_root: Root, eth1_data_votes: Sequence[Eth1Data]
     ) -> None:
         roots = bytearray()
         for vote in eth1_data_votes:
             root = vote.hash_tree_root
-            if root not in self.db:
+            if root not in db:
                 encoding = ssz.encode(vote)
                 self._state_bytes_written += len(encoding)
-                self.db[root] = encoding
+                db[root] = encoding
             roots.extend(root)
 
         # TODO optimize further w/ list diffs?
         key = SchemaV1.state_root_to_eth1_data_votes(state_root)
-        self.db[key] = roots
+        db[key] = roots
 
-    def _write_state_eth1_deposit_index(self, state_root: Root, index: int) -> None:
+    def _write_state_eth1_deposit_index(
+        self, db: DatabaseAPI, state_root: Root, index: int
+    ) -> None:
         key = SchemaV1.state_root_to_eth1_deposit_index(state_root)
         encoding = ssz.encode(index, ssz.uint64)
         self._state_bytes_written += len(encoding)
-        self.db[key] = encoding
+        db[key] = encoding
+
+    def _write_list_pages(
+        self, db: DatabaseAPI, field_name: str, hashable_list: HashableList[object]
+    ) -> Tuple[Tuple[Root, ...], Sequence[int]]:
+        """
+        Write the pages of ``hashable_list`` that changed since the last list written for
+        ``field_name`` and are not in the database yet, and the index of its pages.
+
+        Return the roots of all pages and the indices of the written pages.
+        """
+        list_root = hashable_list.hash_tree_root
+        page_roots = tuple(
+            Root(page_root)
+            for page_root in get_subtree_roots(hashable_list, LIST_PAGE_DEPTH)
+        )
+        last_page_roots = self._last_page_roots.get(field_name, ())
+
+        list_key = SchemaV1.list_root_to_page_roots(list_root)
+        if list_key in db:
+            return page_roots, ()
+
+        chunks: Sequence[Hash32] = hashable_list.chunks
+        page_size = 2 ** LIST_PAGE_DEPTH
+        written_page_indices = []
+        for page_index, page_root in enumerate(page_roots):
+            if (
+                page_index < len(last_page_roots)
+                and last_page_roots[page_index] == page_root
+            ):
+                continue
+
+            page_key = SchemaV1.page_root_to_chunks(page_root)
+            if page_key in db:
+                continue
+
+            start = page_index * page_size
+            encoding = b"".join(chunks[start : start + page_size])
+            self._state_bytes_written += len(encoding)
+            db[page_key] = encoding
+            written_page_indices.append(page_index)
+
+        encoding = ssz.encode(len(hashable_list), ssz.uint64) + b"".join(page_roots)
+        self._state_bytes_written += len(encoding)
+        db[list_key] = encoding
+        return page_roots, written_page_indices
 
     def _write_state_validators(
-        self, state_root: Root, validators: HashableList[Validator]
-    ) -> None:
+        self, db: DatabaseAPI, state_root: Root, validators: HashableList[Validator]
+    ) -> Tuple[Root, ...]:
         """
         Given the size of the validator set and the frequency with which it is expected to change
-        (some but not as frequent, as say, the balances), we want to keep the root of the
-        list of the validators and skip any work we can if no fact about the set has changed.
+        (some but not as frequent, as say, the balances), we only want to visit the
+        validators in the pages of the list that changed.
         """
-        validators_root = validators.hash_tree_root
-        if validators_root not in self.db:
-            roots = bytearray()
-            for validator in validators:
+        page_size = 2 ** LIST_PAGE_DEPTH
+        page_roots, written_page_indices = self._write_list_pages(
+            db, "validators", validators
+        )
+        for page_index in written_page_indices:
+            start = page_index * page_size
+            for validator in validators[start : start + page_size]:
                 root = validator.hash_tree_root
-                if root not in self.db:
+                if root not in db:
                     encoding = ssz.encode(validator)
                     self._state_bytes_written += len(encoding)
-                    self.db[root] = encoding
-                    roots.extend(root)
-            key = SchemaV1.validators_root_to_roots_of_validators(validators_root)
-            self.db[key] = roots
+                    db[root] = encoding
 
-        # TODO optimize further w/ list diffs?
+        validators_root = validators.hash_tree_root
         key = SchemaV1.state_root_to_validators_root(state_root)
         self._state_bytes_written += len(validators_root)
-        self.db[key] = validators_root
+        db[key] = validators_root
+        return page_roots
 
     def _write_state_balances(
-        self, state_root: Root, balances: HashableList[Gwei]
-    ) -> None:
+        self, db: DatabaseAPI, state_root: Root, balances: HashableList[Gwei]
+    ) -> Tuple[Root, ...]:
         """
         Balances will be changing frequently and are numerous.
 
-        Best approach is likely a tree diff; for now, just write the entire set
-        with a quick check for identity w/ the list root.
-        Note there is no gain in checking if a particular balance has already
-        been seen (or changed) since the last state as the main cost is
-        the iteration (rather than serializing an 8-byte Gwei value).
+        Four balances are packed into each chunk of the list, so the pages are simply
+        the packed encoding of the balances they cover. Only the pages that changed are
+        written, which at an epoch boundary is most of them but in between is only
+        the page of the proposer and the odd slashed or deposited validator.
         """
-        balances_root = balances.hash_tree_root
-        if balances_root not in self.db:
-            key = SchemaV1.balances_root_to_balances(balances_root)
-            encoding = ssz.encode(balances)
-            self._state_bytes_written += len(encoding)
-            self.db[key] = encoding
+        page_roots, _ = self._write_list_pages(db, "balances", balances)
 
+        balances_root = balances.hash_tree_root
         key = SchemaV1.state_root_to_balances_root(state_root)
         self._state_bytes_written += len(balances_root)
-        self.db[key] = balances_root
+        db[key] = balances_root
+        return page_roots
 
     def _write_state_randao_mixes(
         self,
+        db: DatabaseAPI,
         state_root: Root,
         randao_mixes: HashableVector[Root],
         current_epoch: Epoch,
@@ -334,10 +393,10 @@ class BeaconChainDB(BaseBeaconChainDB):
         key = SchemaV1.state_root_to_randao_mix(state_root)
         encoding = randao_mixes[current_epoch % EPOCHS_PER_HISTORICAL_VECTOR]
         self._state_bytes_written += len(encoding)
-        self.db[key] = encoding
+        db[key] = encoding
 
     def _write_state_slashings(
-        self, state_root: Root, slashings: HashableVector[Gwei]
+        self, db: DatabaseAPI, state_root: Root, slashings: HashableVector[Gwei]
     ) -> None:
         """
         NOTE: we rely on low frequency of slashing to minimize bandwidth by
@@ -350,148 +409,179 @@ class BeaconChainDB(BaseBeaconChainDB):
         The most efficient storage of slashings is likely "tree diffing" each vector.
         """
         root = slashings.hash_tree_root
-        if root not in self.db:
+        if root not in db:
             encoding = ssz.encode(slashings)
             self._state_bytes_written += len(encoding)
-            self.db[root] = encoding
+            db[root] = encoding
 
         key = SchemaV1.state_root_to_slashings_root(state_root)
         self._state_bytes_written += len(root)
-        self.db[key] = root
+        db[key] = root
 
     def _write_state_previous_epoch_attestations(
-        self, state_root: Root, attestations: HashableList[PendingAttestation]
+        self,
+        db: DatabaseAPI,
+        state_root: Root,
+        attestations: HashableList[PendingAttestation],
     ) -> None:
         # TODO optimize w/ pending attestation -> indexed attestation that already exists?
         roots = bytearray()
         for attestation in attestations:
             root = attestation.hash_tree_root
-            if root not in self.db:
+            if root not in db:
                 encoding = ssz.encode(attestation)
                 self._state_bytes_written += len(encoding)
-                self.db[root] = encoding
+                db[root] = encoding
             roots.extend(root)
 
         # TODO optimize further w/ list diffs?
         key = SchemaV1.state_root_to_previous_epoch_attestations(state_root)
         self._state_bytes_written += len(roots)
-        self.db[key] = roots
+        db[key] = roots
 
     def _write_state_current_epoch_attestations(
-        self, state_root: Root, attestations: HashableList[PendingAttestation]
+        self,
+        db: DatabaseAPI,
+        state_root: Root,
+        attestations: HashableList[PendingAttestation],
     ) -> None:
         # TODO optimize w/ pending attestation -> indexed attestation that already exists?
         roots = bytearray()
         for attestation in attestations:
             root = attestation.hash_tree_root
-            if root not in self.db:
+            if root not in db:
                 encoding = ssz.encode(attestation)
                 self._state_bytes_written += len(encoding)
-                self.db[root] = encoding
+                db[root] = encoding
             roots.extend(root)
 
         # TODO optimize further w/ list diffs?
         key = SchemaV1.state_root_to_current_epoch_attestations(state_root)
         self._state_bytes_written += len(roots)
-        self.db[key] = roots
+        db[key] = roots
 
     def _write_state_justification_bits(
-        self, state_root: Root, justification_bits: Bitfield
+        self, db: DatabaseAPI, state_root: Root, justification_bits: Bitfield
     ) -> None:
         key = SchemaV1.state_root_to_justification_bitfield(state_root)
         encoding = ssz.encode(justification_bits, Bitvector(JUSTIFICATION_BITS_LENGTH))
         self._state_bytes_written += len(encoding)
-        self.db[key] = encoding
+        db[key] = encoding
 
     def _write_state_previous_justified_checkpoint(
-        self, state_root: Root, previous_justified_checkpoint: Checkpoint
+        self,
+        db: DatabaseAPI,
+        state_root: Root,
+        previous_justified_checkpoint: Checkpoint,
     ) -> None:
         root = previous_justified_checkpoint.hash_tree_root
-        if root not in self.db:
+        if root not in db:
             encoding = ssz.encode(previous_justified_checkpoint)
             self._state_bytes_written += len(encoding)
-            self.db[root] = encoding
+            db[root] = encoding
 
         key = SchemaV1.state_root_to_previous_justified_checkpoint_root(state_root)
         self._state_bytes_written += len(root)
-        self.db[key] = root
+        db[key] = root
 
     def _write_state_current_justified_checkpoint(
-        self, state_root: Root, current_justified_checkpoint: Checkpoint
+        self,
+        db: DatabaseAPI,
+        state_root: Root,
+        current_justified_checkpoint: Checkpoint,
     ) -> None:
         root = current_justified_checkpoint.hash_tree_root
-        if root not in self.db:
+        if root not in db:
             encoding = ssz.encode(current_justified_checkpoint)
             self._state_bytes_written += len(encoding)
-            self.db[root] = encoding
+            db[root] = encoding
 
         key = SchemaV1.state_root_to_current_justified_checkpoint_root(state_root)
         self._state_bytes_written += len(root)
-        self.db[key] = root
+        db[key] = root
 
     def _write_state_finalized_checkpoint(
-        self, state_root: Root, finalized_checkpoint: Checkpoint
+        self, db: DatabaseAPI, state_root: Root, finalized_checkpoint: Checkpoint
     ) -> None:
         root = finalized_checkpoint.hash_tree_root
-        if root not in self.db:
+        if root not in db:
             encoding = ssz.encode(finalized_checkpoint)
             self._state_bytes_written += len(encoding)
-            self.db[root] = encoding
+            db[root] = encoding
 
         key = SchemaV1.state_root_to_finalized_checkpoint_root(state_root)
         self._state_bytes_written += len(root)
-        self.db[key] = root
+        db[key] = root
 
-    def _write_state(self, state: BeaconState, config: Eth2Config) -> None:
+    def _write_state(
+        self, db: DatabaseAPI, state: BeaconState, config: Eth2Config
+    ) -> Dict[str, Tuple[Root, ...]]:
         """
         Each field of the state is treated as to minimize redundant encodings of
         data we likely already have in the database.
+
+        Return the page roots of the lists that are stored in pages, per state field.
         """
         state_root = state.hash_tree_root
         current_epoch = state.current_epoch(config.SLOTS_PER_EPOCH)
 
-        self._write_state_slot(state_root, state.slot)
-        self._write_state_fork(state_root, state.fork)
-        self._write_state_block_header(state_root, state.latest_block_header)
+        self._write_state_slot(db, state_root, state.slot)
+        self._write_state_fork(db, state_root, state.fork)
+        self._write_state_block_header(db, state_root, state.latest_block_header)
         self._write_state_block_roots(
+            db,
             state_root, state.slot, state.block_roots, config.SLOTS_PER_HISTORICAL_ROOT
         )
         self._write_state_state_roots(
+            db,
             state_root, state.slot, state.state_roots, config.SLOTS_PER_HISTORICAL_ROOT
         )
-        self._write_state_historical_roots(state_root, state.historical_roots)
-        self._write_state_eth1_data(state_root, state.eth1_data)
-        self._write_state_eth1_data_votes(state_root, state.eth1_data_votes)
-        self._write_state_eth1_deposit_index(state_root, state.eth1_deposit_index)
-        self._write_state_validators(state_root, state.validators)
-        self._write_state_balances(state_root, state.balances)
+        self._write_state_historical_roots(db, state_root, state.historical_roots)
+        self._write_state_eth1_data(db, state_root, state.eth1_data)
+        self._write_state_eth1_data_votes(db, state_root, state.eth1_data_votes)
+        self._write_state_eth1_deposit_index(db, state_root, state.eth1_deposit_index)
+        page_roots = {
+            "validators": self._write_state_validators(db, state_root, state.validators),
+            "balances": self._write_state_balances(db, state_root, state.balances),
+        }
         self._write_state_randao_mixes(
+            db,
             state_root,
             state.randao_mixes,
             current_epoch,
             config.EPOCHS_PER_HISTORICAL_VECTOR,
         )
-        self._write_state_slashings(state_root, state.slashings)
+        self._write_state_slashings(db, state_root, state.slashings)
         self._write_state_previous_epoch_attestations(
+            db,
             state_root, state.previous_epoch_attestations
         )
         self._write_state_current_epoch_attestations(
+            db,
             state_root, state.current_epoch_attestations
         )
-        self._write_state_justification_bits(state_root, state.justification_bits)
+        self._write_state_justification_bits(db, state_root, state.justification_bits)
         self._write_state_previous_justified_checkpoint(
+            db,
             state_root, state.previous_justified_checkpoint
         )
         self._write_state_current_justified_checkpoint(
+            db,
             state_root, state.current_justified_checkpoint
         )
-        self._write_state_finalized_checkpoint(state_root, state.finalized_checkpoint)
+        self._write_state_finalized_checkpoint(
+            db, state_root, state.finalized_checkpoint
+        )
+        return page_roots
 
     def persist_state(self, state: BeaconState, config: Eth2Config) -> None:
         state_root = state.hash_tree_root
-        self._state_cache[state_root] = state
+        self.state_cache.add(state_root, state)
 
-        self._write_state(state, config)
+        with self.db.atomic_batch() as db:
+            page_roots = self._write_state(db, state, config)
+        # Only skip the pages of later lists once they are known to be in the database
+        self._last_page_roots.update(page_roots)
 
     def _get_genesis_data(self) -> Tuple[Timestamp, Root]:
         key = SchemaV1.genesis_data()
@@ -59,16 +59,16 @@ def state_root_to_eth1_deposit_index(root: Root) -> bytes:
     return b"v1:beacon:state-root-to-eth1-deposit-index:" + root
 
 
-def validators_root_to_roots_of_validators(root: Root) -> bytes:
-    return b"v1:beacon:validtors-root-to-roots-of-validators:" + root
+def list_root_to_page_roots(root: Root) -> bytes:
+    return b"v1:beacon:list-root-to-page-roots:" + root
 
 
-def state_root_to_validators_root(root: Root) -> bytes:
-    return b"v1:beacon:state-root-to-validators-root:" + root
+def page_root_to_chunks(root: Root) -> bytes:
+    return b"v1:beacon:page-root-to-chunks:" + root
 
 
-def balances_root_to_balances(root: Root) -> bytes:
-    return b"v1:beacon:balances-root-to-balances:" + root
+def state_root_to_validators_root(root: Root) -> bytes:
+    return b"v1:beacon:state-root-to-validators-root:" + root
 
 
 def state_root_to_balances_root(root: Root) -> bytes:
@@ -0,0 +1,140 @@
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from eth2.beacon.types.states import BeaconState
+from eth2.beacon.typing import Root, Slot
+
+HEAD_STATE = "head"
+JUSTIFIED_STATE = "justified"
+FINALIZED_STATE = "finalized"
+
+# The encoded sizes of the elements of the lists and vectors that make up nearly all of
+# a state: a ``Validator``, a balance or slashing, and a root or randao mix.
+VALIDATOR_SIZE = 48 + 32 + 8 + 1 + 4 * 8
+GWEI_SIZE = 8
+ROOT_SIZE = 32
+
+
+def estimate_state_size(state: BeaconState) -> int:
+    """
+    Estimate the encoded size of ``state`` in bytes from the lengths of its largest
+    fields, without encoding it.
+    """
+    num_roots = (
+        len(state.block_roots)
+        + len(state.state_roots)
+        + len(state.historical_roots)
+        + len(state.randao_mixes)
+    )
+    num_gwei = len(state.balances) + len(state.slashings)
+    return (
+        len(state.validators) * VALIDATOR_SIZE
+        + num_gwei * GWEI_SIZE
+        + num_roots * ROOT_SIZE
+    )
+
+
+class StateCache:
+    """
+    A bounded cache of decoded ``BeaconState`` objects keyed by their hash tree root.
+
+    Decoding (or reconstructing) a state is expensive, and the same handful of states
+    (the head and the checkpoint states) are requested over and over by the fork choice
+    and the APIs, so those can be pinned under a label (e.g. ``HEAD_STATE``) to keep them
+    from being evicted.
+
+    The size of a state grows with the number of validators, so the cache is bounded by
+    the estimated size of its states. When they take more than ``max_bytes``, the least
+    recently used unpinned state is evicted, preferring states from before the finalized
+    state as those are only useful for historical queries. The most recently added state
+    is always kept.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        if max_bytes < 1:
+            raise ValueError(f"StateCache must hold at least one byte, got {max_bytes}")
+        self._max_bytes = max_bytes
+        self._states: "OrderedDict[Root, BeaconState]" = OrderedDict()
+        self._sizes: Dict[Root, int] = {}
+        self._pins: Dict[str, Root] = {}
+
+        # the estimated size of the cached states, in bytes
+        self.size = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __contains__(self, state_root: Root) -> bool:
+        return state_root in self._states
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return self.hits / lookups
+
+    def get(self, state_root: Root) -> Optional[BeaconState]:
+        try:
+            state = self._states[state_root]
+        except KeyError:
+            self.misses += 1
+            return None
+        else:
+            self.hits += 1
+            self._states.move_to_end(state_root)
+            return state
+
+    def add(self, state_root: Root, state: BeaconState) -> None:
+        if state_root not in self._states:
+            state_size = estimate_state_size(state)
+            self._sizes[state_root] = state_size
+            self.size += state_size
+        self._states[state_root] = state
+        self._states.move_to_end(state_root)
+
+        while self.size > self._max_bytes and len(self._states) > 1:
+            victim = self._find_eviction_victim()
+            if victim is None:
+                # Every cached state is pinned; grow until one of the pins moves.
+                break
+            del self._states[victim]
+            self.size -= self._sizes.pop(victim)
+            self.evictions += 1
+
+    def pin(self, label: str, state_root: Root) -> None:
+        """
+        Keep the state at ``state_root`` from being evicted until another root is pinned
+        under the same ``label``. The state itself may be added before or after pinning.
+        """
+        self._pins[label] = state_root
+
+    def unpin(self, label: str) -> None:
+        self._pins.pop(label, None)
+
+    def get_pinned_root(self, label: str) -> Optional[Root]:
+        return self._pins.get(label)
+
+    def _find_eviction_victim(self) -> Optional[Root]:
+        pinned_roots = set(self._pins.values())
+        finalized_slot = self._get_finalized_slot()
+
+        least_recently_used = None
+        for state_root, state in self._states.items():
+            if state_root in pinned_roots:
+                continue
+            elif finalized_slot is not None and state.slot < finalized_slot:
+                return state_root
+            elif least_recently_used is None:
+                least_recently_used = state_root
+        return least_recently_used
+
+    def _get_finalized_slot(self) -> Optional[Slot]:
+        finalized_root = self._pins.get(FINALIZED_STATE)
+        if finalized_root is None or finalized_root not in self._states:
+            return None
+        return self._states[finalized_root].slot
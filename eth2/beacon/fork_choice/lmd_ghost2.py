@@ -1,4 +1,3 @@
-from dataclasses import dataclass
 from typing import (
     Dict,
     Generic,
@@ -11,6 +10,8 @@ from typing import (
     cast,
 )
 
+import numpy as np
+
 from eth2.beacon.db.abc import BaseBeaconChainDB
 from eth2.beacon.epoch_processing_helpers import get_active_validator_indices
 from eth2.beacon.fork_choice.abc import BaseForkChoice, BlockSink
@@ -19,7 +20,7 @@ from eth2.beacon.helpers import compute_epoch_at_slot
 from eth2.beacon.types.blocks import BaseBeaconBlock, BeaconBlock
 from eth2.beacon.types.checkpoints import Checkpoint
 from eth2.beacon.types.states import BeaconState
-from eth2.beacon.typing import Epoch, Gwei, Root, Slot, ValidatorIndex, default_root
+from eth2.beacon.typing import Epoch, Root, Slot, ValidatorIndex, default_root
 from eth2.configs import Eth2Config
 
 # NOTE: copying `proto_array` implementation from:
@@ -371,17 +372,117 @@ class ProtoArray(Generic[T]):
         )
 
 
-@dataclass
-class VoteTracker:
-    current_root: Root
-    next_root: Root
-    next_epoch: Epoch
+# Marks a vote for a block that is not (or no longer) in the ``ProtoArray``.
+NO_NODE = -1
+
+
+class VoteStore:
+    """
+    Columnar store of the latest message of each validator.
+
+    The current and next vote of a validator are kept as (absolute) ``ProtoNodeIndex``
+    values in NumPy arrays, indexed by validator index, so that the deltas of the whole
+    validator set can be computed with a handful of vectorized operations instead of
+    visiting every validator in Python. Votes for blocks not yet in the tree are kept
+    by root until the block arrives.
+    """
+
+    current_indices: np.ndarray
+    next_indices: np.ndarray
+    next_epochs: np.ndarray
+
+    def __init__(self) -> None:
+        self._size = 0
+        self.current_indices = np.full(0, NO_NODE, dtype=np.int64)
+        self.next_indices = np.full(0, NO_NODE, dtype=np.int64)
+        self.next_epochs = np.zeros(0, dtype=np.uint64)
+        self._unresolved_next_roots: Dict[ValidatorIndex, Root] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _ensure_size(self, size: int) -> None:
+        if size <= self._size:
+            return
+
+        capacity = len(self.next_indices)
+        if size > capacity:
+            new_capacity = max(size, 2 * capacity)
+            padding = new_capacity - capacity
+            self.current_indices = np.concatenate(
+                (self.current_indices, np.full(padding, NO_NODE, dtype=np.int64))
+            )
+            self.next_indices = np.concatenate(
+                (self.next_indices, np.full(padding, NO_NODE, dtype=np.int64))
+            )
+            self.next_epochs = np.concatenate(
+                (self.next_epochs, np.zeros(padding, dtype=np.uint64))
+            )
+        self._size = size
+
+    def process_attestations(
+        self,
+        validator_indices: Sequence[ValidatorIndex],
+        block_root: Root,
+        node_index: Optional[ProtoNodeIndex],
+        target_epoch: Epoch,
+    ) -> None:
+        """
+        Record a vote for ``block_root`` (found at ``node_index`` in the tree, if present)
+        from each validator in ``validator_indices`` whose latest vote is for an
+        earlier target epoch.
+        """
+        if len(validator_indices) == 0:
+            return
+
+        validators = np.asarray(validator_indices, dtype=np.int64)
+        self._ensure_size(int(validators.max()) + 1)
+
+        validators = validators[self.next_epochs[validators] < target_epoch]
+        self.next_epochs[validators] = target_epoch
+        if node_index is None:
+            self.next_indices[validators] = NO_NODE
+            for validator_index in validators.tolist():
+                self._unresolved_next_roots[validator_index] = block_root
+        else:
+            self.next_indices[validators] = node_index
+            if self._unresolved_next_roots:
+                for validator_index in validators.tolist():
+                    self._unresolved_next_roots.pop(validator_index, None)
+
+    def resolve(self, indices: Dict[Root, ProtoNodeIndex]) -> None:
+        """
+        Point the votes for blocks that have since been added to the tree at their nodes.
+        """
+        for validator_index, root in tuple(self._unresolved_next_roots.items()):
+            if root in indices:
+                self.next_indices[validator_index] = indices[root]
+                del self._unresolved_next_roots[validator_index]
+
+    def on_prune(self, index_offset: ProtoNodeIndex) -> None:
+        """
+        Forget the votes for nodes that were pruned from the tree.
+        """
+        for node_indices in (self.current_indices, self.next_indices):
+            np.putmask(node_indices, node_indices < index_offset, NO_NODE)
+
+    def on_finalized(self, finalized_epoch: Epoch) -> None:
+        """
+        Forget the votes for unknown blocks that were cast before ``finalized_epoch``.
+        Those blocks precede the finalized checkpoint without being part of the finalized
+        chain, so they never make it into the tree.
+        """
+        self._unresolved_next_roots = {
+            validator_index: root
+            for validator_index, root in self._unresolved_next_roots.items()
+            if self.next_epochs[validator_index] >= finalized_epoch
+        }
 
 
 class ProtoArrayForkChoice(Generic[T]):
     proto_array: ProtoArray[T]
-    votes: List[VoteTracker]
-    balances: Sequence[Gwei]
+    votes: VoteStore
+    balances: np.ndarray
 
     justified: Checkpoint
     finalized: Checkpoint
@@ -401,11 +502,14 @@ class ProtoArrayForkChoice(Generic[T]):
         self.proto_array = ProtoArray(
             justified.epoch, finalized_block, block_sink, config
         )
-        self.balances = []
-        self.votes = []
+        self.balances = np.zeros(0, dtype=np.int64)
+        self.votes = VoteStore()
+        self.justified = justified
+        self.finalized = finalized
 
     def on_prune(self, anchor_root: Root) -> None:
         self.proto_array.on_prune(anchor_root)
+        self.votes.on_prune(self.proto_array._index_offset)
 
     def get_canonical_chain(self, anchor_root: Root) -> Iterable[BlockNode[T]]:
         self._reconcile_changes()
@@ -415,17 +519,20 @@ class ProtoArrayForkChoice(Generic[T]):
     def process_attestation(
         self, validator_index: ValidatorIndex, block_root: Root, target_epoch: Epoch
     ) -> None:
-        if validator_index >= len(self.votes):
-            self.votes.extend(
-                [
-                    VoteTracker(default_root, default_root, Epoch(0))
-                    for _ in range(validator_index - len(self.votes) + 1)
-                ]
-            )
-        vote = self.votes[validator_index]
-        if target_epoch > vote.next_epoch:
-            vote.next_root = block_root
-            vote.next_epoch = target_epoch
+        self.process_attestations((validator_index,), block_root, target_epoch)
+
+    def process_attestations(
+        self,
+        validator_indices: Sequence[ValidatorIndex],
+        block_root: Root,
+        target_epoch: Epoch,
+    ) -> None:
+        self.votes.process_attestations(
+            validator_indices,
+            block_root,
+            self.proto_array.indices.get(block_root),
+            target_epoch,
+        )
 
     def process_block(
         self,
@@ -440,10 +547,13 @@ class ProtoArrayForkChoice(Generic[T]):
         self,
         justified: Checkpoint,
         finalized: Checkpoint,
-        justified_state_balances: Sequence[Gwei],
+        justified_state_balances: np.ndarray,
     ) -> None:
+        if finalized.epoch > self.finalized.epoch:
+            self.votes.on_finalized(finalized.epoch)
+
         old_balances = self.balances
-        new_balances = justified_state_balances
+        new_balances = np.asarray(justified_state_balances, dtype=np.int64)
 
         deltas = _compute_deltas(
             self.proto_array.indices,
@@ -453,7 +563,9 @@ class ProtoArrayForkChoice(Generic[T]):
             new_balances,
         )
 
-        self.proto_array.apply_score_changes(deltas, justified.epoch, finalized.epoch)
+        self.proto_array.apply_score_changes(
+            deltas.tolist(), justified.epoch, finalized.epoch
+        )
 
         self.balances = new_balances
         self.justified = justified
@@ -476,7 +588,7 @@ class ProtoArrayForkChoice(Generic[T]):
         )
 
         self.proto_array.apply_score_changes(
-            deltas, self.justified.epoch, self.finalized.epoch
+            deltas.tolist(), self.justified.epoch, self.finalized.epoch
         )
 
     def find_head(self) -> BlockNode[T]:
@@ -485,43 +597,51 @@ class ProtoArrayForkChoice(Generic[T]):
         return self.proto_array.find_head(self.justified.root)
 
 
+def _balances_of_voters(balances: np.ndarray, num_voters: int) -> np.ndarray:
+    """
+    Validator sets may have different sizes (but attesters are not different,
+    activation only under finality) so treat any missing balance as zero.
+    """
+    if len(balances) >= num_voters:
+        return balances[:num_voters]
+    return np.concatenate(
+        (balances, np.zeros(num_voters - len(balances), dtype=np.int64))
+    )
+
+
 def _compute_deltas(
     indices: Dict[Root, ProtoNodeIndex],
     index_offset: int,
-    votes: List[VoteTracker],
-    old_balances: Sequence[Gwei],
-    new_balances: Sequence[Gwei],
-) -> Sequence[int]:
+    votes: VoteStore,
+    old_balances: np.ndarray,
+    new_balances: np.ndarray,
+) -> np.ndarray:
     """
-    Returns a list of `deltas`, where there is one delta for each of the ProtoArray nodes.
+    Returns an array of `deltas`, where there is one delta for each of the ProtoArray nodes.
 
     The deltas are calculated between `old_balances` and `new_balances`, and/or a change of vote.
+    Moves every validator's current vote to their next vote.
     """
-    deltas = [0] * len(indices)
-
-    for val_index, vote in enumerate(votes):
-        # There is no need to create a score change
-        # if the validator has never voted (may not be active)
-        # or both their votes are for the zero hash (alias to the genesis block).
-        if vote.current_root == default_root and vote.next_root == default_root:
-            continue
+    votes.resolve(indices)
 
-        # Validator sets may have different sizes (but attesters are not different,
-        # activation only under finality)
-        old_balance = old_balances[val_index] if val_index < len(old_balances) else 0
-        new_balance = new_balances[val_index] if val_index < len(new_balances) else 0
+    num_voters = len(votes)
+    current_indices = votes.current_indices[:num_voters]
+    next_indices = votes.next_indices[:num_voters]
+    old_balances = _balances_of_voters(old_balances, num_voters)
+    new_balances = _balances_of_voters(new_balances, num_voters)
 
-        if vote.current_root != vote.next_root or old_balance != new_balance:
-            # Ignore the current or next vote if it is not known in `indices`.
-            # We assume that it is outside of our tree (i.e., pre-finalization)
-            # and therefore not interesting.
-            if vote.current_root in indices:
-                deltas[indices[vote.current_root] - index_offset] -= old_balance
+    changed = (current_indices != next_indices) | (old_balances != new_balances)
+    # Votes for blocks outside of our tree (e.g. pre-finalization) are not interesting.
+    removed = changed & (current_indices != NO_NODE)
+    added = changed & (next_indices != NO_NODE)
 
-            if vote.next_root in indices:
-                deltas[indices[vote.next_root] - index_offset] += new_balance
+    deltas = np.zeros(len(indices), dtype=np.int64)
+    np.subtract.at(
+        deltas, current_indices[removed] - index_offset, old_balances[removed]
+    )
+    np.add.at(deltas, next_indices[added] - index_offset, new_balances[added])
 
-            vote.current_root = vote.next_root
+    current_indices[:] = next_indices
 
     return deltas
 
@@ -584,9 +704,13 @@ class LMDGHOSTForkChoice(BaseForkChoice):
         # NOTE: prune before updating justified as it touches some internal state...
         self._impl.on_prune(self._finalized.root)
         current_epoch = state.current_epoch(self._config.SLOTS_PER_EPOCH)
-        balances = tuple(
-            state.validators[i].effective_balance
-            for i in get_active_validator_indices(state.validators, current_epoch)
+        active_validator_indices = get_active_validator_indices(
+            state.validators, current_epoch
+        )
+        balances = np.fromiter(
+            (state.validators[i].effective_balance for i in active_validator_indices),
+            dtype=np.int64,
+            count=len(active_validator_indices),
         )
         self._impl.update_justified(self._justified, self._finalized, balances)
 
@@ -612,8 +736,7 @@ class LMDGHOSTForkChoice(BaseForkChoice):
     def on_attestation(
         self, block_root: Root, target_epoch: Epoch, *indices: ValidatorIndex
     ) -> None:
-        for validator_index in indices:
-            self._impl.process_attestation(validator_index, block_root, target_epoch)
+        self._impl.process_attestations(indices, block_root, target_epoch)
 
     def find_head(self) -> BaseBeaconBlock:
         node = self._impl.find_head()
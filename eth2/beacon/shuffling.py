@@ -0,0 +1,131 @@
+from array import array
+from typing import MutableMapping, Sequence, Tuple, cast
+
+from eth_typing import Hash32
+from lru import LRU
+import numpy as np
+
+from eth2._utils.hash import hash_eth2
+from eth2.beacon.typing import ValidatorIndex
+
+# Enough for the previous, current and next shuffling of a handful of competing forks.
+SHUFFLING_CACHE_SIZE = 16
+
+ShufflingKey = Tuple[Hash32, Hash32, int]
+
+
+def compute_shuffling(
+    indices: np.ndarray, seed: Hash32, shuffle_round_count: int
+) -> np.ndarray:
+    """
+    Return ``indices`` in committee order, i.e. the result of
+    ``indices[compute_shuffled_index(i, len(indices), seed, shuffle_round_count)]``
+    at every position ``i``.
+
+    Every round of the "swap or not" shuffle is an involution that swaps position ``i``
+    with its mirror around the pivot or leaves both in place, so a whole round can be
+    applied to the array at once. Applying the rounds in reverse order composes them the
+    same way as ``compute_shuffled_index`` does for a single index.
+    """
+    index_count = len(indices)
+    if index_count <= 1:
+        return indices.copy()
+
+    positions = np.arange(index_count, dtype=np.int64)
+    chunk_count = (index_count + 255) // 256
+    shuffled = indices
+    for current_round in reversed(range(shuffle_round_count)):
+        round_seed = seed + current_round.to_bytes(1, "little")
+        pivot = int.from_bytes(hash_eth2(round_seed)[0:8], "little") % index_count
+
+        # One hash decides the swaps of 256 consecutive positions, one bit each.
+        source = b"".join(
+            hash_eth2(round_seed + chunk.to_bytes(4, "little"))
+            for chunk in range(chunk_count)
+        )
+        bits = np.unpackbits(np.frombuffer(source, dtype=np.uint8), bitorder="little")
+
+        flips = (pivot - positions) % index_count
+        swaps = bits[np.maximum(positions, flips)].astype(bool)
+        shuffled = np.where(swaps, shuffled[flips], shuffled)
+    return shuffled
+
+
+class Shuffling:
+    """
+    The active validator indices of an epoch, and the same indices in committee order.
+
+    Both are kept in compact ``array('Q')`` buffers; committees are slices of the shuffled
+    buffer.
+    """
+
+    def __init__(self, active_indices: "array[int]", shuffling: "array[int]") -> None:
+        self.active_indices = cast(Sequence[ValidatorIndex], active_indices)
+        self.shuffling = cast(Sequence[ValidatorIndex], shuffling)
+
+    def get_committee(self, index: int, count: int) -> Sequence[ValidatorIndex]:
+        """
+        Return the ``index``-th of ``count`` committees of the epoch.
+        """
+        active_validator_count = len(self.shuffling)
+        start = (active_validator_count * index) // count
+        end = (active_validator_count * (index + 1)) // count
+        return self.shuffling[start:end]
+
+
+class ShufflingCache:
+    """
+    A LRU cache of ``Shuffling`` keyed by the seed and the root of the active validator
+    indices, so that every chain and ``EpochsContext`` sharing an epoch also shares its
+    shuffling.
+    """
+
+    def __init__(self, max_shufflings: int) -> None:
+        self._shufflings = cast(
+            MutableMapping[ShufflingKey, Shuffling], LRU(max_shufflings)
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._shufflings)
+
+    def get(
+        self,
+        seed: Hash32,
+        active_indices: Sequence[ValidatorIndex],
+        shuffle_round_count: int,
+    ) -> Shuffling:
+        active_indices_buffer = array("Q", active_indices)
+        key: ShufflingKey = (
+            seed,
+            hash_eth2(active_indices_buffer.tobytes()),
+            shuffle_round_count,
+        )
+        try:
+            shuffling = self._shufflings[key]
+        except KeyError:
+            self.misses += 1
+        else:
+            self.hits += 1
+            return shuffling
+
+        shuffled_indices = compute_shuffling(
+            np.frombuffer(active_indices_buffer, dtype=np.uint64),
+            seed,
+            shuffle_round_count,
+        )
+        shuffling = Shuffling(
+            active_indices_buffer, array("Q", shuffled_indices.tobytes())
+        )
+        self._shufflings[key] = shuffling
+        return shuffling
+
+
+shuffling_cache = ShufflingCache(SHUFFLING_CACHE_SIZE)
+
+
+def get_shuffling(
+    seed: Hash32, active_indices: Sequence[ValidatorIndex], shuffle_round_count: int
+) -> Shuffling:
+    return shuffling_cache.get(seed, active_indices, shuffle_round_count)
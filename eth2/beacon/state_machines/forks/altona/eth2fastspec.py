@@ -1,10 +1,25 @@
-from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    MutableMapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    cast,
+)
 
-from eth_typing import BLSPubkey, Hash32
+from eth_typing import BLSPubkey, BLSSignature, Hash32
 from eth_utils import ValidationError, decode_hex, encode_hex
+from lru import LRU
 import milagro_bls_binding as milagro_bls
 
 from eth2._utils.hash import hash_eth2
+from eth2._utils.hash_tree import update_elements
 from eth2._utils.merkle.common import verify_merkle_branch
 from eth2.beacon.attestation_helpers import is_slashable_attestation_data
 from eth2.beacon.committee_helpers import compute_shuffled_index
@@ -24,6 +39,7 @@ from eth2.beacon.helpers import (
     get_randao_mix,
     get_seed,
 )
+from eth2.beacon.shuffling import get_shuffling
 from eth2.beacon.signature_domain import SignatureDomain
 from eth2.beacon.state_machines.forks.altona.configs import ALTONA_CONFIG
 from eth2.beacon.state_machines.forks.serenity.block_validation import (
@@ -31,7 +47,6 @@ from eth2.beacon.state_machines.forks.serenity.block_validation import (
     validate_block_is_new,
     validate_block_parent_root,
     validate_block_slot,
-    validate_randao_reveal,
 )
 from eth2.beacon.state_machines.forks.serenity.slot_processing import _process_slot
 from eth2.beacon.types.attestation_data import AttestationData
@@ -54,6 +69,7 @@ from eth2.beacon.typing import (
     DomainType,
     Epoch,
     Gwei,
+    SerializableUint64,
     Slot,
     ValidatorIndex,
     Version,
@@ -146,177 +162,129 @@ def bls_FastAggregateVerify(
         return result
 
 
-def integer_squareroot(n: int) -> int:
-    """
-    Return the largest integer ``x`` such that ``x**2 <= n``.
-    """
-    x = n
-    y = (x + 1) // 2
-    while y < x:
-        x = y
-        y = (x + n // x) // 2
-    return x
+#
+# Batch signature verification
+#
+class SignatureSet(NamedTuple):
+    pubkeys: Sequence[BLSPubkey]
+    message: Hash32
+    signature: BLSSignature
 
 
-def xor(bytes_1: bytes, bytes_2: bytes) -> bytes:
-    """
-    Return the exclusive-or of two 32-byte strings.
-    """
-    return bytes(a ^ b for a, b in zip(bytes_1, bytes_2))
+# The signature sets of the block being processed, while their verification is deferred.
+_deferred_signature_sets: ContextVar[Optional[List[SignatureSet]]] = ContextVar(
+    "deferred_signature_sets", default=None
+)
 
+# Aggregated public keys by the public keys they aggregate, as milagro only verifies
+# signature sets with a single public key and the same attestation is usually verified
+# more than once (e.g. when it is gossiped, and again when it is included in a block).
+AGGREGATE_PUBKEY_CACHE_SIZE = 2 ** 12
+_aggregate_pubkeys = cast(
+    MutableMapping[Tuple[BLSPubkey, ...], BLSPubkey], LRU(AGGREGATE_PUBKEY_CACHE_SIZE)
+)
 
-# ShuffleList shuffles a list, using the given seed for randomness. Mutates the input list.
-def shuffle_list(input: List[ValidatorIndex], seed: Hash32) -> None:
-    _inner_shuffle_list(input, seed, True)
 
+def aggregate_pubkeys(pubkeys: Sequence[BLSPubkey]) -> BLSPubkey:
+    if len(pubkeys) == 1:
+        return pubkeys[0]
 
-# UnshuffleList undoes a list shuffling using the seed of the shuffling. Mutates the input list.
-def unshuffle_list(input: List[ValidatorIndex], seed: Hash32) -> None:
-    _inner_shuffle_list(input, seed, False)
+    key = tuple(pubkeys)
+    try:
+        return _aggregate_pubkeys[key]
+    except KeyError:
+        aggregate = BLSPubkey(milagro_bls._AggregatePKs(list(pubkeys)))
+        _aggregate_pubkeys[key] = aggregate
+        return aggregate
 
 
-_SHUFFLE_H_SEED_SIZE = 32
-_SHUFFLE_H_ROUND_SIZE = 1
-_SHUFFLE_H_POSITION_WINDOW_SIZE = 4
-_SHUFFLE_H_PIVOT_VIEW_SIZE = _SHUFFLE_H_SEED_SIZE + _SHUFFLE_H_ROUND_SIZE
-_SHUFFLE_H_TOTAL_SIZE = (
-    _SHUFFLE_H_SEED_SIZE + _SHUFFLE_H_ROUND_SIZE + _SHUFFLE_H_POSITION_WINDOW_SIZE
-)
-
+def bls_VerifySignatureSet(signature_set: SignatureSet) -> bool:
+    pubkeys, message, signature = signature_set
+    if len(pubkeys) == 1:
+        return bls_Verify(pubkeys[0], message, signature)
+    else:
+        return bls_FastAggregateVerify(pubkeys, message, signature)
 
-# Shuffles or unshuffles, depending on the `dir` (true for shuffling, false for unshuffling
-def _inner_shuffle_list(input: List[ValidatorIndex], seed: Hash32, dir: bool) -> None:
-    if len(input) <= 1:
-        # nothing to (un)shuffle
-        return
 
-    listSize = len(input)
-    buf = bytearray([0] * _SHUFFLE_H_TOTAL_SIZE)
-    r = 0
-    if not dir:
-        # Start at last round.
-        # Iterating through the rounds in reverse, un-swaps everything, effectively un-shuffling
-        # the list.
-        r = SHUFFLE_ROUND_COUNT - 1
-
-    # Seed is always the first 32 bytes of the hash input, we never have to change this part of the
-    # buffer.
-    buf[:_SHUFFLE_H_SEED_SIZE] = seed[:]
-    while True:
-        # spec: pivot = bytes_to_int(hash_eth2(seed + int_to_bytes1(round))[0:8]) % list_size
-        # This is the "int_to_bytes1(round)", appended to the seed.
-        buf[_SHUFFLE_H_SEED_SIZE] = r
-        # Seed is already in place, now just hash the correct part of the buffer, and take a int
-        # from it,
-        #  and modulo it to get a pivot within range.
-        h = hash_eth2(buf[:_SHUFFLE_H_PIVOT_VIEW_SIZE])
-        pivot = int.from_bytes(h[:8], byteorder=ENDIANNESS) % listSize
-
-        # Split up the for-loop in two:
-        #  1. Handle the part from 0 (incl) to pivot (incl). This is mirrored around (pivot / 2)
-        #  2. Handle the part from pivot (excl) to N (excl). This is mirrored around
-        #  ((pivot / 2) + (size/2))
-        # The pivot defines a split in the array, with each of the splits mirroring their data
-        # within the split.
-        # Print out some example even/odd sized index lists, with some even/odd pivots,
-        #  and you can deduce how the mirroring works exactly.
-        # Note that the mirror is strict enough to not consider swapping the index @mirror with
-        # itself.
-        mirror = (pivot + 1) >> 1
-        # Since we are iterating through the "positions" in order, we can just repeat the hash
-        # every 256th position.
-        # No need to pre-compute every possible hash for efficiency like in the example code.
-        # We only need it consecutively (we are going through each in reverse order however, but
-        # same thing)
-        #
-        # spec: source = hash_eth2(seed + int_to_bytes1(round) + int_to_bytes4(position # 256))
-        # - seed is still in 0:32 (excl., 32 bytes)
-        # - round number is still in 32
-        # - mix in the position for randomness, except the last byte of it,
-        #     which will be used later to select a bit from the resulting hash.
-        # We start from the pivot position, and work back to the mirror position (of the part left
-        # to the pivot).
-        # This makes us process each pear exactly once (instead of unnecessarily twice, like in the
-        # spec)
-        buf[_SHUFFLE_H_PIVOT_VIEW_SIZE:] = ((pivot >> 8) & 0xFFFF_FFFF).to_bytes(
-            length=4, byteorder=ENDIANNESS
+def bls_VerifyMultipleSignatureSets(signature_sets: Sequence[SignatureSet]) -> bool:
+    """
+    Verify all ``signature_sets`` at once; milagro combines them with random scalars
+    so that invalid signatures can not cancel each other out.
+    """
+    try:
+        result = milagro_bls.VerifyMultipleAggregateSignatures(
+            [
+                (signature, aggregate_pubkeys(pubkeys), message)
+                for pubkeys, message, signature in signature_sets
+            ]
         )
-        source = hash_eth2(buf)
-        byteV = source[(pivot & 0xFF) >> 3]
-        i, j = 0, pivot
-        while i < mirror:
-            # The pair is i,j. With j being the bigger of the two, hence the "position" identifier
-            # of the pair.
-            # Every 256th bit (aligned to j).
-            if j & 0xFF == 0xFF:
-                # just overwrite the last part of the buffer, reuse the start (seed, round)
-                buf[_SHUFFLE_H_PIVOT_VIEW_SIZE:] = ((j >> 8) & 0xFFFF_FFFF).to_bytes(
-                    length=4, byteorder=ENDIANNESS
-                )
-                source = hash_eth2(buf)
+    except Exception:
+        result = False
+    finally:
+        return result
+
 
-            # Same trick with byte retrieval. Only every 8th.
-            if j & 0x7 == 0x7:
-                byteV = source[(j & 0xFF) >> 3]
+def verify_signature_set(
+    pubkeys: Sequence[BLSPubkey], message: Hash32, signature: BLSSignature
+) -> bool:
+    """
+    Verify a signature of ``message`` by all of ``pubkeys``, or record it to be verified
+    along with the rest of the block if ``deferred_signature_verification`` is active.
+    """
+    signature_set = SignatureSet(pubkeys, message, signature)
+    deferred_signature_sets = _deferred_signature_sets.get()
+    if deferred_signature_sets is None:
+        return bls_VerifySignatureSet(signature_set)
+    else:
+        deferred_signature_sets.append(signature_set)
+        return True
 
-            bitV = (byteV >> (j & 0x7)) & 0x1
 
-            if bitV == 1:
-                # swap the pair items
-                input[i], input[j] = input[j], input[i]
+@contextmanager
+def deferred_signature_verification() -> Iterator[None]:
+    """
+    Defer the verification of the signatures checked with ``verify_signature_set``
+    in this context, and verify them all at once in a batch when leaving it.
 
-            i, j = i + 1, j - 1
+    Only when the batch is invalid are the signatures checked one by one, to report
+    the offending one.
+    """
+    signature_sets: List[SignatureSet] = []
+    token = _deferred_signature_sets.set(signature_sets)
+    try:
+        yield
+    finally:
+        _deferred_signature_sets.reset(token)
 
-        # Now repeat, but for the part after the pivot.
-        mirror = (pivot + listSize + 1) >> 1
-        end = listSize - 1
-        # Again, seed and round input is in place, just update the position.
-        # We start at the end, and work back to the mirror point.
-        # This makes us process each pear exactly once (instead of unnecessarily twice, like in
-        # the spec)
-        buf[_SHUFFLE_H_PIVOT_VIEW_SIZE:] = ((end >> 8) & 0xFFFF_FFFF).to_bytes(
-            length=4, byteorder=ENDIANNESS
-        )
-        source = hash_eth2(buf)
-        byteV = source[(end & 0xFF) >> 3]
-        i, j = pivot + 1, end
-        while i < mirror:
-            # Exact same thing (copy of above loop body)
-            # --------------------------------------------
-            # The pair is i,j. With j being the bigger of the two, hence the "position"
-            # identifier of the pair.
-            # Every 256th bit (aligned to j).
-            if j & 0xFF == 0xFF:
-                # just overwrite the last part of the buffer, reuse the start (seed, round)
-                buf[_SHUFFLE_H_PIVOT_VIEW_SIZE:] = ((j >> 8) & 0xFFFF_FFFF).to_bytes(
-                    length=4, byteorder=ENDIANNESS
-                )
-                source = hash_eth2(buf)
+    if not signature_sets or bls_VerifyMultipleSignatureSets(signature_sets):
+        return
 
-            # Same trick with byte retrieval. Only every 8th.
-            if j & 0x7 == 0x7:
-                byteV = source[(j & 0xFF) >> 3]
+    for signature_set in signature_sets:
+        if not bls_VerifySignatureSet(signature_set):
+            raise ValidationError(
+                f"Invalid signature {encode_hex(signature_set.signature)} "
+                f"of message {encode_hex(signature_set.message)}"
+            )
+    raise ValidationError("Invalid batch of signatures with all signatures valid")
 
-            bitV = (byteV >> (j & 0x7)) & 0x1
 
-            if bitV == 1:
-                # swap the pair items
-                input[i], input[j] = input[j], input[i]
+def integer_squareroot(n: int) -> int:
+    """
+    Return the largest integer ``x`` such that ``x**2 <= n``.
+    """
+    x = n
+    y = (x + 1) // 2
+    while y < x:
+        x = y
+        y = (x + n // x) // 2
+    return x
 
-            i, j = i + 1, j - 1
-            # --------------------------------------------
 
-        # go forwards?
-        if dir:
-            # -> shuffle
-            r += 1
-            if r == SHUFFLE_ROUND_COUNT:
-                break
-        else:
-            if r == 0:
-                break
-            # -> un-shuffle
-            r -= 1
+def xor(bytes_1: bytes, bytes_2: bytes) -> bytes:
+    """
+    Return the exclusive-or of two 32-byte strings.
+    """
+    return bytes(a ^ b for a, b in zip(bytes_1, bytes_2))
 
 
 def compute_committee_count(active_validators_count: int) -> int:
@@ -344,7 +312,7 @@ class ShufflingEpoch(object):
     active_indices: Sequence[ValidatorIndex]  # non-shuffled active validator indices
     # the active validator indices, shuffled into their committee
     shuffling: Sequence[ValidatorIndex]
-    committees: EpochCommittees  # list of lists of slices of Shuffling
+    committees: EpochCommittees  # list of lists of slices of the shuffling
 
     # indices_bounded: (index, activation_epoch, exit_epoch) per validator.
     def __init__(
@@ -357,35 +325,26 @@ class ShufflingEpoch(object):
 
         seed = get_seed(state, epoch, DomainType(DOMAIN_BEACON_ATTESTER), ALTONA_CONFIG)
 
-        self.active_indices = [
+        active_indices = [
             index
             for (index, activation_epoch, exit_epoch) in indices_bounded
             if activation_epoch <= epoch < exit_epoch
         ]
 
-        shuffling = list(self.active_indices)  # copy
-        unshuffle_list(shuffling, seed)
-        self.shuffling = shuffling
-
-        active_validator_count = len(self.active_indices)
-        committees_per_slot = compute_committee_count(active_validator_count)
+        # The shuffling is shared with every other context (e.g. on another fork)
+        # that has the same seed and active validators.
+        shuffling = get_shuffling(seed, active_indices, SHUFFLE_ROUND_COUNT)
+        self.active_indices = shuffling.active_indices
+        self.shuffling = shuffling.shuffling
 
+        committees_per_slot = compute_committee_count(len(self.active_indices))
         committee_count = committees_per_slot * int(SLOTS_PER_EPOCH)
 
-        def slice_committee(slot: int, comm_index: int) -> Sequence[ValidatorIndex]:
-            index = (slot * committees_per_slot) + comm_index
-            start_offset = (active_validator_count * index) // committee_count
-            end_offset = (active_validator_count * (index + 1)) // committee_count
-            if start_offset > end_offset:
-                raise ValidationError(
-                    f"start offset greater than end offset  "
-                    f"{start_offset} > {end_offset}"
-                )
-            return self.shuffling[start_offset:end_offset]
-
         self.committees = [
             [
-                slice_committee(slot, comm_index)
+                shuffling.get_committee(
+                    slot * committees_per_slot + comm_index, committee_count
+                )
                 for comm_index in range(committees_per_slot)
             ]
             for slot in range(SLOTS_PER_EPOCH)
@@ -1156,8 +1115,13 @@ def process_rewards_and_penalties(
     add_penalties(res.inactivity)
 
     # Important: do not change state one balance at a time.
-    # Set them all at once, constructing the tree in one go.
-    return state.set("balances", new_balances)
+    # Update the changed balances at once, so that each node of the tree is hashed once.
+    updated_balances = {
+        i: Gwei(balance)
+        for i, (balance, old_balance) in enumerate(zip(new_balances, state.balances))
+        if balance != old_balance
+    }
+    return state.set("balances", update_elements(state.balances, updated_balances))
 
 
 def process_registry_updates(
@@ -1247,6 +1211,7 @@ def process_final_updates(
         state = state.set("eth1_data_votes", [])
 
     # Update effective balances with hysteresis
+    updated_validators = {}
     for (index, status), balance in zip(enumerate(process.statuses), state.balances):
         effective_balance = status.validator.effective_balance
         if (
@@ -1256,12 +1221,12 @@ def process_final_updates(
             new_effective_balance = min(
                 balance - balance % EFFECTIVE_BALANCE_INCREMENT, MAX_EFFECTIVE_BALANCE
             )
-            state = state.transform(
-                ("validators", index),
-                lambda _validator: _validator.set(
-                    "effective_balance", new_effective_balance
-                ),
+            updated_validators[index] = state.validators[index].set(
+                "effective_balance", new_effective_balance
             )
+    state = state.set(
+        "validators", update_elements(state.validators, updated_validators)
+    )
 
     # Reset slashings
     state = state.transform(
@@ -1336,9 +1301,17 @@ def process_randao(
     epoch = epochs_ctx.current_shuffling.epoch
     # Verify RANDAO reveal
     proposer_index = epochs_ctx.get_beacon_proposer(state.slot)
-    validate_randao_reveal(
-        state, proposer_index, epoch, body.randao_reveal, ALTONA_CONFIG.SLOTS_PER_EPOCH
+    domain = get_domain(
+        state, SignatureDomain.DOMAIN_RANDAO, ALTONA_CONFIG.SLOTS_PER_EPOCH
     )
+    signing_root = compute_signing_root(SerializableUint64(epoch), domain)
+    if not verify_signature_set(
+        (epochs_ctx.index2pubkey[proposer_index],), signing_root, body.randao_reveal
+    ):
+        raise ValidationError(
+            f"RANDAO reveal is invalid for proposer index {proposer_index}"
+            f" at slot {state.slot}"
+        )
     # Mix in RANDAO reveal
     mix = xor(
         get_randao_mix(state, epoch, ALTONA_CONFIG.EPOCHS_PER_HISTORICAL_VECTOR),
@@ -1511,7 +1484,9 @@ def process_proposer_slashing(
             ),
         )
         signing_root = compute_signing_root(signed_header.message, domain)
-        assert bls_Verify(proposer.pubkey, signing_root, signed_header.signature)
+        assert verify_signature_set(
+            (proposer.pubkey,), signing_root, signed_header.signature
+        )
 
     return slash_validator(epochs_ctx, state, header_1.proposer_index)
 
@@ -1559,7 +1534,7 @@ def is_valid_indexed_attestation(
         indexed_attestation.data.target.epoch,
     )  # TODO maybe optimize get_domain?
     signing_root = compute_signing_root(indexed_attestation.data, domain)
-    return bls_FastAggregateVerify(pubkeys, signing_root, indexed_attestation.signature)
+    return verify_signature_set(pubkeys, signing_root, indexed_attestation.signature)
 
 
 def process_attestation(
@@ -1721,7 +1696,9 @@ def process_voluntary_exit(
         voluntary_exit.epoch,
     )
     signing_root = compute_signing_root(voluntary_exit, domain)
-    assert bls_Verify(validator.pubkey, signing_root, signed_voluntary_exit.signature)
+    assert verify_signature_set(
+        (validator.pubkey,), signing_root, signed_voluntary_exit.signature
+    )
     # Initiate exit
     # TODO could be optimized, but happens too rarely
     return initiate_validator_exit(epochs_ctx, state, voluntary_exit.validator_index)
@@ -1769,7 +1746,9 @@ def verify_block_signature(state: BeaconState, signed_block: SignedBeaconBlock)
         state, SignatureDomain.DOMAIN_BEACON_PROPOSER, ALTONA_CONFIG.SLOTS_PER_EPOCH
     )
     signing_root = compute_signing_root(signed_block.message, domain)
-    return bls_Verify(proposer.pubkey, signing_root, signed_block.signature)
+    return verify_signature_set(
+        (proposer.pubkey,), signing_root, signed_block.signature
+    )
 
 
 def state_transition(
@@ -1,5 +1,6 @@
 from eth2.beacon.state_machines.forks.altona.eth2fastspec import (
     EpochsContext,
+    deferred_signature_verification,
     process_block,
     process_slots,
 )
@@ -29,6 +30,8 @@ def apply_fast_state_transition(
         if check_proposer_signature:
             # validate_proposer_signature(state, signed_block)
             pass
-        state = process_block(epochs_ctx, state, signed_block.message)
+        # NOTE: the signatures of the block are verified in a single batch at the end
+        with deferred_signature_verification():
+            state = process_block(epochs_ctx, state, signed_block.message)
 
     return state
@@ -18,18 +18,16 @@ from eth2.beacon.signature_domain import SignatureDomain
 from eth2.beacon.types.aggregate_and_proof import AggregateAndProof
 from eth2.beacon.types.attestations import Attestation
 from eth2.beacon.types.states import BeaconState
-from eth2.beacon.typing import Bitfield, CommitteeIndex, SerializableUint64, Slot
+from eth2.beacon.typing import Bitfield, CommitteeIndex, Root, SerializableUint64, Slot
 from eth2.configs import Eth2Config
 
 # TODO: TARGET_AGGREGATORS_PER_COMMITTEE is not in Eth2Config now.
 TARGET_AGGREGATORS_PER_COMMITTEE = 16
 
 
-def get_slot_signature(
-    state: BeaconState, slot: Slot, privkey: int, config: Eth2Config
-) -> BLSSignature:
+def get_slot_signing_root(state: BeaconState, slot: Slot, config: Eth2Config) -> Root:
     """
-    Sign on ``slot`` and return the signature.
+    Return the signing root of ``slot``, which aggregators sign as their selection proof.
     """
     domain = get_domain(
         state,
@@ -37,8 +35,16 @@ def get_slot_signature(
         config.SLOTS_PER_EPOCH,
         message_epoch=compute_epoch_at_slot(slot, config.SLOTS_PER_EPOCH),
     )
-    signing_root = compute_signing_root(SerializableUint64(slot), domain)
-    return bls.sign(privkey, signing_root)
+    return compute_signing_root(SerializableUint64(slot), domain)
+
+
+def get_slot_signature(
+    state: BeaconState, slot: Slot, privkey: int, config: Eth2Config
+) -> BLSSignature:
+    """
+    Sign on ``slot`` and return the signature.
+    """
+    return bls.sign(privkey, get_slot_signing_root(state, slot, config))
 
 
 def is_aggregator(
@@ -103,10 +109,14 @@ def validate_aggregate_and_proof(
     aggregate_and_proof: AggregateAndProof,
     attestation_propagation_slot_range: int,
     config: Eth2Config,
+    validate_signatures: bool = True,
 ) -> None:
     """
     Validate aggregate_and_proof
 
+    Option ``validate_signatures`` is used by callers that verify the selection proof and
+    the aggregate signature on their own, e.g. in batches.
+
     Reference: https://github.com/ethereum/eth2.0-specs/blob/master/specs/networking/p2p-interface.md#global-topics  # noqa: E501
     """
     attestation = aggregate_and_proof.aggregate
@@ -136,9 +146,10 @@ def validate_aggregate_and_proof(
             " is not a selected aggregator"
         )
 
-    validate_aggregator_proof(state, aggregate_and_proof, config)
+    if validate_signatures:
+        validate_aggregator_proof(state, aggregate_and_proof, config)
 
-    validate_attestation_signature(state, attestation, config)
+        validate_attestation_signature(state, attestation, config)
 
 
 def validate_attestation_propagation_slot_range(
@@ -163,13 +174,7 @@ def validate_aggregator_proof(
 ) -> None:
     slot = aggregate_and_proof.aggregate.data.slot
     pubkey = state.validators[aggregate_and_proof.aggregator_index].pubkey
-    domain = get_domain(
-        state,
-        SignatureDomain.DOMAIN_BEACON_ATTESTER,
-        config.SLOTS_PER_EPOCH,
-        message_epoch=compute_epoch_at_slot(slot, config.SLOTS_PER_EPOCH),
-    )
-    signing_root = compute_signing_root(SerializableUint64(slot), domain)
+    signing_root = get_slot_signing_root(state, slot, config)
 
     bls.validate(signing_root, aggregate_and_proof.selection_proof, pubkey)
 
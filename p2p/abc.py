@@ -231,12 +231,44 @@ class CommandAPI(ABC, Generic[TCommandPayload]):
     serialization_codec: SerializationCodecAPI[TCommandPayload]
     compression_codec: CompressionCodecAPI
 
-    payload: TCommandPayload
-
     @abstractmethod
     def __init__(self, payload: TCommandPayload) -> None:
         ...
 
+    @property
+    @abstractmethod
+    def payload(self) -> TCommandPayload:
+        """
+        Return the payload, decoding it first if the command was created from its serialized
+        payload.
+        """
+        ...
+
+    @classmethod
+    @abstractmethod
+    def from_serialized_payload(cls: Type['TCommand'], serialized_payload: bytes) -> 'TCommand':
+        """
+        Create the command from its serialized payload, which is only decoded when the
+        ``payload`` is first accessed.
+        """
+        ...
+
+    @property
+    @abstractmethod
+    def serialized_payload(self) -> bytes:
+        """
+        Return the payload as serialized by the ``serialization_codec``.
+        """
+        ...
+
+    @property
+    @abstractmethod
+    def is_decoded(self) -> bool:
+        """
+        Return ``True`` if the payload has been decoded already.
+        """
+        ...
+
     @abstractmethod
     def encode(self, negotiated_command_id: int, snappy_support: bool) -> MessageAPI:
         ...
@@ -246,6 +278,18 @@ class CommandAPI(ABC, Generic[TCommandPayload]):
     def decode(cls: Type['TCommand'], message: MessageAPI, snappy_support: bool) -> 'TCommand':
         ...
 
+    @classmethod
+    @abstractmethod
+    def decode_lazily(cls: Type['TCommand'],
+                      message: MessageAPI,
+                      snappy_support: bool) -> 'TCommand':
+        """
+        Create the command from the given message, without decoding its payload until the
+        ``payload`` is first accessed. A malformed payload raises
+        :class:`~p2p.exceptions.MalformedMessage` at that point.
+        """
+        ...
+
 
 TCommand = TypeVar("TCommand", bound=CommandAPI[Any])
 
@@ -390,6 +434,24 @@ class MultiplexerAPI(ABC):
     def last_msg_time(self) -> float:
         ...
 
+    #
+    # Buffer accounting
+    #
+    @abstractmethod
+    def get_buffered_bytes(self) -> int:
+        """
+        Return the number of payload bytes of the messages that are buffered for all protocols.
+        """
+        ...
+
+    @abstractmethod
+    def get_discarded_msg_count(self) -> int:
+        """
+        Return the number of messages that were discarded because their protocol's buffer was
+        full.
+        """
+        ...
+
     #
     # Proxy Transport properties and methods
     #
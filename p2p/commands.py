@@ -2,7 +2,10 @@ from typing import (
     Any,
     Callable,
     ClassVar,
+    Optional,
+    Tuple,
     Type,
+    TypeVar,
 )
 
 import snappy
@@ -14,7 +17,6 @@ from p2p.abc import (
     CompressionCodecAPI,
     MessageAPI,
     SerializationCodecAPI,
-    TCommand,
 )
 from p2p.constants import RLPX_HEADER_DATA
 from p2p.message import Message
@@ -86,22 +88,70 @@ class NoCompressionCodec(CompressionCodecAPI):
         return data
 
 
+# Marks the payload of a command that was created from its serialized payload, until it is
+# first accessed.
+_NOT_DECODED: Any = object()
+
+TBaseCommand = TypeVar('TBaseCommand', bound='BaseCommand[Any]')
+
+
 class BaseCommand(CommandAPI[TCommandPayload]):
     protocol_command_id: ClassVar[int]
 
     serialization_codec: SerializationCodecAPI[TCommandPayload]
     compression_codec: CompressionCodecAPI = SnappyCodec()
 
-    payload: TCommandPayload
+    _payload: TCommandPayload
+    _serialized_payload: Optional[bytes]
 
     def __init__(self, payload: TCommandPayload) -> None:
-        self.payload = payload
+        self._payload = payload
+        self._serialized_payload = None
+
+    @classmethod
+    def from_serialized_payload(cls: Type[TBaseCommand],
+                                serialized_payload: bytes) -> TBaseCommand:
+        command = cls.__new__(cls)
+        command._payload = _NOT_DECODED
+        command._serialized_payload = serialized_payload
+        return command
+
+    @property
+    def payload(self) -> TCommandPayload:
+        if self._payload is _NOT_DECODED:
+            try:
+                self._payload = self.serialization_codec.decode(self.serialized_payload)
+            except rlp.exceptions.DeserializationError as err:
+                raise MalformedMessage(
+                    f"Failed to decode payload of {self.__class__.__name__}: {err}"
+                ) from err
+        return self._payload
+
+    @property
+    def is_decoded(self) -> bool:
+        return self._payload is not _NOT_DECODED
+
+    @property
+    def serialized_payload(self) -> bytes:
+        if self._serialized_payload is None:
+            self._serialized_payload = self.serialization_codec.encode(self._payload)
+        return self._serialized_payload
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Commands are pickled as their serialized payload, so that they cross process
+        # boundaries (e.g. the event bus) as plain bytes, and are only decoded again by a
+        # consumer that accesses the payload.
+        return (self.from_serialized_payload, (self.serialized_payload,))
 
     def __repr__(self) -> str:
-        return f"{self.__class__}(payload={self.payload})"
+        if self.is_decoded:
+            return f"{self.__class__}(payload={self.payload})"
+        else:
+            # Don't decode the payload just to log it.
+            return f"{self.__class__}(serialized_payload={len(self.serialized_payload)} bytes)"
 
     def encode(self, cmd_id: int, snappy_support: bool) -> MessageAPI:
-        raw_payload_data = self.serialization_codec.encode(self.payload)
+        raw_payload_data = self.serialized_payload
 
         if snappy_support:
             payload_data = self.compression_codec.compress(raw_payload_data)
@@ -121,17 +171,26 @@ class BaseCommand(CommandAPI[TCommandPayload]):
         return Message(header, body)
 
     @classmethod
-    def decode(cls: Type[TCommand], message: MessageAPI, snappy_support: bool) -> TCommand:
-        if snappy_support:
-            payload_data = cls.compression_codec.decompress(message.encoded_payload)
-        else:
-            payload_data = message.encoded_payload
-
+    def decode(cls: Type[TBaseCommand],
+               message: MessageAPI,
+               snappy_support: bool) -> TBaseCommand:
+        command = cls.decode_lazily(message, snappy_support)
         try:
-            payload = cls.serialization_codec.decode(payload_data)
+            command._payload = cls.serialization_codec.decode(command.serialized_payload)
         except rlp.exceptions.DeserializationError as err:
             raise rlp.exceptions.DeserializationError(
                 f"DeserializationError for {cls}",
                 err.serial,
             ) from err
-        return cls(payload)
+        return command
+
+    @classmethod
+    def decode_lazily(cls: Type[TBaseCommand],
+                      message: MessageAPI,
+                      snappy_support: bool) -> TBaseCommand:
+        if snappy_support:
+            payload_data = cls.compression_codec.decompress(message.encoded_payload)
+        else:
+            payload_data = message.encoded_payload
+
+        return cls.from_serialized_payload(payload_data)
@@ -190,22 +190,25 @@ class Connection(ConnectionAPI, Service):
         except PeerConnectionLost:
             pass
         except MalformedMessage as err:
-            self.logger.debug(
-                "Disconnecting peer %s for sending MalformedMessage: %s",
-                self.remote,
-                err,
-                exc_info=True,
-            )
-            try:
-                self.get_base_protocol().send(Disconnect(DisconnectReason.BAD_PROTOCOL))
-            except PeerConnectionLost:
-                self.logger.debug(
-                    "%s went away while trying to disconnect for MalformedMessage",
-                    self,
-                )
+            self._disconnect_for_malformed_message(err)
         finally:
             self.manager.cancel()
 
+    def _disconnect_for_malformed_message(self, err: MalformedMessage) -> None:
+        self.logger.debug(
+            "Disconnecting peer %s for sending MalformedMessage: %s",
+            self.remote,
+            err,
+            exc_info=True,
+        )
+        try:
+            self.get_base_protocol().send(Disconnect(DisconnectReason.BAD_PROTOCOL))
+        except PeerConnectionLost:
+            self.logger.debug(
+                "%s went away while trying to disconnect for MalformedMessage",
+                self,
+            )
+
     #
     # Subscriptions/Handler API
     #
@@ -226,6 +229,16 @@ class Connection(ConnectionAPI, Service):
             self.logger.debug2('Handling command: %s', type(cmd))
             # local copy to prevent multation while iterating
             protocol_handlers = set(self._protocol_handlers[type(protocol)])
+            if protocol_handlers or self._command_handlers[type(cmd)]:
+                # Commands are decoded lazily, but protocol and command handlers consume their
+                # payloads, so a malformed one is caught here rather than in any of them. Message
+                # handlers see every command, and decode the payloads they need themselves.
+                try:
+                    cmd.payload
+                except MalformedMessage as err:
+                    self._disconnect_for_malformed_message(err)
+                    self.manager.cancel()
+                    return
             for proto_handler_fn in protocol_handlers:
                 self.logger.debug2(
                     'Running protocol handler %s for protocol=%s command=%s',
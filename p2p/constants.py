@@ -129,6 +129,15 @@ DEFAULT_PEER_BOOT_TIMEOUT = 20
 # How long before we timeout when waiting for a peer to be ready.
 PEER_READY_TIMEOUT = 1
 
+# Maximum number of payload bytes that the Multiplexer buffers for a single peer, split evenly
+# among its protocols. Messages for a protocol whose share is used up are discarded, except for
+# those of the base protocol.
+MULTIPLEXER_MAX_BUFFERED_BYTES = 16 * 1024 * 1024
+
+# How long a peer waits for space in a subscriber's full message queue before discarding the
+# message.
+PEER_SUBSCRIBER_QUEUE_TIMEOUT = 1
+
 # Name of the endpoint that the discovery uses to connect to the eventbus
 DISCOVERY_EVENTBUS_ENDPOINT = 'discovery'
 # Interval at which peer pool requests new connection candidates
@@ -211,6 +220,7 @@ HKDF_INFO = b"discovery v5 key agreement"
 ID_NONCE_SIGNATURE_PREFIX = b"discovery-id-nonce"
 ENR_REPR_PREFIX = "enr:"  # prefix used when printing an ENR
 MAX_ENR_SIZE = 300  # maximum allowed size of an ENR
+ENR_CACHE_SIZE = 4096  # number of decoded ENRs cached by the NodeDB
 IP_V4_ADDRESS_ENR_KEY = b"ip"
 UDP_PORT_ENR_KEY = b"udp"
 TCP_PORT_ENR_KEY = b"tcp"
@@ -1,4 +1,5 @@
 from typing import (
+    Sequence,
     Type,
     TYPE_CHECKING,
 )
@@ -7,6 +8,7 @@ from collections import (
 )
 
 import rlp
+from rlp.codec import length_prefix
 from rlp.sedes import (
     big_endian_int,
     binary,
@@ -52,6 +54,12 @@ class IPAddressSedes(Binary):
 ip_address_sedes = IPAddressSedes()
 
 
+def encode_rlp_list(encoded_items: Sequence[bytes]) -> bytes:
+    """RLP encode a list of items that are RLP encoded already."""
+    encoded_payload = b"".join(encoded_items)
+    return length_prefix(len(encoded_payload), 0xc0) + encoded_payload
+
+
 class MessageTypeRegistry(MessageTypeRegistryBaseType):
 
     def register(self,
@@ -138,6 +146,22 @@ class NodesMessage(BaseMessage):
         ("enrs", CountableList(ENR)),
     )
 
+    @classmethod
+    def from_encoded_enrs(cls,
+                          request_id: int,
+                          total: int,
+                          enrs: Sequence[ENR],
+                          encoded_enrs: bytes,
+                          ) -> "NodesMessage":
+        """Create a message whose encoding reuses the given RLP encoded list of its ENRs."""
+        message = cls(request_id=request_id, total=total, enrs=enrs)
+        message._cached_rlp = encode_rlp_list((
+            rlp.encode(request_id),
+            rlp.encode(total),
+            encoded_enrs,
+        ))
+        return message
+
 
 @default_message_type_registry.register
 class ReqTicketMessage(BaseMessage):
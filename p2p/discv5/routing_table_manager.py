@@ -1,3 +1,4 @@
+import heapq
 import logging
 import itertools
 import math
@@ -5,7 +6,9 @@ import rlp
 import secrets
 import time
 from typing import (
+    Dict,
     Generator,
+    Iterable,
     List,
     Optional,
     Sequence,
@@ -62,6 +65,7 @@ from p2p.enr import (
     ENR,
 )
 from p2p.discv5.messages import (
+    encode_rlp_list,
     FindNodeMessage,
     NodesMessage,
     PingMessage,
@@ -113,6 +117,81 @@ def partition_enrs(enrs: Sequence[ENR], max_payload_size: int) -> Tuple[Tuple[EN
     )
 
 
+def partition_and_encode_enrs(enrs: Sequence[ENR],
+                              max_payload_size: int,
+                              ) -> Tuple[Tuple[Tuple[ENR, ...], bytes], ...]:
+    """Partition a list of ENRs like `partition_enrs` and RLP encode the ENRs of each partition.
+
+    Each partition is returned together with the encoded list of its ENRs, which only needs to
+    be combined with a request id to encode a NODES message.
+    """
+    serialized_enrs = tuple(rlp.encode(enr) for enr in enrs)
+    enr_sizes = tuple(len(serialized_enr) for serialized_enr in serialized_enrs)
+    partitioned_enr_indices = partition_enr_indices_by_size(enr_sizes, max_payload_size)
+    return tuple(
+        (
+            tuple(enrs[index] for index in indices),
+            encode_rlp_list(tuple(serialized_enrs[index] for index in indices)),
+        )
+        for indices in partitioned_enr_indices
+    )
+
+
+class LookupFrontier:
+    """The nodes closest to the target of a lookup that have been found so far.
+
+    The nodes are kept in a max-heap keyed by their distance to the target, which is bounded to
+    the given size, so that each newly found node is added or rejected in logarithmic time.
+    """
+
+    def __init__(self, target: NodeID, size: int) -> None:
+        self.target = target
+        self.size = size
+        self._heap: List[Tuple[int, NodeID]] = []
+        self._seen_node_ids: Set[NodeID] = set()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    @property
+    def is_full(self) -> bool:
+        return len(self._heap) >= self.size
+
+    def add(self, node_id: NodeID) -> None:
+        """Add a node if it is closer to the target than the farthest node in a full frontier.
+
+        Nodes that have been added before are ignored, even if they were evicted or removed since.
+        """
+        if node_id in self._seen_node_ids:
+            return
+        self._seen_node_ids.add(node_id)
+
+        item = (-compute_distance(self.target, node_id), node_id)
+        if not self.is_full:
+            heapq.heappush(self._heap, item)
+        elif item > self._heap[0]:
+            heapq.heapreplace(self._heap, item)
+
+    def fill(self, node_ids: Iterable[NodeID]) -> None:
+        """Add nodes, ordered by distance to the target, until the frontier is full."""
+        for node_id in node_ids:
+            if self.is_full:
+                break
+            self.add(node_id)
+
+    def remove(self, node_id: NodeID) -> None:
+        for index, (_, present_node_id) in enumerate(self._heap):
+            if present_node_id == node_id:
+                self._heap[index] = self._heap[-1]
+                self._heap.pop()
+                heapq.heapify(self._heap)
+                return
+
+    def iter_closest(self) -> Iterable[NodeID]:
+        """Iterate over the nodes in the frontier, the closest to the target first."""
+        return (node_id for _, node_id in sorted(self._heap, reverse=True))
+
+
 class BaseRoutingTableManagerComponent(Service):
     """Base class for services that participate in managing the routing table."""
 
@@ -319,6 +398,12 @@ class FindNodeHandlerService(BaseRoutingTableManagerComponent):
                  ) -> None:
         super().__init__(local_node_id, routing_table, message_dispatcher, node_db)
         self.outgoing_message_send_channel = outgoing_message_send_channel
+        # The partitioned and encoded ENRs of the last response for each distance, together
+        # with the ENRs they were made of, in order to detect changes of the routing table.
+        self._encoded_partitions_by_distance: Dict[
+            int,
+            Tuple[Tuple[ENR, ...], Tuple[Tuple[Tuple[ENR, ...], bytes], ...]],
+        ] = {}
 
     async def run(self) -> None:
         handler_subscription = self.message_dispatcher.add_request_handler(FindNodeMessage)
@@ -355,34 +440,59 @@ class FindNodeHandlerService(BaseRoutingTableManagerComponent):
 
     async def respond_with_remote_enrs(self, incoming_message: IncomingMessage) -> None:
         """Send a Nodes message containing ENRs of peers at a given node distance."""
-        node_ids = self.routing_table.get_nodes_at_log_distance(incoming_message.message.distance)
-
-        enrs = []
-        for node_id in node_ids:
-            try:
-                enr = self.node_db.get_enr(node_id)
-            except KeyError:
-                self.logger.warning("Missing ENR for node %s", encode_hex(node_id))
-            else:
-                enrs.append(enr)
-
-        enr_partitions = partition_enrs(enrs, NODES_MESSAGE_PAYLOAD_SIZE) or ((),)
+        distance = incoming_message.message.distance
+        enrs = self.get_enrs_at_log_distance(distance)
+        enr_partitions = self.get_encoded_enr_partitions(distance, enrs)
         self.logger.debug(
             "Responding to %s with %d Nodes message containing %d ENRs at distance %d",
             incoming_message.sender_endpoint,
             len(enr_partitions),
             len(enrs),
-            incoming_message.message.distance,
+            distance,
         )
-        for partition in enr_partitions:
-            nodes_message = NodesMessage(
+        for partition, encoded_enrs in enr_partitions:
+            nodes_message = NodesMessage.from_encoded_enrs(
                 request_id=incoming_message.message.request_id,
                 total=len(enr_partitions),
                 enrs=partition,
+                encoded_enrs=encoded_enrs,
             )
             outgoing_message = incoming_message.to_response(nodes_message)
             await self.outgoing_message_send_channel.send(outgoing_message)
 
+    @to_tuple
+    def get_enrs_at_log_distance(self, distance: int) -> Iterable[ENR]:
+        for node_id in self.routing_table.get_nodes_at_log_distance(distance):
+            try:
+                yield self.node_db.get_enr(node_id)
+            except KeyError:
+                self.logger.warning("Missing ENR for node %s", encode_hex(node_id))
+
+    def get_encoded_enr_partitions(self,
+                                   distance: int,
+                                   enrs: Tuple[ENR, ...],
+                                   ) -> Tuple[Tuple[Tuple[ENR, ...], bytes], ...]:
+        """Get the ENRs partitioned into Nodes messages, each with the encoded list of its ENRs.
+
+        The partitions are reused until the ENRs at the distance change, either because the
+        routing table changed or because one of the ENRs got updated.
+        """
+        try:
+            cached_enrs, enr_partitions = self._encoded_partitions_by_distance[distance]
+        except KeyError:
+            pass
+        else:
+            # The NodeDB returns the same ENR instances until they change, so this is cheap
+            if cached_enrs == enrs:
+                return enr_partitions
+
+        enr_partitions = (
+            partition_and_encode_enrs(enrs, NODES_MESSAGE_PAYLOAD_SIZE) or
+            (((), encode_rlp_list(())),)
+        )
+        self._encoded_partitions_by_distance[distance] = (enrs, enr_partitions)
+        return enr_partitions
+
 
 class PingSenderService(BaseRoutingTableManagerComponent):
     """Regularly sends pings to peers to check if they are still alive or not."""
@@ -469,31 +579,27 @@ class LookupService(BaseRoutingTableManagerComponent):
         self.logger.info("Looking up %s", encode_hex(target))
 
         queried_node_ids = set()
-        unresponsive_node_ids = set()
-        received_enrs: List[ENR] = []
-        received_node_ids: List[NodeID] = []
+        # The routing table is only walked as far as needed to fill up the frontier, either
+        # initially or after unresponsive nodes have been removed from it.
+        routing_table_node_ids = self.routing_table.iter_nodes_around(target)
+        frontier = LookupFrontier(target, self.routing_table.bucket_size)
+        frontier.fill(routing_table_node_ids)
 
         async def lookup_and_store_response(peer: NodeID) -> None:
             enrs = await self.lookup_at_peer(peer, target)
             queried_node_ids.add(peer)
             if enrs is not None:
                 for enr in enrs:
-                    received_enrs.append(enr)
-                    received_node_ids.append(enr.node_id)
+                    frontier.add(enr.node_id)
                     self.node_db.set_enr(enr)
             else:
-                unresponsive_node_ids.add(peer)
+                frontier.remove(peer)
+                frontier.fill(routing_table_node_ids)
 
         for lookup_round_counter in itertools.count():
-            candidates = iter_closest_nodes(target, self.routing_table, received_node_ids)
-            responsive_candidates = itertools.dropwhile(
-                lambda node: node in unresponsive_node_ids,
-                candidates,
-            )
-            closest_k_candidates = take(self.routing_table.bucket_size, responsive_candidates)
             closest_k_unqueried_candidates = (
                 candidate
-                for candidate in closest_k_candidates
+                for candidate in frontier.iter_closest()
                 if candidate not in queried_node_ids
             )
             nodes_to_query = tuple(take(
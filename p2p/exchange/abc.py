@@ -36,7 +36,8 @@ if TYPE_CHECKING:
 class NormalizerAPI(ABC, Generic[TResponseCommand, TResult]):
     # This variable indicates how slow normalization is. If normalization requires
     # any non-trivial computation, consider it slow. Then, the Manager will run it in
-    # a thread to ensure it doesn't block the main loop.
+    # a thread (or in the normalization pool, for a PoolNormalizerAPI) to ensure it
+    # doesn't block the main loop.
     is_normalization_slow: bool
 
     @abstractmethod
@@ -47,6 +48,61 @@ class NormalizerAPI(ABC, Generic[TResponseCommand, TResult]):
         ...
 
 
+class PoolNormalizerAPI(NormalizerAPI[TResponseCommand, TResult]):
+    """
+    A slow normalizer whose computation can be run by a :class:`NormalizationPoolAPI`
+    in another process.
+
+    The response is reduced to a picklable job (typically the raw RLP of its items), the
+    job is normalized by :meth:`normalize_job` in a worker, and the result is built from
+    the response and the output of the job.
+    """
+    @abstractmethod
+    def get_job(self, message: TResponseCommand) -> Any:
+        """
+        Return the picklable input of :meth:`normalize_job` for the response
+        """
+        ...
+
+    @staticmethod
+    @abstractmethod
+    def normalize_job(job: Any) -> Any:
+        """
+        Do the heavy lifting of the normalization, and return a picklable output.
+
+        This must be a static method, so that workers can run it without the normalizer.
+        """
+        ...
+
+    @abstractmethod
+    def build_result(self, message: TResponseCommand, job_output: Any) -> TResult:
+        """
+        Combine the response and the output of :meth:`normalize_job` into the final result
+        """
+        ...
+
+
+class NormalizationPoolAPI(ABC):
+    """
+    A long-lived pool, shared by all exchanges, that normalizes responses with
+    a :class:`PoolNormalizerAPI` outside of the event loop.
+    """
+    @property
+    @abstractmethod
+    def queue_depth(self) -> int:
+        """
+        The number of jobs waiting to be sent to a worker
+        """
+        ...
+
+    @abstractmethod
+    async def normalize(
+            self,
+            normalizer: PoolNormalizerAPI[TResponseCommand, TResult],
+            message: TResponseCommand) -> TResult:
+        ...
+
+
 class ValidatorAPI(ABC, Generic[TResult]):
     @abstractmethod
     def validate_result(self, result: TResult) -> None:
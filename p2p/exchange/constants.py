@@ -11,3 +11,9 @@ ROUND_TRIP_TIMEOUT = 20.0
 # estimate the queue length is to determine how long a timeout to use when
 # waiting for the lock to send the next queued peer request.
 NUM_QUEUED_REQUESTS = 4
+
+
+# Slow normalizations are sent to the normalization pool in batches of up to this many
+# responses, or whatever is pending after this many seconds.
+NORMALIZATION_BATCH_SIZE = 8
+NORMALIZATION_BATCH_WINDOW = 0.01
@@ -14,7 +14,7 @@ from async_service import background_asyncio_service
 from p2p.abc import ConnectionAPI
 from p2p.asyncio_utils import create_task
 
-from .abc import ExchangeAPI, NormalizerAPI, ValidatorAPI
+from .abc import ExchangeAPI, NormalizationPoolAPI, NormalizerAPI, ValidatorAPI
 from .candidate_stream import ResponseCandidateStream
 from .manager import ExchangeManager
 from .typing import TResult, TRequestCommand, TResponseCommand
@@ -26,8 +26,12 @@ class BaseExchange(ExchangeAPI[TRequestCommand, TResponseCommand, TResult]):
 
     _manager: ExchangeManager[TRequestCommand, TResponseCommand, TResult]
 
-    def __init__(self) -> None:
+    def __init__(self, normalization_pool: NormalizationPoolAPI = None) -> None:
+        """
+        Slow responses are normalized in the ``normalization_pool``, if given.
+        """
         self.tracker = self.tracker_class()
+        self._normalization_pool = normalization_pool
 
     @contextlib.asynccontextmanager
     async def run_exchange(
@@ -43,6 +47,7 @@ class BaseExchange(ExchangeAPI[TRequestCommand, TResponseCommand, TResult]):
             self._manager = ExchangeManager(
                 connection,
                 response_stream,
+                self._normalization_pool,
             )
             name = f'{self.__class__.__name__}/{connection.remote}'
             yield create_task(response_stream_manager.wait_finished(), name=name)
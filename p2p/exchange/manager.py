@@ -1,5 +1,4 @@
 import asyncio
-from concurrent import futures
 import logging
 from typing import (
     Callable,
@@ -16,8 +15,10 @@ from p2p.exceptions import PeerConnectionLost
 
 from .abc import (
     ExchangeManagerAPI,
+    NormalizationPoolAPI,
     NormalizerAPI,
     PerformanceTrackerAPI,
+    PoolNormalizerAPI,
     ResponseCandidateStreamAPI,
 )
 from .typing import TRequestCommand, TResponseCommand
@@ -34,9 +35,11 @@ class ExchangeManager(ExchangeManagerAPI[TRequestCommand, TResponseCommand, TRes
     def __init__(self,
                  connection: ConnectionAPI,
                  response_stream: ResponseCandidateStreamAPI[TRequestCommand, TResponseCommand],
+                 normalization_pool: NormalizationPoolAPI = None,
                  ) -> None:
         self._connection = connection
         self._response_stream = response_stream
+        self._normalization_pool = normalization_pool
 
     async def get_result(
             self,
@@ -53,45 +56,52 @@ class ExchangeManager(ExchangeManagerAPI[TRequestCommand, TResponseCommand, TRes
                 f"Response stream closed before sending request to {self._connection}"
             )
 
-        loop = asyncio.get_event_loop()
-
-        with futures.ThreadPoolExecutor() as executor:
-            async for payload in stream.payload_candidates(request, tracker, timeout=timeout):
-                try:
-                    payload_validator(payload)
-
-                    if normalizer.is_normalization_slow:
-                        result = await loop.run_in_executor(
-                            executor,
-                            normalizer.normalize_result,
-                            payload
-                        )
-                    else:
-                        result = normalizer.normalize_result(payload)
-
-                    validate_result(result)
-                except ValidationError as err:
-                    self.logger.debug(
-                        "Response validation failed for pending %s request from connection %s: %s",
-                        stream.response_cmd_name,
-                        self._connection,
-                        err,
-                    )
-                    # If this response was just for the wrong request, we'll
-                    # catch the right one later.  Otherwise, this request will
-                    # eventually time out.
-                    continue
-                else:
-                    tracker.record_response(
-                        stream.last_response_time,
-                        request,
-                        result,
-                    )
-                    stream.complete_request()
-                    return result
+        async for payload in stream.payload_candidates(request, tracker, timeout=timeout):
+            try:
+                payload_validator(payload)
+
+                result = await self._normalize(normalizer, payload)
+
+                validate_result(result)
+            except ValidationError as err:
+                self.logger.debug(
+                    "Response validation failed for pending %s request from connection %s: %s",
+                    stream.response_cmd_name,
+                    self._connection,
+                    err,
+                )
+                # If this response was just for the wrong request, we'll
+                # catch the right one later.  Otherwise, this request will
+                # eventually time out.
+                continue
+            else:
+                tracker.record_response(
+                    stream.last_response_time,
+                    request,
+                    result,
+                )
+                stream.complete_request()
+                return result
 
         raise PeerConnectionLost(f"Response stream of {self._connection} was apparently closed")
 
+    async def _normalize(
+            self,
+            normalizer: NormalizerAPI[TResponseCommand, TResult],
+            payload: TResponseCommand) -> TResult:
+        if not normalizer.is_normalization_slow:
+            return normalizer.normalize_result(payload)
+
+        pool = self._normalization_pool
+        if pool is not None and isinstance(normalizer, PoolNormalizerAPI):
+            return await pool.normalize(normalizer, payload)
+        else:
+            return await asyncio.get_event_loop().run_in_executor(
+                None,
+                normalizer.normalize_result,
+                payload,
+            )
+
     @property
     def service(self) -> ResponseCandidateStreamAPI[TRequestCommand, TResponseCommand]:
         """
@@ -0,0 +1,170 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import logging
+import time
+from typing import (
+    Any,
+    Callable,
+    List,
+    Sequence,
+    Tuple,
+)
+
+from async_service import Service
+from pyformance import MetricsRegistry
+
+from .abc import NormalizationPoolAPI, PoolNormalizerAPI
+from .constants import (
+    NORMALIZATION_BATCH_SIZE,
+    NORMALIZATION_BATCH_WINDOW,
+)
+from .typing import TResponseCommand, TResult
+
+
+NormalizeJobFn = Callable[[Any], Any]
+
+# The function to run, its input, the future of its output and the name of the normalizer
+PendingJob = Tuple[NormalizeJobFn, Any, 'asyncio.Future[Any]', str]
+
+# Whether the job succeeded, its output (or exception) and how long it took in the worker
+JobOutcome = Tuple[bool, Any, float]
+
+
+def normalize_jobs(jobs: Sequence[Tuple[NormalizeJobFn, Any]]) -> Tuple[JobOutcome, ...]:
+    """
+    Run a batch of normalization jobs, typically in a worker process.
+
+    A failing job doesn't fail the whole batch: its exception is returned in its place.
+    """
+    outcomes = []
+    for normalize_job, job in jobs:
+        start = time.perf_counter()
+        try:
+            output = normalize_job(job)
+        except Exception as err:
+            outcomes.append((False, err, time.perf_counter() - start))
+        else:
+            outcomes.append((True, output, time.perf_counter() - start))
+    return tuple(outcomes)
+
+
+class NormalizationPool(Service, NormalizationPoolAPI):
+    """
+    Normalize the responses of all exchanges of a node in a pool of worker processes.
+
+    Jobs are collected until either ``batch_size`` of them are pending or ``batch_window``
+    seconds have passed, and are then sent to a worker in a single call. The node passes
+    the pool down to the exchanges of its peers through their :class:`ChainContext`.
+    """
+    logger = logging.getLogger('p2p.exchange.NormalizationPool')
+
+    def __init__(self,
+                 executor: Executor = None,
+                 batch_size: int = NORMALIZATION_BATCH_SIZE,
+                 batch_window: float = NORMALIZATION_BATCH_WINDOW,
+                 metrics_registry: MetricsRegistry = None) -> None:
+        # Unless given an executor, the process pool is only started with the first batch.
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._batch_size = batch_size
+        self._batch_window = batch_window
+
+        self._pending: List[PendingJob] = []
+        self._has_pending = asyncio.Event()
+        self._is_batch_full = asyncio.Event()
+
+        if metrics_registry is None:
+            metrics_registry = MetricsRegistry()
+        self._metrics_registry = metrics_registry
+        self._queue_depth_gauge = metrics_registry.gauge(
+            'trinity.p2p/normalization/queue_depth.gauge'
+        )
+        self._batch_size_histogram = metrics_registry.histogram(
+            'trinity.p2p/normalization/batch_size.histogram'
+        )
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._pending)
+
+    async def normalize(
+            self,
+            normalizer: PoolNormalizerAPI[TResponseCommand, TResult],
+            message: TResponseCommand) -> TResult:
+        future: 'asyncio.Future[Any]' = asyncio.get_event_loop().create_future()
+        self._pending.append((
+            normalizer.normalize_job,
+            normalizer.get_job(message),
+            future,
+            type(normalizer).__name__,
+        ))
+
+        self._has_pending.set()
+        if len(self._pending) >= self._batch_size:
+            self._is_batch_full.set()
+        self._queue_depth_gauge.set_value(len(self._pending))
+
+        job_output = await future
+        return normalizer.build_result(message, job_output)
+
+    async def run(self) -> None:
+        try:
+            while self.manager.is_running:
+                await self._has_pending.wait()
+                if not self._is_batch_full.is_set():
+                    # Give other responses a chance to join the batch.
+                    try:
+                        await asyncio.wait_for(
+                            self._is_batch_full.wait(),
+                            timeout=self._batch_window,
+                        )
+                    except asyncio.TimeoutError:
+                        pass
+
+                batch = self._pending[:self._batch_size]
+                del self._pending[:self._batch_size]
+                if len(self._pending) < self._batch_size:
+                    self._is_batch_full.clear()
+                if not self._pending:
+                    self._has_pending.clear()
+                self._queue_depth_gauge.set_value(len(self._pending))
+
+                self.manager.run_task(self._normalize_batch, batch)
+        finally:
+            for _, _, future, _ in self._pending:
+                future.cancel()
+            self._pending.clear()
+            self._queue_depth_gauge.set_value(0)
+            if self._owns_executor and self._executor is not None:
+                self._executor.shutdown(wait=False)
+
+    async def _normalize_batch(self, batch: Sequence[PendingJob]) -> None:
+        self._batch_size_histogram.add(len(batch))
+        jobs = tuple((normalize_job, job) for normalize_job, job, _, _ in batch)
+        loop = asyncio.get_event_loop()
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor()
+        try:
+            outcomes = await loop.run_in_executor(self._executor, normalize_jobs, jobs)
+        except BrokenProcessPool:
+            self.logger.warning(
+                "Normalization worker died, normalizing %d jobs in a thread instead",
+                len(jobs),
+            )
+            if self._owns_executor:
+                # Start a fresh process pool with the next batch.
+                self._executor = None
+            outcomes = await loop.run_in_executor(None, normalize_jobs, jobs)
+
+        for (_, _, future, normalizer_name), (is_ok, output, duration) in zip(batch, outcomes):
+            self._metrics_registry.histogram(
+                f'trinity.p2p/normalization/{normalizer_name}.histogram'
+            ).add(duration)
+            if future.done():
+                continue
+            elif is_ok:
+                future.set_result(output)
+            else:
+                future.set_exception(output)
@@ -1,6 +1,6 @@
-from typing import Type, Callable
+from typing import Any, Type, Callable
 
-from .abc import NormalizerAPI
+from .abc import NormalizerAPI, PoolNormalizerAPI
 from .typing import TResponseCommand, TResult
 
 
@@ -8,6 +8,18 @@ class BaseNormalizer(NormalizerAPI[TResponseCommand, TResult]):
     is_normalization_slow = False
 
 
+class BasePoolNormalizer(PoolNormalizerAPI[TResponseCommand, TResult]):
+    """
+    A slow normalizer that can target the normalization pool, and that still normalizes
+    in-process (e.g. in a thread) when no pool is running.
+    """
+    is_normalization_slow = True
+
+    def normalize_result(self, cmd: TResponseCommand) -> TResult:
+        job_output: Any = self.normalize_job(self.get_job(cmd))
+        return self.build_result(cmd, job_output)
+
+
 def _pick_payload(cmd: TResponseCommand) -> TResult:
     return cmd.payload
 
@@ -277,7 +277,7 @@ async def negotiate_protocol_handshakes(transport: TransportAPI,
     multiplexer = Multiplexer(transport, base_protocol, selected_protocols)
 
     # This context manager runs a background task which reads messages off of
-    # the `Transport` and feeds them into protocol specific queues.  Each
+    # the `Transport` and feeds them into protocol specific buffers.  Each
     # protocol is responsible for reading its own messages from that queue via
     # the `Multiplexer.stream_protocol_messages` API.
     await multiplexer.stream_in_background()
@@ -448,12 +448,35 @@ class KademliaRoutingTable:
             return bucket_index + 1
 
     def iter_nodes_around(self, reference_node_id: NodeID) -> Iterator[NodeID]:
-        """Iterate over all nodes in the routing table ordered by distance to a given reference."""
-        all_node_ids = itertools.chain(*self.buckets)
+        """Iterate over all nodes in the routing table ordered by distance to a given reference.
+
+        Instead of sorting the whole table, the buckets are visited in order of their distance
+        to the reference, so that only the nodes within a single bucket need to be sorted
+        before they are yielded.
+        """
+        center_distance = compute_distance(self.center_node_id, reference_node_id)
         distance_to_reference = functools.partial(compute_distance, reference_node_id)
-        sorted_node_ids = sorted(all_node_ids, key=distance_to_reference)
-        for node_id in sorted_node_ids:
-            yield node_id
+        for bucket_index in self._iter_bucket_indices_around(center_distance):
+            bucket = self.buckets[bucket_index]
+            if bucket:
+                yield from sorted(bucket, key=distance_to_reference)
+
+    def _iter_bucket_indices_around(self, center_distance: int) -> Iterator[int]:
+        """Iterate over the bucket indices ordered by distance to a reference node.
+
+        The nodes in the bucket with index `i` differ from the center in bit `i` and agree with
+        it in all higher bits, so their distances to a reference that is `center_distance` away
+        from the center agree with `center_distance` in all bits above `i` and differ in bit `i`.
+        Hence the buckets for which bit `i` of `center_distance` is set are closer than any
+        others, the highest first, followed by the remaining buckets, the lowest first.
+        """
+        bucket_indices = range(len(self.buckets))
+        yield from (
+            index for index in reversed(bucket_indices) if center_distance & (1 << index)
+        )
+        yield from (
+            index for index in bucket_indices if not center_distance & (1 << index)
+        )
 
     def iter_all_random(self) -> Iterator[NodeID]:
         """
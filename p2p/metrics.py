@@ -1,5 +1,6 @@
 from typing import Dict, Generic
 from pyformance import MetricsRegistry
+from pyformance.meters import SimpleGauge
 
 from p2p.abc import TPeer
 from p2p.exceptions import PeerReporterRegistryError
@@ -54,9 +55,18 @@ class PeerReporterRegistry(Generic[TPeer]):
                 self.make_periodic_update(peer, peer_id)
 
     def reset_peer_meters(self, peer_id: int) -> None:
-        # subclasses are responsible for implementing method that resets all implemented meters
-        pass
+        # subclasses are responsible for extending this method to reset all implemented meters
+        self._get_buffered_bytes_gauge(peer_id).set_value(0)
+        self._get_discarded_msgs_gauge(peer_id).set_value(0)
 
     def make_periodic_update(self, peer: TPeer, peer_id: int) -> None:
-        # subclasses are responsible for implementing method that updates all implemented meters
-        pass
+        # subclasses are responsible for extending this method to update all implemented meters
+        multiplexer = peer.connection.get_multiplexer()
+        self._get_buffered_bytes_gauge(peer_id).set_value(multiplexer.get_buffered_bytes())
+        self._get_discarded_msgs_gauge(peer_id).set_value(multiplexer.get_discarded_msg_count())
+
+    def _get_buffered_bytes_gauge(self, peer_id: int) -> SimpleGauge:
+        return self.metrics_registry.gauge(f"trinity.p2p/peer_{peer_id}_buffered_bytes.gauge")
+
+    def _get_discarded_msgs_gauge(self, peer_id: int) -> SimpleGauge:
+        return self.metrics_registry.gauge(f"trinity.p2p/peer_{peer_id}_discarded_msgs.gauge")
@@ -6,6 +6,7 @@ from typing import (
     AsyncIterator,
     cast,
     DefaultDict,
+    Deque,
     Dict,
     Optional,
     Sequence,
@@ -29,6 +30,7 @@ from p2p.abc import (
     TransportAPI,
     TProtocol,
 )
+from p2p.constants import MULTIPLEXER_MAX_BUFFERED_BYTES
 from p2p.exceptions import (
     MalformedMessage,
     PeerConnectionLost,
@@ -48,6 +50,9 @@ async def stream_transport_messages(transport: TransportAPI,
                                     ) -> AsyncIterator[Tuple[ProtocolAPI, CommandAPI[Any]]]:
     """
     Streams 2-tuples of (Protocol, Command) over the provided `Transport`
+
+    The payloads of the commands are only decoded once they are accessed, so that commands which
+    are merely forwarded (e.g. to other processes) are never decoded here.
     """
     # A cache for looking up the proper protocol instance for a given command
     # id.
@@ -87,7 +92,7 @@ async def stream_transport_messages(transport: TransportAPI,
         command_type = msg_proto.get_command_type_for_command_id(command_id)
 
         try:
-            cmd = command_type.decode(msg, msg_proto.snappy_support)
+            cmd = command_type.decode_lazily(msg, msg_proto.snappy_support)
         except (rlp.exceptions.DeserializationError, snappy_CompressedLengthError) as err:
             raise MalformedMessage(f"Failed to decode {msg} for {command_type}") from err
 
@@ -98,6 +103,47 @@ async def stream_transport_messages(transport: TransportAPI,
         await asyncio.sleep(0)
 
 
+class MessageBuffer:
+    """
+    A FIFO buffer of commands for a single protocol, which is bounded by the size of their
+    payloads rather than by their number.
+    """
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.num_bytes = 0
+        self._commands: Deque[Tuple[CommandAPI[Any], int]] = collections.deque()
+        self._has_commands = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+    def has_space_for(self, num_bytes: int) -> bool:
+        # A command which is larger than the whole buffer is still accepted once the buffer is
+        # empty, otherwise it could never be delivered.
+        return self.num_bytes == 0 or self.num_bytes + num_bytes <= self.max_bytes
+
+    def put_nowait(self, cmd: CommandAPI[Any], num_bytes: int) -> None:
+        self._commands.append((cmd, num_bytes))
+        self.num_bytes += num_bytes
+        self._has_commands.set()
+
+    def get_nowait(self) -> CommandAPI[Any]:
+        try:
+            cmd, num_bytes = self._commands.popleft()
+        except IndexError:
+            raise asyncio.QueueEmpty()
+
+        self.num_bytes -= num_bytes
+        if not self._commands:
+            self._has_commands.clear()
+        return cmd
+
+    async def get(self) -> CommandAPI[Any]:
+        while not self._commands:
+            await self._has_commands.wait()
+        return self.get_nowait()
+
+
 class Multiplexer(MultiplexerAPI):
 
     _transport: TransportAPI
@@ -105,13 +151,13 @@ class Multiplexer(MultiplexerAPI):
     _last_msg_time: float
 
     _protocol_locks: Dict[Type[ProtocolAPI], asyncio.Lock]
-    _protocol_queues: Dict[Type[ProtocolAPI], 'asyncio.Queue[CommandAPI[Any]]']
+    _protocol_buffers: Dict[Type[ProtocolAPI], MessageBuffer]
 
     def __init__(self,
                  transport: TransportAPI,
                  base_protocol: BaseP2PProtocol,
                  protocols: Sequence[ProtocolAPI],
-                 max_queue_size: int = 4096) -> None:
+                 max_buffered_bytes: int = MULTIPLEXER_MAX_BUFFERED_BYTES) -> None:
         self.logger = get_logger('p2p.multiplexer.Multiplexer')
         self._transport = transport
         # the base `p2p` protocol instance.
@@ -130,16 +176,19 @@ class Multiplexer(MultiplexerAPI):
             in self.get_protocols()
         }
 
-        # Each protocol gets a queue where messages for the individual protocol
-        # are placed when streamed from the transport
-        self._protocol_queues = {
-            type(protocol): asyncio.Queue(max_queue_size)
+        # Each protocol gets an equal share of the bytes that may be buffered for
+        # this peer, where messages for the individual protocol are placed when
+        # streamed from the transport
+        max_protocol_bytes = max_buffered_bytes // len(self.get_protocols())
+        self._protocol_buffers = {
+            type(protocol): MessageBuffer(max_protocol_bytes)
             for protocol
             in self.get_protocols()
         }
 
         self._msg_counts = collections.defaultdict(int)
         self._last_msg_time = 0
+        self._discarded_msg_count = 0
         self._started_streaming = asyncio.Event()
 
     def __str__(self) -> str:
@@ -169,6 +218,15 @@ class Multiplexer(MultiplexerAPI):
     def last_msg_time(self) -> float:
         return self._last_msg_time
 
+    #
+    # Buffer accounting
+    #
+    def get_buffered_bytes(self) -> int:
+        return sum(buffer.num_bytes for buffer in self._protocol_buffers.values())
+
+    def get_discarded_msg_count(self) -> int:
+        return self._discarded_msg_count
+
     #
     # Proxy Transport methods
     #
@@ -276,7 +334,7 @@ class Multiplexer(MultiplexerAPI):
         """
         async with self._protocol_locks[protocol_class]:
             self.raise_if_streaming_error()
-            msg_queue = self._protocol_queues[protocol_class]
+            msg_buffer = self._protocol_buffers[protocol_class]
             while self.is_streaming:
                 try:
                     # We use an optimistic strategy here of using
@@ -284,9 +342,9 @@ class Multiplexer(MultiplexerAPI):
                     # the event loop.  Since this is an async generator it will
                     # yield to the loop each time it returns a value so we
                     # don't have to worry about this blocking other processes.
-                    yield msg_queue.get_nowait()
+                    yield msg_buffer.get_nowait()
                 except asyncio.QueueEmpty:
-                    yield await msg_queue.get()
+                    yield await msg_buffer.get()
 
     #
     # Message reading and streaming API
@@ -321,7 +379,7 @@ class Multiplexer(MultiplexerAPI):
     async def _do_multiplexing(self) -> None:
         """
         Background task that reads messages from the transport and feeds them
-        into individual queues for each of the protocols.
+        into individual buffers for each of the protocols.
         """
         self._started_streaming.set()
         msg_stream = stream_transport_messages(
@@ -347,19 +405,24 @@ class Multiplexer(MultiplexerAPI):
             # track total number of messages received for each command type.
             self._msg_counts[type(cmd)] += 1
 
-            queue = self._protocol_queues[type(protocol)]
-            try:
-                # We must use `put_nowait` here to ensure that in the event
-                # that a single protocol queue is full that we don't block
-                # other protocol messages getting through.
-                queue.put_nowait(cmd)
-            except asyncio.QueueFull:
+            msg_buffer = self._protocol_buffers[type(protocol)]
+            num_bytes = len(cmd.serialized_payload)
+            # We must never wait for space here, as this is the only reader of
+            # the transport and a single full protocol buffer would block other
+            # protocol messages from getting through. Messages for the base
+            # protocol are always buffered, so that pings and disconnects are
+            # never lost.
+            if protocol is self._base_protocol or msg_buffer.has_space_for(num_bytes):
+                msg_buffer.put_nowait(cmd, num_bytes)
+            else:
+                self._discarded_msg_count += 1
                 self.logger.error(
                     (
-                        "Multiplexing queue for protocol '%s' full. "
+                        "Multiplexing buffer for protocol '%s' full (%d bytes). "
                         "discarding message: %s"
                     ),
                     protocol,
+                    msg_buffer.num_bytes,
                     cmd,
                 )
 
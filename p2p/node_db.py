@@ -1,3 +1,5 @@
+from typing import MutableMapping, Tuple, cast
+
 from eth_utils.encoding import (
     big_endian_to_int,
     int_to_big_endian,
@@ -5,9 +7,11 @@ from eth_utils.encoding import (
 
 from eth.abc import DatabaseAPI
 
+from lru import LRU
 import rlp
 
 from p2p.abc import NodeDBAPI
+from p2p.constants import ENR_CACHE_SIZE
 from p2p.enr import ENR
 from p2p.identity_schemes import IdentitySchemeRegistry
 from p2p.typing import NodeID
@@ -16,10 +20,16 @@ from p2p._utils import get_logger
 
 class NodeDB(NodeDBAPI):
 
-    def __init__(self, identity_scheme_registry: IdentitySchemeRegistry, db: DatabaseAPI) -> None:
+    def __init__(self,
+                 identity_scheme_registry: IdentitySchemeRegistry,
+                 db: DatabaseAPI,
+                 enr_cache_size: int = ENR_CACHE_SIZE) -> None:
         self.db = db
         self.logger = get_logger(".".join((self.__module__, self.__class__.__name__,)))
         self._identity_scheme_registry = identity_scheme_registry
+        # Decoding an ENR is far more expensive than reading it, so decoded ENRs are cached by
+        # node id and sequence number, which is cheap to read from the encoded ENR.
+        self._enr_cache = cast(MutableMapping[Tuple[NodeID, int], ENR], LRU(enr_cache_size))
 
     @property
     def identity_scheme_registry(self) -> IdentitySchemeRegistry:
@@ -49,9 +59,19 @@ class NodeDB(NodeDBAPI):
                 f"Cannot overwrite existing ENR ({existing_enr.sequence_number}) with old one "
                 f"({enr.sequence_number})")
         self.db.set(self._get_enr_key(enr.node_id), rlp.encode(enr))
+        self._enr_cache[(enr.node_id, enr.sequence_number)] = enr
 
     def get_enr(self, node_id: NodeID) -> ENR:
-        return rlp.decode(self.db[self._get_enr_key(node_id)], sedes=ENR)
+        encoded_enr = self.db[self._get_enr_key(node_id)]
+        # The sequence number directly follows the signature in the encoded ENR
+        sequence_number = big_endian_to_int(rlp.decode_lazy(encoded_enr)[1])
+        cache_key = (node_id, sequence_number)
+        try:
+            return self._enr_cache[cache_key]
+        except KeyError:
+            enr = rlp.decode(encoded_enr, sedes=ENR)
+            self._enr_cache[cache_key] = enr
+            return enr
 
     def delete_enr(self, node_id: NodeID) -> None:
         del self.db[self._get_enr_key(node_id)]
@@ -42,9 +42,13 @@ from p2p.abc import (
     SessionAPI,
 )
 from p2p.commands import BaseCommand
-from p2p.constants import BLACKLIST_SECONDS_BAD_PROTOCOL
+from p2p.constants import (
+    BLACKLIST_SECONDS_BAD_PROTOCOL,
+    PEER_SUBSCRIBER_QUEUE_TIMEOUT,
+)
 from p2p.disconnect import DisconnectReason
 from p2p.exceptions import (
+    MalformedMessage,
     PeerConnectionLost,
     UnknownProtocol,
 )
@@ -324,10 +328,27 @@ class BasePeer(Service):
     async def _handle_subscriber_message(self,
                                          connection: ConnectionAPI,
                                          cmd: CommandAPI[Any]) -> None:
+        if not cmd.is_decoded and self._has_decoding_subscriber(type(cmd)):
+            try:
+                cmd.payload
+            except MalformedMessage as err:
+                self.logger.debug("Disconnecting %s for sending MalformedMessage: %s", self, err)
+                self.disconnect_nowait(DisconnectReason.BAD_PROTOCOL)
+                return
+
         subscriber_msg = PeerMessage(self, cmd)
-        for subscriber in self._subscribers:
+        for subscriber in tuple(self._subscribers):
+            # A subscriber may have been removed while we waited for the previous one.
+            if subscriber not in self._subscribers:
+                continue
             self.logger.debug2("Adding %s msg to queue of %s", type(cmd), subscriber)
-            subscriber.add_msg(subscriber_msg)
+            await subscriber.wait_add_msg(subscriber_msg, PEER_SUBSCRIBER_QUEUE_TIMEOUT)
+
+    def _has_decoding_subscriber(self, cmd_type: Type[CommandAPI[Any]]) -> bool:
+        return any(
+            subscriber.decodes_payloads and subscriber.is_subscription_command(cmd_type)
+            for subscriber in self._subscribers
+        )
 
     async def disconnect(self, reason: DisconnectReason) -> None:
         """
@@ -378,6 +399,10 @@ class PeerSubscriber(ABC):
     """
     _msg_queue: 'asyncio.Queue[PeerMessage]' = None
 
+    # Subscribers that only forward the messages they get (e.g. to other processes) set this to
+    # False, so that the payloads of the messages are not decoded on their behalf.
+    decodes_payloads: bool = True
+
     @property
     @abstractmethod
     def subscription_msg_types(self) -> FrozenSet[Type[CommandAPI[Any]]]:
@@ -404,8 +429,9 @@ class PeerSubscriber(ABC):
     @abstractmethod
     def msg_queue_maxsize(self) -> int:
         """
-        The max size of messages the underlying :meth:`msg_queue` can keep before it starts
-        discarding new messages. Implementers need to overwrite this to specify the maximum size.
+        The max size of messages the underlying :meth:`msg_queue` can keep before peers have to
+        wait to add new messages (or :meth:`add_msg` starts discarding them). Implementers need to
+        overwrite this to specify the maximum size.
         """
         ...
 
@@ -485,6 +511,46 @@ class PeerSubscriber(ABC):
             )
             return False
 
+    async def wait_add_msg(self, msg: PeerMessage, timeout: float) -> bool:
+        """
+        Add a :class:`~p2p.peer.PeerMessage` to the subscriber, waiting up to ``timeout`` seconds
+        for space in its :meth:`msg_queue` before discarding the message.
+        """
+        peer, cmd = msg
+
+        if hasattr(self, 'logger'):
+            logger = self.logger
+        else:
+            logger = get_logger('p2p.peer.BasePeer')
+
+        if not self.is_subscription_command(type(cmd)):
+            logger.debug2(
+                "Discarding %s msg from %s; not subscribed to msg type; "
+                "subscriptions: %s",
+                loggable(cmd),
+                peer,
+                self.subscription_msg_types,
+            )
+            return False
+
+        try:
+            logger.debug2(
+                "Adding %s msg from %s to queue; queue_size=%d",
+                loggable(cmd),
+                peer,
+                self.queue_size,
+            )
+            await asyncio.wait_for(self.msg_queue.put(msg), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            logger.warning(
+                "%s msg queue is full; discarding %s msg from %s",
+                self.__class__.__name__,
+                loggable(cmd),
+                peer,
+            )
+            return False
+
     @contextlib.contextmanager
     def subscribe(self, peer_pool: 'BasePeerPool') -> Iterator[None]:
         """
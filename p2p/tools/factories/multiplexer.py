@@ -3,7 +3,7 @@ from typing import Callable, Tuple, Type
 from eth_keys import keys
 
 from p2p.abc import MultiplexerAPI, NodeAPI, ProtocolAPI, TransportAPI
-from p2p.constants import DEVP2P_V5
+from p2p.constants import DEVP2P_V5, MULTIPLEXER_MAX_BUFFERED_BYTES
 from p2p.multiplexer import Multiplexer
 from p2p.p2p_proto import BaseP2PProtocol, P2PProtocolV4, P2PProtocolV5
 from p2p.protocol import get_cmd_offsets
@@ -26,6 +26,7 @@ def MultiplexerPairFactory(*,
                            bob_remote: NodeAPI = None,
                            bob_private_key: keys.PrivateKey = None,
                            bob_p2p_version: int = DEVP2P_V5,
+                           max_buffered_bytes: int = MULTIPLEXER_MAX_BUFFERED_BYTES,
                            ) -> Tuple[MultiplexerAPI, MultiplexerAPI]:
     alice_transport, bob_transport = transport_factory(
         alice_remote=alice_remote,
@@ -60,6 +61,7 @@ def MultiplexerPairFactory(*,
         transport=alice_transport,
         base_protocol=alice_p2p_protocol,
         protocols=alice_protocols,
+        max_buffered_bytes=max_buffered_bytes,
     )
 
     bob_p2p_protocol = p2p_protocol_class(bob_transport, 0, snappy_support)
@@ -67,5 +69,6 @@ def MultiplexerPairFactory(*,
         transport=bob_transport,
         base_protocol=bob_p2p_protocol,
         protocols=bob_protocols,
+        max_buffered_bytes=max_buffered_bytes,
     )
     return alice_multiplexer, bob_multiplexer
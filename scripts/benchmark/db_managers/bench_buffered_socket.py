@@ -0,0 +1,121 @@
+import argparse
+import logging
+import os
+import socket
+import sys
+import threading
+import time
+from typing import Callable, Type, Union
+
+from trinity._utils.socket import BufferedSocket
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+
+PAYLOAD_SIZES = (100, 10 * 1024, 10 * 1024 * 1024)
+
+
+class CopyingBufferedSocket:
+    """
+    The previous reader, which receives 4096 bytes at a time and copies the rest of its
+    buffer on every read.
+    """
+    def __init__(self, sock: socket.socket) -> None:
+        self._socket = sock
+        self._buffer = bytearray()
+
+    def read_exactly(self, num_bytes: int) -> bytes:
+        while len(self._buffer) < num_bytes:
+            data = self._socket.recv(4096)
+            if data == b"":
+                raise OSError("Connection closed")
+            self._buffer.extend(data)
+        payload = self._buffer[:num_bytes]
+        self._buffer = self._buffer[num_bytes:]
+        return bytes(payload)
+
+    def read_exactly_view(self, num_bytes: int) -> bytes:
+        return self.read_exactly(num_bytes)
+
+
+def send_messages(sock: socket.socket, payload: bytes, num_messages: int) -> None:
+    # Messages are framed like the log records of the IPCListener
+    message = len(payload).to_bytes(4, 'big') + payload
+    for _ in range(num_messages):
+        sock.sendall(message)
+
+
+def read_messages(
+        sock: Union[BufferedSocket, CopyingBufferedSocket],
+        num_messages: int,
+        use_views: bool) -> None:
+    read: Callable[[int], Union[bytes, memoryview]]
+    read = sock.read_exactly_view if use_views else sock.read_exactly
+    for _ in range(num_messages):
+        length = int.from_bytes(read(4), 'big')
+        read(length)
+
+
+def run_reader(
+        socket_class: Type[Union[BufferedSocket, CopyingBufferedSocket]],
+        payload: bytes,
+        num_messages: int,
+        use_views: bool) -> float:
+    left, right = socket.socketpair()
+    with left, right:
+        sender = threading.Thread(
+            target=send_messages,
+            args=(right, payload, num_messages),
+            daemon=True,
+        )
+        start = time.perf_counter()
+        sender.start()
+        read_messages(socket_class(left), num_messages, use_views)
+        duration = time.perf_counter() - start
+        sender.join()
+    return duration
+
+
+def run(total_bytes: int) -> None:
+    for payload_size in PAYLOAD_SIZES:
+        payload = os.urandom(payload_size)
+        num_messages = max(1, total_bytes // payload_size)
+        logger.info("%d byte payloads, %d message(s):", payload_size, num_messages)
+
+        for name, socket_class, use_views in (
+                ("copying reader", CopyingBufferedSocket, False),
+                ("BufferedSocket.read_exactly", BufferedSocket, False),
+                ("BufferedSocket.read_exactly_view", BufferedSocket, True)):
+            duration = run_reader(socket_class, payload, num_messages, use_views)
+            logger.info(
+                " - %s: %.0f messages/sec, %.1f MB/sec",
+                name,
+                num_messages / duration,
+                num_messages * payload_size / duration / 1024 / 1024,
+            )
+
+
+parser = argparse.ArgumentParser(description='BufferedSocket Benchmark')
+parser.add_argument(
+    '--total-bytes',
+    type=int,
+    required=False,
+    default=100 * 1024 * 1024,
+    help="Number of payload bytes to send for each payload size",
+)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    logger.info(
+        "Running BufferedSocket benchmark:\n - %s byte payloads\n - %d payload byte(s) per size\n*****************************\n",  # noqa: E501
+        ', '.join(str(size) for size in PAYLOAD_SIZES),
+        args.total_bytes,
+    )
+    run(args.total_bytes)
@@ -0,0 +1,151 @@
+import argparse
+import logging
+import multiprocessing
+import os
+import pathlib
+import random
+import signal
+import sys
+import tempfile
+import time
+
+from eth.db.backends.level import LevelDB
+
+from trinity.db.manager import (
+    DBManager,
+    DBClient,
+)
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+
+def random_bytes(num: int) -> bytes:
+    return random.getrandbits(8 * num).to_bytes(num, 'little')
+
+
+def run_server(ipc_path: pathlib.Path) -> None:
+    with tempfile.TemporaryDirectory() as db_path:
+        db = LevelDB(db_path=pathlib.Path(db_path))
+        manager = DBManager(db)
+
+        with manager.run(ipc_path):
+            try:
+                manager.wait_stopped()
+            except KeyboardInterrupt:
+                pass
+
+        ipc_path.unlink()
+
+
+def _report(client_id: int, name: str, num_keys: int, duration: float) -> None:
+    logger.info("Client %d: %-12s %d keys per second", client_id, name, num_keys / duration)
+
+
+def run_client(ipc_path: pathlib.Path, client_id: int, num_keys: int, batch_size: int) -> None:
+    key_values = {
+        random_bytes(32): random_bytes(256)
+        for i in range(num_keys)
+    }
+    keys = tuple(key_values.keys())
+    batches = tuple(
+        keys[index:index + batch_size] for index in range(0, num_keys, batch_size)
+    )
+
+    db_client = DBClient.connect(ipc_path)
+    with db_client.atomic_batch() as batch:
+        for key, value in key_values.items():
+            batch[key] = value
+
+    start = time.perf_counter()
+    for key in keys:
+        db_client.get(key)
+    _report(client_id, "get", num_keys, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for key in keys:
+        db_client.exists(key)
+    _report(client_id, "exists", num_keys, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for batch_keys in batches:
+        db_client.multi_get(batch_keys)
+    _report(client_id, "multi_get", num_keys, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for batch_keys in batches:
+        db_client.multi_exists(batch_keys)
+    _report(client_id, "multi_exists", num_keys, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for batch_keys in batches:
+        pipeline = db_client.pipeline()
+        for key in batch_keys:
+            pipeline.get(key)
+        pipeline.execute()
+    _report(client_id, "pipeline", num_keys, time.perf_counter() - start)
+
+
+parser = argparse.ArgumentParser(description='Database Manager Batch Benchmark')
+parser.add_argument(
+    '--num-clients',
+    type=int,
+    required=False,
+    default=1,
+    help=(
+        "Number of concurrent clients that should access the database"
+    ),
+)
+parser.add_argument(
+    '--num-keys',
+    type=int,
+    required=False,
+    default=10000,
+    help=(
+        "Number of keys that should be looked up by each client"
+    ),
+)
+parser.add_argument(
+    '--batch-size',
+    type=int,
+    required=False,
+    default=384,
+    help=(
+        "Number of keys per batched request"
+    ),
+)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    logger.info(
+        "Running database manager batch benchmark:\n - %d client(s)\n - %d keys\n - %d keys per batch\n*****************************\n",  # noqa: E501
+        args.num_clients,
+        args.num_keys,
+        args.batch_size,
+    )
+    with tempfile.TemporaryDirectory() as ipc_base_dir:
+        ipc_path = pathlib.Path(ipc_base_dir) / 'db.ipc'
+
+        server = multiprocessing.Process(target=run_server, args=[ipc_path])
+
+        clients = [
+            multiprocessing.Process(
+                target=run_client,
+                args=(ipc_path, client_id, args.num_keys, args.batch_size),
+            ) for client_id in range(args.num_clients)
+        ]
+        server.start()
+        for client in clients:
+            client.start()
+        for client in clients:
+            client.join(600)
+
+        os.kill(server.pid, signal.SIGINT)
+        server.join(1)
+    logger.info('\n')
@@ -0,0 +1,91 @@
+import argparse
+import logging
+import sys
+import time
+from typing import Sequence, Tuple
+
+from eth_typing import Hash32
+
+from eth2.beacon.tools.builder.validator import (
+    make_deposit_proof,
+    make_deposit_tree_and_root,
+)
+from eth2.beacon.types.deposit_data import DepositData
+from trinity.components.eth2.eth1_monitor.deposit_tree import DepositTree
+from trinity.components.eth2.eth1_monitor.factories import DepositDataFactory
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+
+def run_rebuild(seq_deposit_data: Sequence[DepositData], num_requests: int) -> float:
+    deposit_count = len(seq_deposit_data)
+    start = time.perf_counter()
+    for request_index in range(num_requests):
+        deposit_index = request_index % deposit_count
+        tree, root = make_deposit_tree_and_root(seq_deposit_data)
+        make_deposit_proof(seq_deposit_data, tree, root, deposit_index)
+    return time.perf_counter() - start
+
+
+def run_incremental(leaves: Sequence[Hash32], num_requests: int) -> Tuple[float, float]:
+    deposit_count = len(leaves)
+    start = time.perf_counter()
+    deposit_tree = DepositTree()
+    deposit_tree.extend(leaves)
+    build_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for request_index in range(num_requests):
+        deposit_index = request_index % deposit_count
+        deposit_tree.get_root(deposit_count)
+        deposit_tree.get_proof(deposit_index, deposit_count)
+    return build_duration, time.perf_counter() - start
+
+
+parser = argparse.ArgumentParser(description='Deposit Tree Benchmark')
+parser.add_argument(
+    '--num-deposits',
+    type=int,
+    required=False,
+    default=10000,
+    help="Number of deposits in the tree",
+)
+parser.add_argument(
+    '--num-requests',
+    type=int,
+    required=False,
+    default=10,
+    help="Number of root+proof requests that should be served",
+)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    logger.info(
+        "Running deposit tree benchmark:\n - %d deposit(s)\n - %d request(s)\n*****************************\n",  # noqa: E501
+        args.num_deposits,
+        args.num_requests,
+    )
+    seq_deposit_data: Tuple[DepositData, ...] = tuple(
+        DepositDataFactory.create_batch(args.num_deposits)
+    )
+    leaves = tuple(data.hash_tree_root for data in seq_deposit_data)
+
+    rebuild_duration = run_rebuild(seq_deposit_data, args.num_requests)
+    logger.info(
+        "Rebuild per request: %.4f seconds per request",
+        rebuild_duration / args.num_requests,
+    )
+
+    build_duration, incremental_duration = run_incremental(leaves, args.num_requests)
+    logger.info(
+        "Incremental tree: %.4f seconds to append all deposits, %.6f seconds per request",
+        build_duration,
+        incremental_duration / args.num_requests,
+    )
@@ -0,0 +1,112 @@
+import argparse
+import logging
+import sys
+import time
+from typing import List, Sequence, Tuple
+
+from eth_typing import Hash32
+import milagro_bls_binding as milagro_bls
+
+from eth2.beacon.state_machines.forks.altona.eth2fastspec import (
+    SignatureSet,
+    bls_VerifyMultipleSignatureSets,
+    bls_VerifySignatureSet,
+)
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+
+def make_block_signature_sets(
+        num_attestations: int,
+        committee_size: int) -> Tuple[SignatureSet, ...]:
+    """
+    The signature sets of a full block: the proposer signature, the RANDAO reveal and
+    one aggregate signature per attestation.
+    """
+    privkeys = tuple(
+        (index + 1).to_bytes(32, 'big') for index in range(committee_size)
+    )
+    pubkeys = tuple(milagro_bls.SkToPk(privkey) for privkey in privkeys)
+
+    signature_sets: List[SignatureSet] = []
+    for message in (Hash32(b'\xff' * 32), Hash32(b'\xfe' * 32)):
+        signature_sets.append(
+            SignatureSet(
+                (pubkeys[0],), message, milagro_bls.Sign(privkeys[0], message)
+            )
+        )
+    for attestation_index in range(num_attestations):
+        message = Hash32(attestation_index.to_bytes(32, 'little'))
+        signature = milagro_bls.Aggregate(
+            [milagro_bls.Sign(privkey, message) for privkey in privkeys]
+        )
+        signature_sets.append(SignatureSet(pubkeys, message, signature))
+    return tuple(signature_sets)
+
+
+def run_individually(signature_sets: Sequence[SignatureSet]) -> float:
+    start = time.perf_counter()
+    assert all(bls_VerifySignatureSet(signature_set) for signature_set in signature_sets)
+    return time.perf_counter() - start
+
+
+def run_batched(signature_sets: Sequence[SignatureSet]) -> float:
+    start = time.perf_counter()
+    assert bls_VerifyMultipleSignatureSets(signature_sets)
+    return time.perf_counter() - start
+
+
+parser = argparse.ArgumentParser(description='Batch BLS Verification Benchmark')
+parser.add_argument(
+    '--num-attestations',
+    type=int,
+    required=False,
+    default=128,
+    help="Number of attestations in the block",
+)
+parser.add_argument(
+    '--committee-size',
+    type=int,
+    required=False,
+    default=128,
+    help="Number of validators that signed each attestation",
+)
+parser.add_argument(
+    '--num-blocks',
+    type=int,
+    required=False,
+    default=3,
+    help="Number of times the signatures of the block should be verified",
+)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    logger.info(
+        "Running batch BLS verification benchmark:\n - %d attestation(s)\n - %d validator(s) per committee\n - %d block(s)\n*****************************\n",  # noqa: E501
+        args.num_attestations,
+        args.committee_size,
+        args.num_blocks,
+    )
+    signature_sets = make_block_signature_sets(args.num_attestations, args.committee_size)
+
+    individual_duration = sum(run_individually(signature_sets) for _ in range(args.num_blocks))
+    logger.info(
+        "Individually: %.4f seconds per block",
+        individual_duration / args.num_blocks,
+    )
+
+    # the first batch also decompresses the public keys of the committee
+    cold_duration = run_batched(signature_sets)
+    logger.info("Batched, cold public key cache: %.4f seconds per block", cold_duration)
+    batched_duration = sum(run_batched(signature_sets) for _ in range(args.num_blocks))
+    logger.info(
+        "Batched: %.4f seconds per block",
+        batched_duration / args.num_blocks,
+    )
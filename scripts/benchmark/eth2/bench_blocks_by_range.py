@@ -0,0 +1,140 @@
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from typing import Sequence, Tuple, cast
+
+from eth.db.atomic import AtomicDB
+from eth_typing import Hash32
+from libp2p.network.stream.net_stream_interface import INetStream
+
+from eth2.beacon.chains.base import BaseBeaconChain
+from eth2.beacon.chains.testnet import SkeletonLakeChain
+from eth2.beacon.db.chain import BeaconChainDB
+from eth2.beacon.fork_choice.higher_slot import HigherSlotScoring
+from eth2.beacon.types.attestations import Attestation
+from eth2.beacon.types.blocks import BeaconBlock, BeaconBlockBody, SignedBeaconBlock
+from eth2.beacon.typing import Root, Slot
+from trinity.protocol.bcc_libp2p.messages import BeaconBlocksByRangeRequest
+from trinity.protocol.bcc_libp2p.utils import (
+    Interaction,
+    get_requested_beacon_blocks,
+    get_requested_beacon_blocks_ssz,
+)
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+
+class Connection:
+    peer_id = "benchmark"
+
+
+class Stream:
+    """
+    Counts the bytes written to it, in place of a libp2p stream.
+    """
+    muxed_conn = Connection()
+
+    def __init__(self) -> None:
+        self.num_bytes = 0
+
+    def get_protocol(self) -> str:
+        return "/eth2/beacon_chain/req/beacon_blocks_by_range/1/ssz"
+
+    async def write(self, data: bytes) -> None:
+        self.num_bytes += len(data)
+
+
+def make_chain(num_blocks: int, num_attestations: int) -> Tuple[BaseBeaconChain, Root]:
+    chain = SkeletonLakeChain(BeaconChainDB(AtomicDB()))
+    scoring = HigherSlotScoring()
+    body = BeaconBlockBody.create(attestations=(Attestation.create(),) * num_attestations)
+    parent_root = Root(Hash32(b'\x00' * 32))
+    block = None
+    for slot in range(num_blocks):
+        block = SignedBeaconBlock.create(
+            message=BeaconBlock.create(slot=Slot(slot), parent_root=parent_root, body=body),
+        )
+        chain.chaindb.persist_block(block, SignedBeaconBlock, scoring)
+        parent_root = block.message.hash_tree_root
+    return chain, parent_root
+
+
+async def serve(
+        chain: BaseBeaconChain,
+        requests: Sequence[BeaconBlocksByRangeRequest],
+        use_ssz: bool) -> Tuple[float, int]:
+    stream = Stream()
+    interaction = Interaction(cast(INetStream, stream))
+    start = time.perf_counter()
+    for request in requests:
+        if use_ssz:
+            blocks_ssz = get_requested_beacon_blocks_ssz(chain, request)
+            await interaction.write_chunk_response_ssz(blocks_ssz)
+        else:
+            blocks = get_requested_beacon_blocks(chain, request)
+            await interaction.write_chunk_response(blocks)
+    return time.perf_counter() - start, stream.num_bytes
+
+
+parser = argparse.ArgumentParser(description='BeaconBlocksByRange Serving Benchmark')
+parser.add_argument(
+    '--num-blocks',
+    type=int,
+    required=False,
+    default=2048,
+    help="Number of blocks in the served chain",
+)
+parser.add_argument(
+    '--num-attestations',
+    type=int,
+    required=False,
+    default=16,
+    help="Number of attestations in every block",
+)
+parser.add_argument(
+    '--count',
+    type=int,
+    required=False,
+    default=64,
+    help="Number of blocks asked for by every request",
+)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    logger.info(
+        "Running BeaconBlocksByRange serving benchmark:\n - %d block(s)\n - %d attestation(s) per block\n - %d block(s) per request\n*****************************\n",  # noqa: E501
+        args.num_blocks,
+        args.num_attestations,
+        args.count,
+    )
+    # The logger of the protocol is verbose about every request.
+    logging.getLogger('trinity.protocol.bcc_libp2p').setLevel(logging.WARNING)
+
+    chain, head_root = make_chain(args.num_blocks, args.num_attestations)
+    requests = tuple(
+        BeaconBlocksByRangeRequest.create(
+            head_block_root=head_root,
+            start_slot=Slot(start_slot),
+            count=args.count,
+            step=1,
+        )
+        for start_slot in range(0, args.num_blocks, args.count)
+    )
+
+    for name, use_ssz in (("Decoded blocks", False), ("Stored SSZ bytes", True)):
+        duration, num_bytes = asyncio.run(serve(chain, requests, use_ssz))
+        logger.info(
+            "%s: %.0f blocks/sec, %d bytes written",
+            name,
+            args.num_blocks / duration,
+            num_bytes,
+        )
@@ -0,0 +1,161 @@
+import argparse
+from dataclasses import dataclass
+import logging
+import sys
+import time
+from typing import Dict, List, Sequence, Tuple
+
+from eth_typing import Hash32
+import numpy as np
+
+from eth2.beacon.fork_choice.lmd_ghost2 import ProtoNodeIndex, VoteStore, _compute_deltas
+from eth2.beacon.typing import Epoch, Root, ValidatorIndex, default_root
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+MAX_EFFECTIVE_BALANCE = 32 * 10 ** 9
+
+
+@dataclass
+class VoteTracker:
+    current_root: Root
+    next_root: Root
+    next_epoch: Epoch
+
+
+def compute_deltas_per_validator(
+        indices: Dict[Root, ProtoNodeIndex],
+        index_offset: int,
+        votes: Sequence[VoteTracker],
+        old_balances: Sequence[int],
+        new_balances: Sequence[int]) -> List[int]:
+    """
+    The previous implementation of ``_compute_deltas``, which visits every validator.
+    """
+    deltas = [0] * len(indices)
+
+    for val_index, vote in enumerate(votes):
+        if vote.current_root == default_root and vote.next_root == default_root:
+            continue
+
+        old_balance = old_balances[val_index] if val_index < len(old_balances) else 0
+        new_balance = new_balances[val_index] if val_index < len(new_balances) else 0
+
+        if vote.current_root != vote.next_root or old_balance != new_balance:
+            if vote.current_root in indices:
+                deltas[indices[vote.current_root] - index_offset] -= old_balance
+
+            if vote.next_root in indices:
+                deltas[indices[vote.next_root] - index_offset] += new_balance
+
+            vote.current_root = vote.next_root
+
+    return deltas
+
+
+def make_round(num_validators: int, num_nodes: int, epoch: int) -> Tuple[np.ndarray, Epoch]:
+    """
+    Every validator attests to one of the nodes once per epoch.
+    """
+    return np.random.randint(num_nodes, size=num_validators), Epoch(epoch)
+
+
+def run_per_validator(
+        roots: Sequence[Root],
+        indices: Dict[Root, ProtoNodeIndex],
+        balances: Sequence[int],
+        rounds: Sequence[Tuple[np.ndarray, Epoch]]) -> float:
+    votes = [
+        VoteTracker(default_root, default_root, Epoch(0)) for _ in range(len(balances))
+    ]
+    duration = 0.0
+    for vote_nodes, epoch in rounds:
+        for vote, node in zip(votes, vote_nodes.tolist()):
+            if epoch > vote.next_epoch:
+                vote.next_root = roots[node]
+                vote.next_epoch = epoch
+        start = time.perf_counter()
+        compute_deltas_per_validator(indices, 0, votes, balances, balances)
+        duration += time.perf_counter() - start
+    return duration
+
+
+def run_vectorized(
+        roots: Sequence[Root],
+        indices: Dict[Root, ProtoNodeIndex],
+        balances: Sequence[int],
+        rounds: Sequence[Tuple[np.ndarray, Epoch]]) -> float:
+    votes = VoteStore()
+    balance_array = np.asarray(balances, dtype=np.int64)
+    duration = 0.0
+    for vote_nodes, epoch in rounds:
+        for node, root in enumerate(roots):
+            validator_indices = tuple(
+                ValidatorIndex(index) for index in np.flatnonzero(vote_nodes == node).tolist()
+            )
+            votes.process_attestations(validator_indices, root, indices[root], epoch)
+        start = time.perf_counter()
+        _compute_deltas(indices, 0, votes, balance_array, balance_array)
+        duration += time.perf_counter() - start
+    return duration
+
+
+parser = argparse.ArgumentParser(description='ProtoArray Vote Deltas Benchmark')
+parser.add_argument(
+    '--num-validators',
+    type=int,
+    nargs='+',
+    required=False,
+    default=(16384, 100000, 300000),
+    help="Number of validators voting in the fork choice",
+)
+parser.add_argument(
+    '--num-nodes',
+    type=int,
+    required=False,
+    default=64,
+    help="Number of blocks in the fork choice tree",
+)
+parser.add_argument(
+    '--num-rounds',
+    type=int,
+    required=False,
+    default=3,
+    help="Number of rounds of votes after which the deltas are computed",
+)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    roots = tuple(Root(Hash32(index.to_bytes(32, 'little'))) for index in range(args.num_nodes))
+    indices = {root: ProtoNodeIndex(index) for index, root in enumerate(roots)}
+
+    for num_validators in args.num_validators:
+        logger.info(
+            "Running vote deltas benchmark:\n - %d validator(s)\n - %d node(s)\n - %d round(s)\n*****************************\n",  # noqa: E501
+            num_validators,
+            args.num_nodes,
+            args.num_rounds,
+        )
+        balances = (MAX_EFFECTIVE_BALANCE,) * num_validators
+        rounds = tuple(
+            make_round(num_validators, args.num_nodes, epoch)
+            for epoch in range(1, args.num_rounds + 1)
+        )
+
+        per_validator_duration = run_per_validator(roots, indices, balances, rounds)
+        logger.info(
+            "Per validator: %.4f seconds per delta computation",
+            per_validator_duration / args.num_rounds,
+        )
+        vectorized_duration = run_vectorized(roots, indices, balances, rounds)
+        logger.info(
+            "Vectorized: %.4f seconds per delta computation",
+            vectorized_duration / args.num_rounds,
+        )
@@ -0,0 +1,86 @@
+import argparse
+import logging
+import sys
+import time
+from typing import Sequence
+
+from eth_typing import Hash32
+import numpy as np
+
+from eth2._utils.hash import hash_eth2
+from eth2.beacon.shuffling import ShufflingCache, compute_shuffling
+from eth2.beacon.state_machines.forks.altona.eth2fastspec import SHUFFLE_ROUND_COUNT
+from eth2.beacon.typing import ValidatorIndex
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+
+def run_vectorized_shuffle(
+        active_indices: Sequence[ValidatorIndex],
+        seeds: Sequence[Hash32]) -> float:
+    indices = np.array(active_indices, dtype=np.uint64)
+    start = time.perf_counter()
+    for seed in seeds:
+        compute_shuffling(indices, seed, SHUFFLE_ROUND_COUNT)
+    return time.perf_counter() - start
+
+
+def run_cached_shuffle(
+        active_indices: Sequence[ValidatorIndex],
+        seeds: Sequence[Hash32],
+        num_contexts: int) -> float:
+    """
+    Every context (e.g. one per fork choice branch) asks for the same shufflings.
+    """
+    cache = ShufflingCache(len(seeds))
+    start = time.perf_counter()
+    for _ in range(num_contexts):
+        for seed in seeds:
+            cache.get(seed, active_indices, SHUFFLE_ROUND_COUNT)
+    return time.perf_counter() - start
+
+
+parser = argparse.ArgumentParser(description='Committee Shuffling Benchmark')
+parser.add_argument(
+    '--num-validators',
+    type=int,
+    required=False,
+    default=100000,
+    help="Number of active validators to shuffle",
+)
+parser.add_argument(
+    '--num-contexts',
+    type=int,
+    required=False,
+    default=4,
+    help="Number of EpochsContext loading the previous, current and next shuffling",
+)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    logger.info(
+        "Running shuffling benchmark:\n - %d validator(s)\n - %d context(s)\n*****************************\n",  # noqa: E501
+        args.num_validators,
+        args.num_contexts,
+    )
+    active_indices = tuple(ValidatorIndex(index) for index in range(args.num_validators))
+    # previous, current and next epoch
+    seeds = tuple(hash_eth2(epoch.to_bytes(8, 'little')) for epoch in range(3))
+
+    vectorized_duration = run_vectorized_shuffle(active_indices, seeds)
+    logger.info(
+        "Vectorized shuffle: %.4f seconds per context",
+        vectorized_duration,
+    )
+    cached_duration = run_cached_shuffle(active_indices, seeds, args.num_contexts)
+    logger.info(
+        "Vectorized and cached shuffle: %.4f seconds per context",
+        cached_duration / args.num_contexts,
+    )
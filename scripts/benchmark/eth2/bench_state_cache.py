@@ -0,0 +1,97 @@
+import argparse
+import logging
+import sys
+import time
+from typing import Sequence, Tuple
+
+from eth.db.atomic import AtomicDB
+from eth_typing import BLSPubkey
+
+from eth2.beacon.db.chain import BeaconChainDB
+from eth2.beacon.db.state_cache import StateCache, estimate_state_size
+from eth2.beacon.state_machines.forks.serenity.configs import SERENITY_CONFIG
+from eth2.beacon.types.states import BeaconState
+from eth2.beacon.types.validators import Validator
+from eth2.beacon.typing import Root
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+
+def make_states(num_states: int, num_validators: int) -> Tuple[BeaconState, ...]:
+    validators = tuple(
+        Validator.create(pubkey=BLSPubkey(index.to_bytes(48, 'little')))
+        for index in range(num_validators)
+    )
+    balances = (SERENITY_CONFIG.MAX_EFFECTIVE_BALANCE,) * num_validators
+    state = BeaconState.create(
+        validators=validators,
+        balances=balances,
+        config=SERENITY_CONFIG,
+    )
+    return tuple(state.set('slot', slot) for slot in range(num_states))
+
+
+def run_lookups(
+        chain_db: BeaconChainDB,
+        state_roots: Sequence[Root],
+        num_requests: int) -> float:
+    start = time.perf_counter()
+    for request_index in range(num_requests):
+        state_root = state_roots[request_index % len(state_roots)]
+        chain_db.get_state_by_root(state_root, BeaconState)
+    return time.perf_counter() - start
+
+
+parser = argparse.ArgumentParser(description='Beacon State Cache Benchmark')
+parser.add_argument(
+    '--num-states',
+    type=int,
+    required=False,
+    default=16,
+    help="Number of distinct states being looked up",
+)
+parser.add_argument(
+    '--num-validators',
+    type=int,
+    required=False,
+    default=10000,
+    help="Number of validators in each state",
+)
+parser.add_argument(
+    '--num-requests',
+    type=int,
+    required=False,
+    default=1000,
+    help="Number of get_state_by_root calls that should be made",
+)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    logger.info(
+        "Running state cache benchmark:\n - %d state(s)\n - %d validator(s)\n - %d request(s)\n*****************************\n",  # noqa: E501
+        args.num_states,
+        args.num_validators,
+        args.num_requests,
+    )
+    chain_db = BeaconChainDB(AtomicDB())
+    states = make_states(args.num_states, args.num_validators)
+    for state in states:
+        chain_db.persist_state(state)
+    state_roots = tuple(state.hash_tree_root for state in states)
+
+    for cache_size in (1, args.num_states):
+        chain_db.state_cache = StateCache(cache_size * estimate_state_size(states[0]))
+        duration = run_lookups(chain_db, state_roots, args.num_requests)
+        logger.info(
+            "Cache of %d state(s): %.6f seconds per request, hit rate %.2f%%",
+            cache_size,
+            duration / args.num_requests,
+            chain_db.state_cache.hit_rate * 100,
+        )
@@ -0,0 +1,161 @@
+import argparse
+import logging
+import random
+import sys
+import time
+from typing import Tuple
+
+from eth.db.atomic import AtomicDB
+from eth_typing import BLSPubkey
+import ssz
+
+from eth2._utils.hash_tree import update_elements
+from eth2.beacon.db.chain2 import BeaconChainDB
+from eth2.beacon.state_machines.forks.altona.configs import ALTONA_CONFIG
+from eth2.beacon.tools.misc.ssz_vector import override_lengths
+from eth2.beacon.types.states import BeaconState
+from eth2.beacon.types.validators import Validator
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+MAX_EFFECTIVE_BALANCE = ALTONA_CONFIG.MAX_EFFECTIVE_BALANCE
+
+
+def make_state(num_validators: int) -> BeaconState:
+    validators = tuple(
+        Validator.create(
+            pubkey=BLSPubkey(index.to_bytes(48, 'big')),
+            effective_balance=MAX_EFFECTIVE_BALANCE,
+        )
+        for index in range(num_validators)
+    )
+    balances = (MAX_EFFECTIVE_BALANCE,) * num_validators
+    return BeaconState.create(
+        validators=validators,
+        balances=balances,
+        config=ALTONA_CONFIG,
+    )
+
+
+def get_full_copy_size(state: BeaconState) -> int:
+    """
+    The bytes written for the balances and the validators when each state stores a full
+    copy of the balances and of the list of validator roots.
+    """
+    return len(ssz.encode(state.balances)) + 32 * len(state.validators)
+
+
+def next_epoch_state(
+        state: BeaconState,
+        rng: random.Random,
+        validator_churn: float) -> Tuple[BeaconState, float]:
+    """
+    Change every balance, as the rewards and penalties of an epoch do, and the effective
+    balance of ``validator_churn`` of the validators.
+    """
+    updated_balances = {
+        index: balance + rng.randrange(10 ** 6)
+        for index, balance in enumerate(state.balances)
+    }
+    num_validators = len(state.validators)
+    updated_validators = {
+        index: state.validators[index].set(
+            'effective_balance', MAX_EFFECTIVE_BALANCE - 10 ** 9
+        )
+        for index in rng.sample(range(num_validators), int(num_validators * validator_churn))
+    }
+
+    start = time.perf_counter()
+    state = state.mset(
+        'balances', update_elements(state.balances, updated_balances),
+        'validators', update_elements(state.validators, updated_validators),
+    )
+    state.hash_tree_root
+    return state, time.perf_counter() - start
+
+
+def next_slot_state(state: BeaconState, rng: random.Random) -> Tuple[BeaconState, float]:
+    """
+    Change the balance of a single validator, e.g. the proposer of the block.
+    """
+    index = rng.randrange(len(state.balances))
+    start = time.perf_counter()
+    state = state.set(
+        'balances',
+        update_elements(state.balances, {index: state.balances[index] + 1}),
+    )
+    state.hash_tree_root
+    return state, time.perf_counter() - start
+
+
+def run_persist(chain_db: BeaconChainDB, state: BeaconState) -> Tuple[float, int]:
+    bytes_written = chain_db._state_bytes_written
+    start = time.perf_counter()
+    chain_db.persist_state(state, ALTONA_CONFIG)
+    return time.perf_counter() - start, chain_db._state_bytes_written - bytes_written
+
+
+parser = argparse.ArgumentParser(description='Beacon State Persistence Benchmark')
+parser.add_argument(
+    '--num-validators',
+    type=int,
+    required=False,
+    default=100000,
+    help="Number of validators in the state",
+)
+parser.add_argument(
+    '--validator-churn',
+    type=float,
+    required=False,
+    default=0.01,
+    help="Share of the validators whose effective balance changes at the epoch boundary",
+)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    logger.info(
+        "Running state persistence benchmark:\n - %d validator(s)\n - %.2f%% validator churn per epoch\n*****************************\n",  # noqa: E501
+        args.num_validators,
+        args.validator_churn * 100,
+    )
+    override_lengths(ALTONA_CONFIG)
+    rng = random.Random(0)
+    state = make_state(args.num_validators)
+    full_copy_size = get_full_copy_size(state)
+    chain_db = BeaconChainDB(AtomicDB())
+
+    duration, bytes_written = run_persist(chain_db, state)
+    logger.info(
+        "Initial state: persisted in %.4f seconds, %d bytes written",
+        duration,
+        bytes_written,
+    )
+
+    state, hash_duration = next_epoch_state(state, rng, args.validator_churn)
+    duration, bytes_written = run_persist(chain_db, state)
+    logger.info(
+        "Epoch boundary state: hashed in %.4f seconds, persisted in %.4f seconds, "
+        "%d bytes written (%d bytes for full copies)",
+        hash_duration,
+        duration,
+        bytes_written,
+        full_copy_size,
+    )
+
+    state, hash_duration = next_slot_state(state, rng)
+    duration, bytes_written = run_persist(chain_db, state)
+    logger.info(
+        "Next slot state: hashed in %.4f seconds, persisted in %.4f seconds, "
+        "%d bytes written (%d bytes for full copies)",
+        hash_duration,
+        duration,
+        bytes_written,
+        full_copy_size,
+    )
@@ -0,0 +1,217 @@
+import argparse
+import functools
+import itertools
+import logging
+import secrets
+import sys
+import time
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from eth_utils.toolz import take
+import trio
+
+from p2p.discv5.constants import LOOKUP_PARALLELIZATION_FACTOR
+from p2p.discv5.routing_table_manager import LookupFrontier
+from p2p.kademlia import compute_distance, KademliaRoutingTable
+from p2p.typing import NodeID
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+
+FRONTIER_SIZE = 16
+
+
+def sorted_nodes_around(routing_table: KademliaRoutingTable,
+                        target: NodeID) -> Iterator[NodeID]:
+    """
+    The previous ``KademliaRoutingTable.iter_nodes_around``, which sorts the whole table.
+    """
+    all_node_ids = itertools.chain(*routing_table.buckets)
+    return iter(sorted(all_node_ids, key=functools.partial(compute_distance, target)))
+
+
+def iter_closest_nodes(
+        target: NodeID,
+        routing_table: KademliaRoutingTable,
+        seen_nodes: Iterable[NodeID]) -> Iterator[NodeID]:
+    """
+    The closest nodes as the previous lookup found them in every round, by sorting the routing
+    table as well as all the nodes received so far.
+    """
+    dist = functools.partial(compute_distance, target)
+    yielded_nodes: Set[NodeID] = set()
+    for node_id in sorted(itertools.chain(sorted_nodes_around(routing_table, target), seen_nodes),
+                          key=dist):
+        if node_id not in yielded_nodes:
+            yielded_nodes.add(node_id)
+            yield node_id
+
+
+class SimulatedNetwork:
+    """
+    Answers FindNode requests by returning the nodes around half of the peer's rank among all
+    nodes ordered by distance to the target, so that every hop gets about twice as close.
+    """
+    def __init__(self, node_ids: Sequence[NodeID]) -> None:
+        self.node_ids = node_ids
+        self._ranks: Dict[NodeID, Tuple[List[NodeID], Dict[NodeID, int]]] = {}
+
+    def prepare(self, target: NodeID) -> None:
+        ranked = sorted(self.node_ids, key=functools.partial(compute_distance, target))
+        self._ranks[target] = (ranked, {node_id: rank for rank, node_id in enumerate(ranked)})
+
+    async def find_node(self, peer: NodeID, target: NodeID) -> List[NodeID]:
+        await trio.sleep(0)
+        ranked, ranks = self._ranks[target]
+        rank = ranks[peer] // 2
+        return ranked[max(0, rank - FRONTIER_SIZE // 2):rank + FRONTIER_SIZE // 2]
+
+
+async def sorting_lookup(network: SimulatedNetwork,
+                         routing_table: KademliaRoutingTable,
+                         target: NodeID) -> int:
+    queried_node_ids: Set[NodeID] = set()
+    received_node_ids: List[NodeID] = []
+
+    async def query(peer: NodeID) -> None:
+        queried_node_ids.add(peer)
+        received_node_ids.extend(await network.find_node(peer, target))
+
+    while True:
+        candidates = iter_closest_nodes(target, routing_table, received_node_ids)
+        nodes_to_query = tuple(take(LOOKUP_PARALLELIZATION_FACTOR, (
+            candidate
+            for candidate in take(FRONTIER_SIZE, candidates)
+            if candidate not in queried_node_ids
+        )))
+        if not nodes_to_query:
+            return len(queried_node_ids)
+        async with trio.open_nursery() as nursery:
+            for peer in nodes_to_query:
+                nursery.start_soon(query, peer)
+
+
+async def frontier_lookup(network: SimulatedNetwork,
+                          routing_table: KademliaRoutingTable,
+                          target: NodeID) -> int:
+    queried_node_ids: Set[NodeID] = set()
+    frontier = LookupFrontier(target, FRONTIER_SIZE)
+    frontier.fill(routing_table.iter_nodes_around(target))
+
+    async def query(peer: NodeID) -> None:
+        queried_node_ids.add(peer)
+        for node_id in await network.find_node(peer, target):
+            frontier.add(node_id)
+
+    while True:
+        nodes_to_query = tuple(take(LOOKUP_PARALLELIZATION_FACTOR, (
+            candidate
+            for candidate in frontier.iter_closest()
+            if candidate not in queried_node_ids
+        )))
+        if not nodes_to_query:
+            return len(queried_node_ids)
+        async with trio.open_nursery() as nursery:
+            for peer in nodes_to_query:
+                nursery.start_soon(query, peer)
+
+
+async def run_lookups(
+        lookup_fn: Callable[[SimulatedNetwork, KademliaRoutingTable, NodeID], Awaitable[int]],
+        network: SimulatedNetwork,
+        routing_table: KademliaRoutingTable,
+        targets: Sequence[NodeID]) -> Tuple[float, int]:
+    num_queries: List[int] = []
+
+    async def lookup(target: NodeID) -> None:
+        num_queries.append(await lookup_fn(network, routing_table, target))
+
+    start = time.perf_counter()
+    async with trio.open_nursery() as nursery:
+        for target in targets:
+            nursery.start_soon(lookup, target)
+    return time.perf_counter() - start, sum(num_queries)
+
+
+def run_closest_nodes_queries(routing_table: KademliaRoutingTable,
+                              targets: Sequence[NodeID]) -> None:
+    for name, iter_fn in (
+            ("sorting the table", sorted_nodes_around),
+            ("walking the buckets", KademliaRoutingTable.iter_nodes_around)):
+        start = time.perf_counter()
+        for target in targets:
+            tuple(take(FRONTIER_SIZE, iter_fn(routing_table, target)))
+        duration = time.perf_counter() - start
+        logger.info(" - %s: %.0f queries/sec", name, len(targets) / duration)
+
+
+async def run(num_nodes: int, num_lookups: int) -> None:
+    local_node_id = NodeID(secrets.token_bytes(32))
+    node_ids = [NodeID(secrets.token_bytes(32)) for _ in range(num_nodes)]
+    # Large enough buckets for the whole network to fit into the table
+    routing_table = KademliaRoutingTable(local_node_id, num_nodes)
+    for node_id in node_ids:
+        routing_table.update(node_id)
+
+    targets = [NodeID(secrets.token_bytes(32)) for _ in range(num_lookups)]
+    logger.info("Closest %d nodes to a target:", FRONTIER_SIZE)
+    run_closest_nodes_queries(routing_table, targets)
+
+    network = SimulatedNetwork(node_ids)
+    for target in targets:
+        network.prepare(target)
+
+    logger.info("%d concurrent lookups:", num_lookups)
+    for name, lookup_fn in (
+            ("sorting in every round", sorting_lookup),
+            ("lookup frontier", frontier_lookup)):
+        duration, num_queries = await run_lookups(lookup_fn, network, routing_table, targets)
+        logger.info(
+            " - %s: %.0f lookups/sec, %d FindNode requests",
+            name,
+            num_lookups / duration,
+            num_queries,
+        )
+
+
+parser = argparse.ArgumentParser(description='Discovery v5 Lookup Benchmark')
+parser.add_argument(
+    '--num-nodes',
+    type=int,
+    required=False,
+    default=10000,
+    help="Number of nodes in the network and in the routing table",
+)
+parser.add_argument(
+    '--num-lookups',
+    type=int,
+    required=False,
+    default=100,
+    help="Number of lookups to run concurrently",
+)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    logger.info(
+        "Running discovery v5 lookup benchmark:\n - %d node(s) in the routing table\n - %d concurrent lookup(s)\n*****************************\n",  # noqa: E501
+        args.num_nodes,
+        args.num_lookups,
+    )
+    trio.run(run, args.num_nodes, args.num_lookups)
@@ -0,0 +1,173 @@
+import argparse
+import asyncio
+from dataclasses import dataclass
+import logging
+import os
+import pathlib
+import random
+import sys
+import tempfile
+import time
+from typing import Any, Iterable, Sequence, Tuple, Type
+
+from eth.rlp.headers import BlockHeader
+from eth.rlp.transactions import BaseTransactionFields
+from eth_typing import Address, BlockNumber
+from eth_utils import big_endian_to_int
+from lahja import AsyncioEndpoint, BaseEvent, ConnectionConfig, EndpointAPI
+
+from p2p.abc import CommandAPI, MessageAPI
+from trinity.protocol.eth.commands import BlockBodiesV65, NodeDataV65
+from trinity.rlp.block_body import BlockBody
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+
+@dataclass
+class CommandEvent(BaseEvent):
+    """
+    Carries a command the way ``PeerPoolMessageEvent`` does: as its serialized payload, which
+    the networking process never decodes.
+    """
+    command: CommandAPI[Any]
+
+
+@dataclass
+class DecodedPayloadEvent(BaseEvent):
+    """
+    Carries the decoded payload of a command, which is how commands used to cross the bus after
+    being decoded by the networking process.
+    """
+    command_type: Type[CommandAPI[Any]]
+    payload: Any
+
+
+def mk_transaction() -> BaseTransactionFields:
+    return BaseTransactionFields(
+        nonce=0,
+        gas=21000,
+        gas_price=1,
+        to=Address(os.urandom(20)),
+        value=random.randint(0, 100),
+        data=b'',
+        v=27,
+        r=big_endian_to_int(os.urandom(32)),
+        s=big_endian_to_int(os.urandom(32)),
+    )
+
+
+def mk_messages(num_items: int) -> Tuple[Tuple[Type[CommandAPI[Any]], MessageAPI], ...]:
+    block_bodies = BlockBodiesV65(tuple(
+        BlockBody(
+            transactions=tuple(mk_transaction() for _ in range(100)),
+            uncles=(BlockHeader(1, BlockNumber(1), 1),),
+        )
+        for _ in range(num_items)
+    ))
+    node_data = NodeDataV65(tuple(os.urandom(532) for _ in range(num_items * 16)))
+    # The messages as the networking process reads them from the wire.
+    return tuple(
+        (type(cmd), cmd.encode(cmd.protocol_command_id, snappy_support=False))
+        for cmd in (block_bodies, node_data)
+    )
+
+
+async def forward(
+        sender: EndpointAPI,
+        receiver: EndpointAPI,
+        event_type: Type[BaseEvent],
+        events: Iterable[BaseEvent],
+        num_messages: int) -> float:
+    received = 0
+
+    async def consume() -> None:
+        nonlocal received
+        async for event in receiver.stream(event_type, num_events=num_messages):
+            # The consumer materializes the payload, as the request server does.
+            if isinstance(event, CommandEvent):
+                event.command.payload
+            received += 1
+
+    consumer = asyncio.ensure_future(consume())
+    await sender.wait_until_any_endpoint_subscribed_to(event_type)
+
+    start = time.perf_counter()
+    for event in events:
+        await sender.broadcast(event)
+    await consumer
+    return received / (time.perf_counter() - start)
+
+
+async def run(
+        ipc_dir: pathlib.Path,
+        messages: Sequence[Tuple[Type[CommandAPI[Any]], MessageAPI]],
+        num_messages: int) -> None:
+    receiver_config = ConnectionConfig.from_name('receiver', base_path=ipc_dir)
+    async with AsyncioEndpoint.serve(receiver_config) as receiver:
+        async with AsyncioEndpoint('sender').run() as sender:
+            await sender.connect_to_endpoints(receiver_config)
+
+            for command_type, message in messages:
+                decoded_events = (
+                    DecodedPayloadEvent(
+                        command_type,
+                        command_type.decode(message, snappy_support=False).payload,
+                    )
+                    for _ in range(num_messages)
+                )
+                command_events = (
+                    CommandEvent(command_type.decode_lazily(message, snappy_support=False))
+                    for _ in range(num_messages)
+                )
+                for name, event_type, events in (
+                    ("Decoded payload", DecodedPayloadEvent, decoded_events),
+                    ("Serialized payload", CommandEvent, command_events),
+                ):
+                    messages_per_second = await forward(
+                        sender,
+                        receiver,
+                        event_type,
+                        events,
+                        num_messages,
+                    )
+                    logger.info(
+                        "%s (%s): %.0f messages/sec",
+                        command_type.__name__,
+                        name,
+                        messages_per_second,
+                    )
+
+
+parser = argparse.ArgumentParser(description='Event Bus Command Forwarding Benchmark')
+parser.add_argument(
+    '--num-messages',
+    type=int,
+    required=False,
+    default=200,
+    help="Number of messages of every type that are sent across the event bus",
+)
+parser.add_argument(
+    '--num-items',
+    type=int,
+    required=False,
+    default=16,
+    help="Number of block bodies in every BlockBodies message (and 16x as many NodeData nodes)",
+)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    logger.info(
+        "Running event bus command forwarding benchmark:\n - %d message(s) of every type\n - %d block bodies per message\n*****************************\n",  # noqa: E501
+        args.num_messages,
+        args.num_items,
+    )
+    messages = mk_messages(args.num_items)
+    with tempfile.TemporaryDirectory() as ipc_dir:
+        asyncio.run(run(pathlib.Path(ipc_dir), messages, args.num_messages))
@@ -0,0 +1,149 @@
+import argparse
+import logging
+import random
+import sys
+import time
+from typing import Dict, List, Tuple
+
+from eth.db.atomic import AtomicDB
+from eth_bloom import BloomFilter
+from eth_typing import Address, Hash32
+
+from trinity.db.eth1.bloom_bits import (
+    BLOOM_BITS,
+    BLOOM_BITS_SECTION_SIZE,
+    BloomBitsIndex,
+    transpose_blooms,
+)
+from trinity.rpc.filters import LogFilter
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+
+WATCHED_ADDRESS = Address(b'\xaa' * 20)
+WATCHED_TOPIC = Hash32(b'\xbb' * 32)
+UNUSED_ADDRESS = Address(b'\xcc' * 20)
+
+FILTERS = (
+    ("address", LogFilter(addresses=(WATCHED_ADDRESS,))),
+    ("address and topic", LogFilter(addresses=(WATCHED_ADDRESS,), topics=((WATCHED_TOPIC,),))),
+    ("unused address", LogFilter(addresses=(UNUSED_ADDRESS,))),
+)
+
+
+def mk_blooms(num_blocks: int, bits_per_bloom: int, watched_ratio: int) -> List[int]:
+    """
+    Random blooms with about ``bits_per_bloom`` bits set, where one block in ``watched_ratio``
+    has a log of the watched address and topic.
+    """
+    watched_bloom = int(BloomFilter.from_iterable((WATCHED_ADDRESS, WATCHED_TOPIC)))
+    blooms = []
+    for _ in range(num_blocks):
+        bloom = 0
+        for _ in range(bits_per_bloom):
+            bloom |= 1 << random.randrange(BLOOM_BITS)
+        if random.randrange(watched_ratio) == 0:
+            bloom |= watched_bloom
+        blooms.append(bloom)
+    return blooms
+
+
+def build_index(
+        num_sections: int,
+        bits_per_bloom: int,
+        watched_ratio: int) -> Tuple[BloomBitsIndex, Dict[str, float], Dict[str, int]]:
+    """
+    Index ``num_sections`` sections of random blooms, and return the index together with the
+    time it takes to match every filter against the header blooms of all blocks.
+    """
+    index = BloomBitsIndex(AtomicDB())
+    scan_seconds = {name: 0.0 for name, _ in FILTERS}
+    num_matches = {name: 0 for name, _ in FILTERS}
+    index_seconds = 0.0
+
+    for section in range(num_sections):
+        blooms = mk_blooms(index.section_size, bits_per_bloom, watched_ratio)
+
+        section_head_hash = Hash32(section.to_bytes(32, 'big'))
+        start = time.perf_counter()
+        index.persist_section(section, transpose_blooms(blooms), section_head_hash)
+        index_seconds += time.perf_counter() - start
+
+        for name, log_filter in FILTERS:
+            start = time.perf_counter()
+            num_matches[name] += sum(1 for bloom in blooms if log_filter.matches_bloom(bloom))
+            scan_seconds[name] += time.perf_counter() - start
+
+    logger.info("Indexing: %.0f blocks/sec", num_sections * index.section_size / index_seconds)
+    return index, scan_seconds, num_matches
+
+
+def query_index(
+        index: BloomBitsIndex,
+        log_filter: LogFilter,
+        num_sections: int) -> Tuple[int, float]:
+    start = time.perf_counter()
+    num_matches = sum(
+        bin(index.match_section(section, log_filter.bloom_criteria)).count('1')
+        for section in range(num_sections)
+    )
+    return num_matches, time.perf_counter() - start
+
+
+def run(num_blocks: int, bits_per_bloom: int, watched_ratio: int) -> None:
+    num_sections = num_blocks // BLOOM_BITS_SECTION_SIZE
+    index, scan_seconds, scan_matches = build_index(num_sections, bits_per_bloom, watched_ratio)
+
+    for name, log_filter in FILTERS:
+        num_matches, index_seconds = query_index(index, log_filter, num_sections)
+        # Both find the same candidates, the index just reads far less to do so
+        assert num_matches == scan_matches[name]
+        logger.info(
+            "Filter by %s: %d candidate block(s), %.1f ms with the index, %.1f ms scanning blooms",
+            name,
+            num_matches,
+            index_seconds * 1000,
+            scan_seconds[name] * 1000,
+        )
+
+
+parser = argparse.ArgumentParser(description='eth_getLogs Bloom Index Benchmark')
+parser.add_argument(
+    '--num-blocks',
+    type=int,
+    required=False,
+    default=1000000,
+    help="Number of blocks to query, rounded down to whole sections",
+)
+parser.add_argument(
+    '--bits-per-bloom',
+    type=int,
+    required=False,
+    default=30,
+    help="Number of random bits set in the bloom of every block",
+)
+parser.add_argument(
+    '--watched-ratio',
+    type=int,
+    required=False,
+    default=1000,
+    help="One in this many blocks has a log of the queried address",
+)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    logger.info(
+        "Running eth_getLogs bloom index benchmark:\n - %d block(s)\n - %d block(s) per section\n - %d random bloom bit(s) per block\n - 1 in %d block(s) with a watched log\n*****************************\n",  # noqa: E501
+        args.num_blocks,
+        BLOOM_BITS_SECTION_SIZE,
+        args.bits_per_bloom,
+        args.watched_ratio,
+    )
+    run(args.num_blocks, args.bits_per_bloom, args.watched_ratio)
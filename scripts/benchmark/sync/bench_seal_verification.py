@@ -0,0 +1,136 @@
+import argparse
+import asyncio
+import logging
+import random
+import sys
+import time
+from typing import List, Sequence, Tuple
+
+from async_service import background_asyncio_service
+from eth.consensus.pow import check_pow, mine_pow_nonce
+from eth.abc import BlockHeaderAPI
+from eth.rlp.headers import BlockHeader
+from eth_typing import BlockNumber
+
+from p2p.constants import SEAL_CHECK_RANDOM_SAMPLE_RATE
+from trinity.sync.common.seals import SealVerificationPool
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+
+def mk_headers(start_block: int, num_headers: int) -> Tuple[BlockHeaderAPI, ...]:
+    """
+    Headers with a valid seal at the lowest difficulty, which the first nonce always meets.
+    """
+    headers: List[BlockHeaderAPI] = []
+    for block_number in range(start_block, start_block + num_headers):
+        header = BlockHeader(
+            difficulty=1,
+            block_number=BlockNumber(block_number),
+            gas_limit=3141592,
+        )
+        nonce, mix_hash = mine_pow_nonce(block_number, header.mining_hash, header.difficulty)
+        headers.append(header.copy(nonce=nonce, mix_hash=mix_hash))
+    return tuple(headers)
+
+
+def sample(
+        headers: Sequence[BlockHeaderAPI],
+        seal_check_random_sample_rate: int) -> List[BlockHeaderAPI]:
+    sample_size = len(headers) // seal_check_random_sample_rate
+    return random.sample(headers, sample_size)
+
+
+def check_inline(
+        headers: Sequence[BlockHeaderAPI],
+        seal_check_random_sample_rate: int) -> float:
+    start = time.perf_counter()
+    for header in sample(headers, seal_check_random_sample_rate):
+        check_pow(
+            header.block_number,
+            header.mining_hash,
+            header.mix_hash,
+            header.nonce,
+            header.difficulty,
+        )
+    return len(headers) / (time.perf_counter() - start)
+
+
+async def check_in_pool(
+        pool: SealVerificationPool,
+        headers: Sequence[BlockHeaderAPI],
+        seal_check_random_sample_rate: int,
+        batch_length: int) -> float:
+    start = time.perf_counter()
+    # The header syncers validate one request worth of headers at a time
+    for batch_start in range(0, len(headers), batch_length):
+        batch = headers[batch_start:batch_start + batch_length]
+        await pool.verify_seals(sample(batch, seal_check_random_sample_rate))
+    return len(headers) / (time.perf_counter() - start)
+
+
+async def run(headers: Sequence[BlockHeaderAPI], batch_length: int) -> None:
+    pool = SealVerificationPool()
+    async with background_asyncio_service(pool):
+        # Start the workers and generate the ethash cache before timing
+        await pool.verify_seals(headers[:1])
+
+        for mode, seal_check_random_sample_rate in (
+                ("Full", 1),
+                ("Sampled", SEAL_CHECK_RANDOM_SAMPLE_RATE)):
+            for name, headers_per_second in (
+                    ("inline", check_inline(headers, seal_check_random_sample_rate)),
+                    ("in pool", await check_in_pool(
+                        pool,
+                        headers,
+                        seal_check_random_sample_rate,
+                        batch_length,
+                    ))):
+                logger.info(
+                    "%s seal check %s: %.0f headers/sec",
+                    mode,
+                    name,
+                    headers_per_second,
+                )
+
+
+parser = argparse.ArgumentParser(description='PoW Seal Verification Benchmark')
+parser.add_argument(
+    '--num-headers',
+    type=int,
+    required=False,
+    default=2048,
+    help="Number of headers to validate the seals of",
+)
+parser.add_argument(
+    '--start-block',
+    type=int,
+    required=False,
+    default=1,
+    help="Block number of the first header, which determines the ethash epoch",
+)
+parser.add_argument(
+    '--batch-length',
+    type=int,
+    required=False,
+    default=192,
+    help="Number of headers that are validated together, like a header sync request",
+)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    logger.info(
+        "Running PoW seal verification benchmark:\n - %d header(s)\n - %d header(s) per batch\n - 1 in %d seal(s) checked in sampled mode\n*****************************\n",  # noqa: E501
+        args.num_headers,
+        args.batch_length,
+        SEAL_CHECK_RANDOM_SAMPLE_RATE,
+    )
+    headers = mk_headers(args.start_block, args.num_headers)
+    asyncio.run(run(headers, args.batch_length))
@@ -0,0 +1,110 @@
+import argparse
+import logging
+import random
+import sys
+import time
+from typing import Sequence, Tuple
+
+from eth_keys import keys
+from eth.abc import SignedTransactionAPI
+from eth.vm.forks.spurious_dragon.transactions import SpuriousDragonTransaction
+from eth_typing import Address
+import rlp
+
+from trinity.components.builtin.tx_pool.pending import PendingTransactions
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+
+def mk_transactions(
+        num_senders: int,
+        num_transactions: int,
+        start_nonce: int = 0) -> Tuple[SignedTransactionAPI, ...]:
+    private_keys = tuple(
+        keys.PrivateKey(sender.to_bytes(32, 'big'))
+        for sender in range(1, num_senders + 1)
+    )
+    transactions = tuple(
+        SpuriousDragonTransaction.create_unsigned_transaction(
+            nonce=start_nonce + index // num_senders,
+            gas_price=random.randint(1, 1000),
+            gas=21000,
+            to=Address(b'\x10' * 20),
+            value=1,
+            data=b'',
+        ).as_signed_transaction(private_keys[index % num_senders], chain_id=1)
+        for index in range(num_transactions)
+    )
+    # The senders are recovered once per transaction, before it reaches the pool
+    for transaction in transactions:
+        transaction.sender
+    return transactions
+
+
+def insert(
+        pending: PendingTransactions,
+        transactions: Sequence[SignedTransactionAPI]) -> float:
+    start = time.perf_counter()
+    for transaction in transactions:
+        pending.add(transaction)
+    return len(transactions) / (time.perf_counter() - start)
+
+
+def run(num_pending: int, num_senders: int, num_evictions: int) -> None:
+    pending_transactions = mk_transactions(num_senders, num_pending)
+    max_per_sender = num_pending // num_senders + 1
+
+    pending = PendingTransactions(max_bytes=2**64, max_per_sender=max_per_sender)
+    logger.info("Insert: %.0f transactions/sec", insert(pending, pending_transactions))
+
+    # A full pool, that has to evict a pending transaction for every new one
+    max_bytes = sum(len(rlp.encode(transaction)) for transaction in pending_transactions)
+    pending = PendingTransactions(max_bytes=max_bytes, max_per_sender=max_per_sender * 2)
+    insert(pending, pending_transactions)
+    new_transactions = mk_transactions(num_senders, num_evictions, start_nonce=max_per_sender)
+    logger.info("Insert and evict: %.0f transactions/sec", insert(pending, new_transactions))
+    logger.info(
+        " - %d transactions pending after the evictions",
+        len(pending),
+    )
+
+
+parser = argparse.ArgumentParser(description='Transaction Pool Benchmark')
+parser.add_argument(
+    '--num-pending',
+    type=int,
+    required=False,
+    default=50000,
+    help="Number of pending transactions in the pool",
+)
+parser.add_argument(
+    '--num-senders',
+    type=int,
+    required=False,
+    default=1000,
+    help="Number of senders that the pending transactions are spread over",
+)
+parser.add_argument(
+    '--num-evictions',
+    type=int,
+    required=False,
+    default=10000,
+    help="Number of transactions that are added to the full pool",
+)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    logger.info(
+        "Running transaction pool benchmark:\n - %d pending transaction(s)\n - %d sender(s)\n - %d transaction(s) added to the full pool\n*****************************\n",  # noqa: E501
+        args.num_pending,
+        args.num_senders,
+        args.num_evictions,
+    )
+    run(args.num_pending, args.num_senders, args.num_evictions)
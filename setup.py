@@ -110,6 +110,7 @@ deps = {
         "cytoolz>=0.9.0,<1.0.0",
         "eth-typing>=2.1.0,<3.0.0",
         "lru-dict>=1.1.6",
+        "numpy>=1.18.0,<3",
         "py-ecc==4.0.0",
         "rlp>=1.1.0,<2.0.0",
         PYEVM_DEPENDENCY,
@@ -117,7 +118,7 @@ deps = {
         "asks>=2.3.6,<3",  # validator client
         "anyio>1.3,<1.4",
         "eth-keyfile",  # validator client
-        "milagro-bls-binding==1.3.0",
+        "milagro-bls-binding==1.9.1",
     ],
     'eth2-lint': [
         "black==19.3b0",
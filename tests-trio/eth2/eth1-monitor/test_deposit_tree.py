@@ -0,0 +1,56 @@
+import pytest
+
+from eth2.beacon.tools.builder.validator import (
+    make_deposit_proof,
+    make_deposit_tree_and_root,
+)
+from trinity.components.eth2.eth1_monitor.deposit_tree import DepositTree
+from trinity.components.eth2.eth1_monitor.exceptions import DepositDataDBValidationError
+from trinity.components.eth2.eth1_monitor.factories import (
+    DepositDataFactory,
+    ListCachedDepositDataDBFactory,
+)
+from trinity.tools.factories.db import AtomicDBFactory
+
+
+@pytest.mark.parametrize("num_deposits", (1, 2, 5, 8, 13))
+def test_deposit_tree_matches_full_rebuild(num_deposits):
+    seq_deposit_data = tuple(DepositDataFactory() for _ in range(num_deposits))
+    deposit_tree = DepositTree()
+    deposit_tree.extend(data.hash_tree_root for data in seq_deposit_data)
+    assert deposit_tree.count == num_deposits
+
+    # Test: roots and proofs of every historical snapshot match the ones built from scratch.
+    for deposit_count in range(1, num_deposits + 1):
+        deposit_data_in_range = seq_deposit_data[:deposit_count]
+        tree, root = make_deposit_tree_and_root(deposit_data_in_range)
+        assert deposit_tree.get_root(deposit_count) == root
+        for deposit_index in range(deposit_count):
+            assert deposit_tree.get_proof(
+                deposit_index, deposit_count
+            ) == make_deposit_proof(deposit_data_in_range, tree, root, deposit_index)
+
+
+def test_deposit_tree_validation():
+    deposit_tree = DepositTree()
+    deposit_tree.append(DepositDataFactory().hash_tree_root)
+    with pytest.raises(DepositDataDBValidationError):
+        deposit_tree.get_root(2)
+    with pytest.raises(DepositDataDBValidationError):
+        deposit_tree.get_proof(1, 1)
+
+
+def test_deposit_tree_persisted():
+    atomic_db = AtomicDBFactory()
+    db = ListCachedDepositDataDBFactory(db=atomic_db)
+    seq_deposit_data = tuple(DepositDataFactory() for _ in range(5))
+    db.add_deposit_data_batch(seq_deposit_data[:3], 1)
+    db.add_deposit_data_batch(seq_deposit_data[3:], 2)
+
+    # Test: a new db on the same `AtomicDB` loads the tree instead of rebuilding it.
+    new_db = ListCachedDepositDataDBFactory(db=atomic_db)
+    assert new_db.deposit_tree.count == 5
+    for deposit_count in range(1, 6):
+        assert new_db.deposit_tree.get_root(
+            deposit_count
+        ) == db.deposit_tree.get_root(deposit_count)
@@ -2,6 +2,8 @@ import time
 
 import pytest
 
+import rlp
+
 from eth.db.backends.memory import MemoryDB
 
 from p2p.node_db import NodeDB
@@ -50,6 +52,26 @@ def test_get_and_set_enr(node_db):
         db.set_enr(enr)
 
 
+def test_decoded_enrs_are_cached():
+    db = NodeDB(default_identity_scheme_registry, MemoryDB(), enr_cache_size=1)
+    private_key = PrivateKeyFactory().to_bytes()
+    enr = ENRFactory(private_key=private_key)
+    db.set_enr(enr)
+    assert db.get_enr(enr.node_id) is enr
+
+    # An updated ENR is read even if it was written without going through the cache
+    updated_enr = ENRFactory(private_key=private_key, sequence_number=enr.sequence_number + 1)
+    db.db.set(db._get_enr_key(enr.node_id), rlp.encode(updated_enr))
+    assert db.get_enr(enr.node_id) == updated_enr
+    assert db.get_enr(enr.node_id) is db.get_enr(enr.node_id)
+
+    # Evicted ENRs are decoded again
+    other_enr = ENRFactory()
+    db.set_enr(other_enr)
+    assert db.get_enr(enr.node_id) == updated_enr
+    assert db.get_enr(other_enr.node_id) == other_enr
+
+
 def test_delete_enr(node_db):
     db = node_db
     enr = ENRFactory()
@@ -19,6 +19,9 @@ from trio.testing import (
 
 from eth.db.backends.memory import MemoryDB
 
+import rlp
+from rlp.sedes import CountableList
+
 from p2p.discv5.channel_services import (
     IncomingMessage,
 )
@@ -40,10 +43,14 @@ from p2p.discv5.messages import (
 from p2p.discv5.message_dispatcher import (
     MessageDispatcher,
 )
+from p2p.enr import ENR
 from p2p.kademlia import compute_distance, compute_log_distance, KademliaRoutingTable
 from p2p.discv5.routing_table_manager import (
     iter_closest_nodes,
+    partition_and_encode_enrs,
     partition_enr_indices_by_size,
+    partition_enrs,
+    LookupFrontier,
     FindNodeHandlerService,
     PingHandlerService,
     PingSenderService,
@@ -432,6 +439,19 @@ def test_enr_partitioning(sizes, max_size):
     )
 
 
+def test_partition_and_encode_enrs():
+    enrs = tuple(ENRFactory() for _ in range(20))
+    max_payload_size = sum(len(rlp.encode(enr)) for enr in enrs[:5])
+    encoded_partitions = partition_and_encode_enrs(enrs, max_payload_size)
+
+    assert tuple(partition for partition, _ in encoded_partitions) == partition_enrs(
+        enrs,
+        max_payload_size,
+    )
+    for partition, encoded_enrs in encoded_partitions:
+        assert encoded_enrs == rlp.encode(partition, sedes=CountableList(ENR))
+
+
 def test_closest_nodes_empty(empty_routing_table):
     target = NodeIDFactory()
     assert list(iter_closest_nodes(target, empty_routing_table, [])) == []
@@ -466,3 +486,24 @@ def test_lookup_generator_mixed(empty_routing_table):
         empty_routing_table.update(node)
     closest_nodes = list(iter_closest_nodes(target, empty_routing_table, nodes_in_additional))
     assert closest_nodes == nodes
+
+
+def test_lookup_frontier_keeps_closest_nodes():
+    target = NodeIDFactory()
+    nodes = sorted(
+        [NodeIDFactory() for _ in range(10)],
+        key=lambda node: compute_distance(node, target)
+    )
+    frontier = LookupFrontier(target, 4)
+    for node in reversed(nodes):
+        frontier.add(node)
+    assert frontier.is_full
+    assert list(frontier.iter_closest()) == nodes[:4]
+
+    # Removed and evicted nodes are not added again
+    frontier.remove(nodes[1])
+    assert list(frontier.iter_closest()) == [nodes[0]] + nodes[2:4]
+    frontier.fill(nodes)
+    assert list(frontier.iter_closest()) == [nodes[0]] + nodes[2:4]
+    frontier.fill(nodes + [NodeIDFactory()])
+    assert len(frontier) == 4
@@ -0,0 +1,160 @@
+import pytest
+import trio
+
+from eth2.beacon.types.blocks import BeaconBlock, SignedBeaconBlock
+from trinity.nodes.beacon.sync import RangeSync
+
+SKIPPED_SLOTS = {7, 40}
+
+
+def _mk_blocks(slots):
+    return {
+        slot: SignedBeaconBlock.create(message=BeaconBlock.create(slot=slot))
+        for slot in slots
+        if slot not in SKIPPED_SLOTS
+    }
+
+
+class FakePeers:
+    def __init__(self, blocks, delays=None, failing=()):
+        self.blocks = blocks
+        self.delays = delays or {}
+        self.failing = failing
+        self.requests = []
+
+    async def get_blocks_by_range(self, peer_id, start_slot, count):
+        self.requests.append((peer_id, start_slot))
+        await trio.sleep(self.delays.get(peer_id, 1))
+        if peer_id in self.failing:
+            raise Exception("peer can't serve blocks")
+        for slot in range(start_slot, start_slot + count):
+            if slot in self.blocks:
+                yield self.blocks[slot]
+
+
+class Importer:
+    def __init__(self):
+        self.imported = []
+
+    def __call__(self, block):
+        if self.imported and self.imported[-1].slot >= block.slot:
+            return False
+        self.imported.append(block)
+        return True
+
+
+@pytest.mark.trio
+async def test_range_sync_imports_blocks_in_order_from_all_peers(autojump_clock):
+    blocks = _mk_blocks(range(1, 101))
+    peers = FakePeers(blocks, delays={"fast": 1, "slow": 3})
+    importer = Importer()
+    range_sync = RangeSync(peers.get_blocks_by_range, importer, 1, 100, batch_size=10)
+    range_sync.add_peer("fast", 100)
+    range_sync.add_peer("slow", 100)
+
+    assert await range_sync.run()
+
+    assert importer.imported == [blocks[slot] for slot in sorted(blocks)]
+    scores = range_sync.peer_scores
+    assert scores["fast"].blocks > scores["slow"].blocks > 0
+    assert scores["fast"].throughput > scores["slow"].throughput
+
+
+@pytest.mark.trio
+async def test_range_sync_reassigns_batches_of_failing_peers(autojump_clock):
+    blocks = _mk_blocks(range(1, 51))
+    peers = FakePeers(blocks, failing=("bad",))
+    importer = Importer()
+    range_sync = RangeSync(peers.get_blocks_by_range, importer, 1, 50, batch_size=10)
+    range_sync.add_peer("bad", 50)
+    range_sync.add_peer("good", 50)
+
+    assert await range_sync.run()
+
+    assert importer.imported == [blocks[slot] for slot in sorted(blocks)]
+    # the failing peer is dropped from the sync
+    assert "bad" not in range_sync.peer_scores
+
+
+@pytest.mark.trio
+async def test_range_sync_reassigns_batches_of_stalled_peers(autojump_clock):
+    blocks = _mk_blocks(range(1, 51))
+    peers = FakePeers(blocks, delays={"stalled": 1000})
+    importer = Importer()
+    range_sync = RangeSync(
+        peers.get_blocks_by_range,
+        importer,
+        1,
+        50,
+        batch_size=10,
+        batch_timeout=20,
+        slow_batch_delay=5,
+    )
+    range_sync.add_peer("stalled", 50)
+    range_sync.add_peer("good", 50)
+
+    with trio.fail_after(100):
+        assert await range_sync.run()
+
+    assert importer.imported == [blocks[slot] for slot in sorted(blocks)]
+
+
+@pytest.mark.trio
+async def test_range_sync_bounds_batches_ahead_of_import(autojump_clock):
+    blocks = _mk_blocks(range(1, 201))
+    peers = FakePeers(blocks, delays={"a": 0.1, "b": 0.1, "c": 0.1})
+    max_buffered_batches = 3
+    buffered = []
+
+    def slow_import(block):
+        buffered.append(range_sync.buffered_batch_count)
+        return True
+
+    range_sync = RangeSync(
+        peers.get_blocks_by_range,
+        slow_import,
+        1,
+        200,
+        batch_size=10,
+        max_buffered_batches=max_buffered_batches,
+    )
+    for peer_id in ("a", "b", "c"):
+        range_sync.add_peer(peer_id, 200)
+
+    assert await range_sync.run()
+
+    assert max(buffered) < max_buffered_batches
+    # no batch is ever requested beyond the window of the import
+    assert len(peers.requests) == 20
+
+
+@pytest.mark.trio
+async def test_range_sync_only_asks_peers_for_slots_they_have(autojump_clock):
+    blocks = _mk_blocks(range(1, 51))
+    peers = FakePeers(blocks)
+    importer = Importer()
+    range_sync = RangeSync(peers.get_blocks_by_range, importer, 1, 50, batch_size=10)
+    range_sync.add_peer("behind", 15)
+    range_sync.add_peer("ahead", 50)
+
+    assert await range_sync.run()
+
+    assert importer.imported == [blocks[slot] for slot in sorted(blocks)]
+    assert all(
+        start_slot <= 15
+        for peer_id, start_slot in peers.requests
+        if peer_id == "behind"
+    )
+
+
+@pytest.mark.trio
+async def test_range_sync_fails_without_peers_for_the_range(autojump_clock):
+    blocks = _mk_blocks(range(1, 51))
+    peers = FakePeers(blocks)
+    importer = Importer()
+    range_sync = RangeSync(peers.get_blocks_by_range, importer, 1, 50, batch_size=10)
+    range_sync.add_peer("behind", 25)
+
+    assert not await range_sync.run()
+
+    assert importer.imported == [blocks[slot] for slot in sorted(blocks) if slot <= 30]
@@ -0,0 +1,83 @@
+import os
+import socket
+import threading
+
+import pytest
+
+from trinity._utils.socket import (
+    BufferedSocket,
+    DEFAULT_BUFFER_SIZE,
+    MAX_RETAINED_BUFFER_SIZE,
+)
+
+
+@pytest.fixture
+def socket_pair():
+    left, right = socket.socketpair()
+    with left, right:
+        yield BufferedSocket(left), right
+
+
+def send_in_background(sock, data):
+    thread = threading.Thread(target=sock.sendall, args=(data,), daemon=True)
+    thread.start()
+    return thread
+
+
+@pytest.mark.parametrize('sizes', ((1, 4, 100), (10, 0, DEFAULT_BUFFER_SIZE * 3, 7)))
+def test_read_exactly(socket_pair, sizes):
+    sock, peer = socket_pair
+    payloads = tuple(os.urandom(size) for size in sizes)
+    thread = send_in_background(peer, b''.join(payloads))
+
+    for payload in payloads:
+        data = sock.read_exactly(len(payload))
+        assert isinstance(data, bytes)
+        assert data == payload
+    thread.join()
+
+
+def test_read_exactly_view(socket_pair):
+    sock, peer = socket_pair
+    peer.sendall(b'abcdef')
+
+    view = sock.read_exactly_view(2)
+    assert isinstance(view, memoryview)
+    assert view == b'ab'
+    assert sock.read_exactly_view(4) == b'cdef'
+
+
+def test_unread_bytes_survive_compaction(socket_pair):
+    sock, peer = socket_pair
+    payload = os.urandom(DEFAULT_BUFFER_SIZE * 2)
+    thread = send_in_background(peer, payload)
+
+    # leave a few unread bytes right before the end of the buffer
+    offset = 0
+    for size in (DEFAULT_BUFFER_SIZE - 10, 1000, 5000):
+        assert sock.read_exactly(size) == payload[offset:offset + size]
+        offset += size
+    assert sock.read_exactly(len(payload) - offset) == payload[offset:]
+    thread.join()
+
+
+def test_large_buffer_is_dropped_once_drained(socket_pair):
+    sock, peer = socket_pair
+    payload = os.urandom(MAX_RETAINED_BUFFER_SIZE * 2)
+    thread = send_in_background(peer, payload + b'tail')
+
+    # the view of the large payload stays valid after the buffer is replaced
+    view = sock.read_exactly_view(len(payload))
+    thread.join()
+    assert sock.read_exactly(4) == b'tail'
+    assert view == payload
+    assert len(sock._buffer) == DEFAULT_BUFFER_SIZE
+
+
+def test_closed_connection(socket_pair):
+    sock, peer = socket_pair
+    peer.sendall(b'abc')
+    peer.close()
+
+    with pytest.raises(OSError, match="Connection closed"):
+        sock.read_exactly(4)
@@ -0,0 +1,137 @@
+import pytest
+
+from eth.db.atomic import AtomicDB
+from eth.rlp.headers import BlockHeader
+from eth_bloom import BloomFilter
+from eth_utils import ValidationError
+
+from trinity.db.eth1.bloom_bits import (
+    BloomBitsIndex,
+    BloomBitsIndexer,
+    get_bloom_bit_indices,
+    transpose_blooms,
+)
+from trinity.db.eth1.chain import AsyncChainDB
+
+
+SECTION_SIZE = 8
+
+ADDRESS_A = b'\xaa' * 20
+ADDRESS_B = b'\xbb' * 20
+TOPIC = b'\x01' * 32
+
+
+def mk_bloom(*values):
+    return int(BloomFilter.from_iterable(values))
+
+
+def mk_header_chain(blooms, parent=None, difficulty=1):
+    headers = []
+    for bloom in blooms:
+        if parent is None:
+            header = BlockHeader(difficulty=difficulty, block_number=0, gas_limit=3141592)
+        else:
+            header = BlockHeader(
+                difficulty=difficulty,
+                block_number=parent.block_number + 1,
+                gas_limit=3141592,
+                parent_hash=parent.hash,
+                timestamp=parent.timestamp + 1,
+            )
+        parent = header.copy(bloom=bloom)
+        headers.append(parent)
+    return headers
+
+
+def test_transpose_blooms():
+    rows = transpose_blooms((0b101, 0b100, 0))
+    assert len(rows) == 2048
+    assert rows[0] == 0b001
+    assert rows[1] == 0
+    assert rows[2] == 0b011
+    assert not any(rows[3:])
+
+
+def test_match_section():
+    index = BloomBitsIndex(AtomicDB(), section_size=SECTION_SIZE)
+    blooms = (
+        mk_bloom(ADDRESS_A),
+        mk_bloom(ADDRESS_B, TOPIC),
+        0,
+        mk_bloom(ADDRESS_A, TOPIC),
+    ) + (0,) * (SECTION_SIZE - 4)
+    index.index_section(0, mk_header_chain(blooms))
+
+    assert index.num_sections == 1
+
+    address_a = get_bloom_bit_indices(ADDRESS_A)
+    address_b = get_bloom_bit_indices(ADDRESS_B)
+    topic = get_bloom_bit_indices(TOPIC)
+    assert index.match_section(0, ((address_a,),)) == 0b1001
+    assert index.match_section(0, ((address_a, address_b),)) == 0b1011
+    assert index.match_section(0, ((address_a, address_b), (topic,))) == 0b1010
+    assert index.match_section(0, ((), (topic,))) == 0b1010
+    assert index.match_section(0, ()) == 2 ** SECTION_SIZE - 1
+
+
+def test_sections_are_indexed_in_order():
+    index = BloomBitsIndex(AtomicDB(), section_size=SECTION_SIZE)
+    headers = mk_header_chain((0,) * SECTION_SIZE * 2)
+
+    with pytest.raises(ValidationError):
+        index.index_section(1, headers[SECTION_SIZE:])
+    with pytest.raises(ValidationError):
+        index.index_section(0, headers[:SECTION_SIZE - 1])
+    with pytest.raises(ValidationError):
+        index.index_section(0, headers[1:SECTION_SIZE + 1])
+
+
+@pytest.mark.asyncio
+async def test_indexer_indexes_confirmed_sections():
+    chaindb = AsyncChainDB(AtomicDB())
+    headers = mk_header_chain(
+        tuple(mk_bloom(ADDRESS_A) if number % 3 else 0 for number in range(SECTION_SIZE * 3 + 2))
+    )
+    chaindb.persist_header(headers[0])
+    chaindb.persist_header_chain(headers[1:])
+
+    index = BloomBitsIndex(chaindb.db, section_size=SECTION_SIZE)
+    indexer = BloomBitsIndexer(chaindb, index, confirmations=4)
+
+    # the third section is not confirmed yet
+    assert await indexer.index_new_sections() == 2
+    assert index.num_sections == 2
+    assert await indexer.index_new_sections() == 0
+
+    address_a = get_bloom_bit_indices(ADDRESS_A)
+    assert index.match_section(1, ((address_a,),)) == 0b01101101
+
+
+@pytest.mark.asyncio
+async def test_indexer_indexes_reorganized_sections_again():
+    chaindb = AsyncChainDB(AtomicDB())
+    headers = mk_header_chain((mk_bloom(ADDRESS_A),) * SECTION_SIZE * 3)
+    chaindb.persist_header(headers[0])
+    chaindb.persist_header_chain(headers[1:])
+
+    index = BloomBitsIndex(chaindb.db, section_size=SECTION_SIZE)
+    indexer = BloomBitsIndexer(chaindb, index, confirmations=1)
+    assert await indexer.index_new_sections() == 2
+
+    # A heavier fork replaces the second section
+    fork = mk_header_chain(
+        (mk_bloom(ADDRESS_B),) * (SECTION_SIZE * 2 - 1),
+        parent=headers[SECTION_SIZE + 1],
+        difficulty=2,
+    )
+    chaindb.persist_header_chain(fork)
+
+    assert await indexer.index_new_sections() == 2
+    assert index.num_sections == 3
+    assert index.get_section_head(1) == fork[SECTION_SIZE - 3].hash
+
+    address_a = get_bloom_bit_indices(ADDRESS_A)
+    address_b = get_bloom_bit_indices(ADDRESS_B)
+    assert index.match_section(1, ((address_a,),)) == 0b11
+    assert index.match_section(1, ((address_b,),)) == 0b11111100
+    assert index.match_section(2, ((address_a,),)) == 0
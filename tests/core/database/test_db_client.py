@@ -2,14 +2,25 @@ from eth.db.atomic import AtomicDB
 
 import pathlib
 import pytest
+import socket
 import tempfile
+import time
 
 from eth.tools.db.atomic import AtomicDatabaseBatchAPITestSuite
 from eth.tools.db.base import DatabaseAPITestSuite
 
+from trinity.db import manager as manager_module
 from trinity.db.manager import (
+    CACHE_ENTRY_OVERHEAD,
+    EXISTS,
+    FAIL_BYTE,
+    LEN_BYTES,
+    SUBSCRIBE_INVALIDATIONS,
+    SUCCESS_BYTE,
+    TAGGED,
     DBManager,
     DBClient,
+    DBClientCache,
 )
 
 
@@ -56,3 +67,182 @@ class TestDBClientDatabaseAPI(DatabaseAPITestSuite):
 
 class TestDBClientAtomicBatchAPI(AtomicDatabaseBatchAPITestSuite):
     pass
+
+
+def test_db_client_multi_get(db_client):
+    db_client[b'key-a'] = b'value-a'
+    db_client[b'key-b'] = b''
+
+    assert db_client.multi_get(()) == {}
+    assert db_client.multi_get((b'key-a', b'missing', b'key-b')) == {
+        b'key-a': b'value-a',
+        b'key-b': b'',
+    }
+
+
+def test_db_client_multi_exists(db_client):
+    db_client[b'key-a'] = b'value-a'
+
+    assert db_client.multi_exists(()) == ()
+    assert db_client.multi_exists((b'missing', b'key-a', b'key-a')) == (False, True, True)
+
+
+def test_db_client_pipeline(db_client):
+    db_client[b'key-a'] = b'value-a'
+
+    pipeline = db_client.pipeline()
+    get_a = pipeline.get(b'key-a')
+    get_missing = pipeline.get(b'missing')
+    set_b = pipeline.set(b'key-b', b'value-b')
+    exists_b = pipeline.exists(b'key-b')
+    delete_missing = pipeline.delete(b'missing')
+    multi_get = pipeline.multi_get((b'key-a', b'key-b'))
+    multi_exists = pipeline.multi_exists((b'key-a', b'missing'))
+    results = pipeline.execute()
+
+    assert len(pipeline) == 0
+    assert results[get_a] == b'value-a'
+    assert results[get_missing] is None
+    assert results[set_b] is True
+    assert results[exists_b] is True
+    assert results[delete_missing] is False
+    assert results[multi_get] == {b'key-a': b'value-a', b'key-b': b'value-b'}
+    assert results[multi_exists] == (True, False)
+
+    # the connection is still usable for regular requests afterwards
+    assert db_client[b'key-b'] == b'value-b'
+
+
+def test_db_client_pipeline_large_responses(db_client):
+    # responses larger than the socket buffers must not dead-lock the pipeline
+    value = b'\x01' * 1024 * 1024
+    db_client[b'key'] = value
+
+    pipeline = db_client.pipeline()
+    for _ in range(8):
+        pipeline.get(b'key')
+    assert pipeline.execute() == (value,) * 8
+
+
+def test_db_manager_fails_unknown_tagged_operations(ipc_path, base_db, db_manager):
+    base_db[b'key'] = b'value'
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.connect(str(ipc_path))
+    try:
+        request_id_data = (7).to_bytes(LEN_BYTES, 'little')
+        sock.sendall(TAGGED.value + request_id_data + b'\xff')
+        assert sock.recv(LEN_BYTES + 1) == request_id_data + FAIL_BYTE
+
+        # the connection keeps serving requests
+        sock.sendall(EXISTS.value + (3).to_bytes(LEN_BYTES, 'little') + b'key')
+        assert sock.recv(1) == SUCCESS_BYTE
+    finally:
+        sock.close()
+
+
+@pytest.fixture
+def cached_db_client(ipc_path, db_manager):
+    client = DBClient.connect(ipc_path, cache_size=1024 * 1024)
+    try:
+        yield client
+    finally:
+        client.close()
+
+
+def test_db_client_cache_reads_through(base_db, cached_db_client):
+    content_key = b'\x01' * 32
+    base_db[content_key] = b'node'
+    base_db[b'mutable'] = b'value'
+
+    assert cached_db_client[content_key] == b'node'
+    assert cached_db_client[b'mutable'] == b'value'
+
+    # Served from the cache even though the underlying db changed without notifications
+    del base_db[content_key]
+    assert cached_db_client[content_key] == b'node'
+    assert cached_db_client.multi_get((content_key,)) == {content_key: b'node'}
+    assert cached_db_client.multi_exists((content_key, b'missing')) == (True, False)
+
+
+def test_db_client_cache_invalidated_by_other_clients(db_client, cached_db_client):
+    db_client[b'mutable'] = b'old'
+    assert cached_db_client[b'mutable'] == b'old'
+
+    # Writes are only acknowledged once the other clients invalidated the old values
+    db_client[b'mutable'] = b'new'
+    assert cached_db_client[b'mutable'] == b'new'
+
+    with db_client.atomic_batch() as batch:
+        batch[b'mutable'] = b'newer'
+    assert cached_db_client[b'mutable'] == b'newer'
+
+    del db_client[b'mutable']
+    assert not cached_db_client.exists(b'mutable')
+
+
+def test_db_manager_disconnects_unresponsive_subscribers(
+        monkeypatch, ipc_path, db_client, cached_db_client):
+    monkeypatch.setattr(manager_module, 'INVALIDATION_TIMEOUT', 0.1)
+
+    # A subscriber that never acknowledges the invalidations
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.connect(str(ipc_path))
+    sock.sendall(SUBSCRIBE_INVALIDATIONS.value)
+    assert sock.recv(1) == SUCCESS_BYTE
+
+    try:
+        db_client[b'mutable'] = b'value'
+        assert cached_db_client[b'mutable'] == b'value'
+
+        # The unresponsive subscriber got disconnected and doesn't block writes anymore
+        assert sock.recv(4096)
+        assert sock.recv(4096) == b''
+        start = time.monotonic()
+        db_client[b'mutable'] = b'new'
+        assert time.monotonic() - start < 0.1
+        assert cached_db_client[b'mutable'] == b'new'
+    finally:
+        sock.close()
+
+
+def test_db_client_cache_updated_by_own_writes(cached_db_client):
+    cached_db_client[b'mutable'] = b'old'
+    assert cached_db_client[b'mutable'] == b'old'
+
+    with cached_db_client.atomic_batch() as batch:
+        batch[b'mutable'] = b'new'
+    assert cached_db_client[b'mutable'] == b'new'
+
+    del cached_db_client[b'mutable']
+    assert not cached_db_client.exists(b'mutable')
+    with pytest.raises(KeyError):
+        cached_db_client[b'mutable']
+
+
+def test_db_client_cache_is_bounded_by_bytes():
+    cache = DBClientCache(max_bytes=3 * (256 + CACHE_ENTRY_OVERHEAD))
+    with cache.read_through() as values:
+        for index in range(8):
+            values[index.to_bytes(32, 'big')] = b'\x00' * 256
+
+    cached_keys = tuple(
+        index for index in range(8) if cache.get(index.to_bytes(32, 'big')) is not None
+    )
+    # only the most recently read values fit
+    assert cached_keys == (5, 6, 7)
+
+
+def test_db_client_cache_ignores_values_invalidated_during_read():
+    cache = DBClientCache(max_bytes=1024)
+    cache.enable_invalidations()
+    with cache.read_through() as values:
+        values[b'mutable'] = b'stale'
+        cache.invalidate((b'mutable',))
+    assert cache.get(b'mutable') is None
+
+
+def test_db_client_cache_only_caches_content_addressed_keys_without_invalidations():
+    cache = DBClientCache(max_bytes=1024)
+    cache.update(((b'mutable', b'value'), (b'\x01' * 32, b'node')), ())
+    assert cache.get(b'mutable') is None
+    assert cache.get(b'\x01' * 32) == b'node'
@@ -282,6 +282,68 @@ async def test_ipc_requests(
     assert result == expected
 
 
+def build_batch_request(*requests):
+    return b'[' + b', '.join(requests) + b']'
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'request_msg, expected',
+    (
+        (
+            build_batch_request(
+                build_request('web3_sha3', ['0x']),
+                build_request('notamethod'),
+                build_request('net_listening'),
+            ),
+            [
+                {
+                    'result': '0xc5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470',
+                    'id': 3,
+                    'jsonrpc': '2.0',
+                },
+                {'error': "Invalid RPC method: 'notamethod'", 'id': 3, 'jsonrpc': '2.0'},
+                {'result': True, 'id': 3, 'jsonrpc': '2.0'},
+            ],
+        ),
+        (
+            b'\n' + build_batch_request(build_request('net_listening')),
+            [{'result': True, 'id': 3, 'jsonrpc': '2.0'}],
+        ),
+        (
+            b'[1]',
+            [{'error': "Invalid Request: must be a JSON object", 'id': -1, 'jsonrpc': '2.0'}],
+        ),
+        (
+            b'[]',
+            {'error': "Invalid Request: empty"},
+        ),
+    ),
+)
+async def test_ipc_batch_requests(
+        jsonrpc_ipc_pipe_path,
+        request_msg,
+        expected,
+        event_loop,
+        event_bus,
+        ipc_server):
+    # Give event subsriptions a moment to propagate.
+    await asyncio.sleep(0.01)
+
+    assert wait_for(jsonrpc_ipc_pipe_path), "IPC server did not successfully start with IPC file"
+
+    reader, writer = await asyncio.open_unix_connection(str(jsonrpc_ipc_pipe_path))
+
+    writer.write(request_msg)
+    await writer.drain()
+    result_bytes = b''
+    while not can_decode_json(result_bytes):
+        result_bytes += await asyncio.tasks.wait_for(reader.read(1024), 0.25)
+
+    writer.close()
+    assert json.loads(result_bytes.decode()) == expected
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     'request_msg, expected, propagate',
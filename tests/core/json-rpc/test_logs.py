@@ -0,0 +1,220 @@
+import json
+import random
+
+import pytest
+
+from eth import constants as eth_constants
+from eth.chains.base import MiningChain
+from eth.consensus.applier import ConsensusApplier
+from eth.consensus.noproof import NoProofConsensus
+from eth.db.atomic import AtomicDB
+from eth.vm.forks.spurious_dragon import SpuriousDragonVM
+from eth_utils import decode_hex, encode_hex
+from eth_utils.toolz import assoc
+
+from trinity.chains.coro import AsyncChainMixin
+from trinity.config import TrinityConfig
+from trinity.db.eth1.bloom_bits import BloomBitsIndex, BloomBitsIndexer
+from trinity.rpc import RPCServer
+from trinity.rpc.filters import LogFilter, get_logs
+from trinity.rpc.modules import initialize_eth1_modules
+
+
+LOGGER_ADDRESS = b'\x77' * 20
+
+# Emits a log without data, with the first 32 bytes of the call data as its only topic:
+# PUSH1 0 CALLDATALOAD PUSH1 0 PUSH1 0 LOG1 STOP
+LOGGER_CODE = decode_hex('0x60003560006000a100')
+
+TOPIC_A = b'\x0a' * 32
+TOPIC_B = b'\x0b' * 32
+
+
+class AsyncMiningChain(AsyncChainMixin, MiningChain):
+    pass
+
+
+def build_request(method, params):
+    return {"jsonrpc": "2.0", "method": method, "params": params, "id": random.randrange(1000)}
+
+
+@pytest.fixture
+def genesis_state(base_genesis_state):
+    return assoc(
+        base_genesis_state,
+        LOGGER_ADDRESS,
+        {
+            'balance': 0,
+            'nonce': 0,
+            'code': LOGGER_CODE,
+            'storage': {},
+        },
+    )
+
+
+@pytest.fixture
+def chain(base_db, genesis_state):
+    klass = AsyncMiningChain.configure(
+        __name__='TestAsyncMiningChain',
+        vm_configuration=ConsensusApplier(NoProofConsensus).amend_vm_configuration(
+            (
+                (eth_constants.GENESIS_BLOCK_NUMBER, SpuriousDragonVM),
+            )
+        ),
+        chain_id=1337,
+    )
+    genesis_params = {
+        'block_number': eth_constants.GENESIS_BLOCK_NUMBER,
+        'difficulty': eth_constants.GENESIS_DIFFICULTY,
+        'gas_limit': 3141592,
+        'parent_hash': eth_constants.GENESIS_PARENT_HASH,
+        'coinbase': eth_constants.GENESIS_COINBASE,
+        'nonce': eth_constants.GENESIS_NONCE,
+        'mix_hash': eth_constants.GENESIS_MIX_HASH,
+        'extra_data': eth_constants.GENESIS_EXTRA_DATA,
+        'timestamp': 1501851927,
+    }
+    return klass.from_genesis(base_db, genesis_params, genesis_state)
+
+
+@pytest.fixture
+def rpc(chain, event_bus):
+    trinity_config = TrinityConfig(app_identifier="eth1", network_id=1)
+    return RPCServer(initialize_eth1_modules(chain, event_bus, trinity_config), chain, event_bus)
+
+
+def mine_logs(chain, private_key, topics):
+    """
+    Mine a block for each of the topics, with a transaction that logs it.
+    """
+    for topic in topics:
+        nonce = chain.get_vm().state.get_nonce(private_key.public_key.to_canonical_address())
+        tx = chain.create_unsigned_transaction(
+            nonce=nonce,
+            gas_price=1,
+            gas=100000,
+            to=LOGGER_ADDRESS,
+            value=0,
+            data=topic,
+        ).as_signed_transaction(private_key)
+        chain.apply_transaction(tx)
+        chain.mine_block()
+
+
+async def execute(rpc, method, *params):
+    response = json.loads(await rpc.execute(build_request(method, params)))
+    assert 'error' not in response, response['error']
+    return response['result']
+
+
+def topics_of(logs):
+    return [log['topics'] for log in logs]
+
+
+@pytest.mark.asyncio
+async def test_get_logs(rpc, chain, funded_address_private_key):
+    mine_logs(chain, funded_address_private_key, (TOPIC_A, TOPIC_B, TOPIC_A))
+
+    logs = await execute(rpc, 'eth_getLogs', {
+        'fromBlock': '0x0',
+        'address': encode_hex(LOGGER_ADDRESS),
+        'topics': [encode_hex(TOPIC_A)],
+    })
+    assert [log['blockNumber'] for log in logs] == ['0x1', '0x3']
+    assert topics_of(logs) == [[encode_hex(TOPIC_A)]] * 2
+
+    block_3 = chain.get_canonical_block_by_number(3)
+    assert logs[1] == {
+        'address': encode_hex(LOGGER_ADDRESS),
+        'data': '0x',
+        'blockHash': encode_hex(block_3.hash),
+        'blockNumber': '0x3',
+        'logIndex': '0x0',
+        'removed': False,
+        'topics': [encode_hex(TOPIC_A)],
+        'transactionHash': encode_hex(block_3.transactions[0].hash),
+        'transactionIndex': '0x0',
+    }
+
+    # alternative topics, a block range and a single block
+    logs = await execute(rpc, 'eth_getLogs', {
+        'fromBlock': '0x2',
+        'topics': [[encode_hex(TOPIC_A), encode_hex(TOPIC_B)]],
+    })
+    assert [log['blockNumber'] for log in logs] == ['0x2', '0x3']
+    logs = await execute(rpc, 'eth_getLogs', {'blockHash': encode_hex(block_3.hash)})
+    assert topics_of(logs) == [[encode_hex(TOPIC_A)]]
+    unknown_address = '0x' + '00' * 20
+    assert await execute(rpc, 'eth_getLogs', {'fromBlock': '0x0', 'address': unknown_address}) == []
+
+
+@pytest.mark.asyncio
+async def test_get_logs_from_index(chain, funded_address_private_key):
+    topics = [TOPIC_A if number % 3 else TOPIC_B for number in range(20)]
+    mine_logs(chain, funded_address_private_key, topics)
+
+    index = BloomBitsIndex(chain.chaindb.db, section_size=8)
+    indexer = BloomBitsIndexer(chain.chaindb, index, confirmations=0)
+    assert await indexer.index_new_sections() == 2
+
+    # The indexed sections and the remaining blocks give the same logs as a full scan
+    for from_block, to_block in ((0, 20), (3, 13), (9, 9), (10, 18)):
+        log_filter = LogFilter(from_block, to_block, topics=((TOPIC_B,),))
+        logs = await get_logs(chain, index, log_filter)
+        unindexed_logs = await get_logs(chain, BloomBitsIndex(AtomicDB()), log_filter)
+
+        assert logs == unindexed_logs
+        assert [int(log['blockNumber'], 16) for log in logs] == [
+            number + 1 for number, topic in enumerate(topics)
+            if topic == TOPIC_B and from_block <= number + 1 <= to_block
+        ]
+
+
+@pytest.mark.asyncio
+async def test_filter_changes(rpc, chain, funded_address_private_key):
+    mine_logs(chain, funded_address_private_key, (TOPIC_A,))
+    filter_id = await execute(rpc, 'eth_newFilter', {'topics': [encode_hex(TOPIC_A)]})
+
+    # only the logs of blocks after the filter was installed are changes
+    assert await execute(rpc, 'eth_getFilterChanges', filter_id) == []
+    mine_logs(chain, funded_address_private_key, (TOPIC_A, TOPIC_B, TOPIC_A))
+    changes = await execute(rpc, 'eth_getFilterChanges', filter_id)
+    assert [log['blockNumber'] for log in changes] == ['0x2', '0x4']
+    assert await execute(rpc, 'eth_getFilterChanges', filter_id) == []
+    assert await execute(rpc, 'eth_getFilterLogs', filter_id) == changes[1:]
+
+    assert await execute(rpc, 'eth_uninstallFilter', filter_id) is True
+    assert await execute(rpc, 'eth_uninstallFilter', filter_id) is False
+    response = json.loads(await rpc.execute(build_request('eth_getFilterChanges', [filter_id])))
+    assert response['error'] == f"Filter {filter_id} not found"
+
+
+@pytest.mark.asyncio
+async def test_get_logs_limits(chain, event_bus, funded_address_private_key):
+    mine_logs(chain, funded_address_private_key, (TOPIC_A, TOPIC_B, TOPIC_A))
+    trinity_config = TrinityConfig(app_identifier="eth1", network_id=1)
+    modules = initialize_eth1_modules(
+        chain,
+        event_bus,
+        trinity_config,
+        max_logs_block_range=2,
+        max_logs_results=1,
+    )
+    rpc = RPCServer(modules, chain, event_bus)
+
+    async def get_error(params):
+        response = json.loads(await rpc.execute(build_request('eth_getLogs', [params])))
+        return response.get('error')
+
+    assert await get_error({'fromBlock': '0x1'}) == "Log queries may span at most 2 blocks"
+    assert await get_error({'fromBlock': '0x2'}) == "Log queries may return at most 1 logs"
+    assert await get_error({'fromBlock': '0x2', 'topics': [encode_hex(TOPIC_A)]}) is None
+
+    # filter changes catch up with the head over several polls instead
+    filter_id = await execute(rpc, 'eth_newFilter', {'topics': [encode_hex(TOPIC_A)]})
+    mine_logs(chain, funded_address_private_key, (TOPIC_A, TOPIC_B, TOPIC_A))
+    changes = await execute(rpc, 'eth_getFilterChanges', filter_id)
+    assert [log['blockNumber'] for log in changes] == ['0x4']
+    changes = await execute(rpc, 'eth_getFilterChanges', filter_id)
+    assert [log['blockNumber'] for log in changes] == ['0x6']
+    assert await execute(rpc, 'eth_getFilterChanges', filter_id) == []
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import random
 
@@ -7,6 +8,7 @@ from eth import MainnetChain
 from trinity.chains.full import FullChain
 from trinity.config import TrinityConfig
 from trinity.rpc import RPCServer
+from trinity.rpc.main import MAXIMUM_BATCH_SIZE
 from trinity.rpc.modules import initialize_eth1_modules, Admin, Net
 
 
@@ -52,3 +54,64 @@ async def test_access_control(event_bus,
     result, error = result_from_response(response)
     assert result == expected_result
     assert error == expected_error
+
+
+@pytest.mark.asyncio
+async def test_batch_requests(event_bus):
+    chain = MainnetFullChain(None)
+    trinity_config = TrinityConfig(app_identifier="eth1", network_id=1)
+    rpc = RPCServer(initialize_eth1_modules(chain, event_bus, trinity_config), chain, event_bus)
+
+    requests = [build_request("net_listening", ()), build_request("net_nope", ())]
+    responses = json.loads(await rpc.execute(requests))
+
+    assert [response['id'] for response in responses] == [request['id'] for request in requests]
+    assert responses[0]['result'] is True
+    assert responses[1]['error'] == "Method not implemented: 'net_nope'"
+
+    # only the latency of executed methods is recorded
+    latencies = rpc.metrics_registry.dump_metrics()
+    assert latencies['trinity.rpc/net_listening/latency.histogram']['count'] == 1
+    assert 'trinity.rpc/net_nope/latency.histogram' not in latencies
+
+
+@pytest.mark.asyncio
+async def test_batch_requests_run_concurrently(event_bus):
+    chain = MainnetFullChain(None)
+    trinity_config = TrinityConfig(app_identifier="eth1", network_id=1)
+    modules = initialize_eth1_modules(chain, event_bus, trinity_config)
+    rpc = RPCServer(modules, chain, event_bus, batch_concurrency=2)
+
+    running = 0
+    max_running = 0
+
+    async def listening():
+        nonlocal running, max_running
+        running += 1
+        max_running = max(running, max_running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return True
+
+    rpc.modules['net'].listening = listening
+
+    responses = json.loads(await rpc.execute([
+        build_request("net_listening", ()) for _ in range(5)
+    ]))
+    assert [response['result'] for response in responses] == [True] * 5
+    assert max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_size_limit(event_bus):
+    chain = MainnetFullChain(None)
+    trinity_config = TrinityConfig(app_identifier="eth1", network_id=1)
+    rpc = RPCServer(initialize_eth1_modules(chain, event_bus, trinity_config), chain, event_bus)
+
+    response = json.loads(await rpc.execute([
+        build_request("net_listening", ()) for _ in range(MAXIMUM_BATCH_SIZE + 1)
+    ]))
+    assert response['error'] == (
+        f"Invalid Request: batch of {MAXIMUM_BATCH_SIZE + 1} requests exceeds the maximum "
+        f"of {MAXIMUM_BATCH_SIZE}"
+    )
@@ -0,0 +1,217 @@
+import os
+import random
+import time
+
+from eth_utils import big_endian_to_int
+import pytest
+import rlp
+
+from eth.db.trie import make_trie_root_and_nodes
+from eth.rlp.headers import BlockHeader
+from eth.rlp.receipts import Receipt
+from eth.rlp.transactions import BaseTransactionFields
+
+from p2p.token_bucket import TokenBucket
+
+from trinity.db.eth1.chain import AsyncChainDB
+from trinity.protocol.eth.commands import (
+    BlockBodiesV65,
+    GetBlockBodiesV65,
+    GetReceiptsV65,
+    ReceiptsV65,
+)
+from trinity.protocol.eth.servers import ETHPeerRequestHandler
+from trinity.rlp.block_body import BlockBody
+from trinity.rlp.encoding import encode_raw_list
+
+
+UNKNOWN_BLOCK_HASH = b'\x01' * 32
+
+
+def mk_transaction():
+    return BaseTransactionFields(
+        nonce=0,
+        gas=21000,
+        gas_price=1,
+        to=os.urandom(20),
+        value=random.randint(0, 100),
+        data=b'',
+        v=27,
+        r=big_endian_to_int(os.urandom(32)),
+        s=big_endian_to_int(os.urandom(32)),
+    )
+
+
+def mk_receipt():
+    return Receipt(state_root=os.urandom(32), gas_used=21000, bloom=0, logs=[])
+
+
+def mk_uncle(block_number):
+    return BlockHeader(
+        state_root=os.urandom(32),
+        difficulty=1000000,
+        block_number=block_number,
+        gas_limit=3141592,
+        timestamp=int(time.time()),
+    )
+
+
+@pytest.fixture
+def chaindb(chaindb_fresh):
+    return AsyncChainDB(chaindb_fresh.db)
+
+
+@pytest.fixture
+def block(chaindb):
+    genesis = chaindb.get_canonical_head()
+    transactions = tuple(mk_transaction() for _ in range(3))
+    receipts = tuple(mk_receipt() for _ in range(3))
+    uncles = (mk_uncle(0),)
+
+    transaction_root, transaction_trie_data = make_trie_root_and_nodes(transactions)
+    receipt_root, receipt_trie_data = make_trie_root_and_nodes(receipts)
+    chaindb.persist_trie_data_dict(transaction_trie_data)
+    chaindb.persist_trie_data_dict(receipt_trie_data)
+    uncles_hash = chaindb.persist_uncles(uncles)
+
+    header = BlockHeader(
+        difficulty=genesis.difficulty,
+        block_number=1,
+        gas_limit=genesis.gas_limit,
+        parent_hash=genesis.hash,
+        timestamp=genesis.timestamp + 1,
+        transaction_root=transaction_root,
+        receipt_root=receipt_root,
+        uncles_hash=uncles_hash,
+    )
+    chaindb.persist_header(header)
+    return header, BlockBody(transactions, uncles), receipts
+
+
+def test_get_encoded_block_bodies(chaindb, block):
+    header, body, _ = block
+    genesis = chaindb.get_canonical_block_header_by_number(0)
+
+    encoded_bodies = chaindb.get_encoded_block_bodies(
+        (header.hash, UNKNOWN_BLOCK_HASH, genesis.hash),
+    )
+    assert encoded_bodies == {
+        header.hash: rlp.encode(body),
+        genesis.hash: rlp.encode(BlockBody((), ())),
+    }
+
+
+def test_get_encoded_receipts(chaindb, block):
+    header, _, receipts = block
+    genesis = chaindb.get_canonical_block_header_by_number(0)
+
+    encoded_receipts = chaindb.get_encoded_receipts(
+        (header.hash, UNKNOWN_BLOCK_HASH, genesis.hash),
+    )
+    assert encoded_receipts == {
+        header.hash: rlp.encode(receipts),
+        genesis.hash: rlp.encode(()),
+    }
+
+
+def test_get_encoded_block_bodies_with_missing_trie_nodes(chaindb, block):
+    header, _, _ = block
+    incomplete_header = header.copy(transaction_root=os.urandom(32))
+    chaindb.persist_header(incomplete_header)
+
+    encoded_bodies = chaindb.get_encoded_block_bodies((incomplete_header.hash, header.hash))
+    assert tuple(encoded_bodies) == (header.hash,)
+
+
+@pytest.mark.parametrize(
+    'items',
+    (
+        # small values end up embedded in their parent nodes
+        tuple(range(300)),
+        tuple(mk_transaction() for _ in range(300)),
+    ),
+)
+def test_get_encoded_trie_leaves(chaindb, items):
+    root_hash, trie_data = make_trie_root_and_nodes(items)
+    chaindb.persist_trie_data_dict(trie_data)
+
+    assert chaindb._get_encoded_trie_leaves(root_hash) == tuple(rlp.encode(item) for item in items)
+
+
+def test_encoded_responses_are_sent_as_is(block):
+    _, body, receipts = block
+
+    for cmd, raw_cmd in (
+        (BlockBodiesV65((body, body)), BlockBodiesV65.from_serialized_payload(encode_raw_list(
+            (rlp.encode(body), rlp.encode(body)),
+        ))),
+        (ReceiptsV65((receipts,)), ReceiptsV65.from_serialized_payload(encode_raw_list(
+            (rlp.encode(receipts),),
+        ))),
+    ):
+        message = raw_cmd.encode(raw_cmd.protocol_command_id, snappy_support=True)
+        assert message == cmd.encode(cmd.protocol_command_id, snappy_support=True)
+        assert type(cmd).decode(message, snappy_support=True).payload == cmd.payload
+
+
+class FakeETHAPI:
+    def __init__(self):
+        self.encoded_bodies = None
+        self.encoded_receipts = None
+
+    def send_encoded_block_bodies(self, encoded_bodies):
+        self.encoded_bodies = encoded_bodies
+
+    def send_encoded_receipts(self, encoded_receipts):
+        self.encoded_receipts = encoded_receipts
+
+
+class FakePeer:
+    session = "session"
+
+    def __init__(self):
+        self.eth_api = FakeETHAPI()
+
+
+@pytest.mark.asyncio
+async def test_handler_serves_encoded_block_bodies(chaindb, block):
+    header, body, _ = block
+    handler = ETHPeerRequestHandler(chaindb)
+    peer = FakePeer()
+
+    block_hashes = (header.hash, UNKNOWN_BLOCK_HASH, header.hash)
+    await handler.handle_get_block_bodies(peer, GetBlockBodiesV65(block_hashes))
+    assert peer.eth_api.encoded_bodies == (rlp.encode(body), rlp.encode(body))
+    assert tuple(handler._encoded_bodies_cache) == (header.hash,)
+
+    # later requests are served from the cache
+    chaindb.db.delete(header.transaction_root)
+    await handler.handle_get_block_bodies(peer, GetBlockBodiesV65((header.hash,)))
+    assert peer.eth_api.encoded_bodies == (rlp.encode(body),)
+
+
+@pytest.mark.asyncio
+async def test_handler_serves_encoded_receipts(chaindb, block):
+    header, _, receipts = block
+    handler = ETHPeerRequestHandler(chaindb)
+    peer = FakePeer()
+
+    await handler.handle_get_receipts(peer, GetReceiptsV65((UNKNOWN_BLOCK_HASH, header.hash)))
+    assert peer.eth_api.encoded_receipts == (rlp.encode(receipts),)
+
+
+@pytest.mark.asyncio
+async def test_handler_delays_peers_that_used_up_their_serving_time(chaindb, block):
+    header, _, _ = block
+    handler = ETHPeerRequestHandler(chaindb)
+    peer = FakePeer()
+
+    budget = TokenBucket(rate=10, capacity=1)
+    # the peer is 0.5 seconds of serving in debt
+    budget._take(6)
+    handler._serving_budgets[peer.session] = budget
+
+    start_at = time.perf_counter()
+    await handler.handle_get_receipts(peer, GetReceiptsV65((header.hash,)))
+    assert time.perf_counter() - start_at >= 0.5
+    assert len(peer.eth_api.encoded_receipts) == 1
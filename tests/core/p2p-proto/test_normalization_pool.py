@@ -0,0 +1,198 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import os
+import random
+
+from async_service import background_asyncio_service
+from eth_hash.auto import keccak
+from eth_utils import big_endian_to_int, ValidationError
+from pyformance import MetricsRegistry
+import pytest
+import rlp
+
+from eth.db.trie import make_trie_root_and_nodes
+from eth.rlp.headers import BlockHeader
+from eth.rlp.receipts import Receipt
+from eth.rlp.transactions import BaseTransactionFields
+
+from p2p.exchange import BasePoolNormalizer, NormalizationPool
+
+from trinity.protocol.common.typing import NodeDataBundles
+from trinity.protocol.eth.commands import BlockBodiesV65, NodeDataV65, ReceiptsV65
+from trinity.protocol.eth.normalizers import (
+    GetBlockBodiesNormalizer,
+    GetNodeDataNormalizer,
+    ReceiptsNormalizer,
+)
+from trinity.rlp.block_body import BlockBody
+from trinity.tools.factories import ChainContextFactory, LatestETHPeerPairFactory
+
+
+def mk_transaction():
+    return BaseTransactionFields(
+        nonce=0,
+        gas=21000,
+        gas_price=1,
+        to=os.urandom(20),
+        value=random.randint(0, 100),
+        data=b'',
+        v=27,
+        r=big_endian_to_int(os.urandom(32)),
+        s=big_endian_to_int(os.urandom(32)),
+    )
+
+
+def mk_receipt():
+    return Receipt(state_root=os.urandom(32), gas_used=21000, bloom=0, logs=[])
+
+
+def round_trip(cmd):
+    # decoded commands are what the normalizers get from peers
+    message = cmd.encode(cmd.protocol_command_id, snappy_support=False)
+    return type(cmd).decode(message, snappy_support=False)
+
+
+@pytest.fixture
+def receipts_cmd():
+    return round_trip(ReceiptsV65(tuple(
+        tuple(mk_receipt() for _ in range(num_receipts))
+        for num_receipts in (1, 3, 0, 5)
+    )))
+
+
+@pytest.fixture
+def block_bodies_cmd():
+    return round_trip(BlockBodiesV65(tuple(
+        BlockBody(
+            transactions=tuple(mk_transaction() for _ in range(num_transactions)),
+            uncles=tuple(BlockHeader(1, 1, 1) for _ in range(num_uncles)),
+        )
+        for num_transactions, num_uncles in ((2, 0), (0, 1), (4, 2))
+    )))
+
+
+def test_receipts_normalizer(receipts_cmd):
+    result = ReceiptsNormalizer().normalize_result(receipts_cmd)
+    assert result == tuple(
+        (receipts, make_trie_root_and_nodes(receipts)) for receipts in receipts_cmd.payload
+    )
+
+
+def test_block_bodies_normalizer(block_bodies_cmd):
+    result = GetBlockBodiesNormalizer().normalize_result(block_bodies_cmd)
+    assert result == tuple(
+        (body, make_trie_root_and_nodes(body.transactions), keccak(rlp.encode(body.uncles)))
+        for body in block_bodies_cmd.payload
+    )
+
+
+def test_node_data_normalizer():
+    nodes = (b'\x01' * 40, b'\x02' * 80)
+    result = GetNodeDataNormalizer().normalize_result(NodeDataV65(nodes))
+    assert result == tuple((keccak(node), node) for node in nodes)
+
+
+class KeccakNormalizer(BasePoolNormalizer[NodeDataV65, NodeDataBundles]):
+    def get_job(self, cmd):
+        return cmd.payload
+
+    @staticmethod
+    def normalize_job(nodes):
+        return tuple(map(keccak, nodes))
+
+    def build_result(self, cmd, node_keys):
+        return tuple(zip(node_keys, cmd.payload))
+
+
+class FailingNormalizer(BasePoolNormalizer[NodeDataV65, None]):
+    def get_job(self, cmd):
+        return cmd.payload
+
+    @staticmethod
+    def normalize_job(job):
+        raise ValidationError("Bad node data")
+
+    def build_result(self, cmd, job_output):
+        return job_output
+
+
+@pytest.mark.asyncio
+async def test_normalization_pool_in_worker_processes(receipts_cmd, block_bodies_cmd):
+    metrics_registry = MetricsRegistry()
+    pool = NormalizationPool(
+        executor=ProcessPoolExecutor(1),
+        metrics_registry=metrics_registry,
+    )
+    async with background_asyncio_service(pool):
+        receipts, block_bodies = await asyncio.wait_for(
+            asyncio.gather(
+                pool.normalize(ReceiptsNormalizer(), receipts_cmd),
+                pool.normalize(GetBlockBodiesNormalizer(), block_bodies_cmd),
+            ),
+            timeout=10,
+        )
+        assert receipts == ReceiptsNormalizer().normalize_result(receipts_cmd)
+        assert block_bodies == GetBlockBodiesNormalizer().normalize_result(block_bodies_cmd)
+        assert pool.queue_depth == 0
+
+    timings = metrics_registry.histogram('trinity.p2p/normalization/ReceiptsNormalizer.histogram')
+    assert timings.get_count() == 1
+
+
+@pytest.mark.asyncio
+async def test_normalization_pool_batches_jobs():
+    metrics_registry = MetricsRegistry()
+    pool = NormalizationPool(
+        executor=ThreadPoolExecutor(),
+        batch_size=3,
+        batch_window=10,
+        metrics_registry=metrics_registry,
+    )
+    async with background_asyncio_service(pool):
+        # a full batch is normalized without waiting for the batch window
+        results = await asyncio.wait_for(
+            asyncio.gather(*(
+                pool.normalize(KeccakNormalizer(), NodeDataV65((bytes([i]),)))
+                for i in range(3)
+            )),
+            timeout=5,
+        )
+        assert results == [((keccak(bytes([i])), bytes([i])),) for i in range(3)]
+
+        batch_sizes = metrics_registry.histogram('trinity.p2p/normalization/batch_size.histogram')
+        assert batch_sizes.get_count() == 1
+        assert batch_sizes.get_max() == 3
+
+
+@pytest.mark.asyncio
+async def test_normalization_pool_raises_normalization_errors():
+    pool = NormalizationPool(executor=ThreadPoolExecutor(), batch_window=0.01)
+    async with background_asyncio_service(pool):
+        with pytest.raises(ValidationError):
+            await asyncio.wait_for(
+                pool.normalize(FailingNormalizer(), NodeDataV65((b'\x01',))),
+                timeout=5,
+            )
+
+
+@pytest.mark.asyncio
+async def test_eth_peer_get_receipts_with_normalization_pool(receipts_cmd):
+    metrics_registry = MetricsRegistry()
+    pool = NormalizationPool(executor=ThreadPoolExecutor(), metrics_registry=metrics_registry)
+    receipts = receipts_cmd.payload
+    headers = tuple(
+        BlockHeader(1, block_number, 1, receipt_root=make_trie_root_and_nodes(receipts)[0])
+        for block_number, receipts in enumerate(receipts, 1)
+    )
+
+    async with background_asyncio_service(pool):
+        peer_context = ChainContextFactory(normalization_pool=pool)
+        async with LatestETHPeerPairFactory(alice_peer_context=peer_context) as (peer, remote):
+            get_receipts_task = asyncio.ensure_future(peer.eth_api.get_receipts(headers))
+            await asyncio.sleep(0)
+            remote.eth_api.send_receipts(receipts)
+            response = await asyncio.wait_for(get_receipts_task, timeout=5)
+
+    assert response == ReceiptsNormalizer().normalize_result(receipts_cmd)
+    timings = metrics_registry.histogram('trinity.p2p/normalization/ReceiptsNormalizer.histogram')
+    assert timings.get_count() == 1
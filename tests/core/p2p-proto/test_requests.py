@@ -6,6 +6,8 @@ import pytest
 from async_service import background_asyncio_service
 from eth_utils import decode_hex
 
+from eth.vm.forks.spurious_dragon.transactions import SpuriousDragonTransaction
+
 from p2p.exceptions import PeerConnectionLost
 from trinity.components.builtin.tx_pool.pool import TxPool
 
@@ -114,6 +116,7 @@ async def test_get_pooled_transactions_request(request,
                                                other_event_bus,
                                                event_loop,
                                                chaindb_20,
+                                               funded_address_private_key,
                                                client_and_server):
     server_event_bus = event_bus
     client_event_bus = other_event_bus
@@ -145,17 +148,30 @@ async def test_get_pooled_transactions_request(request,
         # The reason we run this test separately from the other request tests is because
         # GetPooledTransactions requests should be answered from the tx pool which the previous
         # test does not depend on.
-        await stack.enter_async_context(background_asyncio_service(TxPool(
+        tx_pool = TxPool(
             server_event_bus,
             proxy_peer_pool,
             lambda _: True
-        )))
-
-        # The tx pool always answers these with an empty response
-        txs = await proxy_peer.eth_api.get_pooled_transactions(
-            (decode_hex('0x9ea39df6210064648ecbc465cd628fe52f69af53792e1c2f27840133435159d4'),)
         )
-        assert len(txs) == 0
+        await stack.enter_async_context(background_asyncio_service(tx_pool))
+
+        pooled_tx = SpuriousDragonTransaction.create_unsigned_transaction(
+            nonce=0,
+            gas_price=1,
+            gas=21000,
+            to=b'\x10' * 20,
+            value=1,
+            data=b'',
+        ).as_signed_transaction(funded_address_private_key, chain_id=1)
+        tx_pool.pending_transactions.add(pooled_tx)
+
+        # The tx pool skips the transactions it doesn't have
+        txs = await proxy_peer.eth_api.get_pooled_transactions((
+            decode_hex('0x9ea39df6210064648ecbc465cd628fe52f69af53792e1c2f27840133435159d4'),
+            pooled_tx.hash,
+        ))
+        assert len(txs) == 1
+        assert txs[0].hash == pooled_tx.hash
 
 
 @pytest.mark.asyncio
@@ -9,6 +9,7 @@ from eth.consensus import ConsensusContext
 from eth.constants import EMPTY_SHA3
 from eth.db.atomic import AtomicDB
 from eth.db.schema import SchemaV1
+from eth.db.trie import make_trie_root_and_nodes
 from eth.exceptions import (
     BlockNotFound,
     HeaderNotFound,
@@ -18,7 +19,7 @@ from eth.vm.forks import (
     MuirGlacierVM,
     PetersburgVM,
 )
-from eth_utils import decode_hex
+from eth_utils import ValidationError, decode_hex
 from lahja import ConnectionConfig, AsyncioEndpoint
 import pytest
 import rlp
@@ -133,6 +134,40 @@ def chaindb_with_block_gaps(chaindb_fresh, chaindb_1000):
     yield chaindb_fresh
 
 
+def test_persist_block_chain(chaindb_fresh, chaindb_20):
+    fat_chain = LatestTestChain(chaindb_20.db)
+    blocks = tuple(fat_chain.get_canonical_block_by_number(number) for number in range(1, 21))
+    receipt_trie_data_dicts = tuple(
+        make_trie_root_and_nodes(block.get_receipts(chaindb_20))[1]
+        for block in blocks
+    )
+
+    new_canonical_hashes, old_canonical_hashes = AsyncChainDB(
+        chaindb_fresh.db,
+    ).persist_block_chain(blocks, receipt_trie_data_dicts)
+
+    assert new_canonical_hashes == tuple(block.hash for block in blocks)
+    assert old_canonical_hashes == ()
+    assert chaindb_fresh.get_canonical_head() == blocks[-1].header
+    for block in blocks:
+        assert block.get_receipts(chaindb_fresh) == block.get_receipts(chaindb_20)
+
+
+def test_persist_block_chain_is_atomic(chaindb_fresh, chaindb_20):
+    fat_chain = LatestTestChain(chaindb_20.db)
+    first_block, second_block = (
+        fat_chain.get_canonical_block_by_number(number) for number in (1, 2)
+    )
+    # the uncles don't match the uncles hash of the header
+    invalid_block = second_block.copy(uncles=(first_block.header,))
+
+    with pytest.raises(ValidationError):
+        AsyncChainDB(chaindb_fresh.db).persist_block_chain((first_block, invalid_block))
+
+    assert chaindb_fresh.get_canonical_head().block_number == 0
+    assert not chaindb_fresh.header_exists(first_block.hash)
+
+
 @pytest.mark.asyncio
 async def test_fast_syncer(request, event_loop, event_bus, chaindb_fresh, chaindb_1000):
 
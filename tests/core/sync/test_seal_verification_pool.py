@@ -0,0 +1,173 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from async_service import background_asyncio_service
+from eth_hash.auto import keccak
+from eth_utils import ValidationError
+import pytest
+
+from eth.consensus.noproof import NoProofConsensus
+from eth.consensus.pow import PowConsensus
+from eth.rlp.headers import BlockHeader
+
+from trinity.sync.common import seals
+from trinity.sync.common.constants import ETHASH_CACHE_MAX_EPOCHS
+from trinity.sync.common.seals import (
+    SealVerificationPool,
+    validate_header_chain,
+)
+
+
+EPOCH_LENGTH = seals.EPOCH_LENGTH
+
+
+def fake_mkcache_bytes(block_number):
+    return keccak(block_number.to_bytes(32, 'big')) * 4
+
+
+def fake_hashimoto_light(block_number, cache, mining_hash, nonce):
+    return {
+        b'mix digest': keccak(bytes(cache[:32]) + mining_hash + nonce.to_bytes(8, 'big')),
+        b'result': b'\x00' * 32,
+    }
+
+
+@pytest.fixture(autouse=True)
+def fake_ethash(monkeypatch):
+    generated_caches = []
+
+    def mkcache_bytes(block_number):
+        generated_caches.append(block_number // EPOCH_LENGTH)
+        return fake_mkcache_bytes(block_number)
+
+    monkeypatch.setattr(seals, 'mkcache_bytes', mkcache_bytes)
+    monkeypatch.setattr(seals, 'hashimoto_light', fake_hashimoto_light)
+    return generated_caches
+
+
+def mk_header(block_number, is_valid=True):
+    header = BlockHeader(difficulty=1, block_number=block_number, gas_limit=3141592)
+    cache = fake_mkcache_bytes(block_number // EPOCH_LENGTH * EPOCH_LENGTH)
+    mix_hash = fake_hashimoto_light(block_number, cache, header.mining_hash, 0)[b'mix digest']
+    if not is_valid:
+        mix_hash = keccak(mix_hash)
+    return header.copy(mix_hash=mix_hash, nonce=b'\x00' * 8)
+
+
+@pytest.fixture
+async def pool(tmp_path):
+    pool = SealVerificationPool(tmp_path, executor=ThreadPoolExecutor(2), batch_size=2)
+    async with background_asyncio_service(pool):
+        yield pool
+
+
+class FakeVM:
+    consensus_class = PowConsensus
+
+
+class FakeChain:
+    vm_class = FakeVM
+
+    def __init__(self):
+        self.validations = []
+
+    def get_vm_class(self, header):
+        return self.vm_class
+
+    async def coro_validate_chain(self, parent, headers, seal_check_random_sample_rate=1):
+        self.validations.append((parent, headers, seal_check_random_sample_rate))
+
+
+@pytest.mark.asyncio
+async def test_verify_seals(pool, tmp_path, fake_ethash):
+    headers = tuple(
+        mk_header(block_number)
+        for block_number in (1, 2, 3, EPOCH_LENGTH + 1, EPOCH_LENGTH + 2)
+    )
+    await pool.verify_seals(headers)
+    await pool.verify_seals(headers)
+
+    # every cache is generated once, and shared by the workers
+    assert fake_ethash == [0, 1]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['cache-0', 'cache-1']
+
+
+@pytest.mark.asyncio
+async def test_verify_seals_rejects_invalid_seals(pool):
+    headers = tuple(mk_header(block_number) for block_number in range(1, 5))
+    invalid_header = mk_header(5, is_valid=False)
+
+    with pytest.raises(ValidationError, match="mix hash mismatch"):
+        await pool.verify_seals(headers + (invalid_header,))
+
+
+@pytest.mark.asyncio
+async def test_verify_seals_removes_old_caches(pool, tmp_path):
+    for epoch in range(ETHASH_CACHE_MAX_EPOCHS + 2):
+        await pool.verify_seals((mk_header(epoch * EPOCH_LENGTH + 1),))
+
+    # wait for the evicted caches to be removed
+    await asyncio.sleep(0)
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        f'cache-{epoch}' for epoch in range(2, ETHASH_CACHE_MAX_EPOCHS + 2)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_validate_header_chain_without_pool():
+    chain = FakeChain()
+    parent, *headers = (mk_header(block_number) for block_number in range(4))
+
+    await validate_header_chain(chain, parent, tuple(headers), 48)
+    assert chain.validations == [(parent, tuple(headers), 48)]
+
+
+@pytest.mark.asyncio
+async def test_validate_header_chain_with_pool(pool):
+    chain = FakeChain()
+    parent = mk_header(0)
+    headers = tuple(mk_header(block_number) for block_number in range(1, 4))
+
+    await validate_header_chain(chain, parent, headers, seal_verification_pool=pool)
+    # the seals are checked by the pool, the rest by the chain
+    assert chain.validations == [(parent, headers, 0)]
+
+    with pytest.raises(ValidationError):
+        await validate_header_chain(
+            chain,
+            parent,
+            headers + (mk_header(4, is_valid=False),),
+            seal_verification_pool=pool,
+        )
+
+
+@pytest.mark.asyncio
+async def test_validate_header_chain_with_full_verification(tmp_path):
+    pool = SealVerificationPool(
+        tmp_path,
+        executor=ThreadPoolExecutor(2),
+        seal_check_random_sample_rate=1,
+    )
+    chain = FakeChain()
+    parent = mk_header(0)
+    headers = tuple(mk_header(block_number) for block_number in range(1, 4))
+    invalid_headers = headers + (mk_header(4, is_valid=False),)
+
+    async with background_asyncio_service(pool):
+        # the sample rate that the syncer asks for is overridden, so every seal is checked
+        with pytest.raises(ValidationError):
+            await validate_header_chain(chain, parent, invalid_headers, 0, pool)
+
+
+@pytest.mark.asyncio
+async def test_validate_header_chain_with_pool_and_other_consensus(pool):
+    class NoProofVM:
+        consensus_class = NoProofConsensus
+
+    chain = FakeChain()
+    chain.vm_class = NoProofVM
+    parent = mk_header(0)
+    headers = tuple(mk_header(block_number, is_valid=False) for block_number in range(1, 4))
+
+    await validate_header_chain(chain, parent, headers, seal_verification_pool=pool)
+    assert chain.validations == [(parent, headers, 1)]
@@ -1,4 +1,5 @@
 import tempfile
+import time
 import logging
 from multiprocessing import Process
 from pathlib import Path
@@ -6,7 +7,7 @@ import uuid
 
 import pytest
 
-from trinity._utils.logging import IPCListener, IPCHandler
+from trinity._utils.logging import IPCListener, IPCHandler, _encode_log_batch as encode_log_batch
 
 
 @pytest.fixture
@@ -59,3 +60,128 @@ def test_queued_logging(ipc_path):
     assert 'error log' in error_log.message
     assert 'info log' in info_log.message
     assert 'debug log' in debug_log.message
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        self.logs = []
+        super().__init__()
+
+    def handle(self, record):
+        self.logs.append(record)
+
+
+def wait_for_logs(handler, num_logs):
+    for _ in range(100):
+        if len(handler.logs) >= num_logs:
+            break
+        time.sleep(0.01)
+    return handler.logs
+
+
+def test_batched_logging(ipc_path):
+    recording_handler = RecordingHandler()
+
+    with IPCListener(recording_handler).run(ipc_path):
+        ipc_handler = IPCHandler.connect(ipc_path)
+        logger = logging.getLogger(str(uuid.uuid4()))
+        logger.addHandler(ipc_handler)
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+
+        for index in range(2000):
+            logger.debug('debug log %d', index)
+        try:
+            raise ValueError('oops')
+        except ValueError:
+            logger.exception('error log')
+        ipc_handler.close()
+
+        logs = wait_for_logs(recording_handler, 2001)
+
+    assert [log.message for log in logs[:2000]] == [f'debug log {index}' for index in range(2000)]
+    assert all(log.name == logger.name and log.levelname == 'DEBUG' for log in logs[:2000])
+
+    error_log = logs[2000]
+    assert error_log.levelno == logging.ERROR
+    assert error_log.message.startswith('error log\nTraceback')
+    assert "ValueError: oops" in error_log.message
+    assert ipc_handler.num_dropped == 0
+
+
+def test_logging_drops_records_under_backpressure(ipc_path):
+    recording_handler = RecordingHandler()
+
+    with IPCListener(recording_handler).run(ipc_path):
+        # Nothing can be queued, so only warnings and errors make it through
+        ipc_handler = IPCHandler.connect(ipc_path, max_queued=0)
+        logger = logging.getLogger(str(uuid.uuid4()))
+        logger.addHandler(ipc_handler)
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+
+        logger.info('info log')
+        logger.debug('debug log')
+        logger.warning('warning log')
+        ipc_handler.close()
+
+        logs = wait_for_logs(recording_handler, 2)
+
+    assert ipc_handler.num_dropped == 2
+    assert [log.message for log in logs] == [
+        'warning log',
+        'Dropped 2 log records, the log listener is falling behind',
+    ]
+
+
+def test_logging_formats_records_when_logged(ipc_path):
+    recording_handler = RecordingHandler()
+
+    with IPCListener(recording_handler).run(ipc_path):
+        ipc_handler = IPCHandler.connect(ipc_path)
+        logger = logging.getLogger(str(uuid.uuid4()))
+        logger.addHandler(ipc_handler)
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+
+        items = ['first']
+        logger.info('items: %s', items)
+        # Changes after the record was logged must not show up in its message
+        items.append('second')
+        ipc_handler.close()
+
+        logs = wait_for_logs(recording_handler, 1)
+
+    assert [log.message for log in logs] == ["items: ['first']"]
+
+
+def test_logging_survives_failed_batches(ipc_path, monkeypatch):
+    recording_handler = RecordingHandler()
+    failed_batches = []
+
+    def fail_first_batch(records):
+        if not failed_batches:
+            failed_batches.append(records)
+            raise ValueError('Broken batch')
+        return encode_log_batch(records)
+
+    monkeypatch.setattr('trinity._utils.logging._encode_log_batch', fail_first_batch)
+
+    with IPCListener(recording_handler).run(ipc_path):
+        ipc_handler = IPCHandler.connect(ipc_path)
+        logger = logging.getLogger(str(uuid.uuid4()))
+        logger.addHandler(ipc_handler)
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+
+        logger.info('lost log')
+        for _ in range(100):
+            if failed_batches:
+                break
+            time.sleep(0.01)
+        logger.info('relayed log')
+        ipc_handler.close()
+
+        logs = wait_for_logs(recording_handler, 1)
+
+    assert [log.message for log in logs] == ['relayed log']
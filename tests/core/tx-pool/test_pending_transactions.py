@@ -0,0 +1,178 @@
+import time
+
+import pytest
+import rlp
+
+from eth_keys import keys
+from eth.vm.forks.spurious_dragon.transactions import SpuriousDragonTransaction
+
+from trinity.components.builtin.tx_pool.pending import PendingTransactions
+
+
+SENDER_KEYS = tuple(keys.PrivateKey(bytes([index]) * 32) for index in range(1, 4))
+
+
+def mk_tx(private_key, nonce, gas_price=1, value=1):
+    return SpuriousDragonTransaction.create_unsigned_transaction(
+        nonce=nonce,
+        gas_price=gas_price,
+        gas=21000,
+        to=b'\x10' * 20,
+        value=value,
+        data=b'',
+    ).as_signed_transaction(private_key, chain_id=1)
+
+
+def size_of(*txs):
+    return sum(len(rlp.encode(tx)) for tx in txs)
+
+
+@pytest.fixture
+def alice():
+    return SENDER_KEYS[0]
+
+
+@pytest.fixture
+def bob():
+    return SENDER_KEYS[1]
+
+
+def test_add_and_get(alice):
+    pending = PendingTransactions()
+    tx = mk_tx(alice, 0)
+
+    assert pending.add(tx)
+    assert tx.hash in pending
+    assert pending.get(tx.hash) == tx
+    assert len(pending) == 1
+    assert pending.num_bytes == size_of(tx)
+
+    # the same transaction is only added once
+    assert not pending.add(tx)
+    assert len(pending) == 1
+
+
+def test_sender_transactions_are_ordered_by_nonce(alice, bob):
+    pending = PendingTransactions()
+    alice_txs = tuple(mk_tx(alice, nonce) for nonce in (2, 0, 1))
+    for tx in alice_txs + (mk_tx(bob, 0),):
+        assert pending.add(tx)
+
+    sender = alice.public_key.to_canonical_address()
+    assert pending.get_sender_transactions(sender) == (
+        alice_txs[1],
+        alice_txs[2],
+        alice_txs[0],
+    )
+
+
+@pytest.mark.parametrize(
+    'gas_price, is_replaced',
+    (
+        (100, False),
+        (109, False),
+        (110, True),
+        (200, True),
+    ),
+)
+def test_replace_by_fee(alice, gas_price, is_replaced):
+    pending = PendingTransactions(price_bump=10)
+    original_tx = mk_tx(alice, 0, gas_price=100)
+    replacement_tx = mk_tx(alice, 0, gas_price=gas_price, value=2)
+    pending.add(original_tx)
+
+    assert pending.add(replacement_tx) is is_replaced
+    assert len(pending) == 1
+    assert (replacement_tx.hash in pending) is is_replaced
+    assert (original_tx.hash in pending) is not is_replaced
+
+
+def test_max_transactions_per_sender(alice):
+    pending = PendingTransactions(max_per_sender=2)
+    assert pending.add(mk_tx(alice, 0))
+    assert pending.add(mk_tx(alice, 1))
+    assert not pending.add(mk_tx(alice, 2))
+
+    # replacements are still accepted
+    assert pending.add(mk_tx(alice, 1, gas_price=2))
+
+
+def test_eviction_of_cheapest_transactions(alice, bob):
+    alice_txs = tuple(mk_tx(alice, nonce, gas_price=10 - nonce) for nonce in range(3))
+    bob_txs = (mk_tx(bob, 0, gas_price=5), mk_tx(bob, 1, gas_price=20))
+    pending = PendingTransactions(max_bytes=size_of(*alice_txs, *bob_txs))
+    for tx in alice_txs + bob_txs:
+        assert pending.add(tx)
+
+    # Bob's first transaction is the cheapest, it is evicted together with his later nonce
+    carol_tx = mk_tx(SENDER_KEYS[2], 0, gas_price=7)
+    assert pending.add(carol_tx)
+    assert all(tx.hash not in pending for tx in bob_txs)
+    assert len(pending) == 4
+    assert pending.num_bytes == size_of(*alice_txs, carol_tx)
+
+
+def test_eviction_rejects_cheapest_new_transaction(alice, bob):
+    alice_tx = mk_tx(alice, 0, gas_price=10)
+    pending = PendingTransactions(max_bytes=size_of(alice_tx))
+    pending.add(alice_tx)
+
+    assert not pending.add(mk_tx(bob, 0, gas_price=1))
+    assert len(pending) == 1
+    assert alice_tx.hash in pending
+
+
+def test_prune_mined(alice, bob):
+    pending = PendingTransactions()
+    alice_txs = tuple(mk_tx(alice, nonce) for nonce in range(4))
+    bob_tx = mk_tx(bob, 0)
+    for tx in alice_txs + (bob_tx,):
+        pending.add(tx)
+
+    # A different transaction with Alice's nonce 1 was mined, which also settles nonce 0
+    mined_txs = (mk_tx(alice, 1, value=2), mk_tx(SENDER_KEYS[2], 0))
+    assert pending.prune_mined(mined_txs) == 2
+
+    assert len(pending) == 3
+    assert pending.get_sender_transactions(alice.public_key.to_canonical_address()) == (
+        alice_txs[2:]
+    )
+    assert bob_tx.hash in pending
+    assert pending.num_bytes == size_of(*alice_txs[2:], bob_tx)
+
+
+def test_prune_expired(monkeypatch, alice, bob):
+    clock = [0.0]
+    monkeypatch.setattr(time, 'monotonic', lambda: clock[0])
+
+    pending = PendingTransactions(max_age=60)
+    alice_txs = tuple(mk_tx(alice, nonce) for nonce in range(2))
+    bob_tx = mk_tx(bob, 0)
+    carol_tx = mk_tx(SENDER_KEYS[2], 0)
+    pending.add(alice_txs[0])
+    pending.add(bob_tx)
+    clock[0] = 50.0
+    pending.add(alice_txs[1])
+    pending.add(carol_tx)
+
+    assert pending.prune_expired() == 0
+    # Alice's later nonce can't be executed without her expired transaction
+    assert pending.prune_expired(100.0) == 3
+    assert len(pending) == 1
+    assert carol_tx.hash in pending
+    assert pending.num_bytes == size_of(carol_tx)
+
+    assert pending.prune_expired(111.0) == 1
+    assert len(pending) == 0
+
+
+def test_remove(alice):
+    pending = PendingTransactions()
+    tx = mk_tx(alice, 0)
+    pending.add(tx)
+
+    pending.remove(tx.hash)
+    pending.remove(tx.hash)
+    assert len(pending) == 0
+    assert pending.num_bytes == 0
+    assert pending.get_sender_transactions(alice.public_key.to_canonical_address()) == ()
@@ -7,6 +7,7 @@ from async_service import background_asyncio_service
 from eth._utils.address import (
     force_bytes_to_address
 )
+from eth.rlp.transactions import BaseTransactionFields
 
 from trinity._utils.transactions import DefaultTransactionValidator
 from trinity.components.builtin.tx_pool.pool import (
@@ -228,3 +229,44 @@ def create_random_tx(chain, private_key, is_valid=True):
         to=force_bytes_to_address(b'\x10\x10'),
         value=1,
     ).as_signed_transaction(private_key, chain_id=chain.chain_id)
+
+
+class FakeBlock:
+    def __init__(self, header, transactions):
+        self.header = header
+        self.number = header.block_number
+        self.transactions = transactions
+
+
+@pytest.mark.asyncio
+async def test_prunes_transactions_of_new_canonical_blocks(chain_with_block_validation,
+                                                           funded_address_private_key):
+    chain = chain_with_block_validation
+    txs = tuple(
+        chain.create_unsigned_transaction(
+            nonce=nonce,
+            gas_price=1,
+            gas=21000,
+            to=force_bytes_to_address(b'\x10\x10'),
+            value=1,
+            data=b'',
+        ).as_signed_transaction(funded_address_private_key, chain_id=chain.chain_id)
+        for nonce in range(3)
+    )
+
+    tx_pool = TxPool(None, None, lambda _: True, chain=chain)
+    head = chain.get_canonical_head()
+    tx_pool._update_transaction_class(head)
+
+    # transactions arrive as their plain fields from the wire
+    assert tx_pool._add_txs_to_pool(tuple(
+        BaseTransactionFields(**tx.as_dict()) for tx in txs
+    )) == txs
+    assert len(tx_pool.pending_transactions) == 3
+
+    tx_pool._prune_canonical_blocks((
+        FakeBlock(head.copy(block_number=1), ()),
+        FakeBlock(head.copy(block_number=2), txs[:2]),
+    ))
+    assert len(tx_pool.pending_transactions) == 1
+    assert txs[2].hash in tx_pool.pending_transactions
@@ -5,6 +5,7 @@ from eth.exceptions import BlockNotFound, ParentNotFound
 from hypothesis import given
 from hypothesis import strategies as st
 import pytest
+import ssz
 
 from eth2._utils.hash import hash_eth2
 from eth2._utils.ssz import validate_ssz_equal
@@ -15,7 +16,18 @@ from eth2.beacon.db.exceptions import (
     HeadStateSlotNotFound,
     JustifiedHeadNotFound,
 )
+from eth2.beacon.db.chain import (
+    STATE_CACHE_MAX_BYTES,
+    BeaconChainDB,
+    get_slot_and_parent_root_from_ssz,
+)
 from eth2.beacon.db.schema import SchemaV1
+from eth2.beacon.db.state_cache import (
+    FINALIZED_STATE,
+    HEAD_STATE,
+    JUSTIFIED_STATE,
+    StateCache,
+)
 from eth2.beacon.fork_choice.higher_slot import HigherSlotScore
 from eth2.beacon.state_machines.forks.serenity.blocks import (
     BeaconBlock,
@@ -155,6 +167,21 @@ def test_chaindb_get_block_by_root(chaindb, block, fork_choice_scoring):
     validate_ssz_equal(result_block, block)
 
 
+def test_chaindb_get_block_ssz(chaindb, block, fork_choice_scoring):
+    block_root = block.message.hash_tree_root
+    with pytest.raises(BlockNotFound):
+        chaindb.get_block_ssz_by_root(block_root)
+
+    chaindb.persist_block(block, block.__class__, fork_choice_scoring)
+    block_ssz = chaindb.get_block_ssz_by_root(block_root)
+    assert block_ssz == ssz.encode(block)
+    assert chaindb.get_canonical_block_ssz_by_slot(block.slot) == block_ssz
+    assert get_slot_and_parent_root_from_ssz(block_ssz) == (
+        block.slot,
+        block.parent_root,
+    )
+
+
 def test_chaindb_get_canonical_block_root(chaindb, block, fork_choice_scoring):
     chaindb.persist_block(block, block.__class__, fork_choice_scoring)
     block_root = chaindb.get_canonical_block_root(block.slot)
@@ -334,3 +361,29 @@ def test_chaindb_get_attestation_key_by_root(
         block.message.hash_tree_root,
         0,
     )
+
+
+def test_chaindb_state_cache_is_keyed_by_root(chaindb, state):
+    chaindb.persist_state(state)
+    # drop the cached copy so the next read has to go to the database
+    chaindb.state_cache = StateCache(STATE_CACHE_MAX_BYTES)
+
+    state_root = state.hash_tree_root
+    first_read = chaindb.get_state_by_root(state_root, BeaconState)
+    second_read = chaindb.get_state_by_root(state_root, BeaconState)
+
+    assert first_read == state
+    assert second_read is first_read
+    assert chaindb.state_cache.misses == 1
+    assert chaindb.state_cache.hits == 1
+
+
+def test_chaindb_pins_checkpoint_states(base_db, chaindb_at_genesis, genesis_state):
+    genesis_state_root = genesis_state.hash_tree_root
+    for label in (HEAD_STATE, JUSTIFIED_STATE, FINALIZED_STATE):
+        assert chaindb_at_genesis.state_cache.get_pinned_root(label) == genesis_state_root
+
+    # the checkpoint states are pinned again when the database is reopened
+    reopened_chaindb = BeaconChainDB(base_db)
+    for label in (JUSTIFIED_STATE, FINALIZED_STATE):
+        assert reopened_chaindb.state_cache.get_pinned_root(label) == genesis_state_root
@@ -1,5 +1,9 @@
+import pytest
+import ssz
+
 from eth2.beacon.constants import EMPTY_SIGNATURE, GENESIS_SLOT
-from eth2.beacon.db.chain2 import BeaconChainDB
+from eth2.beacon.db.chain2 import LIST_PAGE_DEPTH, BeaconChainDB
+import eth2.beacon.db.schema2 as SchemaV1
 from eth2.beacon.types.blocks import BeaconBlock, SignedBeaconBlock
 from eth2.beacon.types.states import BeaconState
 from eth2.beacon.typing import Slot
@@ -55,3 +59,70 @@ def test_chain2_at_genesis(base_db, genesis_state, genesis_block, config):
     # assume the fork choice did finalize this block...
     chain_db.mark_canonical_block(block_at_future_slot.message)
     assert chain_db.get_block_by_slot(some_future_slot, BeaconBlock) == future_block
+
+
+def _read_list_chunks(db, list_root):
+    """
+    Return the length and the chunks of the list written by ``_write_list_pages``.
+    """
+    encoding = db[SchemaV1.list_root_to_page_roots(list_root)]
+    length = ssz.decode(encoding[:8], ssz.uint64)
+    chunks = []
+    for offset in range(8, len(encoding), 32):
+        page = db[SchemaV1.page_root_to_chunks(encoding[offset : offset + 32])]
+        chunks.extend(
+            page[chunk_offset : chunk_offset + 32]
+            for chunk_offset in range(0, len(page), 32)
+        )
+    return length, tuple(chunks)
+
+
+def test_chain2_persists_changed_list_pages(base_db, genesis_state, config):
+    chain_db = BeaconChainDB.from_genesis(
+        base_db, genesis_state, SignedBeaconBlock, config
+    )
+    balances = genesis_state.balances
+
+    state = genesis_state.transform(("balances", 0), balances[0] + 1)
+    chain_db.persist_state(state, config)
+    length, chunks = _read_list_chunks(base_db, state.balances.hash_tree_root)
+    assert length == len(state.balances)
+    assert chunks[: len(state.balances.chunks)] == tuple(state.balances.chunks)
+
+    # only the page holding the changed balance is written again
+    bytes_written = chain_db._state_bytes_written
+    state = state.transform(("balances", 1), balances[1] + 1)
+    chain_db.persist_state(state, config)
+    balances_page = 2 ** LIST_PAGE_DEPTH * 32
+    assert chain_db._state_bytes_written - bytes_written < 2 * balances_page
+
+    length, chunks = _read_list_chunks(base_db, state.balances.hash_tree_root)
+    assert length == len(state.balances)
+    assert chunks[: len(state.balances.chunks)] == tuple(state.balances.chunks)
+
+
+def test_chain2_failed_state_write_is_not_diffed_against(
+    base_db, genesis_state, config, monkeypatch
+):
+    chain_db = BeaconChainDB.from_genesis(
+        base_db, genesis_state, SignedBeaconBlock, config
+    )
+    balances = genesis_state.balances
+
+    def _fail(*args):
+        raise ValueError("write failed")
+
+    state = genesis_state.transform(("balances", 0), balances[0] + 1)
+    monkeypatch.setattr(chain_db, "_write_state_randao_mixes", _fail)
+    with pytest.raises(ValueError):
+        chain_db.persist_state(state, config)
+    monkeypatch.undo()
+    balances_key = SchemaV1.list_root_to_page_roots(state.balances.hash_tree_root)
+    assert balances_key not in base_db
+
+    # the page of the changed balance was never committed, so it is written now
+    state = state.transform(("balances", 1), balances[1] + 1)
+    chain_db.persist_state(state, config)
+    length, chunks = _read_list_chunks(base_db, state.balances.hash_tree_root)
+    assert length == len(state.balances)
+    assert chunks[: len(state.balances.chunks)] == tuple(state.balances.chunks)
@@ -0,0 +1,103 @@
+import pytest
+
+from eth2.beacon.db.state_cache import (
+    FINALIZED_STATE,
+    HEAD_STATE,
+    StateCache,
+    estimate_state_size,
+)
+from eth2.beacon.types.states import BeaconState
+
+
+@pytest.fixture()
+def states(sample_beacon_state_params):
+    state = BeaconState.create(**sample_beacon_state_params)
+    return tuple(state.set("slot", slot) for slot in range(8))
+
+
+def _make_cache(num_states, state):
+    # all states of the fixture have the same size
+    return StateCache(num_states * estimate_state_size(state))
+
+
+def _add(cache, *states):
+    for state in states:
+        cache.add(state.hash_tree_root, state)
+
+
+def test_state_cache_hit_and_miss(states):
+    cache = _make_cache(4, states[0])
+    state = states[0]
+
+    assert cache.get(state.hash_tree_root) is None
+    _add(cache, state)
+    assert cache.get(state.hash_tree_root) is state
+
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert cache.hit_rate == 0.5
+
+
+def test_state_cache_evicts_least_recently_used(states):
+    cache = _make_cache(2, states[0])
+    _add(cache, states[0], states[1])
+    # touch the oldest state so the other one is evicted instead
+    cache.get(states[0].hash_tree_root)
+    _add(cache, states[2])
+
+    assert len(cache) == 2
+    assert states[0].hash_tree_root in cache
+    assert states[1].hash_tree_root not in cache
+    assert states[2].hash_tree_root in cache
+    assert cache.evictions == 1
+
+
+def test_state_cache_keeps_pinned_states(states):
+    cache = _make_cache(2, states[0])
+    cache.pin(HEAD_STATE, states[0].hash_tree_root)
+    _add(cache, *states[:4])
+
+    assert states[0].hash_tree_root in cache
+    assert states[3].hash_tree_root in cache
+    assert len(cache) == 2
+
+    # moving the pin releases the previously pinned state
+    cache.pin(HEAD_STATE, states[3].hash_tree_root)
+    _add(cache, states[4])
+    assert states[0].hash_tree_root not in cache
+    assert states[3].hash_tree_root in cache
+
+
+def test_state_cache_evicts_states_before_finalized_first(states):
+    cache = _make_cache(3, states[0])
+    cache.pin(FINALIZED_STATE, states[2].hash_tree_root)
+    _add(cache, states[3], states[1], states[2])
+    # ``states[3]`` is the least recently used but ``states[1]`` predates finality
+    _add(cache, states[4])
+
+    assert states[1].hash_tree_root not in cache
+    assert states[3].hash_tree_root in cache
+
+
+def test_state_cache_grows_when_everything_is_pinned(states):
+    cache = _make_cache(1, states[0])
+    cache.pin(HEAD_STATE, states[0].hash_tree_root)
+    cache.pin(FINALIZED_STATE, states[1].hash_tree_root)
+    _add(cache, states[0], states[1])
+
+    assert len(cache) == 2
+    assert cache.evictions == 0
+
+
+def test_state_cache_is_bounded_by_size(states):
+    large_state = states[2].set("balances", (0,) * 100)
+    assert estimate_state_size(large_state) > estimate_state_size(states[0])
+    cache = _make_cache(2, states[0])
+    _add(cache, states[0], states[1])
+    assert cache.size == 2 * estimate_state_size(states[0])
+
+    # the larger state does not fit next to both of the others
+    _add(cache, large_state)
+    assert len(cache) == 1
+    assert large_state.hash_tree_root in cache
+    assert cache.size == estimate_state_size(large_state)
@@ -0,0 +1,103 @@
+import numpy as np
+
+from eth2.beacon.fork_choice.lmd_ghost2 import (
+    NO_NODE,
+    ProtoNodeIndex,
+    VoteStore,
+    _compute_deltas,
+)
+from eth2.beacon.typing import Epoch, Root
+
+
+def _root(index):
+    return Root(index.to_bytes(32, "little"))
+
+
+def _indices(num_nodes, index_offset=0):
+    return {
+        _root(index): ProtoNodeIndex(index)
+        for index in range(index_offset, index_offset + num_nodes)
+    }
+
+
+def _vote(votes, indices, validator_indices, node, target_epoch):
+    root = _root(node)
+    votes.process_attestations(
+        validator_indices, root, indices.get(root), Epoch(target_epoch)
+    )
+
+
+def test_compute_deltas_for_new_votes():
+    indices = _indices(4)
+    votes = VoteStore()
+    _vote(votes, indices, (0, 1), 1, 1)
+    _vote(votes, indices, (2,), 3, 1)
+    balances = np.array((10, 20, 30), dtype=np.int64)
+
+    deltas = _compute_deltas(indices, 0, votes, balances, balances)
+
+    assert deltas.tolist() == [0, 30, 0, 30]
+    # votes have been moved, so nothing changes the second time around
+    deltas = _compute_deltas(indices, 0, votes, balances, balances)
+    assert deltas.tolist() == [0, 0, 0, 0]
+
+
+def test_compute_deltas_for_moved_votes_and_changed_balances():
+    indices = _indices(3)
+    votes = VoteStore()
+    _vote(votes, indices, (0, 1), 1, 1)
+    old_balances = np.array((10, 20), dtype=np.int64)
+    _compute_deltas(indices, 0, votes, old_balances, old_balances)
+
+    _vote(votes, indices, (0,), 2, 2)
+    # stale votes are ignored
+    _vote(votes, indices, (1,), 2, 1)
+    new_balances = np.array((15, 25, 100), dtype=np.int64)
+    deltas = _compute_deltas(indices, 0, votes, old_balances, new_balances)
+
+    assert deltas.tolist() == [0, -10 - 20 + 25, 15]
+
+
+def test_compute_deltas_waits_for_unknown_blocks():
+    indices = _indices(2)
+    votes = VoteStore()
+    balances = np.array((10,), dtype=np.int64)
+    _vote(votes, indices, (0,), 5, 1)
+
+    deltas = _compute_deltas(indices, 0, votes, balances, balances)
+    assert deltas.tolist() == [0, 0]
+
+    indices[_root(5)] = ProtoNodeIndex(2)
+    deltas = _compute_deltas(indices, 0, votes, balances, balances)
+    assert deltas.tolist() == [0, 0, 10]
+
+
+def test_vote_store_forgets_pruned_nodes():
+    indices = _indices(4)
+    votes = VoteStore()
+    balances = np.array((10, 20), dtype=np.int64)
+    _vote(votes, indices, (0,), 1, 1)
+    _vote(votes, indices, (1,), 3, 1)
+    _compute_deltas(indices, 0, votes, balances, balances)
+
+    pruned_indices = _indices(2, index_offset=2)
+    votes.on_prune(ProtoNodeIndex(2))
+    assert votes.current_indices[:2].tolist() == [NO_NODE, 3]
+
+    _vote(votes, pruned_indices, (0, 1), 2, 2)
+    deltas = _compute_deltas(pruned_indices, 2, votes, balances, balances)
+    assert deltas.tolist() == [30, -20]
+
+
+def test_vote_store_forgets_unknown_blocks_before_finality():
+    indices = _indices(2)
+    votes = VoteStore()
+    balances = np.array((10, 20), dtype=np.int64)
+    _vote(votes, indices, (0,), 5, 1)
+    _vote(votes, indices, (1,), 6, 3)
+
+    votes.on_finalized(Epoch(2))
+    indices[_root(5)] = ProtoNodeIndex(2)
+    indices[_root(6)] = ProtoNodeIndex(3)
+    deltas = _compute_deltas(indices, 0, votes, balances, balances)
+    assert deltas.tolist() == [0, 0, 0, 20]
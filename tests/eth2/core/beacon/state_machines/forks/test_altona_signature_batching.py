@@ -0,0 +1,63 @@
+from eth_utils import ValidationError
+import milagro_bls_binding as milagro_bls
+import pytest
+
+from eth2.beacon.state_machines.forks.altona.eth2fastspec import (
+    SignatureSet,
+    aggregate_pubkeys,
+    bls_VerifyMultipleSignatureSets,
+    deferred_signature_verification,
+    verify_signature_set,
+)
+
+
+def _privkey(index):
+    return (index + 1).to_bytes(32, "big")
+
+
+def _signature_set(message, *indices, signer_offset=0):
+    pubkeys = tuple(milagro_bls.SkToPk(_privkey(index)) for index in indices)
+    signature = milagro_bls.Aggregate(
+        [milagro_bls.Sign(_privkey(index + signer_offset), message) for index in indices]
+    )
+    return SignatureSet(pubkeys, message, signature)
+
+
+@pytest.fixture
+def signature_sets():
+    return (
+        _signature_set(b"\x01" * 32, 0),
+        _signature_set(b"\x02" * 32, 1, 2, 3),
+        _signature_set(b"\x03" * 32, 2, 4),
+    )
+
+
+def test_aggregate_pubkeys(signature_sets):
+    _, (pubkeys, message, signature), _ = signature_sets
+    assert milagro_bls.Verify(aggregate_pubkeys(pubkeys), message, signature)
+
+
+def test_verify_multiple_signature_sets(signature_sets):
+    assert bls_VerifyMultipleSignatureSets(signature_sets)
+
+    invalid_set = _signature_set(b"\x04" * 32, 5, signer_offset=1)
+    assert not bls_VerifyMultipleSignatureSets(signature_sets + (invalid_set,))
+
+
+def test_deferred_signature_verification(signature_sets):
+    with deferred_signature_verification():
+        for signature_set in signature_sets:
+            assert verify_signature_set(*signature_set)
+
+    invalid_set = _signature_set(b"\x04" * 32, 5, signer_offset=1)
+    with pytest.raises(ValidationError):
+        with deferred_signature_verification():
+            # the invalid signature is only detected when leaving the context
+            assert verify_signature_set(*invalid_set)
+            for signature_set in signature_sets:
+                assert verify_signature_set(*signature_set)
+
+    # outside of the context, signatures are verified right away
+    for signature_set in signature_sets:
+        assert verify_signature_set(*signature_set)
+    assert not verify_signature_set(*invalid_set)
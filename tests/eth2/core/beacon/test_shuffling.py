@@ -0,0 +1,55 @@
+from array import array
+
+import numpy as np
+import pytest
+
+from eth2._utils.hash import hash_eth2
+from eth2.beacon.committee_helpers import compute_shuffled_index
+from eth2.beacon.shuffling import ShufflingCache, compute_shuffling
+
+SHUFFLE_ROUND_COUNT = 10
+
+
+@pytest.mark.parametrize("index_count", (0, 1, 2, 255, 256, 257, 1000))
+def test_compute_shuffling_matches_compute_shuffled_index(index_count):
+    seed = hash_eth2(index_count.to_bytes(8, "little"))
+    indices = np.arange(0, 3 * index_count, 3, dtype=np.uint64)
+
+    shuffling = compute_shuffling(indices, seed, SHUFFLE_ROUND_COUNT)
+
+    assert shuffling.tolist() == [
+        indices[
+            compute_shuffled_index(position, index_count, seed, SHUFFLE_ROUND_COUNT)
+        ]
+        for position in range(index_count)
+    ]
+
+
+def test_shuffling_cache():
+    cache = ShufflingCache(2)
+    seed = hash_eth2(b"\x01")
+    active_indices = tuple(range(100))
+
+    shuffling = cache.get(seed, active_indices, SHUFFLE_ROUND_COUNT)
+    assert isinstance(shuffling.active_indices, array)
+    assert tuple(shuffling.active_indices) == active_indices
+    assert sorted(shuffling.shuffling) == list(active_indices)
+    assert cache.get(seed, list(active_indices), SHUFFLE_ROUND_COUNT) is shuffling
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # a different active validator set is a different shuffling
+    assert cache.get(seed, active_indices[1:], SHUFFLE_ROUND_COUNT) is not shuffling
+    cache.get(hash_eth2(b"\x02"), active_indices, SHUFFLE_ROUND_COUNT)
+    assert len(cache) == 2
+    assert cache.get(seed, active_indices, SHUFFLE_ROUND_COUNT) is not shuffling
+
+
+def test_shuffling_committees():
+    cache = ShufflingCache(1)
+    shuffling = cache.get(hash_eth2(b"\x01"), range(10), SHUFFLE_ROUND_COUNT)
+    committees = [shuffling.get_committee(index, 3) for index in range(3)]
+
+    assert [len(committee) for committee in committees] == [3, 3, 4]
+    assert sum((list(committee) for committee in committees), []) == list(
+        shuffling.shuffling
+    )
@@ -0,0 +1,78 @@
+import pytest
+from ssz.hash_tree import compute_hash_tree
+from ssz.hashable_list import HashableList
+from ssz.sedes import List, uint64
+
+from eth2._utils.hash_tree import get_subtree_roots, update_elements
+from eth2.beacon.types.validators import Validator
+
+balances_sedes = List(uint64, 2 ** 40)
+
+
+@pytest.mark.parametrize("length", (1, 5, 100, 1000))
+@pytest.mark.parametrize(
+    "updated_indices",
+    (
+        # few enough to update the branches of the changed chunks
+        lambda length: range(0, length, 7),
+        # enough to rebuild the whole tree
+        lambda length: range(length),
+    ),
+)
+def test_update_elements(length, updated_indices):
+    balances = tuple(range(length))
+    hashable_balances = HashableList.from_iterable(balances, balances_sedes)
+    updated_balances = {index: index * 3 + 1 for index in updated_indices(length)}
+
+    result = update_elements(hashable_balances, updated_balances)
+
+    expected_balances = tuple(
+        updated_balances.get(index, balance) for index, balance in enumerate(balances)
+    )
+    assert tuple(result) == expected_balances
+    assert result.hash_tree_root == balances_sedes.get_hash_tree_root(
+        expected_balances
+    )
+    # the original list is untouched
+    assert tuple(hashable_balances) == balances
+    assert hashable_balances.hash_tree_root == balances_sedes.get_hash_tree_root(
+        balances
+    )
+
+
+def test_update_elements_of_composite_list():
+    sedes = List(Validator, 2 ** 40)
+    validators = tuple(Validator.create(effective_balance=i) for i in range(100))
+    hashable_validators = HashableList.from_iterable(validators, sedes)
+
+    updated_validators = {
+        3: validators[3].set("slashed", True),
+        99: validators[99].set("effective_balance", 32),
+    }
+    result = update_elements(hashable_validators, updated_validators)
+
+    expected_validators = list(validators)
+    for index, validator in updated_validators.items():
+        expected_validators[index] = validator
+    assert result.hash_tree_root == sedes.get_hash_tree_root(expected_validators)
+
+
+def test_update_no_elements():
+    hashable_balances = HashableList.from_iterable(range(10), balances_sedes)
+    assert update_elements(hashable_balances, {}) is hashable_balances
+
+
+@pytest.mark.parametrize("length", (1, 4, 9, 100))
+@pytest.mark.parametrize("depth", (0, 1, 3))
+def test_get_subtree_roots(length, depth):
+    hashable_balances = HashableList.from_iterable(range(length), balances_sedes)
+    chunks = tuple(hashable_balances.chunks)
+    subtree_size = 2 ** depth
+
+    subtree_roots = get_subtree_roots(hashable_balances, depth)
+
+    assert len(subtree_roots) == (len(chunks) + subtree_size - 1) // subtree_size
+    for index, subtree_root in enumerate(subtree_roots):
+        subtree_chunks = chunks[index * subtree_size : (index + 1) * subtree_size]
+        padding = (b"\x00" * 32,) * (subtree_size - len(subtree_chunks))
+        assert compute_hash_tree(subtree_chunks + padding)[-1][0] == subtree_root
@@ -0,0 +1,133 @@
+from eth.db.atomic import AtomicDB
+import pytest
+import ssz
+
+from eth2.beacon.chains.testnet import SkeletonLakeChain
+from eth2.beacon.db.chain import BeaconChainDB
+from eth2.beacon.fork_choice.higher_slot import HigherSlotScoring
+from eth2.beacon.types.blocks import BeaconBlock, SignedBeaconBlock
+
+from trinity.protocol.bcc_libp2p.messages import (
+    BeaconBlocksByRangeRequest,
+    BeaconBlocksByRootRequest,
+)
+from trinity.protocol.bcc_libp2p.utils import (
+    Interaction,
+    _get_fork_blocks_ssz,
+    get_beacon_blocks_by_root,
+    get_beacon_blocks_ssz_by_root,
+    get_requested_beacon_blocks,
+    get_requested_beacon_blocks_ssz,
+)
+
+
+class Connection:
+    peer_id = "peer"
+
+
+class Stream:
+    muxed_conn = Connection()
+
+    def __init__(self):
+        self.data = b''
+
+    def get_protocol(self):
+        return "/eth2/beacon_chain/req/beacon_blocks_by_range/1/ssz"
+
+    async def write(self, data):
+        self.data += data
+
+
+def _build_branch(chaindb, parent_root, slots):
+    branch = []
+    for slot in slots:
+        block = SignedBeaconBlock.create(
+            message=BeaconBlock.create(slot=slot, parent_root=parent_root),
+        )
+        chaindb.persist_block(block, SignedBeaconBlock, HigherSlotScoring())
+        branch.append(block)
+        parent_root = block.message.hash_tree_root
+    return branch
+
+
+@pytest.fixture
+def chain():
+    return SkeletonLakeChain(BeaconChainDB(AtomicDB()))
+
+
+@pytest.fixture
+def canonical_branch(chain):
+    # slots 3 and 6 are skipped
+    return _build_branch(chain.chaindb, b'\x00' * 32, (0, 1, 2, 4, 5, 7, 8, 9))
+
+
+@pytest.mark.parametrize(
+    "start_slot, count, step",
+    (
+        (0, 10, 1),
+        (2, 5, 1),
+        (1, 10, 3),
+        (8, 10, 1),
+    ),
+)
+def test_get_requested_beacon_blocks_ssz(chain, canonical_branch, start_slot, count, step):
+    request = BeaconBlocksByRangeRequest.create(
+        head_block_root=canonical_branch[-1].message.hash_tree_root,
+        start_slot=start_slot,
+        count=count,
+        step=step,
+    )
+    blocks_ssz = tuple(get_requested_beacon_blocks_ssz(chain, request))
+    assert blocks_ssz == tuple(
+        ssz.encode(block) for block in get_requested_beacon_blocks(chain, request)
+    )
+    assert len(blocks_ssz) > 0
+
+
+def test_get_requested_beacon_blocks_ssz_with_unknown_head(chain, canonical_branch):
+    request = BeaconBlocksByRangeRequest.create(
+        head_block_root=b'\x11' * 32,
+        start_slot=0,
+        count=10,
+        step=1,
+    )
+    assert tuple(get_requested_beacon_blocks_ssz(chain, request)) == ()
+
+
+def test_get_fork_blocks_ssz(chain, canonical_branch):
+    fork = _build_branch(chain.chaindb, canonical_branch[2].message.hash_tree_root, (3, 4))
+
+    blocks_ssz = _get_fork_blocks_ssz(
+        chain.chaindb,
+        fork[-1].message.hash_tree_root,
+        (1, 2, 3, 4),
+    )
+    # served from the earliest slot
+    assert blocks_ssz == tuple(
+        ssz.encode(block) for block in (canonical_branch[1], canonical_branch[2]) + tuple(fork)
+    )
+
+
+def test_get_beacon_blocks_ssz_by_root(chain, canonical_branch):
+    request = BeaconBlocksByRootRequest.create(
+        block_roots=(
+            canonical_branch[3].message.hash_tree_root,
+            b'\x11' * 32,
+            canonical_branch[0].message.hash_tree_root,
+        ),
+    )
+    assert get_beacon_blocks_ssz_by_root(chain, request) == tuple(
+        ssz.encode(block) for block in get_beacon_blocks_by_root(chain, request)
+    )
+
+
+@pytest.mark.asyncio
+async def test_write_chunk_response_ssz(canonical_branch):
+    decoded_stream = Stream()
+    await Interaction(decoded_stream).write_chunk_response(canonical_branch)
+
+    ssz_stream = Stream()
+    await Interaction(ssz_stream).write_chunk_response_ssz(
+        ssz.encode(block) for block in canonical_branch
+    )
+    assert ssz_stream.data == decoded_stream.data
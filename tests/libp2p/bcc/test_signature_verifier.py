@@ -0,0 +1,104 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import milagro_bls_binding as milagro_bls
+import pytest
+
+from eth2.beacon.state_machines.forks.altona.eth2fastspec import SignatureSet
+from p2p.service import run_service
+
+from trinity.protocol.bcc_libp2p.signature_verifier import (
+    SignatureVerifier,
+    verify_signature_sets,
+)
+
+
+def _signature_set(index, is_valid=True):
+    privkey = (index + 1).to_bytes(32, "big")
+    signer = privkey if is_valid else (index + 2).to_bytes(32, "big")
+    message = index.to_bytes(32, "little")
+    return SignatureSet(
+        (milagro_bls.SkToPk(privkey),), message, milagro_bls.Sign(signer, message)
+    )
+
+
+def test_verify_signature_sets():
+    signature_sets = (_signature_set(0), _signature_set(1, is_valid=False), _signature_set(2))
+    assert verify_signature_sets(signature_sets[::2]) == (True, True)
+    assert verify_signature_sets(signature_sets) == (True, False, True)
+
+
+@pytest.mark.asyncio
+async def test_signature_verifier_batches_pending_signatures():
+    verifier = SignatureVerifier(
+        executor=ThreadPoolExecutor(),
+        batch_size=3,
+        batch_window=10,
+    )
+    async with run_service(verifier):
+        # a full batch is verified without waiting for the batch window
+        verdicts = await asyncio.wait_for(
+            asyncio.gather(
+                verifier.verify(_signature_set(0)),
+                verifier.verify(_signature_set(1), _signature_set(2, is_valid=False)),
+            ),
+            timeout=5,
+        )
+        assert verdicts == [True, False]
+        assert verifier.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_signature_verifier_flushes_partial_batch_after_window():
+    verifier = SignatureVerifier(
+        executor=ThreadPoolExecutor(),
+        batch_size=64,
+        batch_window=0.01,
+    )
+    async with run_service(verifier):
+        assert await asyncio.wait_for(verifier.verify(_signature_set(0)), timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_signature_verifier_raises_verification_errors(monkeypatch):
+    def broken_verify_signature_sets(signature_sets):
+        raise ValueError("Malformed signature")
+
+    monkeypatch.setattr(
+        'trinity.protocol.bcc_libp2p.signature_verifier.verify_signature_sets',
+        broken_verify_signature_sets,
+    )
+    verifier = SignatureVerifier(executor=ThreadPoolExecutor(), batch_window=0.01)
+    async with run_service(verifier):
+        with pytest.raises(ValueError):
+            await asyncio.wait_for(verifier.verify(_signature_set(0)), timeout=5)
+
+        # the verifier keeps working after a failed batch
+        monkeypatch.undo()
+        assert await asyncio.wait_for(verifier.verify(_signature_set(1)), timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_signature_verifier_bounds_concurrent_batches():
+    verifier = SignatureVerifier(
+        executor=ThreadPoolExecutor(),
+        batch_size=1,
+        batch_window=0.01,
+        max_concurrent_batches=1,
+    )
+    executor_calls = []
+    run_in_executor = verifier._run_in_executor
+
+    async def tracking_run_in_executor(*args):
+        executor_calls.append(args)
+        assert verifier._batch_slots.locked()
+        return await run_in_executor(*args)
+
+    verifier._run_in_executor = tracking_run_in_executor
+    async with run_service(verifier):
+        verdicts = await asyncio.wait_for(
+            asyncio.gather(*(verifier.verify(_signature_set(index)) for index in range(3))),
+            timeout=5,
+        )
+    assert verdicts == [True, True, True]
+    assert len(executor_calls) == 3
@@ -176,6 +176,23 @@ def test_iter_around(routing_table, center_node_id):
     assert tuple(routing_table.iter_nodes_around(node_ids[-1])) != node_ids
 
 
+@pytest.mark.parametrize("reference_log_distance", (None, 1, 100, 256))
+def test_iter_around_matches_sorted_table(center_node_id, reference_log_distance):
+    routing_table = KademliaRoutingTable(center_node_id, 16)
+    for log_distance in itertools.chain(range(1, 257), range(240, 257), range(240, 257)):
+        routing_table.update(NodeIDFactory.at_log_distance(center_node_id, log_distance))
+
+    if reference_log_distance is None:
+        reference_node_id = center_node_id
+    else:
+        reference_node_id = NodeIDFactory.at_log_distance(center_node_id, reference_log_distance)
+    all_node_ids = itertools.chain(*routing_table.buckets)
+    assert tuple(routing_table.iter_nodes_around(reference_node_id)) == tuple(sorted(
+        all_node_ids,
+        key=lambda node_id: compute_distance(reference_node_id, node_id),
+    ))
+
+
 def test_fill_bucket(routing_table, center_node_id, bucket_size):
     assert not routing_table.get_nodes_at_log_distance(200)
     for _ in range(2 * bucket_size):
@@ -13,8 +13,10 @@ from rlp.sedes import (
 
 from p2p.discv5 import messages
 from p2p.enr import ENR
+from p2p.tools.factories.discovery import ENRFactory
 from p2p.discv5.messages import (
     default_message_type_registry,
+    encode_rlp_list,
     BaseMessage,
     PingMessage,
     PongMessage,
@@ -54,6 +56,22 @@ def test_message_encoding():
     assert encoded_message[1:] == rlp.encode(message)
 
 
+@pytest.mark.parametrize("num_enrs", (0, 1, 3))
+def test_nodes_message_from_encoded_enrs(num_enrs):
+    enrs = tuple(ENRFactory() for _ in range(num_enrs))
+    encoded_enrs = encode_rlp_list(tuple(rlp.encode(enr) for enr in enrs))
+    message = NodesMessage.from_encoded_enrs(
+        request_id=300,
+        total=2,
+        enrs=enrs,
+        encoded_enrs=encoded_enrs,
+    )
+    assert message.to_bytes() == NodesMessage(request_id=300, total=2, enrs=enrs).to_bytes()
+    decoded_message = rlp.decode(message.to_bytes()[1:], sedes=NodesMessage)
+    assert decoded_message.request_id == 300
+    assert decoded_message.enrs == enrs
+
+
 # Official test vectors from
 # https://github.com/ethereum/devp2p/blob/master/discv5/discv5-wire-test-vectors.md
 # TODO: Add official test vectors for topic messages once they are aligned with the current
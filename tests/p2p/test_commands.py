@@ -0,0 +1,52 @@
+import pickle
+
+import pytest
+import rlp
+from rlp import sedes
+
+from p2p.commands import BaseCommand, RLPCodec
+from p2p.exceptions import MalformedMessage
+
+
+class CommandForTest(BaseCommand):
+    protocol_command_id = 0
+    serialization_codec = RLPCodec(sedes=sedes.CountableList(sedes.big_endian_int))
+
+
+@pytest.mark.parametrize('snappy_support', (True, False))
+def test_decode_lazily(snappy_support):
+    message = CommandForTest((1, 2, 3)).encode(0, snappy_support)
+
+    command = CommandForTest.decode_lazily(message, snappy_support)
+    assert not command.is_decoded
+    assert command.serialized_payload == rlp.encode((1, 2, 3))
+
+    assert command.payload == (1, 2, 3)
+    assert command.is_decoded
+
+
+def test_decode_lazily_malformed_payload():
+    command = CommandForTest.from_serialized_payload(b'\xc2\x01')
+    with pytest.raises(MalformedMessage):
+        command.payload
+
+
+def test_encode_reuses_serialized_payload():
+    command = CommandForTest.from_serialized_payload(rlp.encode((1, 2)))
+    message = command.encode(0, snappy_support=False)
+
+    assert not command.is_decoded
+    assert message == CommandForTest((1, 2)).encode(0, snappy_support=False)
+
+
+@pytest.mark.parametrize('command', (
+    CommandForTest((1, 2, 3)),
+    CommandForTest.from_serialized_payload(rlp.encode((1, 2, 3))),
+))
+def test_commands_are_pickled_as_serialized_payload(command):
+    result = pickle.loads(pickle.dumps(command))
+
+    assert isinstance(result, CommandForTest)
+    assert not result.is_decoded
+    assert result.serialized_payload == command.serialized_payload
+    assert result.payload == (1, 2, 3)
@@ -32,3 +32,22 @@ async def test_peer_reporter_registry():
         peer_reporter_registry.unassign_peer_reporter(bob)
         assert bob not in peer_reporter_registry._peer_reporters.keys()
         assert len(peer_reporter_registry._peer_reporters.keys()) == 0
+
+
+@pytest.mark.asyncio
+async def test_peer_reporter_registry_reports_buffered_bytes():
+    async with LatestETHPeerPairFactory() as (alice, _):
+        metrics_registry = MetricsRegistry()
+        peer_reporter_registry = PeerReporterRegistry(metrics_registry)
+        peer_reporter_registry.assign_peer_reporter(alice)
+        buffered_bytes_gauge = metrics_registry.gauge("trinity.p2p/peer_0_buffered_bytes.gauge")
+        discarded_msgs_gauge = metrics_registry.gauge("trinity.p2p/peer_0_discarded_msgs.gauge")
+
+        multiplexer = alice.connection.get_multiplexer()
+        multiplexer._discarded_msg_count = 3
+        peer_reporter_registry.trigger_peer_reports()
+        assert buffered_bytes_gauge.get_value() == multiplexer.get_buffered_bytes()
+        assert discarded_msgs_gauge.get_value() == 3
+
+        peer_reporter_registry.unassign_peer_reporter(alice)
+        assert discarded_msgs_gauge.get_value() == 0
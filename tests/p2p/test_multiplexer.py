@@ -4,9 +4,10 @@ import time
 import pytest
 
 from eth_utils import ValidationError
+from rlp import sedes
 
 from p2p.exceptions import UnknownProtocol
-from p2p.commands import BaseCommand, NoneSerializationCodec
+from p2p.commands import BaseCommand, NoneSerializationCodec, RLPCodec
 from p2p.protocol import BaseProtocol
 from p2p.p2p_proto import Ping, Pong, P2PProtocolV5
 
@@ -50,6 +51,18 @@ class ThirdProtocol(BaseProtocol):
     command_length = 2
 
 
+class CommandE(BaseCommand[bytes]):
+    protocol_command_id = 0
+    serialization_codec = RLPCodec(sedes=sedes.binary)
+
+
+class SizedProtocol(BaseProtocol):
+    name = 'sized'
+    version = 1
+    commands = (CommandE,)
+    command_length = 1
+
+
 class UnsupportedProtocol(BaseProtocol):
     name = 'unknown'
     version = 1
@@ -306,6 +319,91 @@ async def test_last_msg_time(monkeypatch, request, event_loop):
     assert alice_multiplexer.last_msg_time == now
 
 
+async def wait_for_total_msg_count(multiplexer, msg_count):
+    async def _wait():
+        while multiplexer.get_total_msg_count() != msg_count:
+            await asyncio.sleep(0.01)
+    await asyncio.wait_for(_wait(), timeout=DEFAULT_TIMEOUT)
+
+
+@pytest.mark.asyncio
+async def test_full_buffer_discards_messages(request, event_loop):
+    # The base protocol and the sized protocol get 1000 bytes each
+    alice_multiplexer, bob_multiplexer = MultiplexerPairFactory(
+        protocol_types=(SizedProtocol,),
+        max_buffered_bytes=2000,
+    )
+    await run_multiplexers([alice_multiplexer, bob_multiplexer], request, event_loop)
+    alice_sized_protocol = alice_multiplexer.get_protocol_by_type(SizedProtocol)
+
+    payloads = tuple(bytes([number]) * 400 for number in range(5))
+    for payload in payloads:
+        alice_sized_protocol.send(CommandE(payload))
+    alice_multiplexer.get_protocol_by_type(P2PProtocolV5).send(Ping(None))
+
+    # Only two of the commands fit into the buffer, the rest is discarded
+    # without blocking the base protocol
+    await wait_for_total_msg_count(bob_multiplexer, 6)
+    cmd_size = len(CommandE(payloads[0]).serialized_payload)
+    ping_size = len(Ping(None).serialized_payload)
+    assert bob_multiplexer.get_buffered_bytes() == cmd_size * 2 + ping_size
+    assert bob_multiplexer.get_discarded_msg_count() == 3
+
+    bob_p2p_stream = bob_multiplexer.stream_protocol_messages(P2PProtocolV5)
+    cmd = await asyncio.wait_for(bob_p2p_stream.asend(None), timeout=DEFAULT_TIMEOUT)
+    assert isinstance(cmd, Ping)
+
+    bob_sized_stream = bob_multiplexer.stream_protocol_messages(SizedProtocol)
+    for payload in payloads[:2]:
+        cmd = await asyncio.wait_for(bob_sized_stream.asend(None), timeout=DEFAULT_TIMEOUT)
+        assert cmd.payload == payload
+    assert bob_multiplexer.get_buffered_bytes() == 0
+
+
+@pytest.mark.asyncio
+async def test_base_protocol_buffer_is_unbounded(request, event_loop):
+    alice_multiplexer, bob_multiplexer = MultiplexerPairFactory(
+        protocol_types=(SizedProtocol,),
+        max_buffered_bytes=2,
+    )
+    await run_multiplexers([alice_multiplexer, bob_multiplexer], request, event_loop)
+    alice_p2p_protocol = alice_multiplexer.get_protocol_by_type(P2PProtocolV5)
+
+    for _ in range(5):
+        alice_p2p_protocol.send(Ping(None))
+
+    await wait_for_total_msg_count(bob_multiplexer, 5)
+    assert bob_multiplexer.get_discarded_msg_count() == 0
+
+    bob_p2p_stream = bob_multiplexer.stream_protocol_messages(P2PProtocolV5)
+    for _ in range(5):
+        cmd = await asyncio.wait_for(bob_p2p_stream.asend(None), timeout=DEFAULT_TIMEOUT)
+        assert isinstance(cmd, Ping)
+
+
+@pytest.mark.asyncio
+async def test_command_larger_than_buffer(request, event_loop):
+    alice_multiplexer, bob_multiplexer = MultiplexerPairFactory(
+        protocol_types=(SizedProtocol,),
+        max_buffered_bytes=2000,
+    )
+    await run_multiplexers([alice_multiplexer, bob_multiplexer], request, event_loop)
+    alice_sized_protocol = alice_multiplexer.get_protocol_by_type(SizedProtocol)
+
+    payload = b'\x01' * 5000
+    alice_sized_protocol.send(CommandE(payload))
+    alice_sized_protocol.send(CommandE(b'\x02'))
+
+    # An oversized command is accepted into an empty buffer, but nothing after it
+    await wait_for_total_msg_count(bob_multiplexer, 2)
+    assert bob_multiplexer.get_buffered_bytes() == len(CommandE(payload).serialized_payload)
+    assert bob_multiplexer.get_discarded_msg_count() == 1
+
+    bob_sized_stream = bob_multiplexer.stream_protocol_messages(SizedProtocol)
+    cmd = await asyncio.wait_for(bob_sized_stream.asend(None), timeout=DEFAULT_TIMEOUT)
+    assert cmd.payload == payload
+
+
 async def run_multiplexers(multiplexers, request, event_loop):
     for multiplexer in multiplexers:
         await multiplexer.stream_in_background()
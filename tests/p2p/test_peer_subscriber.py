@@ -4,6 +4,7 @@ import pytest
 
 from eth_utils import get_extended_debug_logger
 
+from p2p.disconnect import DisconnectReason
 from p2p.peer import PeerSubscriber
 from p2p.commands import BaseCommand
 
@@ -57,3 +58,86 @@ async def test_peer_subscriber_filters_messages(request, event_loop):
             await asyncio.wait_for(get_sum_subscriber.msg_queue.get(), timeout=0.01)
         with pytest.raises(asyncio.TimeoutError):
             await asyncio.wait_for(all_subscriber.msg_queue.get(), timeout=0.01)
+
+
+class SmallQueueSubscriber(PeerSubscriber):
+    logger = logger
+    msg_queue_maxsize = 2
+    subscription_msg_types = {GetSum}
+
+
+@pytest.mark.asyncio
+async def test_peer_subscriber_waits_for_queue_space(request, event_loop):
+    async with ParagonPeerPairFactory() as (peer, remote):
+        subscriber = SmallQueueSubscriber()
+        peer.add_subscriber(subscriber)
+
+        for value in range(5):
+            remote.sub_proto.send(GetSum(GetSumPayload(value, 1)))
+
+        await asyncio.sleep(0.1)
+        assert subscriber.msg_queue.full()
+
+        # None of the messages got discarded while the queue was full
+        for value in range(5):
+            _, cmd = await asyncio.wait_for(subscriber.msg_queue.get(), timeout=1)
+            assert cmd.payload == GetSumPayload(value, 1)
+
+
+@pytest.mark.asyncio
+async def test_peer_subscriber_discards_messages_after_timeout(monkeypatch, request, event_loop):
+    monkeypatch.setattr('p2p.peer.PEER_SUBSCRIBER_QUEUE_TIMEOUT', 0.05)
+    async with ParagonPeerPairFactory() as (peer, remote):
+        subscriber = SmallQueueSubscriber()
+        peer.add_subscriber(subscriber)
+
+        for value in range(3):
+            remote.sub_proto.send(GetSum(GetSumPayload(value, 1)))
+
+        await asyncio.sleep(0.2)
+        for value in range(2):
+            _, cmd = subscriber.msg_queue.get_nowait()
+            assert cmd.payload == GetSumPayload(value, 1)
+
+        # The last message got discarded once the queue stayed full for too long
+        assert subscriber.msg_queue.empty()
+
+
+class ForwardingSubscriber(PeerSubscriber):
+    logger = logger
+    msg_queue_maxsize = 10
+    subscription_msg_types = {GetSum}
+    decodes_payloads = False
+
+
+@pytest.mark.asyncio
+async def test_peer_subscriber_payload_decoding(request, event_loop):
+    async with ParagonPeerPairFactory() as (peer, remote):
+        forwarding_subscriber = ForwardingSubscriber()
+        peer.add_subscriber(forwarding_subscriber)
+
+        remote.sub_proto.send(GetSum(GetSumPayload(7, 8)))
+        _, cmd = await asyncio.wait_for(forwarding_subscriber.msg_queue.get(), timeout=1)
+        assert not cmd.is_decoded
+        assert cmd.payload == GetSumPayload(7, 8)
+
+        get_sum_subscriber = GetSumSubscriber()
+        peer.add_subscriber(get_sum_subscriber)
+
+        remote.sub_proto.send(GetSum(GetSumPayload(1234, 4321)))
+        _, cmd = await asyncio.wait_for(get_sum_subscriber.msg_queue.get(), timeout=1)
+        assert cmd.is_decoded
+
+
+@pytest.mark.asyncio
+async def test_peer_disconnects_on_malformed_payload(request, event_loop):
+    async with ParagonPeerPairFactory() as (peer, remote):
+        get_sum_subscriber = GetSumSubscriber()
+        peer.add_subscriber(get_sum_subscriber)
+
+        # a list of one item, where GetSum has two
+        remote.sub_proto.send(GetSum.from_serialized_payload(b'\xc1\x01'))
+        await asyncio.wait_for(remote.manager.wait_finished(), timeout=2)
+
+        assert remote.remote_disconnect_reason is DisconnectReason.BAD_PROTOCOL
+        assert get_sum_subscriber.msg_queue.empty()
@@ -1,5 +1,4 @@
 import contextlib
-import copy
 import logging
 from logging import (
     StreamHandler
@@ -9,13 +8,20 @@ from logging.handlers import (
 )
 import os
 from pathlib import Path
-import pickle
+import queue
 import socket
+import struct
 import sys
+import threading
+import time
 from types import TracebackType
 from typing import (
     Dict,
     Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
     Type,
     TypeVar,
 )
@@ -54,13 +60,95 @@ def get_logger(name: str) -> eth_utils.ExtendedDebugLogger:
     return eth_utils.get_extended_debug_logger(name)
 
 
+# Records below WARNING are dropped, and counted, once this many records are waiting to be sent.
+# Records of WARNING and above are only dropped once twice as many are waiting.
+MAX_QUEUED_LOG_RECORDS = 10000
+
+# The maximum number of records that are sent together in a single write
+MAX_LOG_BATCH_SIZE = 512
+
+# Every record of a batch is the header below, followed by the UTF-8 encoded logger name and
+# message: the level, the creation time, and the lengths of the name and of the message.
+LOG_RECORD_HEADER = struct.Struct('<BdHI')
+
+
+# The level, creation time, logger name and formatted message of a record
+EncodedLogRecord = Tuple[int, float, str, str]
+
+
+def _encode_log_batch(records: Sequence[EncodedLogRecord]) -> bytes:
+    """
+    Encode the (level, creation time, logger name, message) of the records into a batch,
+    prefixed with its length.
+    """
+    parts = []
+    for levelno, created, name, message in records:
+        name_data = name.encode('utf-8', 'backslashreplace')
+        message_data = message.encode('utf-8', 'backslashreplace')
+        parts.append(LOG_RECORD_HEADER.pack(levelno, created, len(name_data), len(message_data)))
+        parts.append(name_data)
+        parts.append(message_data)
+
+    batch = b''.join(parts)
+    return len(batch).to_bytes(4, 'big') + batch
+
+
+def _decode_log_batch(batch: memoryview) -> Iterator[logging.LogRecord]:
+    offset = 0
+    while offset < len(batch):
+        levelno, created, name_length, message_length = LOG_RECORD_HEADER.unpack_from(
+            batch,
+            offset,
+        )
+        offset += LOG_RECORD_HEADER.size
+        name = str(batch[offset:offset + name_length], 'utf-8')
+        offset += name_length
+        message = str(batch[offset:offset + message_length], 'utf-8')
+        offset += message_length
+
+        record = logging.makeLogRecord({
+            'name': name,
+            'levelno': levelno,
+            'levelname': logging.getLevelName(levelno),
+            'msg': message,
+            'created': created,
+            'msecs': (created - int(created)) * 1000,
+        })
+        record.message = message
+        yield record
+
+
 class IPCHandler(logging.Handler):
+    """
+    Relays log records to the :class:`IPCListener` of the main process. Logging formats the
+    record and queues just its level, logger name, message and creation time, which a background
+    thread sends in batches.
+
+    When the listener cannot keep up, records below WARNING are dropped instead of queued once
+    ``max_queued`` are waiting, and all records once twice as many are. The number of dropped
+    records is counted in ``num_dropped``, and reported in a warning with the next batch.
+    """
     logger = get_logger('trinity._utils.logging.IPCHandler')
 
-    def __init__(self, sock: socket.socket):
-        self._socket = BufferedSocket(sock)
+    def __init__(self, sock: socket.socket, max_queued: int = MAX_QUEUED_LOG_RECORDS) -> None:
+        self._socket = sock
+        self._max_queued = max_queued
+        # The records waiting to be sent, and a None after the last one when closing
+        self._queue: 'queue.Queue[Optional[EncodedLogRecord]]' = queue.Queue(
+            max(1, 2 * max_queued),
+        )
+        self.num_dropped = 0
+        self._num_unreported_dropped = 0
+        self._is_disconnected = False
         super().__init__()
 
+        self._writer = threading.Thread(
+            name=f"{self}:writer",
+            target=self._run_writer,
+            daemon=True,
+        )
+        self._writer.start()
+
     def __enter__(self) -> None:
         pass
 
@@ -68,33 +156,95 @@ class IPCHandler(logging.Handler):
                  exc_type: Type[BaseException],
                  exc_value: BaseException,
                  exc_tb: TracebackType) -> None:
-        self._socket.close()
+        self.close()
 
     @classmethod
-    def connect(cls: Type[THandler], path: Path) -> THandler:
+    def connect(cls: Type[THandler],
+                path: Path,
+                max_queued: int = MAX_QUEUED_LOG_RECORDS) -> THandler:
         wait_for_ipc(path)
         s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         cls.logger.debug("Opened connection to %s: %s", path, s)
         s.connect(str(path))
-        return cls(s)
-
-    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
-        msg = self.format(record)
-        new_record = copy.copy(record)
-        new_record.message = msg
-        new_record.msg = msg
-        new_record.args = None
-        new_record.exc_info = None
-        new_record.exc_text = None
-        return new_record
+        return cls(s, max_queued)
 
     def emit(self, record: logging.LogRecord) -> None:
+        # Handler.handle() holds the handler lock, which guards the counters
+        if self._is_disconnected:
+            return
+        elif record.levelno < logging.WARNING and self._queue.qsize() >= self._max_queued:
+            self._drop_record()
+            return
+
+        # Like QueueHandler.prepare(), format here: the record may reference objects that
+        # change, or are not thread-safe, by the time the writer thread gets to it.
         try:
-            msg_data = pickle.dumps(self.prepare(record))
-            msg_length_data = len(msg_data).to_bytes(4, 'big')
-            self._socket.sendall(msg_length_data + msg_data)
+            message = self.format(record)
         except Exception:
             self.handleError(record)
+            return
+
+        try:
+            self._queue.put_nowait((record.levelno, record.created, record.name, message))
+        except queue.Full:
+            self._drop_record()
+
+    def _drop_record(self) -> None:
+        self.num_dropped += 1
+        self._num_unreported_dropped += 1
+
+    def close(self) -> None:
+        # Send everything that was logged so far before closing the connection
+        while self._writer.is_alive():
+            try:
+                self._queue.put(None, timeout=0.1)
+            except queue.Full:
+                continue
+            else:
+                self._writer.join()
+        self._socket.close()
+        super().close()
+
+    def _run_writer(self) -> None:
+        is_closing = False
+        while not is_closing:
+            records: List[EncodedLogRecord] = []
+            record = self._queue.get()
+            while True:
+                if record is None:
+                    is_closing = True
+                    break
+                records.append(record)
+                if len(records) >= MAX_LOG_BATCH_SIZE:
+                    break
+                try:
+                    record = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            try:
+                self._socket.sendall(self._encode_records(records))
+            except OSError as err:
+                # The listener is gone, there is no one left to send the records to
+                self._is_disconnected = True
+                self.logger.debug("Stopped relaying logs: %s", err)
+                break
+            except Exception:
+                # Lose this batch rather than the writer thread, which would stop relaying logs
+                self.logger.exception("Failed to relay a batch of %d log records", len(records))
+
+    def _encode_records(self, records: List[EncodedLogRecord]) -> bytes:
+        with self.lock:
+            num_dropped, self._num_unreported_dropped = self._num_unreported_dropped, 0
+        if num_dropped:
+            records.append((
+                logging.WARNING,
+                time.time(),
+                self.logger.name,
+                f"Dropped {num_dropped} log records, the log listener is falling behind",
+            ))
+
+        return _encode_log_batch(records)
 
 
 class IPCListener(IPCSocketServer):
@@ -107,30 +257,29 @@ class IPCListener(IPCSocketServer):
     def serve_conn(self, sock: BufferedSocket) -> None:
         while self.is_running:
             try:
-                length_data = sock.read_exactly(4)
+                length_data = sock.read_exactly_view(4)
             except OSError as err:
                 self.logger.debug("%s: closing client connection: %s", self, err)
                 break
             except Exception:
-                self.logger.exception("Error reading serialized record length data")
+                self.logger.exception("Error reading log batch length data")
                 break
 
-            data_length = int.from_bytes(length_data, 'big')
+            batch_length = int.from_bytes(length_data, 'big')
 
             try:
-                record_bytes = sock.read_exactly(data_length)
+                batch = sock.read_exactly_view(batch_length)
             except OSError as err:
                 self.logger.debug("%s: closing client connection: %s", self, err)
                 break
             except Exception:
-                self.logger.exception("Error reading serialized log record data")
+                self.logger.exception("Error reading log batch data")
                 break
 
-            record = pickle.loads(record_bytes)
-
-            for handler in self.handlers:
-                if record.levelno >= handler.level:
-                    handler.handle(record)
+            for record in _decode_log_batch(batch):
+                for handler in self.handlers:
+                    if record.levelno >= handler.level:
+                        handler.handle(record)
 
 
 class TrinityLogFormatter(logging.Formatter):
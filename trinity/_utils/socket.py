@@ -8,10 +8,27 @@ import threading
 from typing import Iterator
 
 
+# The receive buffer of a BufferedSocket starts at this size. Reads fill all of its free space,
+# and it grows to fit larger messages, so that they are received in place.
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+# Reads are only done into at least this much free space, the unread bytes are moved to the
+# start of the buffer otherwise.
+MIN_READ_SIZE = 4096
+
+# A buffer that grew beyond this size is dropped once it is drained, so that idle connections
+# do not hold on to the memory of the largest message they ever received.
+MAX_RETAINED_BUFFER_SIZE = 1024 * 1024
+
+
 class BufferedSocket:
     def __init__(self, sock: socket.socket) -> None:
         self._socket = sock
-        self._buffer = bytearray()
+        self._buffer = bytearray(DEFAULT_BUFFER_SIZE)
+        self._view = memoryview(self._buffer)
+        # The received bytes that were not read yet are self._buffer[self._start:self._end]
+        self._start = 0
+        self._end = 0
         self.sendall = sock.sendall
         self.close = sock.close
         self.shutdown = sock.shutdown
@@ -19,17 +36,52 @@ class BufferedSocket:
         self.__exit__ = sock.__exit__
 
     def read_exactly(self, num_bytes: int) -> bytes:
-        while len(self._buffer) < num_bytes:
+        return bytes(self.read_exactly_view(num_bytes))
 
-            data = self._socket.recv(4096)
-
-            if data == b"":
+    def read_exactly_view(self, num_bytes: int) -> memoryview:
+        """
+        Read exactly ``num_bytes``, without copying them out of the receive buffer. The view is
+        only valid until the next read.
+        """
+        if self._end - self._start < num_bytes:
+            self._receive(num_bytes)
+
+        start = self._start
+        self._start += num_bytes
+        view = self._view[start:self._start]
+
+        if self._start == self._end:
+            self._start = self._end = 0
+            if len(self._buffer) > MAX_RETAINED_BUFFER_SIZE:
+                self._replace_buffer(DEFAULT_BUFFER_SIZE)
+        return view
+
+    def _receive(self, num_bytes: int) -> None:
+        if num_bytes > len(self._buffer):
+            self._replace_buffer(max(num_bytes, 2 * len(self._buffer)))
+        elif (self._start + num_bytes > len(self._buffer)
+                or len(self._buffer) - self._end < MIN_READ_SIZE):
+            # Move the unread bytes to the start, to make room after them
+            num_unread = self._end - self._start
+            self._view[:num_unread] = self._view[self._start:self._end]
+            self._start, self._end = 0, num_unread
+
+        while self._end - self._start < num_bytes:
+            num_received = self._socket.recv_into(self._view[self._end:])
+
+            if num_received == 0:
                 raise OSError("Connection closed")
 
-            self._buffer.extend(data)
-        payload = self._buffer[:num_bytes]
-        self._buffer = self._buffer[num_bytes:]
-        return bytes(payload)
+            self._end += num_received
+
+    def _replace_buffer(self, size: int) -> None:
+        # Views that were handed out keep the old buffer alive, it is never resized in place
+        num_unread = self._end - self._start
+        buffer = bytearray(size)
+        buffer[:num_unread] = self._view[self._start:self._end]
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+        self._start, self._end = 0, num_unread
 
 
 class IPCSocketServer(ABC):
@@ -3,8 +3,11 @@ import asyncio
 from async_service import background_asyncio_service
 from lahja import EndpointAPI
 
+from trinity.components.builtin.metrics.component import metrics_service_from_args
+from trinity.components.builtin.metrics.service.asyncio import AsyncioMetricsService
+from trinity.components.builtin.metrics.service.noop import NOOP_METRICS_SERVICE
 from trinity.config import Eth1AppConfig
-from trinity.constants import SYNC_BEAM
+from trinity.constants import DB_CLIENT_CACHE_SIZE, SYNC_BEAM
 from trinity.db.manager import DBClient
 from trinity.extensibility import (
     AsyncioIsolatedComponent,
@@ -33,11 +36,21 @@ class BeamChainExecutionComponent(AsyncioIsolatedComponent):
         return self._boot_info.args.sync_mode.upper() == SYNC_BEAM.upper()
 
     async def do_run(self, event_bus: EndpointAPI) -> None:
-        trinity_config = self._boot_info.trinity_config
+        boot_info = self._boot_info
+        trinity_config = boot_info.trinity_config
         app_config = trinity_config.get_app_config(Eth1AppConfig)
         chain_config = app_config.get_chain_config()
 
-        base_db = DBClient.connect(trinity_config.database_ipc_path)
+        if boot_info.args.enable_metrics:
+            metrics_service = metrics_service_from_args(boot_info.args, AsyncioMetricsService)
+        else:
+            metrics_service = NOOP_METRICS_SERVICE
+
+        base_db = DBClient.connect(
+            trinity_config.database_ipc_path,
+            cache_size=DB_CLIENT_CACHE_SIZE,
+            metrics_registry=metrics_service.registry,
+        )
 
         with base_db:
             beam_chain = make_pausing_beam_chain(
@@ -51,5 +64,6 @@ class BeamChainExecutionComponent(AsyncioIsolatedComponent):
 
             import_server = BlockImportServer(event_bus, beam_chain)
 
-            async with background_asyncio_service(import_server) as manager:
-                await manager.wait_finished()
+            async with background_asyncio_service(metrics_service):
+                async with background_asyncio_service(import_server) as manager:
+                    await manager.wait_finished()
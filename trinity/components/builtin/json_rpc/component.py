@@ -7,7 +7,7 @@ from argparse import (
 import contextlib
 from typing import Iterator, Tuple, Union, Sequence, Type, Any
 
-from async_service import Service
+from async_service import ServiceAPI
 from eth_utils import ValidationError, to_tuple
 
 from lahja import EndpointAPI
@@ -26,11 +26,20 @@ from trinity.chains.base import AsyncChainAPI
 from trinity.chains.light_eventbus import (
     EventBusLightPeerChain,
 )
+from trinity.components.builtin.metrics.component import metrics_service_from_args
+from trinity.components.builtin.metrics.service.asyncio import AsyncioMetricsService
+from trinity.components.builtin.metrics.service.noop import NOOP_METRICS_SERVICE
 from trinity.db.beacon.chain import AsyncBeaconChainDB
+from trinity.db.eth1.bloom_bits import BloomBitsIndexer
+from trinity.db.eth1.header import AsyncHeaderDB
 from trinity.db.manager import DBClient
 from trinity.extensibility import (
     AsyncioIsolatedComponent,
 )
+from trinity.rpc.filters import (
+    MAX_LOGS_BLOCK_RANGE,
+    MAX_LOGS_RESULTS,
+)
 from trinity.rpc.main import (
     RPCServer,
 )
@@ -173,6 +182,18 @@ class JsonRpcServerComponent(AsyncioIsolatedComponent):
             help="JSON-RPC server port",
             default=8545,
         )
+        arg_parser.add_argument(
+            "--rpc-max-logs-block-range",
+            type=int,
+            help="Maximum number of blocks that a single eth_getLogs request may span",
+            default=MAX_LOGS_BLOCK_RANGE,
+        )
+        arg_parser.add_argument(
+            "--rpc-max-logs-results",
+            type=int,
+            help="Maximum number of logs that a single eth_getLogs request may return",
+            default=MAX_LOGS_RESULTS,
+        )
 
     async def do_run(self, event_bus: EndpointAPI) -> None:
         boot_info = self._boot_info
@@ -180,19 +201,39 @@ class JsonRpcServerComponent(AsyncioIsolatedComponent):
 
         with chain_for_config(trinity_config, event_bus) as chain:
             if trinity_config.has_app_config(Eth1AppConfig):
-                modules = initialize_eth1_modules(chain, event_bus, trinity_config)
+                modules = initialize_eth1_modules(
+                    chain,
+                    event_bus,
+                    trinity_config,
+                    boot_info.args.rpc_max_logs_block_range,
+                    boot_info.args.rpc_max_logs_results,
+                )
             elif trinity_config.has_app_config(BeaconAppConfig):
                 modules = initialize_beacon_modules(chain, event_bus)
             else:
                 raise Exception("Unsupported Node Type")
 
-            rpc = RPCServer(modules, chain, event_bus)
+            if boot_info.args.enable_metrics:
+                metrics_service = metrics_service_from_args(boot_info.args, AsyncioMetricsService)
+            else:
+                metrics_service = NOOP_METRICS_SERVICE
+
+            rpc = RPCServer(modules, chain, event_bus, metrics_registry=metrics_service.registry)
 
             # Run IPC Server
             ipc_server = IPCServer(rpc, boot_info.trinity_config.jsonrpc_ipc_path)
-            services_to_exit: Tuple[Service, ...] = (
+            services_to_exit: Tuple[ServiceAPI, ...] = (
+                metrics_service,
                 ipc_server,
             )
+
+            # Keep the bloom bits index up to date for eth_getLogs, full nodes have the receipts
+            if isinstance(chain, AsyncChainAPI):
+                eth1_app_config = trinity_config.get_app_config(Eth1AppConfig)
+                if eth1_app_config.database_mode is Eth1DbMode.FULL:
+                    header_db = AsyncHeaderDB(chain.chaindb.db)
+                    services_to_exit += (BloomBitsIndexer(header_db),)
+
             try:
                 http_modules = get_http_enabled_modules(boot_info.args.enable_http_apis, modules)
             except ValidationError as error:
@@ -210,6 +251,6 @@ class JsonRpcServerComponent(AsyncioIsolatedComponent):
                     handler=RPCHandler.handle(exec),
                     port=boot_info.args.http_port,
                 )
-                services_to_exit += (http_server,)
+                services_to_exit += (http_server.as_new_service(),)
 
             await run_background_asyncio_services(services_to_exit)
@@ -66,6 +66,7 @@ from trinity.protocol.les.peer import (
 from trinity.sync.full.service import (
     FullChainSyncer,
 )
+from trinity.sync.common.seals import SealVerificationPool
 from trinity.sync.beam.service import (
     BeamSyncService,
 )
@@ -137,7 +138,8 @@ class BaseSyncStrategy(ABC):
                    chain: AsyncChainAPI,
                    base_db: AtomicDatabaseAPI,
                    peer_pool: BasePeerPool,
-                   event_bus: EndpointAPI) -> None:
+                   event_bus: EndpointAPI,
+                   seal_verification_pool: SealVerificationPool) -> None:
         ...
 
 
@@ -153,7 +155,8 @@ class NoopSyncStrategy(BaseSyncStrategy):
                    chain: AsyncChainAPI,
                    base_db: AtomicDatabaseAPI,
                    peer_pool: BasePeerPool,
-                   event_bus: EndpointAPI) -> None:
+                   event_bus: EndpointAPI,
+                   seal_verification_pool: SealVerificationPool) -> None:
 
         logger.info("Node running without sync (--sync-mode=%s)", self.get_sync_mode())
         await asyncio.Future()
@@ -171,13 +174,15 @@ class FullSyncStrategy(BaseSyncStrategy):
                    chain: AsyncChainAPI,
                    base_db: AtomicDatabaseAPI,
                    peer_pool: BasePeerPool,
-                   event_bus: EndpointAPI) -> None:
+                   event_bus: EndpointAPI,
+                   seal_verification_pool: SealVerificationPool) -> None:
 
         syncer = FullChainSyncer(
             chain,
             AsyncChainDB(base_db),
             base_db,
             cast(ETHPeerPool, peer_pool),
+            seal_verification_pool,
         )
 
         await syncer.run()
@@ -206,7 +211,8 @@ class BeamSyncStrategy(BaseSyncStrategy):
                    chain: AsyncChainAPI,
                    base_db: AtomicDatabaseAPI,
                    peer_pool: BasePeerPool,
-                   event_bus: EndpointAPI) -> None:
+                   event_bus: EndpointAPI,
+                   seal_verification_pool: SealVerificationPool) -> None:
 
         syncer = BeamSyncService(
             chain,
@@ -216,7 +222,8 @@ class BeamSyncStrategy(BaseSyncStrategy):
             event_bus,
             args.sync_from_checkpoint,
             args.force_beam_block_number,
-            not args.disable_backfill
+            not args.disable_backfill,
+            seal_verification_pool,
         )
 
         async with background_asyncio_service(syncer) as manager:
@@ -240,7 +247,8 @@ class HeaderSyncStrategy(BaseSyncStrategy):
                    chain: AsyncChainAPI,
                    base_db: AtomicDatabaseAPI,
                    peer_pool: BasePeerPool,
-                   event_bus: EndpointAPI) -> None:
+                   event_bus: EndpointAPI,
+                   seal_verification_pool: SealVerificationPool) -> None:
 
         syncer = HeaderChainSyncer(
             chain,
@@ -248,6 +256,7 @@ class HeaderSyncStrategy(BaseSyncStrategy):
             cast(ETHPeerPool, peer_pool),
             enable_backfill=not args.disable_backfill,
             checkpoint=args.sync_from_checkpoint,
+            seal_verification_pool=seal_verification_pool,
         )
 
         async with background_asyncio_service(syncer) as manager:
@@ -266,12 +275,14 @@ class LightSyncStrategy(BaseSyncStrategy):
                    chain: AsyncChainAPI,
                    base_db: AtomicDatabaseAPI,
                    peer_pool: BasePeerPool,
-                   event_bus: EndpointAPI) -> None:
+                   event_bus: EndpointAPI,
+                   seal_verification_pool: SealVerificationPool) -> None:
 
         syncer = LightChainSyncer(
             chain,
             AsyncHeaderDB(base_db),
             cast(LESPeerPool, peer_pool),
+            seal_verification_pool,
         )
 
         async with background_asyncio_service(syncer) as manager:
@@ -311,6 +322,12 @@ class SyncerComponent(AsyncioIsolatedComponent):
             default=cls.default_strategy.get_sync_mode(),
         )
 
+        syncing_parser.add_argument(
+            '--full-seal-verification',
+            action='store_true',
+            help="Check the PoW seal of every synced header, instead of a random sample",
+        )
+
         for sync_strategy in cls.strategies:
             sync_strategy.configure_parser(syncing_parser)
 
@@ -371,21 +388,35 @@ class SyncerComponent(AsyncioIsolatedComponent):
         node = NodeClass(event_bus, metrics_service, trinity_config)
         strategy = self.get_active_strategy(boot_info)
 
-        async with background_asyncio_service(node) as node_manager:
-            sync_task = create_task(
-                self.launch_sync(node, strategy, boot_info, event_bus), self.name)
-            # The Node service is our responsibility, so we must exit if either that or the syncer
-            # returns.
-            node_manager_task = create_task(
-                node_manager.wait_finished(), f'{NodeClass.__name__} wait_finished() task')
-            await wait_first([sync_task, node_manager_task])
+        # Checks the PoW seals of the synced headers off the main loop
+        if boot_info.args.full_seal_verification:
+            seal_check_random_sample_rate = 1
+        else:
+            seal_check_random_sample_rate = None
+        seal_verification_pool = SealVerificationPool(
+            trinity_config.ethash_cache_dir,
+            seal_check_random_sample_rate=seal_check_random_sample_rate,
+        )
+
+        async with background_asyncio_service(seal_verification_pool):
+            async with background_asyncio_service(node) as node_manager:
+                sync_task = create_task(
+                    self.launch_sync(node, strategy, boot_info, event_bus, seal_verification_pool),
+                    self.name,
+                )
+                # The Node service is our responsibility, so we must exit if either that or the
+                # syncer returns.
+                node_manager_task = create_task(
+                    node_manager.wait_finished(), f'{NodeClass.__name__} wait_finished() task')
+                await wait_first([sync_task, node_manager_task])
 
     @classmethod
     async def launch_sync(cls,
                           node: Node[BasePeer],
                           strategy: BaseSyncStrategy,
                           boot_info: BootInfo,
-                          event_bus: EndpointAPI) -> None:
+                          event_bus: EndpointAPI,
+                          seal_verification_pool: SealVerificationPool) -> None:
         await node.get_manager().wait_started()
         await strategy.sync(
             boot_info.args,
@@ -394,6 +425,7 @@ class SyncerComponent(AsyncioIsolatedComponent):
             node.base_db,
             node.get_peer_pool(),
             event_bus,
+            seal_verification_pool,
         )
 
 
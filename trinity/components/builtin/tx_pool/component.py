@@ -83,6 +83,6 @@ class TxComponent(AsyncioIsolatedComponent):
 
             proxy_peer_pool = ETHProxyPeerPool(event_bus, TO_NETWORKING_BROADCAST_CONFIG)
             async with background_asyncio_service(proxy_peer_pool):
-                tx_pool = TxPool(event_bus, proxy_peer_pool, validator)
+                tx_pool = TxPool(event_bus, proxy_peer_pool, validator, chain)
                 async with background_asyncio_service(tx_pool) as manager:
                     await manager.wait_finished()
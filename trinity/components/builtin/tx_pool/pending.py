@@ -0,0 +1,245 @@
+import bisect
+import heapq
+import itertools
+import time
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from eth_typing import Address, Hash32
+import rlp
+
+from eth.abc import SignedTransactionAPI
+
+
+# The maximum total size of the RLP encoded transactions in the pool. At about 120 bytes for a
+# plain value transfer, this holds a couple hundred thousand transactions.
+MAX_POOL_BYTES = 32 * 1024 * 1024
+
+# The maximum number of pending transactions of any single sender, so that no sender can fill
+# the pool with transactions that may never become executable.
+MAX_TRANSACTIONS_PER_SENDER = 64
+
+# A transaction only replaces a pending transaction of the same sender and nonce if its gas
+# price is at least this many percent higher.
+PRICE_BUMP_PERCENT = 10
+
+# Transactions are dropped from the pool after this many seconds, so that transactions whose
+# nonce never becomes executable, for instance because of a gap in the sender's nonces, don't
+# linger in the pool until it overflows.
+MAX_TRANSACTION_AGE = 3 * 60 * 60
+
+
+class PendingTransaction(NamedTuple):
+    transaction: SignedTransactionAPI
+    sender: Address
+    size: int
+    added_at: float
+
+
+class PendingTransactions:
+    """
+    The transactions of a :class:`~trinity.components.builtin.tx_pool.pool.TxPool`, indexed
+    by hash, by sender and nonce, and by gas price.
+
+    A transaction with the same sender and nonce as a pending one replaces it if it pays a
+    gas price that is at least ``price_bump`` percent higher, and is rejected otherwise.
+
+    Whenever the encoded transactions exceed ``max_bytes``, the pool evicts the transaction
+    with the lowest gas price, together with all later nonces of its sender, which can no
+    longer be executed without it.
+
+    Transactions that were added more than ``max_age`` seconds ago are dropped by
+    :meth:`prune_expired`, together with all later nonces of their sender.
+    """
+    def __init__(self,
+                 max_bytes: int = MAX_POOL_BYTES,
+                 max_per_sender: int = MAX_TRANSACTIONS_PER_SENDER,
+                 price_bump: int = PRICE_BUMP_PERCENT,
+                 max_age: float = MAX_TRANSACTION_AGE) -> None:
+        self._max_bytes = max_bytes
+        self._max_per_sender = max_per_sender
+        self._price_bump = price_bump
+        self._max_age = max_age
+
+        # Ordered by insertion, and thus by age
+        self._by_hash: Dict[Hash32, PendingTransaction] = {}
+        # The nonces of every sender, in ascending order, and the pending transaction of each
+        self._nonces: Dict[Address, List[int]] = {}
+        self._by_sender: Dict[Address, Dict[int, Hash32]] = {}
+        # A min-heap of (gas price, insertion order, hash). Entries of transactions that left
+        # the pool are only dropped once they reach the top, or when the heap is compacted.
+        self._by_price: List[Tuple[int, int, Hash32]] = []
+        self._counter = itertools.count()
+
+        self._num_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._by_hash)
+
+    def __contains__(self, transaction_hash: Hash32) -> bool:
+        return transaction_hash in self._by_hash
+
+    @property
+    def num_bytes(self) -> int:
+        return self._num_bytes
+
+    def get(self, transaction_hash: Hash32) -> Optional[SignedTransactionAPI]:
+        try:
+            return self._by_hash[transaction_hash].transaction
+        except KeyError:
+            return None
+
+    def get_sender_transactions(self, sender: Address) -> Tuple[SignedTransactionAPI, ...]:
+        """
+        Return the pending transactions of the given sender, ordered by nonce.
+        """
+        by_nonce = self._by_sender.get(sender, {})
+        return tuple(
+            self._by_hash[by_nonce[nonce]].transaction
+            for nonce in self._nonces.get(sender, ())
+        )
+
+    def add(self, transaction: SignedTransactionAPI) -> bool:
+        """
+        Add the transaction to the pool, and return whether it was accepted. The transaction
+        must have been validated already.
+        """
+        transaction_hash = Hash32(transaction.hash)
+        if transaction_hash in self._by_hash:
+            return False
+
+        sender = transaction.sender
+        by_nonce = self._by_sender.get(sender, {})
+
+        if transaction.nonce in by_nonce:
+            replaced = self._by_hash[by_nonce[transaction.nonce]].transaction
+            min_gas_price = replaced.gas_price * (100 + self._price_bump) // 100
+            if transaction.gas_price < max(min_gas_price, replaced.gas_price + 1):
+                return False
+            self._remove(Hash32(replaced.hash))
+        elif len(by_nonce) >= self._max_per_sender:
+            return False
+
+        pending = PendingTransaction(
+            transaction,
+            sender,
+            len(rlp.encode(transaction)),
+            time.monotonic(),
+        )
+        self._by_hash[transaction_hash] = pending
+        self._by_sender.setdefault(sender, by_nonce)[transaction.nonce] = transaction_hash
+        bisect.insort(self._nonces.setdefault(sender, []), transaction.nonce)
+        price_entry: Tuple[int, int, Hash32] = (
+            transaction.gas_price,
+            next(self._counter),
+            transaction_hash,
+        )
+        heapq.heappush(self._by_price, price_entry)
+        self._num_bytes += pending.size
+
+        self._evict()
+        return transaction_hash in self._by_hash
+
+    def remove(self, transaction_hash: Hash32) -> None:
+        """
+        Remove the transaction from the pool, if it is pending.
+        """
+        if transaction_hash in self._by_hash:
+            self._remove(transaction_hash)
+            self._maybe_compact()
+
+    def prune_mined(self, transactions: Iterable[SignedTransactionAPI]) -> int:
+        """
+        Remove the given transactions, which were included in a block, and all pending
+        transactions of their senders that reuse one of their nonces. Return the number of
+        removed transactions.
+        """
+        num_transactions = len(self)
+
+        mined_nonces: Dict[Address, int] = {}
+        for transaction in transactions:
+            transaction_hash = Hash32(transaction.hash)
+            if transaction_hash in self._by_hash:
+                sender = self._by_hash[transaction_hash].sender
+            else:
+                sender = transaction.sender
+                if sender not in self._nonces:
+                    continue
+            mined_nonces[sender] = max(transaction.nonce, mined_nonces.get(sender, 0))
+
+        for sender, mined_nonce in mined_nonces.items():
+            nonces = self._nonces[sender]
+            stale_nonces = nonces[:bisect.bisect_right(nonces, mined_nonce)]
+            for nonce in stale_nonces:
+                self._remove(self._by_sender[sender][nonce])
+
+        self._maybe_compact()
+        return num_transactions - len(self)
+
+    def prune_expired(self, now: float = None) -> int:
+        """
+        Remove the transactions that were added more than ``max_age`` seconds before ``now``,
+        which defaults to the current monotonic time, and all later nonces of their senders.
+        Return the number of removed transactions.
+        """
+        if now is None:
+            now = time.monotonic()
+        num_transactions = len(self)
+
+        expired = tuple(itertools.takewhile(
+            lambda pending: now - pending.added_at > self._max_age,
+            self._by_hash.values(),
+        ))
+        for pending in expired:
+            if pending.transaction.nonce in self._by_sender.get(pending.sender, {}):
+                self._remove_from_nonce(pending.sender, pending.transaction.nonce)
+
+        self._maybe_compact()
+        return num_transactions - len(self)
+
+    def _evict(self) -> None:
+        while self._num_bytes > self._max_bytes:
+            _, _, transaction_hash = heapq.heappop(self._by_price)
+            if transaction_hash not in self._by_hash:
+                # the transaction already left the pool
+                continue
+
+            pending = self._by_hash[transaction_hash]
+            self._remove_from_nonce(pending.sender, pending.transaction.nonce)
+
+        self._maybe_compact()
+
+    def _remove_from_nonce(self, sender: Address, first_nonce: int) -> None:
+        # Remove the transaction with the given nonce and all later ones of the sender
+        nonces = self._nonces[sender]
+        later_nonces = nonces[bisect.bisect_left(nonces, first_nonce):]
+        for nonce in later_nonces:
+            self._remove(self._by_sender[sender][nonce])
+
+    def _remove(self, transaction_hash: Hash32) -> None:
+        pending = self._by_hash.pop(transaction_hash)
+        sender, nonce = pending.sender, pending.transaction.nonce
+
+        del self._by_sender[sender][nonce]
+        nonces = self._nonces[sender]
+        del nonces[bisect.bisect_left(nonces, nonce)]
+        if not nonces:
+            del self._nonces[sender]
+            del self._by_sender[sender]
+
+        self._num_bytes -= pending.size
+
+    def _maybe_compact(self) -> None:
+        # Keep the stale entries from outnumbering the pending transactions in the heap
+        if len(self._by_price) > 2 * len(self._by_hash) + 64:
+            self._by_price = [
+                entry for entry in self._by_price
+                if entry[2] in self._by_hash
+            ]
+            heapq.heapify(self._by_price)
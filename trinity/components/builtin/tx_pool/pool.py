@@ -3,8 +3,10 @@ from typing import (
     Callable,
     Iterable,
     List,
+    Optional,
     Sequence,
     Tuple,
+    Type,
 )
 import uuid
 
@@ -12,12 +14,16 @@ from async_service import Service
 from lahja import EndpointAPI
 
 from eth_utils.toolz import partition_all
-from eth.abc import SignedTransactionAPI
+from eth.abc import BlockAPI, BlockHeaderAPI, SignedTransactionAPI
 
 from p2p.abc import SessionAPI
+from p2p.disconnect import DisconnectReason
+from p2p.exceptions import MalformedMessage
 
 from trinity._utils.bloom import RollingBloom
 from trinity._utils.logging import get_logger
+from trinity.chains.base import AsyncChainAPI
+from trinity.components.builtin.tx_pool.pending import PendingTransactions
 from trinity.protocol.eth.events import (
     TransactionsEvent,
     GetPooledTransactionsEvent,
@@ -26,7 +32,7 @@ from trinity.protocol.eth.peer import (
     ETHProxyPeer,
     ETHProxyPeerPool,
 )
-from trinity.sync.common.events import SendLocalTransaction
+from trinity.sync.common.events import NewCanonicalBlocks, SendLocalTransaction
 
 
 # The 'LOW_WATER` mark determines the minimum size at which we'll choose to
@@ -42,6 +48,9 @@ BATCH_LOW_WATER = 100
 # at once.
 BATCH_HIGH_WATER = 200
 
+# How often we drop the transactions that have been in the pool for too long
+EXPIRY_INTERVAL = 60.0
+
 
 class TxPool(Service):
     """
@@ -49,10 +58,17 @@ class TxPool(Service):
     of transactions, represented as :class:`~eth.abc.SignedTransactionAPI` among the
     connected peers.
 
+    Valid transactions are held in a
+    :class:`~trinity.components.builtin.tx_pool.pending.PendingTransactions` pool, which
+    answers ``GetPooledTransactions`` requests. The pool needs a ``chain`` to follow: it holds
+    transactions as the transaction class of the canonical head, and the transactions of new
+    canonical blocks, as announced by :class:`~trinity.sync.common.events.NewCanonicalBlocks`,
+    are pruned from it. Transactions that stay in the pool for too long expire.
+
       .. note::
 
-        This is a minimal viable implementation that only relays transactions but doesn't actually
-        hold on to them yet. It's still missing many features of a grown up transaction pool.
+        Transactions are not re-injected into the pool when their block leaves the canonical
+        chain, and they don't survive a restart.
     """
     logger = get_logger('trinity.components.txpool.TxPool')
 
@@ -60,6 +76,8 @@ class TxPool(Service):
                  event_bus: EndpointAPI,
                  peer_pool: ETHProxyPeerPool,
                  tx_validation_fn: Callable[[SignedTransactionAPI], bool],
+                 chain: AsyncChainAPI = None,
+                 pending_transactions: PendingTransactions = None,
                  ) -> None:
         self._event_bus = event_bus
         self._peer_pool = peer_pool
@@ -68,6 +86,13 @@ class TxPool(Service):
             raise ValueError('Must pass a tx validation function')
 
         self.tx_validation_fn = tx_validation_fn
+        self._chain = chain
+        # Transactions are only held once the transaction class of the canonical head is known
+        self._transaction_class: Optional[Type[SignedTransactionAPI]] = None
+
+        if pending_transactions is None:
+            pending_transactions = PendingTransactions()
+        self.pending_transactions = pending_transactions
 
         # The effectiveness of the filter is based on the number of peers int the peer pool.
         #
@@ -111,30 +136,107 @@ class TxPool(Service):
         # Process all local transactions coming through the JSON-RPC API
         self.manager.run_daemon_task(self._process_local_transactions)
 
+        # Follow the canonical head, and prune the transactions that are included in new blocks
+        if self._chain is not None:
+            self.manager.run_daemon_task(self._track_canonical_head)
+
+        self.manager.run_daemon_task(self._expire_transactions)
+
         async for event in self._event_bus.stream(TransactionsEvent):
-            self.manager.run_task(self._handle_tx, event.session, event.command.payload)
+            try:
+                transactions = event.command.payload
+            except MalformedMessage as err:
+                self.logger.debug(
+                    "Disconnecting %s for sending MalformedMessage: %s", event.session, err
+                )
+                peer = await self._peer_pool.ensure_proxy_peer(event.session)
+                self.manager.run_task(peer.disconnect, DisconnectReason.BAD_PROTOCOL)
+                continue
+            self.manager.run_task(self._handle_tx, event.session, transactions)
 
     async def _process_get_pooled_transactions_requests(self) -> None:
 
         async for event in self._event_bus.stream(GetPooledTransactionsEvent):
+            try:
+                transaction_hashes = event.command.payload
+            except MalformedMessage as err:
+                self.logger.debug(
+                    "Disconnecting %s for sending MalformedMessage: %s", event.session, err
+                )
+                peer = await self._peer_pool.ensure_proxy_peer(event.session)
+                self.manager.run_task(peer.disconnect, DisconnectReason.BAD_PROTOCOL)
+                continue
+
             asking_peer = await self._peer_pool.ensure_proxy_peer(event.session)
-            asking_peer.eth_api.send_pooled_transactions([])
+            # Unknown hashes are skipped, as the protocol allows
+            pooled_transactions = tuple(
+                self.pending_transactions.get(transaction_hash)
+                for transaction_hash in transaction_hashes
+                if transaction_hash in self.pending_transactions
+            )
+            asking_peer.eth_api.send_pooled_transactions(pooled_transactions)
 
     async def _process_local_transactions(self) -> None:
 
         async for event in self._event_bus.stream(SendLocalTransaction):
             # We probably want to save the transaction in the database to make sure it survives
-            # across reboots and gets rebroadcasted if needed. It should probably also be monitored
-            # for inclusion and removed when it's either included or past the maximum age.
+            # across reboots and gets rebroadcasted if needed. It should probably also be removed
+            # once it's past the maximum age.
             # See: https://github.com/ethereum/trinity/issues/29
-            await self._internal_queue.put((event.transaction,))
+            valid_txs = self._add_txs_to_pool((event.transaction,))
+            if valid_txs:
+                await self._internal_queue.put(valid_txs)
 
     async def _handle_tx(self, sender: SessionAPI, txs: Sequence[SignedTransactionAPI]) -> None:
 
         self.logger.debug2('Received %d transactions from %s', len(txs), sender)
 
         self._add_txs_to_bloom(sender, txs)
-        await self._internal_queue.put(txs)
+        valid_txs = self._add_txs_to_pool(txs)
+        if valid_txs:
+            await self._internal_queue.put(valid_txs)
+
+    def _add_txs_to_pool(
+            self,
+            txs: Sequence[SignedTransactionAPI]) -> Tuple[SignedTransactionAPI, ...]:
+        """
+        Add the valid transactions to the pool and return them, for relaying to our peers.
+        """
+        valid_txs = tuple(val for val in txs if self.tx_validation_fn(val))
+        if self._transaction_class is not None:
+            for val in valid_txs:
+                # Valid transactions are relayed even if the pool already holds one with the
+                # same sender and nonce, so that our peers can apply their own replacement rules.
+                self.pending_transactions.add(self._transaction_class.from_base_transaction(val))
+        return valid_txs
+
+    async def _track_canonical_head(self) -> None:
+        head = await self._chain.coro_get_canonical_head()
+        self._update_transaction_class(head)
+
+        async for event in self._event_bus.stream(NewCanonicalBlocks):
+            self._prune_canonical_blocks(event.new_canonical_blocks)
+
+    def _update_transaction_class(self, head: BlockHeaderAPI) -> None:
+        self._transaction_class = self._chain.get_vm_class(head).get_transaction_class()
+
+    def _prune_canonical_blocks(self, blocks: Sequence[BlockAPI]) -> None:
+        self._update_transaction_class(blocks[-1].header)
+        for block in blocks:
+            num_pruned = self.pending_transactions.prune_mined(block.transactions)
+            if num_pruned:
+                self.logger.debug(
+                    "Pruned %d transactions of block #%d from the pool",
+                    num_pruned,
+                    block.number,
+                )
+
+    async def _expire_transactions(self) -> None:
+        while self.manager.is_running:
+            await asyncio.sleep(EXPIRY_INTERVAL)
+            num_expired = self.pending_transactions.prune_expired()
+            if num_expired:
+                self.logger.debug("Dropped %d expired transactions from the pool", num_expired)
 
     async def _process_transactions(self) -> None:
         while self.manager.is_running:
@@ -185,7 +287,6 @@ class TxPool(Service):
         return tuple(
             val for val in txs
             if self._construct_bloom_entry(peer.session, val) not in self._bloom
-            if self.tx_validation_fn(val)
         )
 
     def _construct_bloom_entry(self, session: SessionAPI, tx: SignedTransactionAPI) -> bytes:
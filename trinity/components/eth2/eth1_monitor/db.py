@@ -2,11 +2,13 @@ from abc import ABC, abstractmethod
 from typing import List, Optional, Sequence, Tuple
 
 from eth.abc import AtomicDatabaseAPI, DatabaseAPI
-from eth_typing import BlockNumber
+from eth_typing import BlockNumber, Hash32
 import ssz
 
+from eth2.beacon.constants import DEPOSIT_CONTRACT_TREE_DEPTH
 from eth2.beacon.types.deposit_data import DepositData
 
+from .deposit_tree import DepositTree, DepositTreeNode
 from .exceptions import DepositDataDBValidationError
 
 
@@ -26,6 +28,11 @@ class BaseSchema(ABC):
     def make_highest_processed_block_number_lookup_key() -> bytes:
         ...
 
+    @staticmethod
+    @abstractmethod
+    def make_deposit_tree_node_lookup_key(level: int, index: int) -> bytes:
+        ...
+
 
 class SchemaV1(BaseSchema):
     @staticmethod
@@ -40,6 +47,12 @@ class SchemaV1(BaseSchema):
     def make_highest_processed_block_number_lookup_key() -> bytes:
         return b"v1:deposit_data:highest_processed_block_number"
 
+    @staticmethod
+    def make_deposit_tree_node_lookup_key(level: int, index: int) -> bytes:
+        return (
+            b"v1:deposit_tree:node:" + level.to_bytes(1, "big") + index.to_bytes(8, "big")
+        )
+
 
 class BaseDepositDataDB(ABC):
     @property
@@ -52,6 +65,11 @@ class BaseDepositDataDB(ABC):
     def highest_processed_block_number(self) -> BlockNumber:
         ...
 
+    @property
+    @abstractmethod
+    def deposit_tree(self) -> DepositTree:
+        ...
+
     @abstractmethod
     def add_deposit_data_batch(
         self, seq_deposit_data: Sequence[DepositData], block_number: BlockNumber
@@ -103,6 +121,7 @@ class DepositDataDB(BaseDepositDataDB):
 
     _deposit_count: int
     _highest_processed_block_number: BlockNumber
+    _deposit_tree: DepositTree
 
     def __init__(
         self,
@@ -125,11 +144,16 @@ class DepositDataDB(BaseDepositDataDB):
         self._highest_processed_block_number = (
             self._get_highest_processed_block_number()
         )
+        self._deposit_tree = self._load_deposit_tree()
 
     @property
     def deposit_count(self) -> int:
         return self._deposit_count
 
+    @property
+    def deposit_tree(self) -> DepositTree:
+        return self._deposit_tree
+
     @property
     def highest_processed_block_number(self) -> BlockNumber:
         return self._highest_processed_block_number
@@ -148,6 +172,9 @@ class DepositDataDB(BaseDepositDataDB):
         with self.db.atomic_batch() as db:
             for index, data in enumerate(seq_deposit_data):
                 self._set_deposit_data(db, count + index, data)
+                self._set_deposit_tree_nodes(
+                    db, self._deposit_tree.append(data.hash_tree_root)
+                )
             self._set_deposit_count(db, new_count)
             self._set_highest_processed_block_number(db, block_number)
         self._deposit_count = new_count
@@ -174,6 +201,34 @@ class DepositDataDB(BaseDepositDataDB):
             self.get_deposit_data(index) for index in range(from_index, to_index)
         )
 
+    def _load_deposit_tree(self) -> DepositTree:
+        """
+        Load the complete nodes of the deposit tree. If the tree was never persisted, e.g.
+        the deposit data was written by an older version, build it once from the deposit
+        data and persist it.
+        """
+        try:
+            layers = tuple(
+                tuple(
+                    Hash32(
+                        self.db[SchemaV1.make_deposit_tree_node_lookup_key(level, index)]
+                    )
+                    for index in range(self.deposit_count >> level)
+                )
+                for level in range(DEPOSIT_CONTRACT_TREE_DEPTH)
+            )
+        except KeyError:
+            deposit_tree = DepositTree()
+            with self.db.atomic_batch() as db:
+                for index in range(self.deposit_count):
+                    self._set_deposit_tree_nodes(
+                        db,
+                        deposit_tree.append(self.get_deposit_data(index).hash_tree_root),
+                    )
+            return deposit_tree
+        else:
+            return DepositTree(layers)
+
     def _get_deposit_count(self) -> int:
         key = SchemaV1.make_deposit_count_lookup_key()
         try:
@@ -196,6 +251,13 @@ class DepositDataDB(BaseDepositDataDB):
     ) -> None:
         db[SchemaV1.make_deposit_data_lookup_key(index)] = ssz.encode(deposit_data)
 
+    @staticmethod
+    def _set_deposit_tree_nodes(
+        db: DatabaseAPI, nodes: Sequence[DepositTreeNode]
+    ) -> None:
+        for level, index, node in nodes:
+            db[SchemaV1.make_deposit_tree_node_lookup_key(level, index)] = node
+
     @classmethod
     def _set_deposit_count(cls, db: DatabaseAPI, deposit_count: int) -> None:
         db[SchemaV1.make_deposit_count_lookup_key()] = cls._serialize_uint(
@@ -239,6 +301,10 @@ class ListCachedDepositDataDB(BaseDepositDataDB):
     def highest_processed_block_number(self) -> BlockNumber:
         return self._db.highest_processed_block_number
 
+    @property
+    def deposit_tree(self) -> DepositTree:
+        return self._db.deposit_tree
+
     def add_deposit_data_batch(
         self, seq_deposit_data: Sequence[DepositData], block_number: BlockNumber
     ) -> None:
@@ -0,0 +1,125 @@
+from typing import Iterable, List, Sequence, Tuple
+
+from eth_typing import Hash32
+from eth_utils.toolz import iterate, take
+
+from eth2._utils.hash import hash_eth2
+from eth2.beacon.constants import DEPOSIT_CONTRACT_TREE_DEPTH
+
+from .exceptions import DepositDataDBValidationError
+
+# `ZERO_HASHES[level]` is the root of an empty subtree of height `level`.
+ZERO_HASHES: Tuple[Hash32, ...] = tuple(
+    take(
+        DEPOSIT_CONTRACT_TREE_DEPTH + 1,
+        iterate(lambda node: Hash32(hash_eth2(node + node)), Hash32(b"\x00" * 32)),
+    )
+)
+
+# A node which became complete after an append, i.e. `(level, index, node)`.
+DepositTreeNode = Tuple[int, int, Hash32]
+
+
+def _mix_in_length(root: Hash32, deposit_count: int) -> Hash32:
+    return hash_eth2(root + deposit_count.to_bytes(32, byteorder="little"))
+
+
+class DepositTree:
+    """
+    Append-only Merkle tree over the ``hash_tree_root`` of each ``DepositData``, mirroring
+    the deposit contract.
+
+    Only the nodes whose subtree is completely filled are stored: ``self._layers[level]``
+    holds exactly ``count >> level`` nodes. Such nodes never change once written, so the
+    root and the proofs for any earlier ``deposit_count`` can be derived from them by
+    recomputing the (at most ``DEPOSIT_CONTRACT_TREE_DEPTH``) partially filled nodes on
+    the right edge of the snapshot.
+    """
+
+    _layers: List[List[Hash32]]
+
+    def __init__(self, layers: Sequence[Sequence[Hash32]] = ()) -> None:
+        self._layers = [[] for _ in range(DEPOSIT_CONTRACT_TREE_DEPTH)]
+        for level, layer in enumerate(layers):
+            self._layers[level].extend(layer)
+        count = len(self._layers[0])
+        for level, layer in enumerate(self._layers):
+            if len(layer) != count >> level:
+                raise DepositDataDBValidationError(
+                    f"Invalid deposit tree layer: level={level}, len(layer)={len(layer)}, "
+                    f"expected={count >> level}"
+                )
+
+    @property
+    def count(self) -> int:
+        return len(self._layers[0])
+
+    def append(self, leaf: Hash32) -> Tuple[DepositTreeNode, ...]:
+        """
+        Append ``leaf`` to the tree, and return the nodes that became complete, so that the
+        caller can persist them.
+        """
+        new_nodes = []
+        node = leaf
+        for level, layer in enumerate(self._layers):
+            layer.append(node)
+            new_nodes.append((level, len(layer) - 1, node))
+            if len(layer) % 2 == 1:
+                break
+            node = hash_eth2(layer[-2] + layer[-1])
+        return tuple(new_nodes)
+
+    def extend(self, leaves: Iterable[Hash32]) -> Tuple[DepositTreeNode, ...]:
+        return tuple(node for leaf in leaves for node in self.append(leaf))
+
+    def get_root(self, deposit_count: int) -> Hash32:
+        """
+        Return the deposit root, with the length mixed in, of the first ``deposit_count``
+        deposits.
+        """
+        self._validate_deposit_count(deposit_count)
+        return _mix_in_length(
+            self._get_node(DEPOSIT_CONTRACT_TREE_DEPTH, 0, deposit_count),
+            deposit_count,
+        )
+
+    def get_proof(self, deposit_index: int, deposit_count: int) -> Tuple[Hash32, ...]:
+        """
+        Return the Merkle proof, with the length mixed in, of the deposit at
+        ``deposit_index`` in the tree made from the first ``deposit_count`` deposits.
+        """
+        self._validate_deposit_count(deposit_count)
+        if deposit_index < 0 or deposit_index >= deposit_count:
+            raise DepositDataDBValidationError(
+                "`deposit_index` should be in the range of [0, `deposit_count`): "
+                f"deposit_index={deposit_index}, deposit_count={deposit_count}"
+            )
+        branch = tuple(
+            self._get_node(level, (deposit_index >> level) ^ 1, deposit_count)
+            for level in range(DEPOSIT_CONTRACT_TREE_DEPTH)
+        )
+        return branch + (Hash32(deposit_count.to_bytes(32, byteorder="little")),)
+
+    def _get_node(self, level: int, index: int, deposit_count: int) -> Hash32:
+        """
+        Return the node at ``(level, index)`` of the tree made from the first
+        ``deposit_count`` leaves.
+        """
+        start = index << level
+        end = start + (1 << level)
+        if start >= deposit_count:
+            return ZERO_HASHES[level]
+        elif end <= deposit_count:
+            return self._layers[level][index]
+        else:
+            # Only one child of a partially filled node can be partially filled as well.
+            left = self._get_node(level - 1, index * 2, deposit_count)
+            right = self._get_node(level - 1, index * 2 + 1, deposit_count)
+            return hash_eth2(left + right)
+
+    def _validate_deposit_count(self, deposit_count: int) -> None:
+        if deposit_count < 0 or deposit_count > self.count:
+            raise DepositDataDBValidationError(
+                "`deposit_count` should be in the range of [0, `self.count`]: "
+                f"deposit_count={deposit_count}, self.count={self.count}"
+            )
@@ -101,6 +101,7 @@ from trinity.constants import (
     LOG_DIR,
     LOG_FILE,
     NODE_DB_DIR,
+    ETHASH_CACHE_DIR,
     PID_DIR,
     SYNC_LIGHT,
     APP_IDENTIFIER_VALIDATOR_CLIENT,
@@ -435,6 +436,13 @@ class TrinityConfig:
         """
         return self.with_app_suffix(self.data_dir / NODE_DB_DIR)
 
+    @property
+    def ethash_cache_dir(self) -> Path:
+        """
+        Return the directory for the ethash caches that PoW seals are checked with.
+        """
+        return self.with_app_suffix(self.data_dir / ETHASH_CACHE_DIR)
+
     @property
     def logging_ipc_path(self) -> Path:
         """
@@ -28,6 +28,7 @@ LOG_DIR = 'logs'
 LOG_FILE = 'trinity.log'
 PID_DIR = 'pids'
 NODE_DB_DIR = 'discovery-node-records'
+ETHASH_CACHE_DIR = 'ethash'
 
 # sync modes
 SYNC_FULL = 'full'
@@ -94,3 +95,7 @@ DEFAULT_PREFERRED_NODES: Dict[int, Tuple[Node, ...]] = {
 # These are not failures that we expect to be transient, so no point in retrying frequently.
 BLACKLIST_SECONDS_WRONG_NETWORK_OR_GENESIS = 60 * 60
 BLACKLIST_SECONDS_DAO_FORK_CHECK_FAILURE = 60 * 60
+
+# Maximum number of bytes of database values cached by the ``DBClient`` of the processes
+# that do a lot of repeated lookups (syncing, block import).
+DB_CLIENT_CACHE_SIZE = 64 * 1024 * 1024
@@ -0,0 +1,262 @@
+import asyncio
+import logging
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Sequence,
+    Tuple,
+)
+
+from async_service import Service
+from eth_bloom.bloom import get_bloom_bits
+from eth_typing import BlockNumber, Hash32
+from eth_utils import (
+    big_endian_to_int,
+    int_to_big_endian,
+    ValidationError,
+)
+
+from eth.abc import AtomicDatabaseAPI, BlockHeaderAPI
+from eth.exceptions import HeaderNotFound
+
+from trinity.db.eth1.header import BaseAsyncHeaderDB
+from trinity.db.manager import batch_exists, batch_get
+
+
+# The number of blocks in a section of the index. Every section stores a row of this many bits
+# for each of the 2048 bits of the header bloom.
+BLOOM_BITS_SECTION_SIZE = 4096
+
+# A section is only indexed once its last block is this deep in the canonical chain, so that it
+# is unlikely to be re-organized later.
+BLOOM_BITS_CONFIRMATIONS = 256
+
+# How often the indexer checks the canonical head for new sections to index
+BLOOM_BITS_POLL_INTERVAL = 10.0
+
+BLOOM_BITS = 2048
+
+NUM_SECTIONS_KEY = b'bloom-bits:num-sections'
+
+
+def _make_row_key(bit: int, section: int) -> bytes:
+    return b'bloom-bits:row:%d:%d' % (bit, section)
+
+
+def _make_section_head_key(section: int) -> bytes:
+    return b'bloom-bits:section-head:%d' % section
+
+
+def get_bloom_bit_indices(value: bytes) -> Tuple[int, ...]:
+    """
+    Return the indices of the three bits that ``value`` sets in a bloom.
+    """
+    return tuple(bloom_bits.bit_length() - 1 for bloom_bits in get_bloom_bits(value))
+
+
+def transpose_blooms(blooms: Sequence[int]) -> List[int]:
+    """
+    Transpose the given blooms into one row for each bloom bit, where bit ``i`` of a row is
+    set if that bit is set in the bloom at index ``i``.
+    """
+    rows = [0] * BLOOM_BITS
+    for offset, bloom in enumerate(blooms):
+        while bloom:
+            lowest_bit = bloom & -bloom
+            rows[lowest_bit.bit_length() - 1] |= 1 << offset
+            bloom ^= lowest_bit
+    return rows
+
+
+class BloomBitsIndex:
+    """
+    The blooms of the canonical headers, stored bit-transposed in sections of ``section_size``
+    blocks. For every section, the index stores a row of ``section_size`` bits for every bloom
+    bit, which tells the blocks of the section whose bloom has that bit set. Looking for a value
+    in a section thus only reads the three rows of the bits that the value sets.
+
+    Only complete sections are indexed, in order.
+    """
+    def __init__(self, db: AtomicDatabaseAPI, section_size: int = BLOOM_BITS_SECTION_SIZE) -> None:
+        if section_size % 8:
+            raise ValidationError(f"Section size must be a multiple of 8, got {section_size}")
+        self._db = db
+        self.section_size = section_size
+
+    @property
+    def num_sections(self) -> int:
+        """
+        The number of sections that are indexed, starting from the genesis block.
+        """
+        try:
+            return big_endian_to_int(self._db[NUM_SECTIONS_KEY])
+        except KeyError:
+            return 0
+
+    def get_section_head(self, section: int) -> Hash32:
+        """
+        Return the hash of the last header of the given section, when it was indexed.
+        """
+        return Hash32(self._db[_make_section_head_key(section)])
+
+    def index_section(self, section: int, headers: Sequence[BlockHeaderAPI]) -> None:
+        """
+        Index the blooms of the headers of the given section, and drop any sections above it.
+        """
+        num_sections = self.num_sections
+        if section > num_sections:
+            raise ValidationError(
+                f"Cannot index section {section} before section {num_sections}"
+            )
+        elif len(headers) != self.section_size:
+            raise ValidationError(
+                f"Section must have {self.section_size} headers, got {len(headers)}"
+            )
+        elif headers[0].block_number != section * self.section_size:
+            raise ValidationError(
+                f"Section {section} cannot start with block #{headers[0].block_number}"
+            )
+
+        rows = transpose_blooms(tuple(header.bloom for header in headers))
+        self.persist_section(section, rows, headers[-1].hash)
+
+    def persist_section(self, section: int, rows: Sequence[int], section_head: Hash32) -> None:
+        """
+        Store the transposed blooms of the given section, as made by :func:`transpose_blooms`.
+        """
+        row_keys = tuple(_make_row_key(bit, section) for bit in range(BLOOM_BITS))
+        if _make_section_head_key(section) in self._db:
+            # The section is indexed again, its empty rows might have been set before
+            stale_keys = tuple(
+                key for key, exists in zip(row_keys, batch_exists(self._db, row_keys))
+                if exists
+            )
+        else:
+            stale_keys = ()
+
+        with self._db.atomic_batch() as batch:
+            for key in stale_keys:
+                del batch[key]
+            for key, row in zip(row_keys, rows):
+                # Empty rows are not stored at all
+                if row:
+                    batch[key] = row.to_bytes(self.section_size // 8, 'little')
+            batch[_make_section_head_key(section)] = section_head
+            batch[NUM_SECTIONS_KEY] = int_to_big_endian(section + 1)
+
+    def match_section(self, section: int, criteria: Sequence[Sequence[Sequence[int]]]) -> int:
+        """
+        Return a mask of the blocks of the section that may match all of the ``criteria``:
+        bit ``i`` of the mask is set if the block at offset ``i`` may match. Every criterion
+        is a sequence of alternative values, given as the bloom bits they set. A criterion
+        without alternatives matches all blocks.
+        """
+        bits = set(bit for criterion in criteria for value in criterion for bit in value)
+        rows = self._get_rows(section, bits)
+
+        mask = (1 << self.section_size) - 1
+        for criterion in criteria:
+            if not criterion:
+                continue
+
+            criterion_mask = 0
+            for value in criterion:
+                value_mask = mask
+                for bit in value:
+                    value_mask &= rows[bit]
+                criterion_mask |= value_mask
+
+            mask &= criterion_mask
+            if not mask:
+                break
+        return mask
+
+    def _get_rows(self, section: int, bits: Iterable[int]) -> Dict[int, int]:
+        bits = tuple(bits)
+        keys = tuple(_make_row_key(bit, section) for bit in bits)
+        # All rows of the section are read in a single round trip to the database
+        encoded_rows = batch_get(self._db, keys)
+        return {
+            bit: int.from_bytes(encoded_rows.get(key, b''), 'little')
+            for bit, key in zip(bits, keys)
+        }
+
+
+class BloomBitsIndexer(Service):
+    """
+    Keep the :class:`BloomBitsIndex` up to date with the canonical chain, by indexing every
+    section once it has ``confirmations`` blocks on top. Sections whose last header left the
+    canonical chain are indexed again.
+    """
+    logger = logging.getLogger('trinity.db.eth1.bloom_bits.BloomBitsIndexer')
+
+    def __init__(self,
+                 chaindb: BaseAsyncHeaderDB,
+                 index: BloomBitsIndex = None,
+                 confirmations: int = BLOOM_BITS_CONFIRMATIONS,
+                 poll_interval: float = BLOOM_BITS_POLL_INTERVAL) -> None:
+        self._chaindb = chaindb
+        if index is None:
+            index = BloomBitsIndex(chaindb.db)
+        self._index = index
+        self._confirmations = confirmations
+        self._poll_interval = poll_interval
+
+    async def run(self) -> None:
+        while self.manager.is_running:
+            await self.index_new_sections()
+            await asyncio.sleep(self._poll_interval)
+
+    async def index_new_sections(self) -> int:
+        """
+        Index all sections that are confirmed by the canonical head and not indexed yet, and
+        return how many were indexed.
+        """
+        head = await self._chaindb.coro_get_canonical_head()
+        section_size = self._index.section_size
+        num_confirmed_sections = max(
+            0,
+            (head.block_number + 1 - self._confirmations) // section_size,
+        )
+
+        first_section = await self._get_first_unindexed_section()
+        num_indexed = 0
+        for section in range(first_section, num_confirmed_sections):
+            # Reading the headers and transposing their blooms takes a while, so it is done
+            # off the event loop, in a single job per section
+            rows, section_head = await asyncio.get_event_loop().run_in_executor(
+                None,
+                self._transpose_section,
+                section,
+            )
+            self._index.persist_section(section, rows, section_head)
+            num_indexed += 1
+            self.logger.debug("Indexed the blooms of section %d", section)
+
+        return num_indexed
+
+    def _transpose_section(self, section: int) -> Tuple[List[int], Hash32]:
+        section_size = self._index.section_size
+        headers = tuple(
+            self._chaindb.get_canonical_block_header_by_number(BlockNumber(block_number))
+            for block_number in range(section * section_size, (section + 1) * section_size)
+        )
+        return transpose_blooms(tuple(header.bloom for header in headers)), headers[-1].hash
+
+    async def _get_first_unindexed_section(self) -> int:
+        section_size = self._index.section_size
+        section = self._index.num_sections
+        while section > 0:
+            try:
+                canonical_hash = await self._chaindb.coro_get_canonical_block_hash(
+                    BlockNumber(section * section_size - 1),
+                )
+            except HeaderNotFound:
+                pass
+            else:
+                if canonical_hash == self._index.get_section_head(section - 1):
+                    break
+            self.logger.debug("Section %d was re-organized, indexing it again", section - 1)
+            section -= 1
+        return section
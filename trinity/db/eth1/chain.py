@@ -2,12 +2,31 @@ from abc import abstractmethod
 from typing import (
     Dict,
     Iterable,
+    List,
     Sequence,
     Tuple,
     Type,
+    Union,
 )
 
 from eth_typing import Hash32
+import rlp
+from rlp.sedes import big_endian_int
+from trie.constants import (
+    BLANK_NODE_HASH,
+    NODE_TYPE_BRANCH,
+    NODE_TYPE_EXTENSION,
+)
+from trie.exceptions import MissingTrieNode
+from trie.typing import (
+    Nibbles,
+    RawHexaryNode,
+)
+from trie.utils.nibbles import nibbles_to_bytes
+from trie.utils.nodes import (
+    annotate_node,
+    get_node_type,
+)
 
 from eth.abc import (
     BlockAPI,
@@ -15,10 +34,14 @@ from eth.abc import (
     ReceiptAPI,
     SignedTransactionAPI,
 )
+from eth.constants import EMPTY_UNCLE_HASH, GENESIS_PARENT_HASH
 from eth.db.chain import ChainDB
+from eth.exceptions import HeaderNotFound
 
 from trinity._utils.async_dispatch import async_method
 from trinity.db.eth1.header import BaseAsyncHeaderDB
+from trinity.db.manager import batch_get
+from trinity.rlp.encoding import encode_raw_list
 
 
 class BaseAsyncChainDB(BaseAsyncHeaderDB, ChainDB):
@@ -26,6 +49,118 @@ class BaseAsyncChainDB(BaseAsyncHeaderDB, ChainDB):
     Abstract base class for the async counterpart to ``ChainDatabaseAPI``.
     """
 
+    def persist_block_chain(
+            self,
+            blocks: Sequence[BlockAPI],
+            trie_data_dicts: Sequence[Dict[Hash32, bytes]] = (),
+            genesis_parent_hash: Hash32 = GENESIS_PARENT_HASH,
+    ) -> Tuple[Tuple[Hash32, ...], Tuple[Hash32, ...]]:
+        """
+        Persist a run of blocks, in order, together with the trie data (like the transaction and
+        receipt tries) that belongs to them, all in a single atomic write batch.
+
+        :return: the hashes of the blocks that became canonical, and of the ones that stopped
+            being canonical, across the whole run
+        """
+        new_canonical_hashes: Tuple[Hash32, ...] = ()
+        old_canonical_hashes: Tuple[Hash32, ...] = ()
+        with self.db.atomic_batch() as db:
+            for trie_data_dict in trie_data_dicts:
+                self._persist_trie_data_dict(db, trie_data_dict)
+
+            for block in blocks:
+                new_hashes, old_hashes = self._persist_block(db, block, genesis_parent_hash)
+                new_canonical_hashes += new_hashes
+                old_canonical_hashes += old_hashes
+
+        return new_canonical_hashes, old_canonical_hashes
+
+    def get_encoded_block_bodies(self, block_hashes: Sequence[Hash32]) -> Dict[Hash32, bytes]:
+        """
+        Return the RLP encoded bodies of the given blocks, assembled from the stored transaction
+        trie leaves and the stored uncles, without decoding any of them. Blocks that we don't
+        have in full are left out.
+        """
+        encoded_bodies = {}
+        for block_hash in block_hashes:
+            try:
+                header = self.get_block_header_by_hash(block_hash)
+                encoded_transactions = self._get_encoded_trie_leaves(header.transaction_root)
+                if header.uncles_hash == EMPTY_UNCLE_HASH:
+                    encoded_uncles = encode_raw_list(())
+                else:
+                    encoded_uncles = self.db[header.uncles_hash]
+            except (HeaderNotFound, MissingTrieNode, KeyError):
+                continue
+            encoded_bodies[block_hash] = encode_raw_list(
+                (encode_raw_list(encoded_transactions), encoded_uncles)
+            )
+        return encoded_bodies
+
+    def get_encoded_receipts(self, block_hashes: Sequence[Hash32]) -> Dict[Hash32, bytes]:
+        """
+        Return the RLP encoded receipts of each of the given blocks, assembled from the stored
+        receipt trie leaves. Blocks that we don't have all receipts of are left out.
+        """
+        encoded_receipts = {}
+        for block_hash in block_hashes:
+            try:
+                header = self.get_block_header_by_hash(block_hash)
+                encoded_block_receipts = self._get_encoded_trie_leaves(header.receipt_root)
+            except (HeaderNotFound, MissingTrieNode):
+                continue
+            encoded_receipts[block_hash] = encode_raw_list(encoded_block_receipts)
+        return encoded_receipts
+
+    def _get_encoded_trie_leaves(self, root_hash: Hash32) -> Tuple[bytes, ...]:
+        """
+        Return the values of a trie that is keyed by the RLP encoded index, like the transaction
+        and receipt tries, ordered by index. The trie is walked one level at a time, and the
+        nodes of each level are looked up in a single batch.
+        """
+        if root_hash == BLANK_NODE_HASH:
+            return ()
+
+        encoded_leaves: Dict[int, bytes] = {}
+        # The prefix of every node of the next level, and either its hash or its body, if it
+        # is embedded in its parent
+        references: List[Tuple[Nibbles, Union[Hash32, RawHexaryNode]]] = [
+            (Nibbles(()), root_hash),
+        ]
+        while references:
+            encoded_nodes = batch_get(self.db, (
+                reference for _, reference in references if isinstance(reference, bytes)
+            ))
+
+            next_references: List[Tuple[Nibbles, Union[Hash32, RawHexaryNode]]] = []
+            for prefix, reference in references:
+                raw_node: RawHexaryNode
+                if not isinstance(reference, bytes):
+                    raw_node = reference
+                elif reference in encoded_nodes:
+                    raw_node = rlp.decode(encoded_nodes[reference])
+                else:
+                    raise MissingTrieNode(Hash32(reference), root_hash, b'', prefix)
+
+                node = annotate_node(raw_node)
+                if node.value:
+                    key = nibbles_to_bytes(prefix + node.suffix)
+                    encoded_leaves[rlp.decode(key, sedes=big_endian_int)] = node.value
+
+                node_type = get_node_type(raw_node)
+                if node_type == NODE_TYPE_BRANCH:
+                    next_references.extend(
+                        (prefix + segment, raw_node[segment[0]])
+                        for segment in node.sub_segments
+                    )
+                elif node_type == NODE_TYPE_EXTENSION:
+                    segment, = node.sub_segments
+                    next_references.append((prefix + segment, raw_node[1]))
+
+            references = next_references
+
+        return tuple(encoded_leaves[index] for index in sorted(encoded_leaves))
+
     @abstractmethod
     async def coro_exists(self, key: bytes) -> bool:
         ...
@@ -41,6 +176,15 @@ class BaseAsyncChainDB(BaseAsyncHeaderDB, ChainDB):
     ) -> Tuple[Tuple[Hash32, ...], Tuple[Hash32, ...]]:
         ...
 
+    @abstractmethod
+    async def coro_persist_block_chain(
+        self,
+        blocks: Sequence[BlockAPI],
+        trie_data_dicts: Sequence[Dict[Hash32, bytes]] = (),
+        genesis_parent_hash: Hash32 = GENESIS_PARENT_HASH,
+    ) -> Tuple[Tuple[Hash32, ...], Tuple[Hash32, ...]]:
+        ...
+
     @abstractmethod
     async def coro_persist_uncles(self, uncles: Sequence[BlockHeaderAPI]) -> Hash32:
         ...
@@ -68,6 +212,18 @@ class BaseAsyncChainDB(BaseAsyncHeaderDB, ChainDB):
     ) -> Tuple[ReceiptAPI, ...]:
         ...
 
+    @abstractmethod
+    async def coro_get_encoded_block_bodies(
+            self,
+            block_hashes: Sequence[Hash32]) -> Dict[Hash32, bytes]:
+        ...
+
+    @abstractmethod
+    async def coro_get_encoded_receipts(
+            self,
+            block_hashes: Sequence[Hash32]) -> Dict[Hash32, bytes]:
+        ...
+
 
 class AsyncChainDB(BaseAsyncChainDB):
     coro_exists = async_method(BaseAsyncChainDB.exists)
@@ -82,9 +238,12 @@ class AsyncChainDB(BaseAsyncChainDB):
     coro_persist_header = async_method(BaseAsyncChainDB.persist_header)
     coro_persist_header_chain = async_method(BaseAsyncChainDB.persist_header_chain)
     coro_persist_block = async_method(BaseAsyncChainDB.persist_block)
+    coro_persist_block_chain = async_method(BaseAsyncChainDB.persist_block_chain)
     coro_persist_header_chain = async_method(BaseAsyncChainDB.persist_header_chain)
     coro_persist_uncles = async_method(BaseAsyncChainDB.persist_uncles)
     coro_persist_trie_data_dict = async_method(BaseAsyncChainDB.persist_trie_data_dict)
     coro_get_block_transactions = async_method(BaseAsyncChainDB.get_block_transactions)
     coro_get_block_uncles = async_method(BaseAsyncChainDB.get_block_uncles)
     coro_get_receipts = async_method(BaseAsyncChainDB.get_receipts)
+    coro_get_encoded_block_bodies = async_method(BaseAsyncChainDB.get_encoded_block_bodies)
+    coro_get_encoded_receipts = async_method(BaseAsyncChainDB.get_encoded_receipts)
@@ -4,19 +4,33 @@ import errno
 import itertools
 import logging
 import pathlib
+import queue
 import socket
 import struct
 import threading
 from types import TracebackType
 from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
     Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
     Type,
+    cast,
 )
 
+import cachetools
 from eth_utils.toolz import partition
+from pyformance import MetricsRegistry
 
 from eth.abc import (
     AtomicDatabaseAPI,
+    DatabaseAPI,
 )
 from eth.db.atomic import AtomicDBWriteBatch
 from eth.db.backends.base import BaseAtomicDB
@@ -33,6 +47,10 @@ class Operation(enum.Enum):
     DELETE = b'\x02'
     EXISTS = b'\x03'
     ATOMIC_BATCH = b'\x04'
+    MULTI_GET = b'\x05'
+    MULTI_EXISTS = b'\x06'
+    TAGGED = b'\x07'
+    SUBSCRIBE_INVALIDATIONS = b'\x08'
 
 
 GET = Operation.GET
@@ -111,9 +129,90 @@ ATOMIC_BATCH Response:
 - Success Byte: 0x01
 """
 
+MULTI_GET = Operation.MULTI_GET
+"""
+MULTI_GET Request:
+
+- Operation Byte: 0x05
+- Key Count: 4-byte little endian
+- Key Sizes: Array of 4-byte little endian
+- Keys: Array of raw bytes
+
+MULTI_GET Response:
+
+- Array, in the order of the requested keys, of either:
+    - Success Byte: 0x01, Value Length: 4-byte little endian, Value: raw
+    - Fail Byte: 0x00
+"""
+
+MULTI_EXISTS = Operation.MULTI_EXISTS
+"""
+MULTI_EXISTS Request:
+
+- Operation Byte: 0x06
+- Key Count: 4-byte little endian
+- Key Sizes: Array of 4-byte little endian
+- Keys: Array of raw bytes
+
+MULTI_EXISTS Response:
+
+- Array, in the order of the requested keys, of Response Bytes: True: 0x01 or False: 0x00
+"""
+
+TAGGED = Operation.TAGGED
+"""
+TAGGED Request:
+
+- Operation Byte: 0x07
+- Request ID: 4-byte little endian
+- Request: any request except TAGGED, including its own operation byte
+
+TAGGED Response:
+
+- Request ID: 4-byte little endian
+- Response: the response to the wrapped request
+
+Tagged requests can be pipelined: a client may send many of them without waiting for
+the responses, and match each response to its request by the request ID.
+"""
+
+SUBSCRIBE_INVALIDATIONS = Operation.SUBSCRIBE_INVALIDATIONS
+"""
+SUBSCRIBE_INVALIDATIONS Request:
+
+- Operation Byte: 0x08
+
+SUBSCRIBE_INVALIDATIONS Response:
+
+- Success Byte: 0x01, once the subscription is active
+- Then, until the connection is closed, a stream of invalidations, each being:
+    - Key Count: 4-byte little endian
+    - Key Sizes: Array of 4-byte little endian
+    - Keys: Array of raw bytes
+
+- The client acknowledges every invalidation with a Success Byte: 0x01, once it stopped
+  serving the stale values.
+
+An invalidation is sent after every SET, DELETE and ATOMIC_BATCH that changed one of the
+keys, and the write is only acknowledged to the writer once all subscribers acknowledged
+the invalidation. Keys of ``CONTENT_ADDRESSED_KEY_SIZE`` bytes are hashes of their value, so
+they are only invalidated when they are deleted.
+
+A subscriber that has more than ``MAX_PENDING_INVALIDATIONS`` invalidations pending, or that
+does not acknowledge one within ``INVALIDATION_TIMEOUT`` seconds, is disconnected.
+"""
+
 
 LEN_BYTES = 4
 DOUBLE_LEN_BYTES = 2 * LEN_BYTES
+NUM_REQUEST_IDS = 2 ** (8 * LEN_BYTES)
+
+# By convention, 32-byte keys are the hash of their value (trie nodes, headers, code...)
+CONTENT_ADDRESSED_KEY_SIZE = 32
+
+# Bounds on how far an invalidation subscriber can fall behind before it gets disconnected
+MAX_PENDING_INVALIDATIONS = 1024
+INVALIDATION_TIMEOUT = 5
 
 
 SUCCESS_BYTE = b'\x01'
@@ -142,6 +241,8 @@ class DBManager(IPCSocketServer):
         """
         super().__init__()
         self.db = db
+        self._invalidation_subscriptions: Set[_InvalidationSubscription] = set()
+        self._invalidation_subscriptions_lock = threading.Lock()
 
     def serve_conn(self, sock: BufferedSocket) -> None:
         while self.is_running:
@@ -156,27 +257,38 @@ class DBManager(IPCSocketServer):
 
             try:
                 operation = Operation(operation_byte)
-            except TypeError:
+            except (TypeError, ValueError):
                 self.logger.error("Unrecognized database operation: %s", operation_byte.hex())
                 break
 
             try:
-                if operation is GET:
-                    self.handle_GET(sock)
-                elif operation is SET:
-                    self.handle_SET(sock)
-                elif operation is DELETE:
-                    self.handle_DELETE(sock)
-                elif operation is EXISTS:
-                    self.handle_EXISTS(sock)
-                elif operation is ATOMIC_BATCH:
-                    self.handle_ATOMIC_BATCH(sock)
-                else:
-                    self.logger.error("Got unhandled operation %s", operation)
+                self.handle_operation(operation, sock)
             except Exception as err:
                 self.logger.exception("Unhandled error during operation %s: %s", operation, err)
                 raise
 
+    def handle_operation(self, operation: Operation, sock: BufferedSocket) -> None:
+        if operation is GET:
+            self.handle_GET(sock)
+        elif operation is SET:
+            self.handle_SET(sock)
+        elif operation is DELETE:
+            self.handle_DELETE(sock)
+        elif operation is EXISTS:
+            self.handle_EXISTS(sock)
+        elif operation is ATOMIC_BATCH:
+            self.handle_ATOMIC_BATCH(sock)
+        elif operation is MULTI_GET:
+            self.handle_MULTI_GET(sock)
+        elif operation is MULTI_EXISTS:
+            self.handle_MULTI_EXISTS(sock)
+        elif operation is TAGGED:
+            self.handle_TAGGED(sock)
+        elif operation is SUBSCRIBE_INVALIDATIONS:
+            self.handle_SUBSCRIBE_INVALIDATIONS(sock)
+        else:
+            self.logger.error("Got unhandled operation %s", operation)
+
     def handle_GET(self, sock: BufferedSocket) -> None:
         key_size_data = sock.read_exactly(LEN_BYTES)
         key = sock.read_exactly(int.from_bytes(key_size_data, 'little'))
@@ -188,13 +300,14 @@ class DBManager(IPCSocketServer):
             sock.sendall(SUCCESS_BYTE + len(value).to_bytes(LEN_BYTES, 'little') + value)
 
     def handle_SET(self, sock: BufferedSocket) -> None:
-        key_and_value_size_data = sock.read_exactly(DOUBLE_LEN_BYTES)
+        key_and_value_size_data = sock.read_exactly_view(DOUBLE_LEN_BYTES)
         key_size, value_size = struct.unpack('<II', key_and_value_size_data)
         combined_size = key_size + value_size
-        key_and_value_data = sock.read_exactly(combined_size)
-        key = key_and_value_data[:key_size]
-        value = key_and_value_data[key_size:]
+        key_and_value_data = sock.read_exactly_view(combined_size)
+        key = bytes(key_and_value_data[:key_size])
+        value = bytes(key_and_value_data[key_size:])
         self.db[key] = value
+        self._notify_invalidations((key,), ())
         sock.sendall(SUCCESS_BYTE)
 
     def handle_DELETE(self, sock: BufferedSocket) -> None:
@@ -205,6 +318,7 @@ class DBManager(IPCSocketServer):
         except KeyError:
             sock.sendall(FAIL_BYTE)
         else:
+            self._notify_invalidations((), (key,))
             sock.sendall(SUCCESS_BYTE)
 
     def handle_EXISTS(self, sock: BufferedSocket) -> None:
@@ -216,12 +330,12 @@ class DBManager(IPCSocketServer):
             sock.sendall(FAIL_BYTE)
 
     def handle_ATOMIC_BATCH(self, sock: BufferedSocket) -> None:
-        kv_pair_and_delete_count_data = sock.read_exactly(DOUBLE_LEN_BYTES)
+        kv_pair_and_delete_count_data = sock.read_exactly_view(DOUBLE_LEN_BYTES)
         kv_pair_count, delete_count = struct.unpack('<II', kv_pair_and_delete_count_data)
         total_kv_count = 2 * kv_pair_count
 
         if kv_pair_count or delete_count:
-            kv_and_delete_sizes_data = sock.read_exactly(
+            kv_and_delete_sizes_data = sock.read_exactly_view(
                 DOUBLE_LEN_BYTES * kv_pair_count + LEN_BYTES * delete_count
             )
             fmt_str = '<' + 'I' * (total_kv_count + delete_count)
@@ -230,18 +344,304 @@ class DBManager(IPCSocketServer):
             kv_sizes = kv_and_delete_sizes[:total_kv_count]
             delete_sizes = kv_and_delete_sizes[total_kv_count:total_kv_count + delete_count]
 
+            written_keys = []
+            deleted_keys = []
             with self.db.atomic_batch() as batch:
                 for key_size, value_size in partition(2, kv_sizes):
                     combined_size = key_size + value_size
-                    key_and_value_data = sock.read_exactly(combined_size)
-                    key = key_and_value_data[:key_size]
-                    value = key_and_value_data[key_size:]
+                    # Only the key and the value are copied out of the receive buffer
+                    key_and_value_data = sock.read_exactly_view(combined_size)
+                    key = bytes(key_and_value_data[:key_size])
+                    value = bytes(key_and_value_data[key_size:])
                     batch[key] = value
+                    written_keys.append(key)
                 for key_size in delete_sizes:
                     key = sock.read_exactly(key_size)
                     del batch[key]
+                    deleted_keys.append(key)
 
-        sock.sendall(SUCCESS_BYTE)
+            self._notify_invalidations(written_keys, deleted_keys)
+            sock.sendall(SUCCESS_BYTE)
+        else:
+            sock.sendall(SUCCESS_BYTE)
+
+    def handle_MULTI_GET(self, sock: BufferedSocket) -> None:
+        response = []
+        for key in _read_keys(sock):
+            try:
+                value = self.db[key]
+            except KeyError:
+                response.append(FAIL_BYTE)
+            else:
+                response.append(SUCCESS_BYTE + len(value).to_bytes(LEN_BYTES, 'little') + value)
+        sock.sendall(b''.join(response))
+
+    def handle_MULTI_EXISTS(self, sock: BufferedSocket) -> None:
+        sock.sendall(b''.join(
+            SUCCESS_BYTE if key in self.db else FAIL_BYTE
+            for key in _read_keys(sock)
+        ))
+
+    def handle_TAGGED(self, sock: BufferedSocket) -> None:
+        request_id_data = sock.read_exactly(LEN_BYTES)
+        tagged_sock = _TaggedResponseSocket(sock, request_id_data)
+        operation_byte = sock.read_exactly(1)
+        try:
+            operation = Operation(operation_byte)
+        except (TypeError, ValueError):
+            self.logger.error("Unrecognized tagged database operation: %s", operation_byte.hex())
+            tagged_sock.sendall(FAIL_BYTE)
+            return
+
+        if operation is TAGGED:
+            self.logger.error("Nested TAGGED database requests are not supported")
+            tagged_sock.sendall(FAIL_BYTE)
+        else:
+            self.handle_operation(operation, cast(BufferedSocket, tagged_sock))
+
+    def handle_SUBSCRIBE_INVALIDATIONS(self, sock: BufferedSocket) -> None:
+        subscription = _InvalidationSubscription(sock)
+        with self._invalidation_subscriptions_lock:
+            self._invalidation_subscriptions.add(subscription)
+
+        delivered_events: List[threading.Event] = []
+        try:
+            sock.sendall(SUCCESS_BYTE)
+            while self.is_running:
+                try:
+                    keys, delivered = subscription.pending.get(timeout=1)
+                except queue.Empty:
+                    continue
+
+                # Coalesce everything that is already queued into a single message
+                delivered_events = [delivered]
+                while True:
+                    try:
+                        more_keys, delivered = subscription.pending.get_nowait()
+                    except queue.Empty:
+                        break
+                    keys += more_keys
+                    delivered_events.append(delivered)
+
+                sock.sendall(_encode_keys(keys))
+                Result(sock.read_exactly(1))
+                for delivered in delivered_events:
+                    delivered.set()
+        except OSError as err:
+            self.logger.debug("%s: closing invalidation subscription: %s", self, err)
+        finally:
+            with self._invalidation_subscriptions_lock:
+                self._invalidation_subscriptions.discard(subscription)
+            subscription.close()
+            # The subscriber stops caching mutable keys once disconnected
+            for delivered in delivered_events:
+                delivered.set()
+
+    def _notify_invalidations(
+            self,
+            written_keys: Sequence[bytes],
+            deleted_keys: Sequence[bytes]) -> None:
+        """
+        Deliver the invalidations to all subscribers, and block until they acknowledged them.
+        """
+        if not self._invalidation_subscriptions:
+            return
+
+        keys = tuple(
+            key for key in written_keys if len(key) != CONTENT_ADDRESSED_KEY_SIZE
+        ) + tuple(deleted_keys)
+        if not keys:
+            return
+
+        with self._invalidation_subscriptions_lock:
+            subscriptions = tuple(self._invalidation_subscriptions)
+
+        waiting_for = []
+        for subscription in subscriptions:
+            delivered = threading.Event()
+            try:
+                subscription.pending.put_nowait((keys, delivered))
+            except queue.Full:
+                self.logger.warning(
+                    "%s: disconnecting invalidation subscriber with %d pending invalidations",
+                    self,
+                    MAX_PENDING_INVALIDATIONS,
+                )
+                subscription.close()
+            else:
+                waiting_for.append((subscription, delivered))
+
+        for subscription, delivered in waiting_for:
+            if not delivered.wait(INVALIDATION_TIMEOUT):
+                self.logger.warning(
+                    "%s: disconnecting invalidation subscriber that did not acknowledge "
+                    "invalidations within %ds",
+                    self,
+                    INVALIDATION_TIMEOUT,
+                )
+                subscription.close()
+
+
+class _InvalidationSubscription:
+    """
+    The invalidations waiting to be sent to a subscriber, each with an event to set once the
+    subscriber acknowledged it.
+    """
+    def __init__(self, sock: BufferedSocket) -> None:
+        self._sock = sock
+        self.pending: 'queue.Queue[Tuple[Tuple[bytes, ...], threading.Event]]' = queue.Queue(
+            MAX_PENDING_INVALIDATIONS,
+        )
+
+    def close(self) -> None:
+        """
+        Disconnect the subscriber, which stops caching mutable keys when its invalidations
+        connection drops, and release the writers waiting on it.
+        """
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        while True:
+            try:
+                _, delivered = self.pending.get_nowait()
+            except queue.Empty:
+                break
+            delivered.set()
+
+
+class _TaggedResponseSocket:
+    """
+    Prefixes the response of a TAGGED request with its request ID. Every handler sends its
+    whole response with a single ``sendall`` so the prefix only needs to be added once.
+    """
+    def __init__(self, sock: BufferedSocket, request_id_data: bytes) -> None:
+        self._request_id_data = request_id_data
+        self.read_exactly = sock.read_exactly
+        self.read_exactly_view = sock.read_exactly_view
+        self._sendall = sock.sendall
+
+    def sendall(self, data: bytes) -> None:
+        self._sendall(self._request_id_data + data)
+
+
+def _encode_keys(keys: Sequence[bytes]) -> bytes:
+    fmt_str = '<I' + 'I' * len(keys)
+    return struct.pack(fmt_str, len(keys), *(len(key) for key in keys)) + b''.join(keys)
+
+
+def _read_keys(sock: BufferedSocket) -> Tuple[bytes, ...]:
+    key_count = int.from_bytes(sock.read_exactly_view(LEN_BYTES), 'little')
+    if not key_count:
+        return ()
+    key_sizes = struct.unpack(
+        '<' + 'I' * key_count,
+        sock.read_exactly_view(LEN_BYTES * key_count),
+    )
+    keys_data = sock.read_exactly_view(sum(key_sizes))
+    keys = []
+    offset = 0
+    for key_size in key_sizes:
+        keys.append(bytes(keys_data[offset:offset + key_size]))
+        offset += key_size
+    return tuple(keys)
+
+
+def _read_value(sock: BufferedSocket) -> Optional[bytes]:
+    result_byte = sock.read_exactly(1)
+    if result_byte == SUCCESS_BYTE:
+        value_size_data = sock.read_exactly(LEN_BYTES)
+        return sock.read_exactly(int.from_bytes(value_size_data, 'little'))
+    elif result_byte == FAIL_BYTE:
+        return None
+    else:
+        raise Exception(f"Unknown result byte: {result_byte.hex()}")
+
+
+def _read_bool(sock: BufferedSocket) -> bool:
+    result_byte = sock.read_exactly(1)
+    if result_byte == SUCCESS_BYTE:
+        return True
+    elif result_byte == FAIL_BYTE:
+        return False
+    else:
+        raise Exception(f"Unknown result byte: {result_byte.hex()}")
+
+
+def _read_multi_get(keys: Sequence[bytes], sock: BufferedSocket) -> Dict[bytes, bytes]:
+    values = {}
+    for key in keys:
+        value = _read_value(sock)
+        if value is not None:
+            values[key] = value
+    return values
+
+
+def _read_multi_exists(keys: Sequence[bytes], sock: BufferedSocket) -> Tuple[bool, ...]:
+    result_bytes = sock.read_exactly_view(len(keys))
+    return tuple(result_byte == SUCCESS_BYTE[0] for result_byte in result_bytes)
+
+
+ResponseReader = Callable[[BufferedSocket], Any]
+
+
+class DBPipeline:
+    """
+    Collects requests to be sent to the :class:`DBManager` without waiting for each
+    response, using TAGGED requests. The responses are matched to the requests by request
+    ID when the pipeline is executed.
+
+    Each method returns the position of its result in the tuple returned by :meth:`execute`.
+    Failed lookups do not raise: a missing key is ``None`` for ``get``, and ``False`` for
+    ``delete``.
+    """
+    def __init__(self, client: 'DBClient') -> None:
+        self._client = client
+        self._requests: List[Tuple[bytes, ResponseReader]] = []
+        self._written_keys: List[bytes] = []
+
+    def __len__(self) -> int:
+        return len(self._requests)
+
+    def get(self, key: bytes) -> int:
+        return self._add(GET.value + len(key).to_bytes(LEN_BYTES, 'little') + key, _read_value)
+
+    def set(self, key: bytes, value: bytes) -> int:
+        self._written_keys.append(key)
+        return self._add(
+            SET.value + struct.pack('<II', len(key), len(value)) + key + value,
+            lambda sock: Result(sock.read_exactly(1)) is SUCCESS,
+        )
+
+    def delete(self, key: bytes) -> int:
+        self._written_keys.append(key)
+        return self._add(DELETE.value + len(key).to_bytes(LEN_BYTES, 'little') + key, _read_bool)
+
+    def exists(self, key: bytes) -> int:
+        return self._add(EXISTS.value + len(key).to_bytes(LEN_BYTES, 'little') + key, _read_bool)
+
+    def multi_get(self, keys: Sequence[bytes]) -> int:
+        keys = tuple(keys)
+        return self._add(
+            MULTI_GET.value + _encode_keys(keys),
+            lambda sock: _read_multi_get(keys, sock),
+        )
+
+    def multi_exists(self, keys: Sequence[bytes]) -> int:
+        keys = tuple(keys)
+        return self._add(
+            MULTI_EXISTS.value + _encode_keys(keys),
+            lambda sock: _read_multi_exists(keys, sock),
+        )
+
+    def _add(self, request: bytes, read_response: ResponseReader) -> int:
+        self._requests.append((request, read_response))
+        return len(self._requests) - 1
+
+    def execute(self) -> Tuple[Any, ...]:
+        requests, self._requests = self._requests, []
+        written_keys, self._written_keys = self._written_keys, []
+        return self._client._execute_pipeline(requests, written_keys)
 
 
 class AtomicBatch(AtomicDBWriteBatch):
@@ -262,12 +662,144 @@ class AtomicBatch(AtomicDBWriteBatch):
         return diff
 
 
+# Rough per-entry overhead of the python objects held by the cache, in bytes
+CACHE_ENTRY_OVERHEAD = 128
+
+
+def _get_cache_entry_size(value: bytes) -> int:
+    return len(value) + CACHE_ENTRY_OVERHEAD
+
+
+class DBClientCache:
+    """
+    A read-through LRU cache of database values, bounded by the total size of the values.
+
+    Content-addressed keys are always cached. Other keys are only cached while an
+    invalidation subscription to the :class:`DBManager` is active, so that writes from other
+    processes evict them.
+    """
+    logger = logging.getLogger('trinity.db.manager.DBClientCache')
+
+    def __init__(self, max_bytes: int, metrics_registry: MetricsRegistry = None) -> None:
+        self._cache = cachetools.LRUCache(max_bytes, getsizeof=_get_cache_entry_size)
+        self._lock = threading.Lock()
+        self._invalidations_active = False
+        # Keys invalidated while a read is in flight: their values must not be cached.
+        self._stale_keys: Optional[Set[bytes]] = None
+
+        if metrics_registry is None:
+            metrics_registry = MetricsRegistry()
+        self._hit_counter = metrics_registry.counter('trinity.db/client/cache_hits.counter')
+        self._miss_counter = metrics_registry.counter('trinity.db/client/cache_misses.counter')
+
+    def is_cacheable(self, key: bytes) -> bool:
+        return len(key) == CONTENT_ADDRESSED_KEY_SIZE or self._invalidations_active
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        if not self.is_cacheable(key):
+            return None
+
+        with self._lock:
+            value = self._cache.get(key)
+
+        if value is None:
+            self._miss_counter.inc()
+        else:
+            self._hit_counter.inc()
+        return value
+
+    @contextlib.contextmanager
+    def read_through(self) -> Iterator[Dict[bytes, bytes]]:
+        """
+        Wrap a request to the database, and cache the values that the caller adds to the
+        yielded dict, unless they were invalidated while the request was in flight.
+        """
+        with self._lock:
+            self._stale_keys = set()
+
+        values: Dict[bytes, bytes] = {}
+        try:
+            yield values
+        finally:
+            with self._lock:
+                stale_keys, self._stale_keys = self._stale_keys, None
+                for key, value in values.items():
+                    if key not in stale_keys and self.is_cacheable(key):
+                        self._put(key, value)
+
+    def update(self, written: Iterable[Tuple[bytes, bytes]], deleted: Iterable[bytes]) -> None:
+        """
+        Update the cache after a successful write from this process.
+        """
+        with self._lock:
+            for key, value in written:
+                if self.is_cacheable(key):
+                    self._put(key, value)
+                else:
+                    self._cache.pop(key, None)
+            for key in deleted:
+                self._cache.pop(key, None)
+
+    def invalidate(self, keys: Iterable[bytes]) -> None:
+        with self._lock:
+            for key in keys:
+                self._cache.pop(key, None)
+                if self._stale_keys is not None:
+                    self._stale_keys.add(key)
+
+    def enable_invalidations(self) -> None:
+        self._invalidations_active = True
+
+    def disable_invalidations(self) -> None:
+        """
+        Stop caching mutable keys, and drop the ones in cache since they can't be
+        invalidated anymore.
+        """
+        with self._lock:
+            self._invalidations_active = False
+            for key in tuple(self._cache.keys()):
+                if len(key) != CONTENT_ADDRESSED_KEY_SIZE:
+                    del self._cache[key]
+
+    def _put(self, key: bytes, value: bytes) -> None:
+        try:
+            self._cache[key] = value
+        except ValueError:
+            # The value is bigger than the whole cache
+            self._cache.pop(key, None)
+
+
 class DBClient(BaseAtomicDB):
     logger = logging.getLogger('trinity.db.client.DBClient')
 
-    def __init__(self, sock: socket.socket):
+    _invalidations_socket: BufferedSocket = None
+
+    def __init__(self,
+                 sock: socket.socket,
+                 cache: DBClientCache = None,
+                 invalidations_sock: socket.socket = None) -> None:
+        """
+        If a ``cache`` is given, values are read through it. If ``invalidations_sock`` is
+        given too, it is used to subscribe to the invalidations of the :class:`DBManager`,
+        which allows caching keys that are not content-addressed.
+        """
         self._socket = BufferedSocket(sock)
         self._lock = threading.Lock()
+        self._request_ids = itertools.count()
+        self._cache = cache
+
+        if invalidations_sock is not None:
+            if cache is None:
+                raise ValueError("Can only subscribe to invalidations when using a cache")
+            self._invalidations_socket = BufferedSocket(invalidations_sock)
+            self._invalidations_socket.sendall(SUBSCRIBE_INVALIDATIONS.value)
+            Result(self._invalidations_socket.read_exactly(1))
+            cache.enable_invalidations()
+            threading.Thread(
+                name="DBClient._receive_invalidations",
+                target=self._receive_invalidations,
+                daemon=True,
+            ).start()
 
     def __enter__(self) -> None:
         self._socket.__enter__()
@@ -277,20 +809,29 @@ class DBClient(BaseAtomicDB):
                  exc_value: BaseException,
                  exc_tb: TracebackType) -> None:
         self._socket.__exit__(exc_type, exc_value, exc_tb)
+        if self._invalidations_socket is not None:
+            self._invalidations_socket.__exit__(exc_type, exc_value, exc_tb)
 
     def __getitem__(self, key: bytes) -> bytes:
-        with self._lock:
-            self._socket.sendall(GET.value + len(key).to_bytes(LEN_BYTES, 'little') + key)
-            result_byte = self._socket.read_exactly(1)
+        if self._cache is None:
+            with self._lock:
+                value = self._get(key)
+        else:
+            value = self._cache.get(key)
+            if value is None:
+                with self._lock, self._cache.read_through() as values:
+                    value = self._get(key)
+                    if value is not None:
+                        values[key] = value
+
+        if value is None:
+            raise KeyError(key)
+        else:
+            return value
 
-            if result_byte == SUCCESS_BYTE:
-                value_size_data = self._socket.read_exactly(LEN_BYTES)
-                value = self._socket.read_exactly(int.from_bytes(value_size_data, 'little'))
-                return value
-            elif result_byte == FAIL_BYTE:
-                raise KeyError(key)
-            else:
-                raise Exception(f"Unknown result byte: {result_byte.hex}")
+    def _get(self, key: bytes) -> Optional[bytes]:
+        self._socket.sendall(GET.value + len(key).to_bytes(LEN_BYTES, 'little') + key)
+        return _read_value(self._socket)
 
     def __setitem__(self, key: bytes, value: bytes) -> None:
         with self._lock:
@@ -298,11 +839,15 @@ class DBClient(BaseAtomicDB):
                 SET.value + struct.pack('<II', len(key), len(value)) + key + value
             )
             Result(self._socket.read_exactly(1))
+            if self._cache is not None:
+                self._cache.update(((key, value),), ())
 
     def __delitem__(self, key: bytes) -> None:
         with self._lock:
             self._socket.sendall(DELETE.value + len(key).to_bytes(4, 'little') + key)
             result_byte = self._socket.read_exactly(1)
+            if self._cache is not None:
+                self._cache.update((), (key,))
 
         if result_byte == SUCCESS_BYTE:
             return
@@ -312,6 +857,9 @@ class DBClient(BaseAtomicDB):
             raise Exception(f"Unknown result byte: {result_byte.hex}")
 
     def _exists(self, key: bytes) -> bool:
+        if self._cache is not None and self._cache.get(key) is not None:
+            return True
+
         with self._lock:
             self._socket.sendall(EXISTS.value + len(key).to_bytes(4, 'little') + key)
             result_byte = self._socket.read_exactly(1)
@@ -323,6 +871,109 @@ class DBClient(BaseAtomicDB):
         else:
             raise Exception(f"Unknown result byte: {result_byte.hex}")
 
+    def multi_get(self, keys: Sequence[bytes]) -> Dict[bytes, bytes]:
+        """
+        Look up all ``keys`` in a single round trip, returning the values of the keys that
+        are present.
+        """
+        if self._cache is None:
+            cached_values: Dict[bytes, bytes] = {}
+            missing_keys = tuple(keys)
+        else:
+            cached_values = {}
+            uncached_keys = []
+            for key in keys:
+                value = self._cache.get(key)
+                if value is None:
+                    uncached_keys.append(key)
+                else:
+                    cached_values[key] = value
+            missing_keys = tuple(uncached_keys)
+
+        if not missing_keys:
+            return cached_values
+
+        with self._lock:
+            self._socket.sendall(MULTI_GET.value + _encode_keys(missing_keys))
+            if self._cache is None:
+                return _read_multi_get(missing_keys, self._socket)
+            with self._cache.read_through() as values:
+                values.update(_read_multi_get(missing_keys, self._socket))
+
+        return {**cached_values, **values}
+
+    def multi_exists(self, keys: Sequence[bytes]) -> Tuple[bool, ...]:
+        """
+        Check the presence of all ``keys`` in a single round trip, in the order of ``keys``.
+        """
+        keys = tuple(keys)
+        if self._cache is None:
+            missing_keys = keys
+        else:
+            missing_keys = tuple(key for key in keys if self._cache.get(key) is None)
+
+        if not missing_keys:
+            return (True,) * len(keys)
+
+        with self._lock:
+            self._socket.sendall(MULTI_EXISTS.value + _encode_keys(missing_keys))
+            remote_exists = dict(zip(
+                missing_keys,
+                _read_multi_exists(missing_keys, self._socket),
+            ))
+        return tuple(remote_exists.get(key, True) for key in keys)
+
+    def pipeline(self) -> DBPipeline:
+        return DBPipeline(self)
+
+    def _execute_pipeline(
+            self,
+            requests: Sequence[Tuple[bytes, ResponseReader]],
+            written_keys: Sequence[bytes]) -> Tuple[Any, ...]:
+        if not requests:
+            return ()
+
+        if self._cache is not None:
+            # Pipelined reads bypass the cache, but pipelined writes must not leave stale
+            # values behind.
+            self._cache.update((), written_keys)
+
+        with self._lock:
+            readers_by_id: Dict[bytes, Tuple[int, ResponseReader]] = {}
+            tagged_requests = []
+            for index, (request, read_response) in enumerate(requests):
+                request_id = next(self._request_ids) % NUM_REQUEST_IDS
+                request_id_data = request_id.to_bytes(LEN_BYTES, 'little')
+                readers_by_id[request_id_data] = (index, read_response)
+                tagged_requests.append(TAGGED.value + request_id_data + request)
+
+            # The requests are written from another thread, so that the server never
+            # blocks on sending responses we are not reading yet.
+            send_errors: List[BaseException] = []
+            sender = threading.Thread(
+                name="DBClient._execute_pipeline",
+                target=_sendall_capturing_errors,
+                args=(self._socket, b''.join(tagged_requests), send_errors),
+                daemon=True,
+            )
+            sender.start()
+            try:
+                results: List[Any] = [None] * len(requests)
+                for _ in range(len(requests)):
+                    request_id_data = self._socket.read_exactly(LEN_BYTES)
+                    try:
+                        index, read_response = readers_by_id.pop(request_id_data)
+                    except KeyError:
+                        raise Exception(
+                            f"Unknown request ID in response: {request_id_data.hex()}"
+                        )
+                    results[index] = read_response(self._socket)
+            finally:
+                sender.join()
+            if send_errors:
+                raise send_errors[0]
+            return tuple(results)
+
     @contextlib.contextmanager
     def atomic_batch(self) -> Iterator[AtomicBatch]:
         batch = AtomicBatch(self)
@@ -353,24 +1004,97 @@ class DBClient(BaseAtomicDB):
                 ATOMIC_BATCH.value + kv_pair_count_and_size_data + kv_and_delete_data
             )
             Result(self._socket.read_exactly(1))
+            if self._cache is not None:
+                self._cache.update(pending_kv_pairs, pending_deletes)
 
-    def close(self) -> None:
+    def _receive_invalidations(self) -> None:
         try:
-            self._socket.shutdown(socket.SHUT_WR)
-        except OSError as e:
-            # on mac OS this can result in the following error:
-            # OSError: [Errno 57] Socket is not connected
-            if e.errno != errno.ENOTCONN:
-                raise
-        self._socket.close()
+            while True:
+                self._cache.invalidate(_read_keys(self._invalidations_socket))
+                self._invalidations_socket.sendall(SUCCESS_BYTE)
+        except OSError as err:
+            self.logger.debug("Stopped receiving invalidations: %s", err)
+        finally:
+            self._cache.disable_invalidations()
+
+    def close(self) -> None:
+        if self._invalidations_socket is not None:
+            # Shutting down reads too wakes up the thread receiving the invalidations
+            _shutdown_and_close(self._invalidations_socket, socket.SHUT_RDWR)
+        _shutdown_and_close(self._socket, socket.SHUT_WR)
 
     @classmethod
-    def connect(cls, path: pathlib.Path, timeout: int = 5) -> "DBClient":
+    def connect(cls,
+                path: pathlib.Path,
+                timeout: int = 5,
+                cache_size: int = 0,
+                metrics_registry: MetricsRegistry = None) -> "DBClient":
+        """
+        Connect to the :class:`DBManager` serving at ``path``. If ``cache_size`` is set,
+        values are cached in an LRU of up to that many bytes, and a second connection is
+        used to receive invalidations.
+        """
         wait_for_ipc(path, timeout)
         s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         cls.logger.debug("Opened connection to %s: %s", path, s)
         s.connect(str(path))
-        return cls(s)
+
+        if not cache_size:
+            return cls(s)
+
+        invalidations_sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        invalidations_sock.connect(str(path))
+        return cls(s, DBClientCache(cache_size, metrics_registry), invalidations_sock)
+
+
+def _shutdown_and_close(sock: BufferedSocket, how: int) -> None:
+    try:
+        sock.shutdown(how)
+    except OSError as e:
+        # on mac OS this can result in the following error:
+        # OSError: [Errno 57] Socket is not connected
+        if e.errno != errno.ENOTCONN:
+            raise
+    sock.close()
+
+
+def _sendall_capturing_errors(
+        sock: BufferedSocket,
+        data: bytes,
+        errors: List[BaseException]) -> None:
+    try:
+        sock.sendall(data)
+    except BaseException as err:
+        errors.append(err)
+
+
+def batch_get(db: DatabaseAPI, keys: Iterable[bytes]) -> Dict[bytes, bytes]:
+    """
+    Look up many keys at once, in a single round trip if ``db`` is a :class:`DBClient`.
+    """
+    keys = tuple(keys)
+    if isinstance(db, DBClient):
+        return db.multi_get(keys)
+
+    values = {}
+    for key in keys:
+        try:
+            values[key] = db[key]
+        except KeyError:
+            pass
+    return values
+
+
+def batch_exists(db: DatabaseAPI, keys: Iterable[bytes]) -> Tuple[bool, ...]:
+    """
+    Check the presence of many keys at once, in a single round trip if ``db`` is a
+    :class:`DBClient`.
+    """
+    keys = tuple(keys)
+    if isinstance(db, DBClient):
+        return db.multi_exists(keys)
+    else:
+        return tuple(key in db for key in keys)
 
 
 def _run() -> None:
@@ -52,6 +52,12 @@ async def process_metrics(chain: BaseBeaconChain, event_bus: EndpointAPI) -> Non
     metrics.beacon_finalized_epoch.set(epoch_info.finalized_checkpoint.epoch)
     metrics.beacon_finalized_root.set(root_to_int(epoch_info.finalized_checkpoint.root))
 
+    # State cache
+    state_cache = chain.chaindb.state_cache
+    metrics.beacon_state_cache_hits.set(state_cache.hits)
+    metrics.beacon_state_cache_misses.set(state_cache.misses)
+    metrics.beacon_state_cache_hit_rate.set(state_cache.hit_rate)
+
 
 class MetricsHandler(BaseHTTPHandler):
 
@@ -3,6 +3,8 @@ from typing import (
     Any,
     Callable,
     Dict,
+    List,
+    Union,
 )
 
 from aiohttp import web
@@ -33,7 +35,7 @@ async def load_json_request(request: web.Request) -> Any:
 
 async def execute_json_rpc(
     execute_rpc: Callable[[Any], Any],
-    json_request: Dict['str', Any]
+    json_request: Union[Dict['str', Any], List[Any]]
 ) -> str:
     try:
         result = await execute_rpc(json_request)
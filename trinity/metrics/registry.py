@@ -1,4 +1,4 @@
-from prometheus_client import CollectorRegistry, Counter, Gauge
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
 
 
 class AllMetrics:
@@ -55,6 +55,53 @@ class AllMetrics:
             "beacon_finalized_root", "Current finalized root", registry=registry
         )  # noqa: E501
 
+        # State cache
+        self.beacon_state_cache_hits = Gauge(
+            "beacon_state_cache_hits",
+            "Number of beacon state lookups served from the state cache",
+            registry=registry,
+        )  # noqa: E501
+        self.beacon_state_cache_misses = Gauge(
+            "beacon_state_cache_misses",
+            "Number of beacon state lookups that missed the state cache",
+            registry=registry,
+        )  # noqa: E501
+        self.beacon_state_cache_hit_rate = Gauge(
+            "beacon_state_cache_hit_rate",
+            "Ratio of beacon state lookups served from the state cache",
+            registry=registry,
+        )  # noqa: E501
+
+        # Gossip signature verification
+        self.gossip_signature_queue_depth = Gauge(
+            "gossip_signature_queue_depth",
+            "Number of gossip signatures waiting to be verified",
+            registry=registry,
+        )  # noqa: E501
+        self.gossip_signature_batch_size = Histogram(
+            "gossip_signature_batch_size",
+            "Number of gossip signatures verified per batch",
+            buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256),
+            registry=registry,
+        )  # noqa: E501
+        self.gossip_signature_latency = Histogram(
+            "gossip_signature_latency",
+            "Seconds from the submission of a gossip signature until its verdict",
+            registry=registry,
+        )  # noqa: E501
+
+        # Range sync
+        self.beacon_sync_slots_per_second = Gauge(
+            "beacon_sync_slots_per_second",
+            "Slots imported per second by the running range sync",
+            registry=registry,
+        )  # noqa: E501
+        self.beacon_sync_downloaded_blocks = Counter(
+            "beacon_sync_downloaded_blocks",
+            "Number of blocks downloaded by the range sync",
+            registry=registry,
+        )  # noqa: E501
+
         #
         # Other
         #
@@ -10,6 +10,7 @@ from lahja import EndpointAPI
 
 from eth.abc import AtomicDatabaseAPI
 
+from p2p.exchange import NormalizationPool
 from p2p.peer_pool import BasePeerPool
 
 from trinity.chains.base import AsyncChainAPI
@@ -24,6 +25,7 @@ from trinity.config import (
     Eth1AppConfig,
     TrinityConfig,
 )
+from trinity.constants import DB_CLIENT_CACHE_SIZE
 from trinity.protocol.common.peer import BasePeer
 from trinity.protocol.common.peer_pool_event_bus import (
     PeerPoolEventServer,
@@ -51,7 +53,11 @@ class Node(Service, Generic[TPeer]):
                  metrics_service: MetricsServiceAPI,
                  trinity_config: TrinityConfig) -> None:
         self.trinity_config = trinity_config
-        self._base_db = DBClient.connect(trinity_config.database_ipc_path)
+        self._base_db = DBClient.connect(
+            trinity_config.database_ipc_path,
+            cache_size=DB_CLIENT_CACHE_SIZE,
+            metrics_registry=metrics_service.registry,
+        )
         self._headerdb = AsyncHeaderDB(self._base_db)
 
         self._jsonrpc_ipc_path: Path = trinity_config.jsonrpc_ipc_path
@@ -59,6 +65,8 @@ class Node(Service, Generic[TPeer]):
 
         self.event_bus = event_bus
         self.metrics_service = metrics_service
+        # Shared by the exchanges of all peers, to normalize slow responses off the main loop
+        self._normalization_pool = NormalizationPool(metrics_registry=metrics_service.registry)
 
     async def handle_network_id_requests(self) -> None:
         async for req in self.event_bus.stream(NetworkIdRequest):
@@ -130,4 +138,5 @@ class Node(Service, Generic[TPeer]):
             self.manager.run_daemon_child_service(self.get_p2p_server())
             self.manager.run_daemon_child_service(self.get_event_server())
             self.manager.run_daemon_child_service(self.metrics_service)
+            self.manager.run_daemon_child_service(self._normalization_pool)
             await self.manager.wait_finished()
@@ -1,8 +1,7 @@
 from dataclasses import dataclass
 import logging
 from pathlib import Path
-import time
-from typing import Any, Collection, Iterable, Optional, Set, Tuple, Type
+from typing import Any, Collection, Dict, Optional, Set, Tuple, Type
 
 from async_service import background_trio_service
 from eth.db.backends.level import LevelDB
@@ -33,8 +32,7 @@ from trinity.nodes.beacon.metadata import MetaData
 from trinity.nodes.beacon.metadata import SeqNumber as MetaDataSeqNumber
 from trinity.nodes.beacon.request_responder import GoodbyeReason
 from trinity.nodes.beacon.status import Status
-
-SYNC_REATTEMPT_COUNT = 10
+from trinity.nodes.beacon.sync import RangeSync
 
 
 def _mk_clock(
@@ -92,14 +90,6 @@ class SyncRequest:
     start_slot: Slot
     count: int
 
-    def get_batches(self, max_size: int) -> Iterable["SyncRequest"]:
-        last_slot = self.start_slot + self.count
-        batch_offsets = range(self.start_slot, self.start_slot + self.count, max_size)
-        for offset in batch_offsets:
-            remainder = last_slot - offset
-            batch_size = max_size if remainder > max_size else remainder
-            yield self.__class__(self.peer_id, Slot(offset), batch_size)
-
 
 class BeaconNode:
     logger = logging.getLogger("trinity.nodes.beacon.full.BeaconNode")
@@ -169,6 +159,9 @@ class BeaconNode:
         self._sync_notifier, self._sync_requests = trio.open_memory_channel[
             SyncRequest
         ](0)
+        # the status of the peers ahead of us, any of which can serve a sync
+        self._sync_peers: Dict[PeerID, Status] = {}
+        self._range_sync: Optional[RangeSync] = None
         self._syncer = _mk_syncer()
 
         api_context = Context(
@@ -440,11 +433,21 @@ class BeaconNode:
                 if isinstance(update, Status):
                     request = self._determine_sync_request(peer_id, update)
                     if request:
-                        await self._sync_notifier.send(request)
+                        self._sync_peers[peer_id] = update
+                        if self._range_sync is not None:
+                            # join the sync in progress
+                            self._range_sync.add_peer(peer_id, update.head_slot)
+                        else:
+                            await self._sync_notifier.send(request)
+                    else:
+                        self._sync_peers.pop(peer_id, None)
                 elif isinstance(update, GoodbyeReason):
                     self.logger.debug(
                         "recv'd goodbye from %s with reason: %s", peer_id, update
                     )
+                    self._sync_peers.pop(peer_id, None)
+                    if self._range_sync is not None:
+                        self._range_sync.remove_peer(peer_id)
                     await self._host.drop_peer(peer_id)
                 elif isinstance(update, MetaDataSeqNumber):
                     # TODO: track peers and their metadata
@@ -452,35 +455,53 @@ class BeaconNode:
                         "recv'd ping from %s with seq number: %s", peer_id, update
                     )
 
-    async def _sync_batch(
-        self, batch: SyncRequest, start_time: float, start_slot: Slot
-    ) -> bool:
+    def _determine_next_sync_request(self) -> Optional[SyncRequest]:
+        """
+        Once a sync is done, keep syncing from our head if a peer is still ahead of it.
+        """
+        if not self._sync_peers:
+            return None
+        peer_id, status = max(
+            self._sync_peers.items(), key=lambda item: item[1].head_slot
+        )
+        head = self._chain.get_canonical_head()
+        if head.slot < status.head_slot:
+            return SyncRequest(
+                peer_id, Slot(head.slot + 1), status.head_slot - head.slot
+            )
+        else:
+            return None
+
+    async def _sync(self, request: SyncRequest) -> bool:
+        range_sync = RangeSync(
+            self._host.get_blocks_by_range,
+            self.on_block,
+            request.start_slot,
+            request.count,
+        )
+        for peer_id, status in self._sync_peers.items():
+            range_sync.add_peer(peer_id, status.head_slot)
+
+        self.logger.info(
+            "starting sync of %d slots from slot %d with %d peers",
+            request.count,
+            request.start_slot,
+            len(self._sync_peers),
+        )
+        self._range_sync = range_sync
         try:
-            count = 0
-            async for block in self._host.get_blocks_by_range(
-                batch.peer_id, batch.start_slot, batch.count
-            ):
-                count += 1
-                imported = self.on_block(block)
-                if not imported:
-                    self.logger.warning(
-                        "an issue with sync of this block %s",
-                        humanize_hash(block.hash_tree_root),
-                    )
-                    return False
-                if count % 8 == 0:
-                    now = time.time()
-                    slots = block.slot - start_slot
-                    slots_per_second = slots / (now - start_time)
-                    self.logger.info(
-                        "synced to slot %d, syncing at [ %2f slots/sec ]",
-                        block.slot,
-                        slots_per_second,
-                    )
-        except Exception as e:
-            self.logger.exception(e)
-            return False
-        return True
+            success = await range_sync.run()
+        finally:
+            self._range_sync = None
+
+        for peer_id, score in range_sync.peer_scores.items():
+            self.logger.debug(
+                "peer %s served %d blocks during sync with %d failures",
+                peer_id,
+                score.blocks,
+                score.failures,
+            )
+        return success
 
     async def _manage_sync_requests(
         self, task_status: TaskStatus[None] = trio.TASK_STATUS_IGNORED
@@ -488,22 +509,16 @@ class BeaconNode:
         task_status.started()
         async with self._sync_requests:
             async for request in self._sync_requests:
-                start_time = time.time()
-                start_slot = request.start_slot
-                self.logger.info(
-                    "starting sync of %d slots at %s", request.count, time.ctime()
-                )
-
-                # NOTE: seeing more robust operation with lower batch size...
-                for batch in request.get_batches(128):
-                    success = await self._sync_batch(batch, start_time, start_slot)
-                    for _ in range(SYNC_REATTEMPT_COUNT):
-                        if not success:
-                            success = await self._sync_batch(
-                                batch, start_time, start_slot
-                            )
-                        else:
-                            break
+                next_request: Optional[SyncRequest] = request
+                while next_request is not None:
+                    if not await self._sync(next_request):
+                        self.logger.warning(
+                            "sync of %d slots from slot %d did not complete",
+                            next_request.count,
+                            next_request.start_slot,
+                        )
+                        break
+                    next_request = self._determine_next_sync_request()
 
     async def run(
         self, task_status: TaskStatus[None] = trio.TASK_STATUS_IGNORED
@@ -0,0 +1,393 @@
+from dataclasses import dataclass, field
+import logging
+from typing import (
+    AsyncIterable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from libp2p.peer.id import ID as PeerID
+import trio
+
+from eth2.beacon.types.blocks import SignedBeaconBlock
+from eth2.beacon.typing import Slot
+from trinity.metrics.registry import metrics
+
+# NOTE: seeing more robust operation with lower batch size...
+SYNC_BATCH_SIZE = 128
+# How many batches may be downloaded ahead of the batch being imported.
+SYNC_MAX_BUFFERED_BATCHES = 8
+# Seconds a peer has to serve a batch before it is given to another peer.
+SYNC_BATCH_TIMEOUT = 30
+# Seconds the import waits for a batch before also asking an idle peer for it.
+SYNC_SLOW_BATCH_DELAY = 10
+SYNC_MAX_BATCH_ATTEMPTS = 10
+SYNC_MAX_PEER_FAILURES = 3
+# Weight of the latest batch in the throughput of a peer.
+THROUGHPUT_SMOOTHING = 0.3
+
+BlocksByRangeProvider = Callable[[PeerID, Slot, int], AsyncIterable[SignedBeaconBlock]]
+BlockImporter = Callable[[SignedBeaconBlock], bool]
+
+
+@dataclass
+class Batch:
+    index: int
+    start_slot: Slot
+    count: int
+    attempts: int = 0
+    # peers currently downloading the batch
+    peers: Set[PeerID] = field(default_factory=set)
+    failed_peers: Set[PeerID] = field(default_factory=set)
+
+    @property
+    def end_slot(self) -> Slot:
+        return Slot(self.start_slot + self.count)
+
+
+@dataclass
+class PeerScore:
+    head_slot: Slot
+    # exponential moving average of the slots per second served by the peer
+    throughput: Optional[float] = None
+    blocks: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+
+    def record_success(self, slot_count: int, blocks: int, duration: float) -> None:
+        throughput = slot_count / max(duration, 1e-3)
+        if self.throughput is None:
+            self.throughput = throughput
+        else:
+            self.throughput += THROUGHPUT_SMOOTHING * (throughput - self.throughput)
+        self.blocks += blocks
+        self.consecutive_failures = 0
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self.consecutive_failures += 1
+
+
+def _mk_batches(start_slot: Slot, count: int, batch_size: int) -> Tuple[Batch, ...]:
+    last_slot = start_slot + count
+    return tuple(
+        Batch(index, Slot(offset), min(batch_size, last_slot - offset))
+        for index, offset in enumerate(range(start_slot, last_slot, batch_size))
+    )
+
+
+class RangeSync:
+    """
+    Sync the blocks in ``count`` slots from ``start_slot`` with every peer given by
+    ``add_peer``, which may also be called while the sync runs.
+
+    The range is split in batches of ``batch_size`` slots. Every peer downloads the
+    lowest pending batch it can serve as soon as it is done with the previous one, so
+    faster peers serve more batches. A batch that fails, times out or doesn't import is
+    given to another peer, and a batch the import has been waiting on for too long is
+    also given to an idle peer, keeping whichever copy arrives first.
+
+    Downloaded batches are imported in order by a single task, and downloads stay within
+    ``max_buffered_batches`` of the batch being imported, which bounds the memory used
+    by batches waiting for the import.
+    """
+
+    logger = logging.getLogger("trinity.nodes.beacon.sync.RangeSync")
+
+    def __init__(
+        self,
+        get_blocks_by_range: BlocksByRangeProvider,
+        import_block: BlockImporter,
+        start_slot: Slot,
+        count: int,
+        batch_size: int = SYNC_BATCH_SIZE,
+        max_buffered_batches: int = SYNC_MAX_BUFFERED_BATCHES,
+        batch_timeout: float = SYNC_BATCH_TIMEOUT,
+        slow_batch_delay: float = SYNC_SLOW_BATCH_DELAY,
+        max_batch_attempts: int = SYNC_MAX_BATCH_ATTEMPTS,
+    ) -> None:
+        self._get_blocks_by_range = get_blocks_by_range
+        self._import_block = import_block
+        self._start_slot = start_slot
+        self._max_buffered_batches = max_buffered_batches
+        self._batch_timeout = batch_timeout
+        self._slow_batch_delay = slow_batch_delay
+        self._max_batch_attempts = max_batch_attempts
+
+        self._batches = _mk_batches(start_slot, count, batch_size)
+        self._pending: Set[int] = set(range(len(self._batches)))
+        self._downloaded: Dict[int, Tuple[PeerID, Sequence[SignedBeaconBlock]]] = {}
+        self._next_index = 0
+
+        self._peers: Dict[PeerID, PeerScore] = {}
+        self._peer_scopes: Dict[PeerID, trio.CancelScope] = {}
+        self._nursery: Optional[trio.Nursery] = None
+        self._changed = trio.Event()
+
+    @property
+    def peer_scores(self) -> Dict[PeerID, PeerScore]:
+        return self._peers
+
+    @property
+    def buffered_batch_count(self) -> int:
+        return len(self._downloaded)
+
+    def add_peer(self, peer_id: PeerID, head_slot: Slot) -> None:
+        if peer_id in self._peers:
+            self._peers[peer_id].head_slot = head_slot
+        else:
+            self._peers[peer_id] = PeerScore(head_slot)
+            if self._nursery is not None:
+                self._nursery.start_soon(self._download_batches, peer_id)
+        self._notify()
+
+    def remove_peer(self, peer_id: PeerID) -> None:
+        if self._peers.pop(peer_id, None) is None:
+            return
+        scope = self._peer_scopes.pop(peer_id, None)
+        if scope is not None:
+            scope.cancel()
+        for batch in self._batches[self._next_index:]:
+            if peer_id in batch.peers:
+                batch.peers.discard(peer_id)
+                self._release(batch)
+        self._notify()
+
+    async def run(self) -> bool:
+        """
+        Return whether every batch of the range was imported.
+        """
+        async with trio.open_nursery() as nursery:
+            self._nursery = nursery
+            for peer_id in tuple(self._peers):
+                nursery.start_soon(self._download_batches, peer_id)
+            try:
+                return await self._import_batches()
+            finally:
+                self._nursery = None
+                nursery.cancel_scope.cancel()
+
+    def _notify(self) -> None:
+        self._changed.set()
+        self._changed = trio.Event()
+
+    async def _wait_for_change(self) -> None:
+        await self._changed.wait()
+
+    def _release(self, batch: Batch) -> None:
+        """
+        Make ``batch`` available to the peers again, unless it is no longer needed or
+        another peer is still downloading it.
+        """
+        if (
+            batch.index >= self._next_index
+            and batch.index not in self._downloaded
+            and not batch.peers
+        ):
+            self._pending.add(batch.index)
+
+    def _has_other_candidate(self, batch: Batch, peer_id: PeerID) -> bool:
+        return any(
+            other != peer_id
+            and other not in batch.failed_peers
+            and other not in batch.peers
+            and score.head_slot >= batch.start_slot
+            for other, score in self._peers.items()
+        )
+
+    def _find_batch(self, peer_id: PeerID) -> Optional[Batch]:
+        head_slot = self._peers[peer_id].head_slot
+        window_end = min(
+            self._next_index + self._max_buffered_batches, len(self._batches)
+        )
+        for index in range(self._next_index, window_end):
+            if index not in self._pending:
+                continue
+            batch = self._batches[index]
+            if batch.start_slot > head_slot:
+                return None
+            if peer_id in batch.peers:
+                continue
+            if peer_id in batch.failed_peers and self._has_other_candidate(
+                batch, peer_id
+            ):
+                continue
+            return batch
+        return None
+
+    async def _claim_batch(self, peer_id: PeerID) -> Optional[Batch]:
+        while peer_id in self._peers and self._next_index < len(self._batches):
+            batch = self._find_batch(peer_id)
+            if batch is not None:
+                self._pending.discard(batch.index)
+                batch.peers.add(peer_id)
+                return batch
+            await self._wait_for_change()
+        return None
+
+    async def _download_batches(self, peer_id: PeerID) -> None:
+        with trio.CancelScope() as scope:
+            self._peer_scopes[peer_id] = scope
+            while True:
+                batch = await self._claim_batch(peer_id)
+                if batch is None:
+                    break
+                blocks = await self._download_batch(peer_id, batch)
+                batch.peers.discard(peer_id)
+                if blocks is None:
+                    self._on_batch_failure(batch, peer_id)
+                else:
+                    self._on_batch_downloaded(batch, peer_id, blocks)
+        if self._peer_scopes.get(peer_id) is scope:
+            del self._peer_scopes[peer_id]
+
+    def _get_timeout(self, peer_id: PeerID, batch: Batch) -> float:
+        throughput = self._peers[peer_id].throughput
+        if throughput is None:
+            return self._batch_timeout
+        # a peer known to be fast has less time before the batch goes to another peer
+        expected_duration = batch.count / throughput
+        return min(self._batch_timeout, max(4 * expected_duration, 1.0))
+
+    async def _download_batch(
+        self, peer_id: PeerID, batch: Batch
+    ) -> Optional[Sequence[SignedBeaconBlock]]:
+        blocks: List[SignedBeaconBlock] = []
+        start_time = trio.current_time()
+        with trio.move_on_after(self._get_timeout(peer_id, batch)) as scope:
+            try:
+                async for block in self._get_blocks_by_range(
+                    peer_id, batch.start_slot, batch.count
+                ):
+                    blocks.append(block)
+            except Exception as e:
+                self.logger.debug(
+                    "failed to get batch at slot %d from %s: %s",
+                    batch.start_slot,
+                    peer_id,
+                    e,
+                )
+                return None
+        if scope.cancelled_caught:
+            self.logger.debug(
+                "timed out getting batch at slot %d from %s", batch.start_slot, peer_id
+            )
+            return None
+
+        last_slot = batch.start_slot - 1
+        for block in blocks:
+            if not last_slot < block.slot < batch.end_slot:
+                self.logger.debug(
+                    "got block at unexpected slot %d from %s", block.slot, peer_id
+                )
+                return None
+            last_slot = block.slot
+
+        score = self._peers.get(peer_id)
+        if score is not None:
+            score.record_success(
+                batch.count, len(blocks), trio.current_time() - start_time
+            )
+        metrics.beacon_sync_downloaded_blocks.inc(len(blocks))
+        return blocks
+
+    def _on_batch_downloaded(
+        self, batch: Batch, peer_id: PeerID, blocks: Sequence[SignedBeaconBlock]
+    ) -> None:
+        if batch.index >= self._next_index and batch.index not in self._downloaded:
+            self._downloaded[batch.index] = (peer_id, blocks)
+            self._pending.discard(batch.index)
+            self._notify()
+
+    def _on_batch_failure(self, batch: Batch, peer_id: PeerID) -> None:
+        batch.attempts += 1
+        batch.failed_peers.add(peer_id)
+        self._release(batch)
+
+        score = self._peers.get(peer_id)
+        if score is not None:
+            score.record_failure()
+            if score.consecutive_failures >= SYNC_MAX_PEER_FAILURES:
+                self.logger.info(
+                    "dropping %s from sync after %d failed batches",
+                    peer_id,
+                    score.consecutive_failures,
+                )
+                self.remove_peer(peer_id)
+        self._notify()
+
+    def _is_stalled(self, batch: Batch) -> bool:
+        if batch.attempts >= self._max_batch_attempts:
+            self.logger.warning(
+                "giving up sync of batch at slot %d after %d attempts",
+                batch.start_slot,
+                batch.attempts,
+            )
+            return True
+        if not batch.peers and not any(
+            score.head_slot >= batch.start_slot for score in self._peers.values()
+        ):
+            self.logger.warning(
+                "no peer left to sync batch at slot %d", batch.start_slot
+            )
+            return True
+        return False
+
+    async def _wait_for_batch(self, batch: Batch) -> bool:
+        while batch.index not in self._downloaded:
+            if self._is_stalled(batch):
+                return False
+            with trio.move_on_after(self._slow_batch_delay):
+                await self._wait_for_change()
+                continue
+            if batch.peers and batch.index not in self._pending:
+                self.logger.debug(
+                    "batch at slot %d is slow, asking another peer", batch.start_slot
+                )
+                self._pending.add(batch.index)
+                self._notify()
+        return True
+
+    async def _import_blocks(self, blocks: Sequence[SignedBeaconBlock]) -> bool:
+        for block in blocks:
+            if not self._import_block(block):
+                return False
+            # let the downloads make progress between blocks
+            await trio.sleep(0)
+        return True
+
+    async def _import_batches(self) -> bool:
+        start_time = trio.current_time()
+        while self._next_index < len(self._batches):
+            batch = self._batches[self._next_index]
+            if not await self._wait_for_batch(batch):
+                return False
+
+            peer_id, blocks = self._downloaded.pop(batch.index)
+            if not await self._import_blocks(blocks):
+                self.logger.warning(
+                    "failed to import batch at slot %d from %s",
+                    batch.start_slot,
+                    peer_id,
+                )
+                self._on_batch_failure(batch, peer_id)
+                continue
+
+            self._next_index += 1
+            self._notify()
+
+            slots = batch.end_slot - self._start_slot
+            slots_per_second = slots / max(trio.current_time() - start_time, 1e-3)
+            metrics.beacon_sync_slots_per_second.set(slots_per_second)
+            self.logger.info(
+                "synced to slot %d, syncing at [ %2f slots/sec ] from %d peers",
+                batch.end_slot - 1,
+                slots_per_second,
+                len(self._peers),
+            )
+        return True
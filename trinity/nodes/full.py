@@ -57,6 +57,7 @@ class FullNode(Node[ETHPeer]):
                 max_peers=self._max_peers,
                 event_bus=self.event_bus,
                 metrics_registry=self.metrics_service.registry,
+                normalization_pool=self._normalization_pool,
             )
         return self._p2p_server
 
@@ -24,6 +24,12 @@ TTFB_TIMEOUT = 5  # seconds
 RESP_TIMEOUT = 10  # seconds
 # The maximum number of slots during which an attestation can be propagated.
 ATTESTATION_PROPAGATION_SLOT_RANGE = 32
+# The maximum number of gossip signatures verified in one batch.
+SIGNATURE_VERIFICATION_BATCH_SIZE = 64
+# How long to wait for more gossip signatures before verifying a partial batch.
+SIGNATURE_VERIFICATION_BATCH_WINDOW = 0.05  # seconds
+# The maximum number of batches of gossip signatures being verified at the same time.
+SIGNATURE_VERIFICATION_MAX_CONCURRENT_BATCHES = 4
 
 #
 # Gossip domain
@@ -139,6 +139,7 @@ from .messages import (
     BeaconBlocksByRangeRequest,
     BeaconBlocksByRootRequest,
 )
+from .signature_verifier import SignatureVerifier
 from .topic_validators import (
     get_beacon_aggregate_and_proof_validator,
     get_beacon_attestation_validator,
@@ -152,8 +153,8 @@ from .utils import (
     peer_is_ahead,
     validate_peer_status,
     get_my_status,
-    get_requested_beacon_blocks,
-    get_beacon_blocks_by_root,
+    get_requested_beacon_blocks_ssz,
+    get_beacon_blocks_ssz_by_root,
 )
 
 from trinity.metrics.events import (
@@ -389,6 +390,8 @@ class Node(BaseService):
 
         self.handshaked_peers = PeerPool()
 
+        self.signature_verifier = SignatureVerifier(token=self.cancel_token)
+
         self.run_task(self.start())
 
     @property
@@ -398,6 +401,7 @@ class Node(BaseService):
     async def _run(self) -> None:
         self.logger.info("libp2p node %s is up", self.listen_maddr)
         self.run_daemon_task(self.update_status())
+        self.run_daemon(self.signature_verifier)
 
         # Metrics and HTTP APIs
         self.run_daemon_task(self.handle_libp2p_peers_requests())
@@ -440,21 +444,25 @@ class Node(BaseService):
         )
         self.pubsub.set_topic_validator(
             PUBSUB_TOPIC_BEACON_ATTESTATION,
-            get_beacon_attestation_validator(self.chain),
-            False,
+            get_beacon_attestation_validator(self.chain, self.signature_verifier),
+            True,
         )
         # Attestation subnets
         for subnet_id in self.subnets:
             self.pubsub.set_topic_validator(
                 PUBSUB_TOPIC_COMMITTEE_BEACON_ATTESTATION.substitute(subnet_id=str(subnet_id)),
-                get_committee_index_beacon_attestation_validator(self.chain, subnet_id),
-                False,
+                get_committee_index_beacon_attestation_validator(
+                    self.chain,
+                    subnet_id,
+                    self.signature_verifier,
+                ),
+                True,
             )
 
         self.pubsub.set_topic_validator(
             PUBSUB_TOPIC_BEACON_AGGREGATE_AND_PROOF,
-            get_beacon_aggregate_and_proof_validator(self.chain),
-            False,
+            get_beacon_aggregate_and_proof_validator(self.chain, self.signature_verifier),
+            True,
         )
 
     async def dial_peer_maddr(self, maddr: Multiaddr, peer_id: ID) -> None:
@@ -740,12 +748,12 @@ class Node(BaseService):
 
             request = await interaction.read_request(BeaconBlocksByRangeRequest)
             try:
-                blocks = get_requested_beacon_blocks(self.chain, request)
+                blocks_ssz = get_requested_beacon_blocks_ssz(self.chain, request)
             except InvalidRequest as error:
                 error_message = str(error)[:128]
                 await interaction.write_error_response(error_message, ResponseCode.INVALID_REQUEST)
             else:
-                await interaction.write_chunk_response(blocks)
+                await interaction.write_chunk_response_ssz(blocks_ssz)
 
     async def request_beacon_blocks_by_range(
         self,
@@ -781,9 +789,9 @@ class Node(BaseService):
             peer_id = interaction.peer_id
             self._check_peer_handshaked(peer_id)
             request = await interaction.read_request(BeaconBlocksByRootRequest)
-            blocks = get_beacon_blocks_by_root(self.chain, request)
+            blocks_ssz = get_beacon_blocks_ssz_by_root(self.chain, request)
 
-            await interaction.write_chunk_response(blocks)
+            await interaction.write_chunk_response_ssz(blocks_ssz)
 
     async def request_beacon_blocks_by_root(
             self,
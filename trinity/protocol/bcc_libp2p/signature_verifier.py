@@ -0,0 +1,164 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor
+import time
+from typing import (
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from cancel_token import CancelToken, OperationCancelled
+
+from eth2.beacon.state_machines.forks.altona.eth2fastspec import (
+    SignatureSet,
+    bls_VerifyMultipleSignatureSets,
+    bls_VerifySignatureSet,
+)
+
+from p2p.service import BaseService
+
+from trinity.metrics.registry import metrics
+
+from .configs import (
+    SIGNATURE_VERIFICATION_BATCH_SIZE,
+    SIGNATURE_VERIFICATION_BATCH_WINDOW,
+    SIGNATURE_VERIFICATION_MAX_CONCURRENT_BATCHES,
+)
+
+
+def verify_signature_sets(signature_sets: Sequence[SignatureSet]) -> Tuple[bool, ...]:
+    """
+    Return the verdict of each of ``signature_sets``.
+
+    The whole batch is verified at once, and only if that fails are the sets verified one
+    by one to single out the invalid ones.
+    """
+    if bls_VerifyMultipleSignatureSets(signature_sets):
+        return (True,) * len(signature_sets)
+    return tuple(
+        bls_VerifySignatureSet(signature_set) for signature_set in signature_sets
+    )
+
+
+PendingSignature = Tuple[SignatureSet, 'asyncio.Future[bool]', float]
+
+
+class SignatureVerifier(BaseService):
+    """
+    Verify the signatures of gossip messages off the event loop.
+
+    Signatures submitted with :meth:`verify` are collected until either ``batch_size`` of
+    them are pending or ``batch_window`` seconds have passed, and are then verified as one
+    batch in ``executor`` (a process pool by default). At most ``max_concurrent_batches``
+    batches are verified at a time, the signatures submitted meanwhile wait in larger
+    batches.
+    """
+    def __init__(
+            self,
+            executor: Executor = None,
+            batch_size: int = SIGNATURE_VERIFICATION_BATCH_SIZE,
+            batch_window: float = SIGNATURE_VERIFICATION_BATCH_WINDOW,
+            max_concurrent_batches: int = SIGNATURE_VERIFICATION_MAX_CONCURRENT_BATCHES,
+            token: CancelToken = None) -> None:
+        super().__init__(token)
+        if executor is None:
+            self._executor: Executor = ProcessPoolExecutor()
+            self._owns_executor = True
+        else:
+            self._executor = executor
+            self._owns_executor = False
+        self._batch_size = batch_size
+        self._batch_window = batch_window
+        self._batch_slots = asyncio.Semaphore(max_concurrent_batches)
+
+        self._pending: List[PendingSignature] = []
+        self._has_pending = asyncio.Event()
+        self._is_batch_full = asyncio.Event()
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._pending)
+
+    async def verify(self, *signature_sets: SignatureSet) -> bool:
+        """
+        Return ``True`` if all of ``signature_sets`` are valid.
+        """
+        loop = self.get_event_loop()
+        submitted_at = time.monotonic()
+        futures = []
+        for signature_set in signature_sets:
+            future: 'asyncio.Future[bool]' = loop.create_future()
+            self._pending.append((signature_set, future, submitted_at))
+            futures.append(future)
+
+        self._has_pending.set()
+        if len(self._pending) >= self._batch_size:
+            self._is_batch_full.set()
+        metrics.gossip_signature_queue_depth.set(len(self._pending))
+
+        verdicts = await self.wait(asyncio.gather(*futures))
+        return all(verdicts)
+
+    async def _run(self) -> None:
+        while self.is_operational:
+            await self.wait(self._has_pending.wait())
+            if not self._is_batch_full.is_set():
+                # Give other signatures a chance to join the batch.
+                try:
+                    await self.wait(self._is_batch_full.wait(), timeout=self._batch_window)
+                except asyncio.TimeoutError:
+                    pass
+
+            await self.wait(self._batch_slots.acquire())
+            batch = self._pending[:self._batch_size]
+            del self._pending[:self._batch_size]
+            if len(self._pending) < self._batch_size:
+                self._is_batch_full.clear()
+            if not self._pending:
+                self._has_pending.clear()
+            metrics.gossip_signature_queue_depth.set(len(self._pending))
+
+            self.run_task(self._verify_batch(batch))
+
+    async def _verify_batch(self, batch: Sequence[PendingSignature]) -> None:
+        metrics.gossip_signature_batch_size.observe(len(batch))
+        signature_sets = tuple(signature_set for signature_set, _, _ in batch)
+        verdicts: Optional[Tuple[bool, ...]] = None
+        try:
+            verdicts = await self._run_in_executor(
+                self._executor,
+                verify_signature_sets,
+                signature_sets,
+            )
+        except OperationCancelled:
+            raise
+        except Exception as err:
+            self.logger.exception("Failed to verify a batch of %d signatures", len(batch))
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(err)
+        finally:
+            self._batch_slots.release()
+            if verdicts is None:
+                # The process pool died and we are shutting down, or we got cancelled.
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.cancel()
+
+        if verdicts is None:
+            return
+
+        verified_at = time.monotonic()
+        for (_, future, submitted_at), verdict in zip(batch, verdicts):
+            metrics.gossip_signature_latency.observe(verified_at - submitted_at)
+            if not future.done():
+                future.set_result(verdict)
+
+    async def _cleanup(self) -> None:
+        for _, future, _ in self._pending:
+            future.cancel()
+        self._pending.clear()
+        metrics.gossip_signature_queue_depth.set(0)
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
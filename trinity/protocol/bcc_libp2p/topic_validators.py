@@ -1,5 +1,6 @@
 import logging
 from typing import (
+    Awaitable,
     Callable,
 )
 
@@ -12,19 +13,23 @@ from eth_utils import (
 
 from eth.exceptions import BlockNotFound
 
+from eth2.beacon.epoch_processing_helpers import get_indexed_attestation
+from eth2.beacon.helpers import compute_signing_root, get_domain
+from eth2.beacon.signature_domain import SignatureDomain
 from eth2.beacon.types.aggregate_and_proof import AggregateAndProof
 from eth2.beacon.types.attestations import Attestation
 from eth2.beacon.chains.base import BaseBeaconChain
 from eth2.beacon.types.blocks import BaseSignedBeaconBlock, SignedBeaconBlock
 from eth2.beacon.types.states import BeaconState
 from eth2.beacon.state_machines.base import BaseBeaconStateMachine
+from eth2.beacon.state_machines.forks.altona.eth2fastspec import SignatureSet
 from eth2.beacon.state_machines.forks.serenity.block_validation import (
     validate_proposer_signature,
 )
 from eth2.beacon.tools.builder.aggregator import (
+    get_slot_signing_root,
     validate_aggregate_and_proof,
     validate_attestation_propagation_slot_range,
-    validate_attestation_signature,
 )
 from eth2.beacon.typing import SubnetId
 from eth2.configs import Eth2Config
@@ -38,6 +43,7 @@ from trinity.protocol.bcc_libp2p.configs import (
     ATTESTATION_SUBNET_COUNT,
 )
 from trinity.protocol.bcc_libp2p.exceptions import InvalidGossipMessage
+from trinity.protocol.bcc_libp2p.signature_verifier import SignatureVerifier
 
 
 logger = logging.getLogger('trinity.components.eth2.beacon.TopicValidator')
@@ -69,9 +75,11 @@ def get_beacon_block_validator(chain: BaseBeaconChain) -> Callable[..., bool]:
     return beacon_block_validator
 
 
-def get_beacon_attestation_validator(chain: BaseBeaconChain) -> Callable[..., bool]:
+def get_beacon_attestation_validator(
+    chain: BaseBeaconChain, signature_verifier: SignatureVerifier
+) -> Callable[..., Awaitable[bool]]:
     # TODO:  The beacon_attestation topic is only for interop and will be removed prior to mainnet.
-    def beacon_attestation_validator(msg_forwarder: ID, msg: rpc_pb2.Message) -> bool:
+    async def beacon_attestation_validator(msg_forwarder: ID, msg: rpc_pb2.Message) -> bool:
         try:
             attestation = ssz.decode(msg.data, sedes=Attestation)
         except (TypeError, ssz.DeserializationError) as error:
@@ -88,10 +96,9 @@ def get_beacon_attestation_validator(chain: BaseBeaconChain) -> Callable[..., bo
 
         try:
             validate_voting_beacon_block(chain, attestation)
-            validate_attestation_signature(
-                state,
-                attestation,
-                state_machine.config,
+            await run_validate_signatures(
+                signature_verifier,
+                get_attestation_signature_set(state, attestation, state_machine.config),
             )
         except InvalidGossipMessage as error:
             logger.debug("%s", str(error))
@@ -103,9 +110,9 @@ def get_beacon_attestation_validator(chain: BaseBeaconChain) -> Callable[..., bo
 
 
 def get_committee_index_beacon_attestation_validator(
-    chain: BaseBeaconChain, subnet_id: SubnetId
-) -> Callable[..., bool]:
-    def committee_index_beacon_attestation_validator(
+    chain: BaseBeaconChain, subnet_id: SubnetId, signature_verifier: SignatureVerifier
+) -> Callable[..., Awaitable[bool]]:
+    async def committee_index_beacon_attestation_validator(
         msg_forwarder: ID, msg: rpc_pb2.Message
     ) -> bool:
         try:
@@ -131,10 +138,9 @@ def get_committee_index_beacon_attestation_validator(
                 attestation,
                 ATTESTATION_PROPAGATION_SLOT_RANGE,
             )
-            validate_attestation_signature(
-                state,
-                attestation,
-                state_machine.config,
+            await run_validate_signatures(
+                signature_verifier,
+                get_attestation_signature_set(state, attestation, state_machine.config),
             )
         except InvalidGossipMessage as error:
             logger.debug("%s", str(error))
@@ -145,8 +151,12 @@ def get_committee_index_beacon_attestation_validator(
     return committee_index_beacon_attestation_validator
 
 
-def get_beacon_aggregate_and_proof_validator(chain: BaseBeaconChain) -> Callable[..., bool]:
-    def beacon_aggregate_and_proof_validator(msg_forwarder: ID, msg: rpc_pb2.Message) -> bool:
+def get_beacon_aggregate_and_proof_validator(
+    chain: BaseBeaconChain, signature_verifier: SignatureVerifier
+) -> Callable[..., Awaitable[bool]]:
+    async def beacon_aggregate_and_proof_validator(
+        msg_forwarder: ID, msg: rpc_pb2.Message
+    ) -> bool:
         try:
             aggregate_and_proof = ssz.decode(msg.data, sedes=AggregateAndProof)
         except (TypeError, ssz.DeserializationError) as error:
@@ -169,6 +179,13 @@ def get_beacon_aggregate_and_proof_validator(chain: BaseBeaconChain) -> Callable
                 aggregate_and_proof,
                 state_machine.config,
             )
+            await run_validate_signatures(
+                signature_verifier,
+                get_aggregator_proof_signature_set(
+                    state, aggregate_and_proof, state_machine.config
+                ),
+                get_attestation_signature_set(state, attestation, state_machine.config),
+            )
         except InvalidGossipMessage as error:
             logger.debug("%s", str(error))
             return False
@@ -247,9 +264,53 @@ def run_validate_aggregate_and_proof(
             aggregate_and_proof,
             ATTESTATION_PROPAGATION_SLOT_RANGE,
             config,
+            validate_signatures=False,
         )
     except ValidationError as error:
         raise InvalidGossipMessage(
             f"Failed to validate aggregate_and_proof={aggregate_and_proof}",
             error,
         )
+
+
+async def run_validate_signatures(
+    signature_verifier: SignatureVerifier, *signature_sets: SignatureSet
+) -> None:
+    if not await signature_verifier.verify(*signature_sets):
+        raise InvalidGossipMessage(f"Invalid signature in {signature_sets}")
+
+
+def get_attestation_signature_set(
+    state: BeaconState, attestation: Attestation, config: Eth2Config
+) -> SignatureSet:
+    try:
+        indexed_attestation = get_indexed_attestation(state, attestation, config)
+    except ValidationError as error:
+        raise InvalidGossipMessage(
+            f"Failed to get the attesting indices of attestation={attestation}",
+            error,
+        )
+
+    pubkeys = tuple(
+        state.validators[index].pubkey for index in indexed_attestation.attesting_indices
+    )
+    domain = get_domain(
+        state,
+        SignatureDomain.DOMAIN_BEACON_ATTESTER,
+        config.SLOTS_PER_EPOCH,
+        attestation.data.target.epoch,
+    )
+    signing_root = compute_signing_root(attestation.data, domain)
+    return SignatureSet(pubkeys, signing_root, attestation.signature)
+
+
+def get_aggregator_proof_signature_set(
+    state: BeaconState, aggregate_and_proof: AggregateAndProof, config: Eth2Config
+) -> SignatureSet:
+    """
+    Return the signature set that :func:`validate_aggregator_proof` verifies.
+    """
+    slot = aggregate_and_proof.aggregate.data.slot
+    pubkey = state.validators[aggregate_and_proof.aggregator_index].pubkey
+    signing_root = get_slot_signing_root(state, slot, config)
+    return SignatureSet((pubkey,), signing_root, aggregate_and_proof.selection_proof)
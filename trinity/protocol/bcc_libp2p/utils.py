@@ -20,6 +20,10 @@ from eth2.beacon.chains.base import (
 from eth2.beacon.constants import (
     ZERO_ROOT,
 )
+from eth2.beacon.db.chain import (
+    BaseBeaconChainDB,
+    get_slot_and_parent_root_from_ssz,
+)
 from eth2.beacon.helpers import (
     compute_start_slot_at_epoch,
 )
@@ -27,6 +31,7 @@ from eth2.beacon.types.blocks import (
     BaseBeaconBlock,
 )
 from eth2.beacon.typing import (
+    Root,
     Slot,
 )
 from eth.exceptions import (
@@ -94,6 +99,8 @@ MsgType = TypeVar("MsgType", bound=HashableContainer)
 
 logger = logging.getLogger('trinity.protocol.bcc_libp2p')
 
+SUCCESS_RESP_CODE_BYTE = ResponseCode.SUCCESS.value.to_bytes(1, "big")
+
 
 def peer_id_from_pubkey(pubkey: datatypes.PublicKey) -> ID:
     algo = multihash.Func.sha2_256
@@ -336,6 +343,107 @@ def get_beacon_blocks_by_root(
             yield block
 
 
+def get_requested_beacon_blocks_ssz(
+    chain: BaseBeaconChain,
+    request: BeaconBlocksByRangeRequest
+) -> Iterable[bytes]:
+    """
+    Like :func:`get_requested_beacon_blocks`, but return the blocks as they are stored,
+    SSZ encoded, so that they can be served without being decoded and encoded again.
+
+    Blocks on our canonical chain are looked up by slot as they are written to the
+    stream. Blocks on a fork are found by reading the parent root of each block from
+    its encoding, from the requested head back to the start slot.
+    """
+    chaindb = chain.chaindb
+    try:
+        head_slot = chaindb.get_slot_by_root(request.head_block_root)
+    except (BlockNotFound, ValidationError) as error:
+        logger.info("Sending empty blocks, reason: %s", error)
+        return tuple()
+
+    # Check if slot of specified head block is greater than specified start slot
+    if head_slot < request.start_slot:
+        raise InvalidRequest(
+            f"head block slot({head_slot}) lower than `start_slot`({request.start_slot})"
+        )
+
+    slot_of_requested_blocks = tuple(
+        slot for slot in (
+            request.start_slot + i * request.step for i in range(request.count)
+        )
+        if slot <= head_slot
+    )
+    if len(slot_of_requested_blocks) == 0:
+        return tuple()
+
+    try:
+        is_canonical = chaindb.get_canonical_block_root(head_slot) == request.head_block_root
+    except BlockNotFound:
+        is_canonical = False
+
+    if is_canonical:
+        return _get_canonical_blocks_ssz(chaindb, slot_of_requested_blocks)
+    else:
+        try:
+            validate_start_slot(chain, request.start_slot)
+        except ValidationError as val_error:
+            raise InvalidRequest(str(val_error))
+        return _get_fork_blocks_ssz(
+            chaindb,
+            request.head_block_root,
+            slot_of_requested_blocks,
+        )
+
+
+def _get_canonical_blocks_ssz(
+    chaindb: BaseBeaconChainDB,
+    slot_of_requested_blocks: Sequence[Slot],
+) -> Iterable[bytes]:
+    for slot in slot_of_requested_blocks:
+        try:
+            yield chaindb.get_canonical_block_ssz_by_slot(slot)
+        except BlockNotFound:
+            pass
+
+
+def _get_fork_blocks_ssz(
+    chaindb: BaseBeaconChainDB,
+    head_block_root: Root,
+    slot_of_requested_blocks: Sequence[Slot],
+) -> Tuple[bytes, ...]:
+    requested_slots = set(slot_of_requested_blocks)
+    start_slot = slot_of_requested_blocks[0]
+    blocks_ssz = []
+    block_root = head_block_root
+    while True:
+        try:
+            block_ssz = chaindb.get_block_ssz_by_root(block_root)
+        except BlockNotFound:
+            # This should not happen as we only persist block if its
+            # ancestors are also in the database.
+            break
+        slot, block_root = get_slot_and_parent_root_from_ssz(block_ssz)
+        if slot in requested_slots:
+            blocks_ssz.append(block_ssz)
+        if slot <= start_slot:
+            break
+    # Blocks are found from the head back, but are served from the earliest slot.
+    return tuple(reversed(blocks_ssz))
+
+
+@to_tuple
+def get_beacon_blocks_ssz_by_root(
+    chain: BaseBeaconChain,
+    request: BeaconBlocksByRootRequest,
+) -> Iterable[bytes]:
+    for block_root in request.block_roots:
+        try:
+            yield chain.chaindb.get_block_ssz_by_root(block_root)
+        except (BlockNotFound, ValidationError):
+            pass
+
+
 # TODO: Refactor: Probably move these [de]serialization functions to `Node` as methods,
 #   expose the hard-coded to parameters, and pass the timeout from the methods?
 
@@ -374,6 +482,13 @@ class Interaction:
         for message in messages:
             await write_resp(self.stream, message, ResponseCode.SUCCESS)
 
+    async def write_chunk_response_ssz(self, messages_ssz: Iterable[bytes]) -> None:
+        count = 0
+        for message_ssz in messages_ssz:
+            await write_resp_ssz(self.stream, message_ssz)
+            count += 1
+        self.debug(f"Respond {count} chunks")
+
     async def write_error_response(self, error_message: str, code: ResponseCode) -> None:
         self.debug(f"Respond {str(code)}  {error_message}")
         await write_resp(self.stream, error_message, code)
@@ -511,6 +626,14 @@ async def write_resp(
     await _write_stream(stream, resp_code_byte + msg_bytes)
 
 
+async def write_resp_ssz(stream: INetStream, msg_ssz: bytes) -> None:
+    """
+    Write an already SSZ encoded response message to the `stream`.
+    `WriteMessageFailure` is raised if fail to write the message.
+    """
+    await _write_stream(stream, SUCCESS_RESP_CODE_BYTE + _serialize_bytes(msg_ssz))
+
+
 async def _write_stream(stream: INetStream, data: bytes) -> None:
     try:
         await stream.write(data)
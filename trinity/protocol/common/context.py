@@ -8,6 +8,7 @@ from eth.abc import (
     VirtualMachineAPI,
 )
 
+from p2p.exchange.abc import NormalizationPoolAPI
 from p2p.peer import BasePeerContext
 
 from trinity.db.eth1.header import BaseAsyncHeaderDB
@@ -21,8 +22,11 @@ class ChainContext(BasePeerContext):
                  client_version_string: str,
                  listen_port: int,
                  p2p_version: int,
+                 normalization_pool: NormalizationPoolAPI = None,
                  ) -> None:
         super().__init__(client_version_string, listen_port, p2p_version)
         self.headerdb = headerdb
         self.network_id = network_id
         self.vm_configuration = vm_configuration
+        # Shared by the exchanges of all peers, to normalize slow responses off the main loop
+        self.normalization_pool = normalization_pool
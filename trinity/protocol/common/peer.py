@@ -146,12 +146,14 @@ class BaseProxyPeer(Service):
 
 class BaseChainPeerReporterRegistry(PeerReporterRegistry[BaseChainPeer]):
     def reset_peer_meters(self, peer_id: int) -> None:
+        super().reset_peer_meters(peer_id)
         head_gauge = self._get_blockheight_gauge(peer_id)
         td_gauge = self._get_td_gauge(peer_id)
         head_gauge.set_value(0)
         td_gauge.set_value(0)
 
     def make_periodic_update(self, peer: BaseChainPeer, peer_id: int) -> None:
+        super().make_periodic_update(peer, peer_id)
         head_gauge = self._get_blockheight_gauge(peer_id)
         td_gauge = self._get_td_gauge(peer_id)
 
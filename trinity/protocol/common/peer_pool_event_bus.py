@@ -76,6 +76,10 @@ class PeerPoolEventServer(Service, PeerSubscriber, Generic[TPeer]):
 
     subscription_msg_types: FrozenSet[Type[CommandAPI[Any]]] = frozenset({})
 
+    # Peer messages are forwarded as they came off the wire and only decoded by the consumers
+    # on the other side of the event bus.
+    decodes_payloads = False
+
     def __init__(self,
                  event_bus: EndpointAPI,
                  peer_pool: BasePeerPool) -> None:
@@ -25,13 +25,15 @@ from lahja import (
 )
 
 from p2p.abc import CommandAPI, SessionAPI
+from p2p.disconnect import DisconnectReason
+from p2p.exceptions import MalformedMessage
 
 from trinity._utils.headers import sequence_builder
 from trinity.db.eth1.header import BaseAsyncHeaderDB
 from trinity.protocol.common.payloads import BlockHeadersQuery
 from trinity._utils.logging import get_logger
 
-from .events import PeerPoolMessageEvent
+from .events import DisconnectPeerEvent, PeerPoolMessageEvent
 
 
 class BaseIsolatedRequestServer(Service):
@@ -71,6 +73,13 @@ class BaseIsolatedRequestServer(Service):
             # catch and re-raise to avoid reporting via the except below and
             # treated as unexpected.
             raise
+        except MalformedMessage as err:
+            # The payloads of forwarded peer messages are only decoded here.
+            self.logger.debug("Disconnecting %s for sending MalformedMessage: %s", session, err)
+            await self.event_bus.broadcast(
+                DisconnectPeerEvent(session, DisconnectReason.BAD_PROTOCOL),
+                self.broadcast_config,
+            )
         except Exception:
             self.logger.exception("Unexpected error when processing msg from %s", session)
 
@@ -14,6 +14,7 @@ from eth.abc import (
 
 from p2p.abc import ConnectionAPI, ProtocolAPI
 from p2p.exchange import ExchangeAPI, ExchangeLogic
+from p2p.exchange.abc import NormalizationPoolAPI
 from p2p.logic import Application, CommandHandler
 from p2p.qualifiers import HasProtocol
 
@@ -36,6 +37,7 @@ from trinity.protocol.eth.commands import (
     GetPooledTransactionsV65,
 )
 from trinity.rlp.block_body import BlockBody
+from trinity.rlp.encoding import encode_raw_list
 
 from .exchanges import (
     GetBlockBodiesV65Exchange,
@@ -122,15 +124,15 @@ class BaseETHAPI(Application):
     get_receipts: GetReceiptsV65Exchange
     get_pooled_transactions: GetPooledTransactionsV65Exchange
 
-    def __init__(self) -> None:
+    def __init__(self, normalization_pool: NormalizationPoolAPI = None) -> None:
         self.head_info = self.head_info_tracker_cls()
         self.add_child_behavior(self.head_info.as_behavior())
 
         # Request/Response API
-        self.get_block_bodies = GetBlockBodiesV65Exchange()
+        self.get_block_bodies = GetBlockBodiesV65Exchange(normalization_pool)
         self.get_block_headers = GetBlockHeadersV65Exchange()
         self.get_node_data = GetNodeDataV65Exchange()
-        self.get_receipts = GetReceiptsV65Exchange()
+        self.get_receipts = GetReceiptsV65Exchange(normalization_pool)
 
         self.add_child_behavior(ExchangeLogic(self.get_block_bodies).as_behavior())
         self.add_child_behavior(ExchangeLogic(self.get_block_headers).as_behavior())
@@ -203,12 +205,22 @@ class BaseETHAPI(Application):
         )
         self.protocol.send(BlockBodiesV65(block_bodies))
 
+    def send_encoded_block_bodies(self, encoded_bodies: Sequence[bytes]) -> None:
+        self.protocol.send(
+            BlockBodiesV65.from_serialized_payload(encode_raw_list(encoded_bodies))
+        )
+
     def send_get_receipts(self, block_hashes: Sequence[Hash32]) -> None:
         self.protocol.send(GetReceiptsV65(tuple(block_hashes)))
 
     def send_receipts(self, receipts: Sequence[Sequence[ReceiptAPI]]) -> None:
         self.protocol.send(ReceiptsV65(tuple(map(tuple, receipts))))
 
+    def send_encoded_receipts(self, encoded_receipts: Sequence[bytes]) -> None:
+        self.protocol.send(
+            ReceiptsV65.from_serialized_payload(encode_raw_list(encoded_receipts))
+        )
+
     def send_transactions(self, transactions: Sequence[SignedTransactionAPI]) -> None:
         self.protocol.send(Transactions(tuple(transactions)))
 
@@ -262,8 +274,8 @@ class ETHV65API(ETHV64API):
     def protocol(self) -> ProtocolAPI:
         return self.connection.get_protocol_by_type(ETHProtocolV65)
 
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(self, normalization_pool: NormalizationPoolAPI = None) -> None:
+        super().__init__(normalization_pool)
 
         # Request/Response API
         self.get_pooled_transactions = GetPooledTransactionsV65Exchange()
@@ -149,7 +149,7 @@ class GetPooledTransactionsV65(BaseCommand[Tuple[Hash32, ...]]):
 class PooledTransactionsV65(BaseCommand[Tuple[SignedTransactionAPI, ...]]):
     protocol_command_id = 10
     serialization_codec: RLPCodec[Tuple[SignedTransactionAPI, ...]] = RLPCodec(
-        sedes=sedes.CountableList(SignedTransactionAPI),
+        sedes=sedes.CountableList(BaseTransactionFields),
     )
 
 
@@ -4,3 +4,15 @@ MAX_STATE_FETCH = 384
 MAX_BODIES_FETCH = 128
 MAX_RECEIPTS_FETCH = 256
 MAX_HEADERS_FETCH = 192
+
+# Seconds of request serving every peer is allowed per second, and the seconds of serving a
+# peer that was idle can use up at once. Requests of peers that go beyond it are delayed, so
+# that serving peers doesn't compete with our own block import.
+MAX_SERVING_TIME_PER_PEER = 0.05
+MAX_SERVING_TIME_BURST = 0.5
+# The number of peers whose serving time we keep track of.
+MAX_TRACKED_SERVING_BUDGETS = 1024
+
+# Max total size of the encoded block bodies that are kept around, to serve peers that ask for
+# the same (usually recent) blocks without reading them again.
+ENCODED_BODIES_CACHE_SIZE = 16 * 1024 * 1024
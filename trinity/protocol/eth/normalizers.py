@@ -1,19 +1,20 @@
 from typing import (
-    Iterable,
+    Dict,
+    Sequence,
+    Tuple,
 )
 
-from eth_utils import (
-    to_tuple,
-)
+from eth_typing import Hash32
 
-from eth.db.trie import make_trie_root_and_nodes
+from eth.constants import BLANK_ROOT_HASH
+from eth.db.trie import TrieRootAndData
 from eth_hash.auto import keccak
 import rlp
+from trie import HexaryTrie
 
-from p2p.exchange import BaseNormalizer
+from p2p.exchange import BaseNormalizer, BasePoolNormalizer
 
 from trinity.protocol.common.typing import (
-    BlockBodyBundle,
     BlockBodyBundles,
     NodeDataBundles,
     ReceiptsBundles,
@@ -26,29 +27,79 @@ from .commands import (
 )
 
 
+def make_trie_root_and_nodes_from_rlp(encoded_items: Sequence[bytes]) -> TrieRootAndData:
+    """
+    Like :func:`eth.db.trie.make_trie_root_and_nodes`, but for items that are already
+    RLP encoded.
+    """
+    kv_store: Dict[Hash32, bytes] = {}
+    trie = HexaryTrie(kv_store, BLANK_ROOT_HASH)
+    with trie.squash_changes() as memory_trie:
+        for index, item in enumerate(encoded_items):
+            index_key = rlp.encode(index, sedes=rlp.sedes.big_endian_int)
+            memory_trie[index_key] = item
+    return trie.root_hash, kv_store
+
+
 class GetNodeDataNormalizer(BaseNormalizer[NodeDataV65, NodeDataBundles]):
+    # Hashing the nodes is cheap, and beam sync is waiting for them urgently, so they are not
+    # worth shipping to the normalization pool.
     is_normalization_slow = True
 
     def normalize_result(self, cmd: NodeDataV65) -> NodeDataBundles:
-        node_keys = map(keccak, cmd.payload)
-        result = tuple(zip(node_keys, cmd.payload))
-        return result
+        return tuple((Hash32(keccak(node)), node) for node in cmd.payload)
 
 
-class ReceiptsNormalizer(BaseNormalizer[ReceiptsV65, ReceiptsBundles]):
-    is_normalization_slow = True
+# Decoded payloads keep the RLP they were decoded from, so encoding their items again to
+# ship them to the normalization pool is cheap.
 
-    def normalize_result(self, cmd: ReceiptsV65) -> ReceiptsBundles:
-        trie_roots_and_data = map(make_trie_root_and_nodes, cmd.payload)
+class ReceiptsNormalizer(BasePoolNormalizer[ReceiptsV65, ReceiptsBundles]):
+    def get_job(self, cmd: ReceiptsV65) -> Tuple[Tuple[bytes, ...], ...]:
+        return tuple(
+            tuple(rlp.encode(receipt) for receipt in receipts)
+            for receipts in cmd.payload
+        )
+
+    @staticmethod
+    def normalize_job(
+            encoded_receipts: Tuple[Tuple[bytes, ...], ...]) -> Tuple[TrieRootAndData, ...]:
+        return tuple(map(make_trie_root_and_nodes_from_rlp, encoded_receipts))
+
+    def build_result(
+            self,
+            cmd: ReceiptsV65,
+            trie_roots_and_data: Tuple[TrieRootAndData, ...]) -> ReceiptsBundles:
         return tuple(zip(cmd.payload, trie_roots_and_data))
 
 
-class GetBlockBodiesNormalizer(BaseNormalizer[BlockBodiesV65, BlockBodyBundles]):
-    is_normalization_slow = True
+class GetBlockBodiesNormalizer(BasePoolNormalizer[BlockBodiesV65, BlockBodyBundles]):
+    def get_job(self, cmd: BlockBodiesV65) -> Tuple[Tuple[Tuple[bytes, ...], bytes], ...]:
+        return tuple(
+            (
+                tuple(rlp.encode(transaction) for transaction in body.transactions),
+                rlp.encode(body.uncles),
+            )
+            for body in cmd.payload
+        )
+
+    @staticmethod
+    def normalize_job(
+            encoded_bodies: Tuple[Tuple[Tuple[bytes, ...], bytes], ...]
+    ) -> Tuple[Tuple[TrieRootAndData, Hash32], ...]:
+        return tuple(
+            (
+                make_trie_root_and_nodes_from_rlp(encoded_transactions),
+                Hash32(keccak(encoded_uncles)),
+            )
+            for encoded_transactions, encoded_uncles in encoded_bodies
+        )
 
-    @to_tuple
-    def normalize_result(self, cmd: BlockBodiesV65) -> Iterable[BlockBodyBundle]:
-        for body in cmd.payload:
-            uncle_hashes = keccak(rlp.encode(body.uncles))
-            transaction_root_and_nodes = make_trie_root_and_nodes(body.transactions)
-            yield body, transaction_root_and_nodes, uncle_hashes
+    def build_result(
+            self,
+            cmd: BlockBodiesV65,
+            roots_and_hashes: Tuple[Tuple[TrieRootAndData, Hash32], ...]) -> BlockBodyBundles:
+        return tuple(
+            (body, transaction_root_and_nodes, uncles_hash)
+            for body, (transaction_root_and_nodes, uncles_hash)
+            in zip(cmd.payload, roots_and_hashes)
+        )
@@ -88,10 +88,11 @@ class ETHPeer(BaseChainPeer):
     eth_api: AnyETHAPI
 
     def get_behaviors(self) -> Tuple[BehaviorAPI, ...]:
+        normalization_pool = self.context.normalization_pool
         return super().get_behaviors() + (
-            ETHV63API().as_behavior(),
-            ETHV64API().as_behavior(),
-            ETHV65API().as_behavior()
+            ETHV63API(normalization_pool).as_behavior(),
+            ETHV64API(normalization_pool).as_behavior(),
+            ETHV65API(normalization_pool).as_behavior()
         )
 
     def _pre_run(self) -> None:
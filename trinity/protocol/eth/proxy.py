@@ -28,6 +28,7 @@ from trinity.protocol.common.typing import (
     ReceiptsBundles,
 )
 from trinity.rlp.block_body import BlockBody
+from trinity.rlp.encoding import encode_raw_list
 
 from .commands import (
     BlockBodiesV65,
@@ -229,6 +230,13 @@ class ProxyETHAPI:
             self._broadcast_config,
         )
 
+    def send_encoded_block_bodies(self, encoded_bodies: Sequence[bytes]) -> None:
+        command = BlockBodiesV65.from_serialized_payload(encode_raw_list(encoded_bodies))
+        self._event_bus.broadcast_nowait(
+            SendBlockBodiesEvent(self.session, command),
+            self._broadcast_config,
+        )
+
     def send_receipts(self, receipts: Sequence[Sequence[ReceiptAPI]]) -> None:
         command = ReceiptsV65(tuple(map(tuple, receipts)))
         self._event_bus.broadcast_nowait(
@@ -236,6 +244,13 @@ class ProxyETHAPI:
             self._broadcast_config,
         )
 
+    def send_encoded_receipts(self, encoded_receipts: Sequence[bytes]) -> None:
+        command = ReceiptsV65.from_serialized_payload(encode_raw_list(encoded_receipts))
+        self._event_bus.broadcast_nowait(
+            SendReceiptsEvent(self.session, command),
+            self._broadcast_config,
+        )
+
     def send_node_data(self, nodes: Sequence[bytes]) -> None:
         command = NodeDataV65(tuple(nodes))
         self._event_bus.broadcast_nowait(
@@ -1,22 +1,16 @@
+import time
 from typing import (
     Any,
 )
 
-from eth.exceptions import (
-    HeaderNotFound,
-)
-from eth_utils import (
-    to_hex,
-)
+import cachetools
 from lahja import (
     BroadcastConfig,
     EndpointAPI,
 )
-from trie.exceptions import (
-    MissingTrieNode,
-)
 
 from p2p.abc import CommandAPI, SessionAPI
+from p2p.token_bucket import TokenBucket
 
 from trinity.db.eth1.chain import BaseAsyncChainDB
 from trinity.protocol.common.servers import (
@@ -34,15 +28,15 @@ from trinity.protocol.eth.peer import (
     ETHProxyPeer,
 )
 
-from eth.rlp.receipts import Receipt
-from eth.rlp.transactions import BaseTransactionFields
-
 from trinity.protocol.eth.constants import (
+    ENCODED_BODIES_CACHE_SIZE,
     MAX_BODIES_FETCH,
     MAX_RECEIPTS_FETCH,
+    MAX_SERVING_TIME_BURST,
+    MAX_SERVING_TIME_PER_PEER,
     MAX_STATE_FETCH,
+    MAX_TRACKED_SERVING_BUDGETS,
 )
-from trinity.rlp.block_body import BlockBody
 
 from .commands import (
     GetBlockHeadersV65,
@@ -55,6 +49,9 @@ from .commands import (
 class ETHPeerRequestHandler(BasePeerRequestHandler):
     def __init__(self, db: BaseAsyncChainDB) -> None:
         self.db: BaseAsyncChainDB = db
+        # Block bodies never change, so the encoded ones are served to other peers as is.
+        self._encoded_bodies_cache = cachetools.LRUCache(ENCODED_BODIES_CACHE_SIZE, getsizeof=len)
+        self._serving_budgets = cachetools.LRUCache(MAX_TRACKED_SERVING_BUDGETS)
 
     async def handle_get_block_headers(
             self,
@@ -69,72 +66,80 @@ class ETHPeerRequestHandler(BasePeerRequestHandler):
     async def handle_get_block_bodies(self,
                                       peer: ETHProxyPeer,
                                       command: GetBlockBodiesV65) -> None:
-        block_hashes = command.payload
-
-        self.logger.debug2("%s requested bodies for %d blocks", peer, len(block_hashes))
-        bodies = []
         # Only serve up to MAX_BODIES_FETCH items in every request.
-        for block_hash in block_hashes[:MAX_BODIES_FETCH]:
-            try:
-                header = await self.db.coro_get_block_header_by_hash(block_hash)
-            except HeaderNotFound:
-                self.logger.debug(
-                    "%s asked for a block with a header we don't have: %s", peer, to_hex(block_hash)
-                )
-                continue
-            try:
-                transactions = await self.db.coro_get_block_transactions(
-                    header,
-                    BaseTransactionFields,
-                )
-            except MissingTrieNode as exc:
-                self.logger.debug(
-                    "%s asked for block transactions we don't have: %s, "
-                    "due to %r",
-                    peer,
-                    to_hex(block_hash),
-                    exc,
-                )
-                continue
-            try:
-                uncles = await self.db.coro_get_block_uncles(header.uncles_hash)
-            except HeaderNotFound as exc:
-                self.logger.debug(
-                    "%s asked for a block with uncles we don't have: %s", peer, exc
-                )
-                continue
-            bodies.append(BlockBody(transactions, uncles))
+        block_hashes = command.payload[:MAX_BODIES_FETCH]
+
+        self.logger.debug2("%s requested bodies for %d blocks", peer, len(command.payload))
+        budget = await self._wait_for_serving_budget(peer)
+        start_at = time.perf_counter()
+
+        encoded_bodies = {
+            block_hash: self._encoded_bodies_cache[block_hash]
+            for block_hash in set(block_hashes)
+            if block_hash in self._encoded_bodies_cache
+        }
+        uncached_block_hashes = tuple(set(block_hashes).difference(encoded_bodies))
+        if uncached_block_hashes:
+            read_bodies = await self.db.coro_get_encoded_block_bodies(uncached_block_hashes)
+            self._encoded_bodies_cache.update(read_bodies)
+            encoded_bodies.update(read_bodies)
+
+        bodies = tuple(
+            encoded_bodies[block_hash]
+            for block_hash in block_hashes
+            if block_hash in encoded_bodies
+        )
+        if len(bodies) < len(block_hashes):
+            self.logger.debug(
+                "%s asked for %d block bodies that we don't have, out of request for %d",
+                peer,
+                len(block_hashes) - len(bodies),
+                len(block_hashes),
+            )
         self.logger.debug2("Replying to %s with %d block bodies", peer, len(bodies))
-        peer.eth_api.send_block_bodies(bodies)
+        peer.eth_api.send_encoded_block_bodies(bodies)
+        await budget.take(time.perf_counter() - start_at)
 
     async def handle_get_receipts(self, peer: ETHProxyPeer, command: GetReceiptsV65) -> None:
-        block_hashes = command.payload
-
-        self.logger.debug2("%s requested receipts for %d blocks", peer, len(block_hashes))
-        receipts = []
         # Only serve up to MAX_RECEIPTS_FETCH items in every request.
-        for block_hash in block_hashes[:MAX_RECEIPTS_FETCH]:
-            try:
-                header = await self.db.coro_get_block_header_by_hash(block_hash)
-            except HeaderNotFound:
-                self.logger.debug(
-                    "%s asked receipts for a block we don't have: %s", peer, to_hex(block_hash)
-                )
-                continue
-            try:
-                block_receipts = await self.db.coro_get_receipts(header, Receipt)
-            except MissingTrieNode as exc:
-                self.logger.debug(
-                    "%s asked for block receipts we don't have: %s, "
-                    "due to %r",
-                    peer,
-                    to_hex(block_hash),
-                    exc,
-                )
-                continue
-            receipts.append(block_receipts)
+        block_hashes = command.payload[:MAX_RECEIPTS_FETCH]
+
+        self.logger.debug2("%s requested receipts for %d blocks", peer, len(command.payload))
+        budget = await self._wait_for_serving_budget(peer)
+        start_at = time.perf_counter()
+
+        encoded_receipts = await self.db.coro_get_encoded_receipts(block_hashes)
+        receipts = tuple(
+            encoded_receipts[block_hash]
+            for block_hash in block_hashes
+            if block_hash in encoded_receipts
+        )
+        if len(receipts) < len(block_hashes):
+            self.logger.debug(
+                "%s asked for receipts of %d blocks that we don't have, out of request for %d",
+                peer,
+                len(block_hashes) - len(receipts),
+                len(block_hashes),
+            )
         self.logger.debug2("Replying to %s with receipts for %d blocks", peer, len(receipts))
-        peer.eth_api.send_receipts(receipts)
+        peer.eth_api.send_encoded_receipts(receipts)
+        await budget.take(time.perf_counter() - start_at)
+
+    async def _wait_for_serving_budget(self, peer: ETHProxyPeer) -> TokenBucket:
+        """
+        Wait until the peer paid off the time we spent serving its previous requests, and
+        return the budget to charge for the time spent on the current one.
+        """
+        try:
+            budget = self._serving_budgets[peer.session]
+        except KeyError:
+            budget = TokenBucket(MAX_SERVING_TIME_PER_PEER, MAX_SERVING_TIME_BURST)
+            self._serving_budgets[peer.session] = budget
+
+        if budget.get_num_tokens() == 0:
+            self.logger.debug2("Delaying request of %s, which used up its serving time", peer)
+        await budget.take(0)
+        return budget
 
     async def handle_get_node_data(self, peer: ETHProxyPeer, command: GetNodeDataV65) -> None:
         node_hashes = command.payload
@@ -0,0 +1,11 @@
+from typing import Sequence
+
+import rlp
+
+
+def encode_raw_list(encoded_items: Sequence[bytes]) -> bytes:
+    """
+    Return the RLP encoded list of the given, already RLP encoded, items.
+    """
+    payload = b''.join(encoded_items)
+    return rlp.codec.length_prefix(len(payload), 0xc0) + payload
@@ -0,0 +1,294 @@
+import asyncio
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from eth_typing import (
+    Address,
+    BlockNumber,
+    Hash32,
+)
+from eth_utils import (
+    decode_hex,
+    int_to_big_endian,
+    ValidationError,
+)
+
+from eth.abc import (
+    BlockHeaderAPI,
+    ChainDatabaseAPI,
+    LogAPI,
+)
+from eth._utils.padding import (
+    pad32,
+)
+
+from trinity.chains.base import AsyncChainAPI
+from trinity.db.eth1.bloom_bits import (
+    BloomBitsIndex,
+    get_bloom_bit_indices,
+)
+from trinity.exceptions import RpcError
+from trinity.rpc.format import (
+    to_int_if_hex,
+    to_log_response,
+)
+from trinity.rpc.modules._util import get_block_number
+from trinity.rpc.typing import RpcLogResponse
+
+
+# Installed filters that were not polled for this many seconds are uninstalled
+FILTER_TIMEOUT = 5 * 60
+
+# A single log query may span at most this many blocks
+MAX_LOGS_BLOCK_RANGE = 10000
+
+# A single log query may return at most this many logs
+MAX_LOGS_RESULTS = 10000
+
+
+def _decode_addresses(value: Union[None, str, Sequence[str]]) -> Tuple[Address, ...]:
+    if value is None:
+        return ()
+    elif isinstance(value, str):
+        value = (value,)
+
+    addresses = tuple(Address(decode_hex(address)) for address in value)
+    for address in addresses:
+        if len(address) != 20:
+            raise ValidationError(f"Filter address must be 20 bytes long, got {len(address)}")
+    return addresses
+
+
+def _decode_topics(value: Union[None, str, Sequence[str]]) -> Tuple[bytes, ...]:
+    if value is None:
+        # Any topic matches at this position
+        return ()
+    elif isinstance(value, str):
+        value = (value,)
+
+    topics = tuple(decode_hex(topic) for topic in value)
+    for topic in topics:
+        if len(topic) != 32:
+            raise ValidationError(f"Filter topic must be 32 bytes long, got {len(topic)}")
+    return topics
+
+
+class LogFilter:
+    """
+    The logs that an ``eth_getLogs`` or ``eth_newFilter`` request asks for.
+
+    A log matches if it was emitted by any of the ``addresses``, and if for every position in
+    ``topics`` its topic at that position is any of the given alternatives. No addresses, or no
+    alternatives at a position, match any log.
+    """
+    def __init__(self,
+                 from_block: Union[str, int] = 'latest',
+                 to_block: Union[str, int] = 'latest',
+                 block_hash: Hash32 = None,
+                 addresses: Sequence[Address] = (),
+                 topics: Sequence[Sequence[bytes]] = ()) -> None:
+        self.from_block = from_block
+        self.to_block = to_block
+        self.block_hash = block_hash
+        self.addresses = tuple(addresses)
+        self.topics = tuple(tuple(alternatives) for alternatives in topics)
+
+        # The bloom bits that the matching logs set, see BloomBitsIndex.match_section()
+        self.bloom_criteria = (
+            tuple(get_bloom_bit_indices(address) for address in self.addresses),
+        ) + tuple(
+            tuple(get_bloom_bit_indices(topic) for topic in alternatives)
+            for alternatives in self.topics
+        )
+
+    @classmethod
+    def from_params(cls, params: Dict[str, Any]) -> 'LogFilter':
+        block_hash = params.get('blockHash')
+        if block_hash is not None:
+            if 'fromBlock' in params or 'toBlock' in params:
+                raise ValidationError("Cannot filter by blockHash together with fromBlock/toBlock")
+            block_hash = Hash32(decode_hex(block_hash))
+
+        return cls(
+            from_block=to_int_if_hex(params.get('fromBlock', 'latest')),
+            to_block=to_int_if_hex(params.get('toBlock', 'latest')),
+            block_hash=block_hash,
+            addresses=_decode_addresses(params.get('address')),
+            topics=tuple(_decode_topics(topics) for topics in params.get('topics') or ()),
+        )
+
+    def matches_bloom(self, bloom: int) -> bool:
+        """
+        Return whether a block with the given bloom may contain matching logs.
+        """
+        return all(
+            any(all(bloom & (1 << bit) for bit in value) for value in criterion)
+            for criterion in self.bloom_criteria
+            if criterion
+        )
+
+    def matches(self, log: LogAPI) -> bool:
+        if self.addresses and log.address not in self.addresses:
+            return False
+        elif len(self.topics) > len(log.topics):
+            return False
+
+        for alternatives, topic in zip(self.topics, log.topics):
+            if alternatives and pad32(int_to_big_endian(topic)) not in alternatives:
+                return False
+        return True
+
+
+class InstalledFilter:
+    """
+    A :class:`LogFilter` installed by ``eth_newFilter``, which remembers the first block whose
+    logs were not returned by ``eth_getFilterChanges`` yet.
+    """
+    def __init__(self, log_filter: LogFilter, next_block_number: BlockNumber) -> None:
+        self.log_filter = log_filter
+        self.next_block_number = next_block_number
+        self.last_polled_at = time.monotonic()
+
+    @property
+    def is_expired(self) -> bool:
+        return time.monotonic() - self.last_polled_at > FILTER_TIMEOUT
+
+
+async def get_logs(chain: AsyncChainAPI,
+                   index: BloomBitsIndex,
+                   log_filter: LogFilter,
+                   max_block_range: int = MAX_LOGS_BLOCK_RANGE,
+                   max_results: int = MAX_LOGS_RESULTS) -> List[RpcLogResponse]:
+    """
+    Return the logs of the canonical chain that match the filter.
+
+    Raise :class:`~trinity.exceptions.RpcError` if the filter spans more than
+    ``max_block_range`` blocks, or matches more than ``max_results`` logs.
+    """
+    if log_filter.block_hash is not None:
+        header = await chain.coro_get_block_header_by_hash(log_filter.block_hash)
+        if log_filter.matches_bloom(header.bloom):
+            return await _get_block_logs(chain, header, log_filter)
+        else:
+            return []
+
+    head = await chain.coro_get_canonical_head()
+    from_number = await get_block_number(chain, log_filter.from_block)
+    to_number = min(head.block_number, await get_block_number(chain, log_filter.to_block))
+    if to_number - from_number + 1 > max_block_range:
+        raise RpcError(f"Log queries may span at most {max_block_range} blocks")
+
+    return await get_logs_in_range(
+        chain,
+        index,
+        log_filter,
+        from_number,
+        BlockNumber(to_number),
+        max_results,
+    )
+
+
+async def get_logs_in_range(chain: AsyncChainAPI,
+                            index: BloomBitsIndex,
+                            log_filter: LogFilter,
+                            from_number: BlockNumber,
+                            to_number: BlockNumber,
+                            max_results: int = MAX_LOGS_RESULTS) -> List[RpcLogResponse]:
+    """
+    Return the logs of the canonical blocks ``from_number`` through ``to_number`` that match
+    the filter.
+
+    Raise :class:`~trinity.exceptions.RpcError` if more than ``max_results`` logs match.
+    """
+    logs: List[RpcLogResponse] = []
+    async for header in _find_candidate_headers(chain, index, log_filter, from_number, to_number):
+        logs.extend(await _get_block_logs(chain, header, log_filter))
+        if len(logs) > max_results:
+            raise RpcError(f"Log queries may return at most {max_results} logs")
+    return logs
+
+
+async def _find_candidate_headers(chain: AsyncChainAPI,
+                                  index: BloomBitsIndex,
+                                  log_filter: LogFilter,
+                                  from_number: BlockNumber,
+                                  to_number: BlockNumber) -> AsyncIterator[BlockHeaderAPI]:
+    section_size = index.section_size
+    indexed_end = min(index.num_sections * section_size, to_number + 1)
+
+    # The indexed sections only need the rows of the bits that the filter looks for
+    block_number: int = from_number
+    while block_number < indexed_end:
+        section, offset = divmod(block_number, section_size)
+        section_end = min((section + 1) * section_size, indexed_end)
+
+        mask = index.match_section(section, log_filter.bloom_criteria) >> offset
+        mask &= (1 << (section_end - block_number)) - 1
+        while mask:
+            lowest_bit = mask & -mask
+            yield await chain.coro_get_canonical_block_header_by_number(
+                BlockNumber(block_number + lowest_bit.bit_length() - 1),
+            )
+            mask ^= lowest_bit
+
+        block_number = section_end
+        # Give other requests a turn between sections
+        await asyncio.sleep(0)
+
+    # The blocks that are not indexed yet are matched against their header blooms
+    if block_number <= to_number:
+        headers = await asyncio.get_event_loop().run_in_executor(
+            None,
+            _scan_header_blooms,
+            chain.chaindb,
+            log_filter,
+            BlockNumber(block_number),
+            to_number,
+        )
+        for header in headers:
+            yield header
+
+
+def _scan_header_blooms(chaindb: ChainDatabaseAPI,
+                        log_filter: LogFilter,
+                        from_number: BlockNumber,
+                        to_number: BlockNumber) -> Tuple[BlockHeaderAPI, ...]:
+    headers = (
+        chaindb.get_canonical_block_header_by_number(BlockNumber(block_number))
+        for block_number in range(from_number, to_number + 1)
+    )
+    return tuple(header for header in headers if log_filter.matches_bloom(header.bloom))
+
+
+async def _get_block_logs(chain: AsyncChainAPI,
+                          header: BlockHeaderAPI,
+                          log_filter: LogFilter) -> List[RpcLogResponse]:
+    block = await chain.coro_get_block_by_header(header)
+    receipts = await asyncio.get_event_loop().run_in_executor(
+        None,
+        block.get_receipts,
+        chain.chaindb,
+    )
+
+    logs = []
+    log_index = 0
+    for transaction_index, (transaction, receipt) in enumerate(zip(block.transactions, receipts)):
+        for log in receipt.logs:
+            if log_filter.matches(log):
+                logs.append(to_log_response(
+                    log,
+                    log_index,
+                    transaction,
+                    transaction_index,
+                    header,
+                ))
+            log_index += 1
+    return logs
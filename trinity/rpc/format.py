@@ -27,18 +27,23 @@ import rlp
 from eth.abc import (
     BlockAPI,
     BlockHeaderAPI,
+    LogAPI,
     ReceiptAPI,
     SignedTransactionAPI,
 )
 from eth.constants import (
     CREATE_CONTRACT_ADDRESS,
 )
+from eth._utils.padding import (
+    pad32,
+)
 
 from trinity.chains.base import AsyncChainAPI
 from trinity.rpc.typing import (
     RpcBlockResponse,
     RpcBlockTransactionResponse,
     RpcHeaderResponse,
+    RpcLogResponse,
     RpcReceiptResponse,
     RpcTransactionResponse,
 )
@@ -105,6 +110,27 @@ def to_receipt_response(receipt: ReceiptAPI,
     }
 
 
+def to_log_response(log: LogAPI,
+                    log_index: int,
+                    transaction: SignedTransactionAPI,
+                    transaction_index: int,
+                    header: BlockHeaderAPI) -> RpcLogResponse:
+    return {
+        "address": encode_hex(log.address),
+        "data": encode_hex(log.data),
+        "blockHash": encode_hex(header.hash),
+        "blockNumber": hex(header.block_number),
+        "logIndex": hex(log_index),
+        # Logs are only looked up in the canonical chain, so they were never removed
+        "removed": False,
+        "topics": [
+            encode_hex(pad32(int_to_big_endian(topic))) for topic in log.topics
+        ],
+        "transactionHash": encode_hex(transaction.hash),
+        "transactionIndex": hex(transaction_index),
+    }
+
+
 def transaction_to_dict(transaction: SignedTransactionAPI) -> RpcTransactionResponse:
     return {
         'hash': encode_hex(transaction.hash),
@@ -16,6 +16,9 @@ from trinity.rpc.main import (
 )
 
 MAXIMUM_REQUEST_BYTES = 10000
+# A batch request is read in many chunks of up to ``MAXIMUM_REQUEST_BYTES``, this limits their
+# total size.
+MAXIMUM_BATCH_REQUEST_BYTES = 100 * MAXIMUM_REQUEST_BYTES
 NEW_LINE = "\n"
 
 
@@ -49,7 +52,14 @@ async def connection_loop(execute_rpc: Callable[[Any], Any],
     while True:
         request_bytes = b''
         try:
-            request_bytes = await reader.readuntil(b'}')
+            if raw_request:
+                # A batch request is a JSON list, which can only be complete at a closing bracket
+                separator = b']' if raw_request.startswith('[') else b'}'
+                request_bytes = await reader.readuntil(separator)
+            else:
+                request_bytes = await read_request_start(reader)
+                if request_bytes not in (b'[', b'}'):
+                    request_bytes += await reader.readuntil(b'}')
         except asyncio.LimitOverrunError as e:
             logger.info("Client request was too long. Erasing buffer and restarting...")
             request_bytes = await reader.read(e.consumed)
@@ -66,6 +76,15 @@ async def connection_loop(execute_rpc: Callable[[Any], Any],
             logger.info("Client started request with non json data: %r", bad_prefix)
             await write_error(writer, 'Cannot parse json: ' + bad_prefix)
 
+        if len(raw_request) > MAXIMUM_BATCH_REQUEST_BYTES:
+            logger.info("Client request was too long in total. Erasing buffer and restarting...")
+            await write_error(
+                writer,
+                f"reached limit: {len(raw_request)} bytes, starting with '{raw_request[:20]!r}'",
+            )
+            raw_request = ''
+            continue
+
         try:
             request = json.loads(raw_request)
         except json.JSONDecodeError:
@@ -95,10 +114,26 @@ async def connection_loop(execute_rpc: Callable[[Any], Any],
         await writer.drain()
 
 
+async def read_request_start(reader: asyncio.StreamReader) -> bytes:
+    """
+    Skip any whitespace between two requests, and return the first byte of the next request.
+    """
+    while True:
+        first_byte = await reader.readexactly(1)
+        if not first_byte.isspace():
+            return first_byte
+
+
 def strip_non_json_prefix(raw_request: str) -> Tuple[str, str]:
-    if raw_request and raw_request[0] != '{':
-        prefix, bracket, rest = raw_request.partition('{')
-        return prefix.strip(), bracket + rest
+    if raw_request and raw_request[0] not in '{[':
+        starts = tuple(
+            index for index in (raw_request.find('{'), raw_request.find('['))
+            if index != -1
+        )
+        if not starts:
+            return raw_request.strip(), ''
+        start = min(starts)
+        return raw_request[:start].strip(), raw_request[start:]
     else:
         return '', raw_request
 
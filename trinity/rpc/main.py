@@ -1,7 +1,10 @@
+import asyncio
 import json
+import time
 from typing import (
     Any,
     Dict,
+    List,
     Sequence,
     Tuple,
     Union,
@@ -9,6 +12,7 @@ from typing import (
 )
 
 from lahja import EndpointAPI
+from pyformance import MetricsRegistry
 
 from eth_utils import (
     get_logger,
@@ -33,6 +37,12 @@ REQUIRED_REQUEST_KEYS = {
     'method',
 }
 
+# The maximum number of requests in a single batch request
+MAXIMUM_BATCH_SIZE = 100
+
+# The maximum number of requests of a single batch request that are executed concurrently
+BATCH_CONCURRENCY = 8
+
 
 def validate_request(request: Dict[str, Any]) -> None:
     missing_keys = REQUIRED_REQUEST_KEYS - set(request.keys())
@@ -65,17 +75,28 @@ class RPCServer:
     The key entry point for all requests is :meth:`RPCServer.execute`, which
     then proxies to the appropriate method. For example, see
     :meth:`RPCServer.eth_getBlockByHash`.
+
+    A JSON-RPC 2.0 batch, a list of up to ``MAXIMUM_BATCH_SIZE`` requests, is answered with a
+    list of responses. Up to ``batch_concurrency`` requests of a batch are executed at the same
+    time, so they may complete in any order.
     """
     chain = None
 
     def __init__(self,
                  modules: Sequence[BaseRPCModule],
                  chain: Union[AsyncChainAPI, BaseAsyncBeaconChainDB],
-                 event_bus: EndpointAPI = None) -> None:
+                 event_bus: EndpointAPI = None,
+                 batch_concurrency: int = BATCH_CONCURRENCY,
+                 metrics_registry: MetricsRegistry = None) -> None:
         self.event_bus = event_bus
         self.modules: Dict[str, BaseRPCModule] = {}
         self.chain = chain
         self.logger: ExtendedDebugLogger = get_logger('trinity.rpc.main.RPCServer')
+        self._batch_concurrency = batch_concurrency
+
+        if metrics_registry is None:
+            metrics_registry = MetricsRegistry()
+        self.metrics_registry = metrics_registry
 
         for module in modules:
             name = module.get_name()
@@ -129,9 +150,13 @@ class RPCServer:
 
             params = request.get('params', [])
 
+            start_at = time.perf_counter()
             result = await execute_with_retries(
                 self.event_bus, method, params, self.chain,
             )
+            self.metrics_registry.histogram(
+                f"trinity.rpc/{request['method']}/latency.histogram"
+            ).add(time.perf_counter() - start_at)
 
             if request['method'] == 'evm_resetToGenesisFixture':
                 result = True
@@ -157,7 +182,7 @@ class RPCServer:
             return result, None
 
     async def execute(self,
-                      request: Dict[str, Any]) -> str:
+                      request: Union[Dict[str, Any], List[Any]]) -> str:
         """
         Delegate to :meth:`~trinity.rpc.main.RPCServer.execute_with_access_control` with
         unrestricted access.
@@ -168,7 +193,7 @@ class RPCServer:
     async def execute_with_access_control(
             self,
             disallowed_modules: Sequence[Type[BaseRPCModule]],
-            request: Dict[str, Any]) -> str:
+            request: Union[Dict[str, Any], List[Any]]) -> str:
         """
         The key entry point for all incoming requests. Execution of requests to certain modules
         can be restricted by providing a sequence of ``disallowed_modules`` to this API. An empty
@@ -176,5 +201,41 @@ class RPCServer:
         Access restriction happens on this level because one instance of the server may allow or
         prevent execution of certain requests based on external conditions (e.g request origin).
         """
+        if isinstance(request, list):
+            return await self._execute_batch(disallowed_modules, request)
+        else:
+            return await self._execute_single(disallowed_modules, request)
+
+    async def _execute_single(self,
+                              disallowed_modules: Sequence[Type[BaseRPCModule]],
+                              request: Dict[str, Any]) -> str:
+        if not isinstance(request, dict):
+            return generate_response({}, None, "Invalid Request: must be a JSON object")
+
         result, error = await self._get_result(request, disallowed_modules)
         return generate_response(request, result, error)
+
+    async def _execute_batch(self,
+                             disallowed_modules: Sequence[Type[BaseRPCModule]],
+                             requests: List[Any]) -> str:
+        if not requests:
+            return generate_response({}, None, "Invalid Request: empty batch")
+        elif len(requests) > MAXIMUM_BATCH_SIZE:
+            return generate_response(
+                {},
+                None,
+                f"Invalid Request: batch of {len(requests)} requests exceeds the maximum "
+                f"of {MAXIMUM_BATCH_SIZE}",
+            )
+
+        semaphore = asyncio.Semaphore(self._batch_concurrency)
+
+        async def execute_bounded(request: Any) -> str:
+            async with semaphore:
+                return await self._execute_single(disallowed_modules, request)
+
+        responses = await asyncio.gather(*(
+            execute_bounded(request) for request in requests
+        ))
+        # The responses are already serialized, join them into a JSON list
+        return '[' + ', '.join(responses) + ']'
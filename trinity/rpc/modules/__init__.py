@@ -11,6 +11,10 @@ from eth_utils import (
 
 from trinity.chains.base import AsyncChainAPI
 from trinity.config import TrinityConfig
+from trinity.rpc.filters import (
+    MAX_LOGS_BLOCK_RANGE,
+    MAX_LOGS_RESULTS,
+)
 
 from .main import (  # noqa: F401
     BaseRPCModule,
@@ -31,8 +35,10 @@ from .web3 import Web3  # noqa: F401
 @to_tuple
 def initialize_eth1_modules(chain: AsyncChainAPI,
                             event_bus: EndpointAPI,
-                            trinity_config: TrinityConfig) -> Iterable[BaseRPCModule]:
-    yield Eth(chain, event_bus, trinity_config)
+                            trinity_config: TrinityConfig,
+                            max_logs_block_range: int = MAX_LOGS_BLOCK_RANGE,
+                            max_logs_results: int = MAX_LOGS_RESULTS) -> Iterable[BaseRPCModule]:
+    yield Eth(chain, event_bus, trinity_config, max_logs_block_range, max_logs_results)
     yield EVM(chain, event_bus)
     yield Net(event_bus)
     yield Web3()
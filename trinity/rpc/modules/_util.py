@@ -14,21 +14,30 @@ from eth_utils import (
 from trinity.chains.base import AsyncChainAPI
 
 
-async def get_header(chain: AsyncChainAPI, at_block: Union[str, int]) -> BlockHeaderAPI:
+async def get_block_number(chain: AsyncChainAPI, at_block: Union[str, int]) -> BlockNumber:
+    """
+    Return the number of the block that ``at_block`` refers to, which may be after the head.
+    """
     if at_block == 'pending':
         raise NotImplementedError("RPC interface does not support the 'pending' block at this time")
     elif at_block == 'latest':
-        at_header = chain.get_canonical_head()
+        head = await chain.coro_get_canonical_head()
+        return head.block_number
     elif at_block == 'earliest':
         # TODO find if genesis block can be non-zero. Why does 'earliest' option even exist?
-        block = await chain.coro_get_canonical_block_by_number(BlockNumber(0))
-        at_header = block.header
+        return BlockNumber(0)
     # mypy doesn't have user defined type guards yet
     # https://github.com/python/mypy/issues/5206
     elif is_integer(at_block) and at_block >= 0:  # type: ignore
-        block = await chain.coro_get_canonical_block_by_number(BlockNumber(int(at_block)))
-        at_header = block.header
+        return BlockNumber(int(at_block))
     else:
         raise TypeError("Unrecognized block reference: %r" % at_block)
 
-    return at_header
+
+async def get_header(chain: AsyncChainAPI, at_block: Union[str, int]) -> BlockHeaderAPI:
+    if at_block == 'latest':
+        return chain.get_canonical_head()
+
+    block_number = await get_block_number(chain, at_block)
+    block = await chain.coro_get_canonical_block_by_number(block_number)
+    return block.header
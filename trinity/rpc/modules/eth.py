@@ -1,4 +1,5 @@
 import os
+import time
 
 import rlp
 from eth.rlp.transactions import BaseTransactionFields
@@ -61,7 +62,16 @@ from trinity.config import TrinityConfig
 from trinity.constants import (
     TO_NETWORKING_BROADCAST_CONFIG,
 )
+from trinity.db.eth1.bloom_bits import BloomBitsIndex
 from trinity.exceptions import RpcError
+from trinity.rpc.filters import (
+    get_logs,
+    get_logs_in_range,
+    InstalledFilter,
+    LogFilter,
+    MAX_LOGS_BLOCK_RANGE,
+    MAX_LOGS_RESULTS,
+)
 from trinity.rpc.format import (
     block_to_dict,
     header_to_dict,
@@ -75,12 +85,14 @@ from trinity.rpc.modules import (
     Eth1ChainRPCModule,
 )
 from trinity.rpc.modules._util import (
+    get_block_number,
     get_header,
 )
 from trinity.rpc.retry import retryable
 from trinity.rpc.typing import (
     RpcBlockResponse,
     RpcHeaderResponse,
+    RpcLogResponse,
     RpcReceiptResponse,
     RpcTransactionResponse,
 )
@@ -161,10 +173,34 @@ class Eth(Eth1ChainRPCModule):
     def __init__(self,
                  chain: AsyncChainAPI,
                  event_bus: EndpointAPI,
-                 trinity_config: TrinityConfig) -> None:
+                 trinity_config: TrinityConfig,
+                 max_logs_block_range: int = MAX_LOGS_BLOCK_RANGE,
+                 max_logs_results: int = MAX_LOGS_RESULTS) -> None:
         self.trinity_config = trinity_config
+        self._max_logs_block_range = max_logs_block_range
+        self._max_logs_results = max_logs_results
+        self._filters: Dict[str, InstalledFilter] = {}
         super().__init__(chain, event_bus)
 
+    @property
+    def _bloom_bits_index(self) -> BloomBitsIndex:
+        # The chain may be replaced, so the index always uses the current chain's database
+        return BloomBitsIndex(self.chain.chaindb.db)
+
+    def _get_filter(self, filter_id: str) -> InstalledFilter:
+        self._uninstall_expired_filters()
+        try:
+            installed_filter = self._filters[filter_id]
+        except KeyError:
+            raise RpcError(f"Filter {filter_id} not found")
+        installed_filter.last_polled_at = time.monotonic()
+        return installed_filter
+
+    def _uninstall_expired_filters(self) -> None:
+        for filter_id, installed_filter in tuple(self._filters.items()):
+            if installed_filter.is_expired:
+                del self._filters[filter_id]
+
     async def accounts(self) -> List[str]:
         # trinity does not manage accounts for the user
         return []
@@ -258,6 +294,54 @@ class Eth(Eth1ChainRPCModule):
 
         return encode_hex(pad32(int_to_big_endian(stored_val)))
 
+    @format_params(identity)
+    async def getFilterChanges(self, filter_id: str) -> List[RpcLogResponse]:
+        installed_filter = self._get_filter(filter_id)
+        log_filter = installed_filter.log_filter
+        head = await self.chain.coro_get_canonical_head()
+
+        from_number = installed_filter.next_block_number
+        to_block_number = await get_block_number(self.chain, log_filter.to_block)
+        to_number: int = min(head.block_number, to_block_number)
+        if to_number - from_number + 1 > self._max_logs_block_range:
+            # Catch up over several polls, rather than scanning all blocks at once
+            to_number = from_number + self._max_logs_block_range - 1
+            next_block_number = BlockNumber(to_number + 1)
+        else:
+            next_block_number = max(from_number, BlockNumber(head.block_number + 1))
+
+        logs = await get_logs_in_range(
+            self.chain,
+            self._bloom_bits_index,
+            log_filter,
+            from_number,
+            BlockNumber(to_number),
+            self._max_logs_results,
+        )
+        installed_filter.next_block_number = next_block_number
+        return logs
+
+    @format_params(identity)
+    async def getFilterLogs(self, filter_id: str) -> List[RpcLogResponse]:
+        installed_filter = self._get_filter(filter_id)
+        return await get_logs(
+            self.chain,
+            self._bloom_bits_index,
+            installed_filter.log_filter,
+            self._max_logs_block_range,
+            self._max_logs_results,
+        )
+
+    @format_params(LogFilter.from_params)
+    async def getLogs(self, log_filter: LogFilter) -> List[RpcLogResponse]:
+        return await get_logs(
+            self.chain,
+            self._bloom_bits_index,
+            log_filter,
+            self._max_logs_block_range,
+            self._max_logs_results,
+        )
+
     @format_params(decode_hex)
     async def getTransactionByHash(self,
                                    transaction_hash: Hash32) -> RpcTransactionResponse:
@@ -393,6 +477,22 @@ class Eth(Eth1ChainRPCModule):
     async def mining(self) -> bool:
         return False
 
+    @format_params(LogFilter.from_params)
+    async def newFilter(self, log_filter: LogFilter) -> str:
+        if log_filter.block_hash is not None:
+            raise ValidationError("Cannot install a filter for a single blockHash")
+
+        self._uninstall_expired_filters()
+        head = await self.chain.coro_get_canonical_head()
+        # Only the logs of blocks after the current head are returned as changes
+        next_block_number = max(
+            BlockNumber(head.block_number + 1),
+            await get_block_number(self.chain, log_filter.from_block),
+        )
+        filter_id = encode_hex(os.urandom(16))
+        self._filters[filter_id] = InstalledFilter(log_filter, next_block_number)
+        return filter_id
+
     async def protocolVersion(self) -> str:
         return "63"
 
@@ -405,3 +505,7 @@ class Eth(Eth1ChainRPCModule):
                 "highestBlock": res.progress.highest_block
             }
         return False
+
+    @format_params(identity)
+    async def uninstallFilter(self, filter_id: str) -> bool:
+        return self._filters.pop(filter_id, None) is not None
@@ -20,6 +20,7 @@ from pyformance import MetricsRegistry
 
 from p2p.constants import DEFAULT_MAX_PEERS, DEVP2P_V5
 from p2p.disconnect import DisconnectReason
+from p2p.exchange.abc import NormalizationPoolAPI
 from p2p.exceptions import (
     HandshakeFailure,
     NoMatchingPeerCapabilities,
@@ -69,11 +70,13 @@ class BaseServer(Service, Generic[TPeerPool]):
                  max_peers: int = DEFAULT_MAX_PEERS,
                  event_bus: EndpointAPI = None,
                  metrics_registry: MetricsRegistry = None,
+                 normalization_pool: NormalizationPoolAPI = None,
                  ) -> None:
         self.logger = get_logger(self.__module__ + '.' + self.__class__.__name__)
         # cross process event bus
         self.event_bus = event_bus
         self.metrics_registry = metrics_registry
+        self.normalization_pool = normalization_pool
 
         # setup parameters for the base devp2p handshake.
         self.p2p_handshake_params = DevP2PHandshakeParams(
@@ -202,6 +205,7 @@ class FullServer(BaseServer[ETHPeerPool]):
             client_version_string=self.p2p_handshake_params.client_version_string,
             listen_port=self.p2p_handshake_params.listen_port,
             p2p_version=self.p2p_handshake_params.version,
+            normalization_pool=self.normalization_pool,
         )
         return ETHPeerPool(
             privkey=self.privkey,
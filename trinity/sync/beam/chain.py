@@ -74,6 +74,7 @@ from trinity.sync.common.headers import (
     ManualHeaderSyncer,
     persist_headers,
 )
+from trinity.sync.common.seals import SealVerificationPool
 from trinity.sync.common.strategies import (
     FromCheckpointLaunchStrategy,
     FromGenesisLaunchStrategy,
@@ -125,7 +126,8 @@ class BeamSyncer(Service):
             checkpoint: Checkpoint = None,
             force_beam_block_number: BlockNumber = None,
             enable_backfill: bool = True,
-            enable_state_backfill: bool = True) -> None:
+            enable_state_backfill: bool = True,
+            seal_verification_pool: SealVerificationPool = None) -> None:
         self.logger = get_logger('trinity.sync.beam.chain.BeamSyncer')
 
         self._body_for_header_exists = body_for_header_exists(chain_db, chain)
@@ -145,6 +147,7 @@ class BeamSyncer(Service):
             chain_db,
             peer_pool,
             self._launch_strategy,
+            seal_verification_pool,
         )
         self._header_persister = HeaderOnlyPersist(
             self._header_syncer,
@@ -195,7 +198,12 @@ class BeamSyncer(Service):
             self._manual_header_syncer,
         )
 
-        self._header_backfill = SequentialHeaderChainGapSyncer(chain, chain_db, peer_pool)
+        self._header_backfill = SequentialHeaderChainGapSyncer(
+            chain,
+            chain_db,
+            peer_pool,
+            seal_verification_pool,
+        )
         self._block_backfill = BodyChainGapSyncer(chain, chain_db, peer_pool)
 
         self._chain = chain
@@ -8,6 +8,16 @@ from trinity.sync.common.constants import PREDICTED_BLOCK_TIME
 #   even at a small value (like 1ms), this timeout is rarely triggered.
 DELAY_BEFORE_NON_URGENT_REQUEST = 0.05
 
+# Coroutines waiting on missing nodes are resumed as soon as the nodes are stored by the
+# beam downloader. Nodes can also be written to the database by the backfill, or generated
+# locally by block import in another process, which never wakes the waiters. So check the
+# database directly for the remaining nodes after this many seconds. Keep it short, because
+# block import is stalled while it waits.
+RECHECK_MISSING_NODES_AFTER = 0.5
+
+# How many times to check the database for missing nodes, before giving up waiting on them
+MAX_MISSING_NODE_RECHECKS = 1200
+
 # How much large should our buffer be? This is a multiplier on how many
 # nodes we can request at once from a single peer.
 REQUEST_BUFFER_MULTIPLIER = 16
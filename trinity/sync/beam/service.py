@@ -15,6 +15,7 @@ from trinity.sync.beam.constants import (
     PREDICTED_BLOCK_TIME,
 )
 from trinity.sync.common.checkpoint import Checkpoint
+from trinity.sync.common.seals import SealVerificationPool
 from trinity._utils.logging import get_logger
 
 from .chain import BeamSyncer
@@ -31,7 +32,8 @@ class BeamSyncService(Service):
             event_bus: EndpointAPI,
             checkpoint: Checkpoint = None,
             force_beam_block_number: BlockNumber = None,
-            enable_header_backfill: bool = False) -> None:
+            enable_header_backfill: bool = False,
+            seal_verification_pool: SealVerificationPool = None) -> None:
         self.logger = get_logger('trinity.sync.beam.service.BeamSyncService')
         self.chain = chain
         self.chaindb = chaindb
@@ -41,6 +43,7 @@ class BeamSyncService(Service):
         self.checkpoint = checkpoint
         self.force_beam_block_number = force_beam_block_number
         self.enable_header_backfill = enable_header_backfill
+        self.seal_verification_pool = seal_verification_pool
 
     async def run(self) -> None:
         head = await self.chaindb.coro_get_canonical_head()
@@ -67,6 +70,7 @@ class BeamSyncService(Service):
                 self.checkpoint,
                 self.force_beam_block_number,
                 self.enable_header_backfill,
+                seal_verification_pool=self.seal_verification_pool,
             )
             self.manager.run_child_service(beam_syncer)
             do_pivot = await self._monitor_for_pivot(beam_syncer)
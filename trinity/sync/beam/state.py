@@ -1,14 +1,15 @@
 import asyncio
-from collections import Counter
+from collections import Counter, defaultdict
 from concurrent.futures import CancelledError
-import itertools
 import time
 import typing
 from typing import (
     Any,
     Collection,
+    DefaultDict,
     FrozenSet,
     Iterable,
+    Sequence,
     Set,
     Tuple,
     Type,
@@ -40,6 +41,7 @@ from trie.exceptions import MissingTrieNode
 from trinity._utils.datastructures import TaskQueue
 from trinity._utils.logging import get_logger
 from trinity._utils.timer import Timer
+from trinity.db.manager import batch_exists
 from trinity.protocol.common.typing import (
     NodeDataBundles,
 )
@@ -55,10 +57,34 @@ from trinity.sync.beam.queen import (
 )
 from trinity.sync.beam.constants import (
     ESTIMATED_BEAMABLE_SECONDS,
+    MAX_MISSING_NODE_RECHECKS,
+    RECHECK_MISSING_NODES_AFTER,
     REQUEST_BUFFER_MULTIPLIER,
 )
 
 
+class _NodeWaiter:
+    """
+    A coroutine waiting for a set of missing nodes to be stored.
+    """
+    def __init__(self, node_hashes: Set[Hash32]) -> None:
+        self.remaining_hashes = set(node_hashes)
+        self.all_present = asyncio.Event()
+
+    def resolve(self, node_hash: Hash32) -> bool:
+        """
+        Mark the node as present, and return whether the waiter just got all its nodes.
+        """
+        if node_hash not in self.remaining_hashes:
+            return False
+        self.remaining_hashes.remove(node_hash)
+        if self.remaining_hashes:
+            return False
+        else:
+            self.all_present.set()
+            return True
+
+
 class BeamDownloader(Service, PeerSubscriber):
     """
     Coordinate the request of needed state data: accounts, storage, bytecodes, and
@@ -68,6 +94,8 @@ class BeamDownloader(Service, PeerSubscriber):
     _urgent_processed_nodes = 0
     _predictive_processed_nodes = 0
     _total_timeouts = 0
+    _total_stored_nodes = 0
+    _total_waiter_wakeups = 0
     _predictive_requests = 0
     _urgent_requests = 0
     _time_on_urgent = 0.0
@@ -101,8 +129,8 @@ class BeamDownloader(Service, PeerSubscriber):
         buffer_size = MAX_STATE_FETCH * REQUEST_BUFFER_MULTIPLIER
         self._node_tasks = TaskQueue[Hash32](buffer_size, lambda task: 0)
 
-        # list of events waiting on new data
-        self._new_data_events: Set[asyncio.Event] = set()
+        # coroutines waiting on missing nodes, indexed by the hashes they are missing
+        self._waiters_by_hash: DefaultDict[Hash32, Set[_NodeWaiter]] = defaultdict(set)
 
         self._peer_pool = peer_pool
 
@@ -145,25 +173,41 @@ class BeamDownloader(Service, PeerSubscriber):
             self,
             node_hashes: Iterable[Hash32],
             queue: TaskQueue[Hash32]) -> int:
-        missing_nodes = set(
-            node_hash for node_hash in node_hashes if self._is_node_missing(node_hash)
-        )
+        missing_nodes = set(self._get_missing_node_hashes(tuple(node_hashes)))
         unrequested_nodes = tuple(
             node_hash for node_hash in missing_nodes if node_hash not in queue
         )
-        if unrequested_nodes:
-            await queue.add(unrequested_nodes)
-        if missing_nodes:
-            await self._node_hashes_present(missing_nodes)
+        if not missing_nodes:
+            return 0
+
+        # Register the waiter before yielding to the event loop, so that nodes stored in the
+        #   meantime resolve it.
+        waiter = self._add_node_waiter(missing_nodes)
+        try:
+            if unrequested_nodes:
+                await queue.add(unrequested_nodes)
+            await self._wait_for_node_waiter(waiter)
+        finally:
+            self._remove_node_waiter(waiter, missing_nodes)
         return len(unrequested_nodes)
 
-    def _is_node_missing(self, node_hash: Hash32) -> bool:
-        if len(node_hash) != 32:
-            raise ValidationError(f"Must request node by its 32-byte hash: 0x{node_hash.hex()}")
+    def _get_missing_node_hashes(self, node_hashes: Sequence[Hash32]) -> Tuple[Hash32, ...]:
+        """
+        Check the presence of all ``node_hashes`` with a single database round trip.
+        """
+        for node_hash in node_hashes:
+            if len(node_hash) != 32:
+                raise ValidationError(
+                    f"Must request node by its 32-byte hash: 0x{node_hash.hex()}"
+                )
 
-        self.logger.debug2("checking if node 0x%s is present", node_hash.hex())
+        self.logger.debug2("checking if %d nodes are present", len(node_hashes))
 
-        return node_hash not in self._db
+        return tuple(
+            node_hash
+            for node_hash, is_present in zip(node_hashes, batch_exists(self._db, node_hashes))
+            if not is_present
+        )
 
     async def download_accounts(
             self,
@@ -404,9 +448,12 @@ class BeamDownloader(Service, PeerSubscriber):
             urgent: bool) -> Tuple[NodeDataBundles, NodeDataBundles]:
         nodes = await self._request_nodes(peer, node_hashes)
 
+        missing_node_hashes = set(
+            self._get_missing_node_hashes(tuple(node_hash for node_hash, _ in nodes))
+        )
         new_nodes = tuple(
             (node_hash, node) for node_hash, node in nodes
-            if self._is_node_missing(node_hash)
+            if node_hash in missing_node_hashes
         )
 
         if new_nodes:
@@ -415,45 +462,54 @@ class BeamDownloader(Service, PeerSubscriber):
                 for node_hash, node in new_nodes:
                     batch[node_hash] = node
 
-        # If there are any new nodes returned, then notify any coros that are waiting on
-        #   node data to resume.
-        # Note that we notify waiting coros even if no new data returned, but they are urgent.
-        # We do this in case the urgent data was retrieved by backfill, or generated locally.
-        #   That way, urgent coros don't get stuck hanging until a timeout. This can cause an
-        #   especially flaky test_beam_syncer_backfills_all_state[42].
-        if urgent or new_nodes:
-            for new_data in self._new_data_events:
-                new_data.set()
+        # Every returned node is now in the database, whether we just wrote it or it was
+        #   already present (e.g. retrieved by backfill, or generated locally), so resolve
+        #   the coros waiting on them without reading them back.
+        self._total_stored_nodes += len(new_nodes)
+        self._resolve_node_waiters(node_hash for node_hash, _ in nodes)
 
         return nodes, new_nodes
 
-    def _is_node_present(self, node_hash: Hash32) -> bool:
-        """
-        Check if node_hash has data in the database or in the predicted node set.
-        """
-        return node_hash in self._db
-
-    async def _node_hashes_present(self, node_hashes: Set[Hash32]) -> None:
-        remaining_hashes = node_hashes.copy()
-
-        # save an event that gets triggered when new data comes in
-        new_data = asyncio.Event()
-        self._new_data_events.add(new_data)
-
-        iterations = itertools.count()
-
-        while remaining_hashes and next(iterations) < 1000:
-            await new_data.wait()
-
-            found_hashes = set(found for found in remaining_hashes if self._is_node_present(found))
-            remaining_hashes -= found_hashes
-
-            new_data.clear()
-
-        if remaining_hashes:
-            self.logger.error("Never collected node data for hashes %r", remaining_hashes)
+    def _resolve_node_waiters(self, node_hashes: Iterable[Hash32]) -> None:
+        for node_hash in node_hashes:
+            for waiter in self._waiters_by_hash.pop(node_hash, ()):
+                if waiter.resolve(node_hash):
+                    self._total_waiter_wakeups += 1
+
+    def _add_node_waiter(self, node_hashes: Set[Hash32]) -> _NodeWaiter:
+        waiter = _NodeWaiter(node_hashes)
+        for node_hash in node_hashes:
+            self._waiters_by_hash[node_hash].add(waiter)
+        return waiter
+
+    def _remove_node_waiter(self, waiter: _NodeWaiter, node_hashes: Set[Hash32]) -> None:
+        for node_hash in node_hashes:
+            waiters = self._waiters_by_hash.get(node_hash)
+            if waiters is not None:
+                waiters.discard(waiter)
+                if not waiters:
+                    del self._waiters_by_hash[node_hash]
+
+    async def _wait_for_node_waiter(self, waiter: _NodeWaiter) -> None:
+        for _ in range(MAX_MISSING_NODE_RECHECKS):
+            try:
+                await asyncio.wait_for(
+                    waiter.all_present.wait(),
+                    timeout=RECHECK_MISSING_NODES_AFTER,
+                )
+            except asyncio.TimeoutError:
+                # The nodes might have been written to the database by someone else
+                remaining_hashes = tuple(waiter.remaining_hashes)
+                still_missing = set(self._get_missing_node_hashes(remaining_hashes))
+                for node_hash in remaining_hashes:
+                    if node_hash not in still_missing:
+                        waiter.resolve(node_hash)
+                if waiter.all_present.is_set():
+                    return
+            else:
+                return
 
-        self._new_data_events.remove(new_data)
+        self.logger.error("Never collected node data for hashes %r", waiter.remaining_hashes)
 
     def register_peer(self, peer: BasePeer) -> None:
         super().register_peer(peer)
@@ -536,6 +592,10 @@ class BeamDownloader(Service, PeerSubscriber):
             msg += "urg_reqs=%d  " % (self._urgent_requests)
             msg += "pred_reqs=%d  " % (self._predictive_requests)
             msg += "timeouts=%d" % self._total_timeouts
+            msg += "  wakeups/node=%.3f" % (
+                self._total_waiter_wakeups / max(1, self._total_stored_nodes)
+            )
+            msg += "  waited=%d" % len(self._waiters_by_hash)
             msg += "  u_pend=%d" % self._node_tasks.num_pending()
             msg += "  u_prog=%d" % self._node_tasks.num_in_progress()
             msg += "  p_pend=%d" % self._maybe_useful_nodes.num_pending()
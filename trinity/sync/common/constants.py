@@ -31,6 +31,11 @@ HEADER_QUEUE_SIZE_TARGET = 6000
 # Only need a few seconds of buffer on the DB write side.
 BLOCK_QUEUE_SIZE_TARGET = 1000
 
+# How long to wait for more blocks to become ready, when fewer than BLOCK_QUEUE_SIZE_TARGET
+# are, before persisting the ones we have. Every batch is a single DB write, so waiting a
+# moment for a bigger batch saves many small writes (and round trips to the DB process).
+BLOCK_PERSIST_LATENCY_TARGET = 1.0
+
 # How many blocks to import at a time
 # Only need a few seconds of buffer on the DB side
 # This is specifically for blocks where execution happens locally.
@@ -46,3 +51,10 @@ BLOCK_IMPORT_QUEUE_SIZE = 75
 #   There is no point previewing more than that, because if we are that far behind,
 #   then we will pivot anyway. So we can try this setting until we identify I/O as the
 #   bottleneck.
+
+# How many PoW seals a seal verification worker checks in a single call
+SEAL_CHECK_BATCH_SIZE = 32
+
+# How many ethash caches (one per epoch) are kept on disk by the seal verification pool, and
+# memory-mapped by each of its workers. Syncing only ever straddles two epochs at a time.
+ETHASH_CACHE_MAX_EPOCHS = 3
@@ -33,6 +33,18 @@ class SendLocalTransaction(BaseEvent):
     transaction: SignedTransactionAPI
 
 
+@dataclass
+class NewCanonicalBlocks(BaseEvent):
+    """
+    Broadcast by :class:`~trinity.sync.full.chain.RegularChainBodySyncer` after importing a block
+    that changed the canonical chain, including when it runs as part of beam sync. Fast sync
+    persists blocks without importing them, so it never broadcasts this event. The
+    ``old_canonical_blocks`` are non-empty if the import caused a re-org.
+    """
+    new_canonical_blocks: Tuple[BlockAPI, ...]
+    old_canonical_blocks: Tuple[BlockAPI, ...]
+
+
 @dataclass
 class SyncingResponse(BaseEvent):
     is_syncing: bool
@@ -72,6 +72,7 @@ from trinity.sync.common.constants import (
 )
 from trinity.sync.common.events import SyncingRequest, SyncingResponse
 from trinity.sync.common.peers import TChainPeer, WaitingPeers
+from trinity.sync.common.seals import SealVerificationPool, validate_header_chain
 from trinity.sync.common.strategies import (
     FromGenesisLaunchStrategy,
     SyncLaunchStrategyAPI,
@@ -106,10 +107,12 @@ class SkeletonSyncer(Service, Generic[TChainPeer]):
                  chain: AsyncChainAPI,
                  db: BaseAsyncHeaderDB,
                  peer: TChainPeer,
-                 launch_strategy: SyncLaunchStrategyAPI = None) -> None:
+                 launch_strategy: SyncLaunchStrategyAPI = None,
+                 seal_verification_pool: SealVerificationPool = None) -> None:
         self.logger = get_logger('trinity.sync.common.headers.SkeletonSyncer')
         self._chain = chain
         self._db = db
+        self._seal_verification_pool = seal_verification_pool
         if launch_strategy is None:
             launch_strategy = FromGenesisLaunchStrategy(db)
 
@@ -186,7 +189,12 @@ class SkeletonSyncer(Service, Generic[TChainPeer]):
             pairs = tuple(zip(parents, children))
             try:
                 validate_pair_coros = (
-                    self._chain.coro_validate_chain(parent, (child, ))
+                    validate_header_chain(
+                        self._chain,
+                        parent,
+                        (child, ),
+                        seal_verification_pool=self._seal_verification_pool,
+                    )
                     for parent, child in pairs
                 )
                 await asyncio.gather(*validate_pair_coros)
@@ -242,10 +250,12 @@ class SkeletonSyncer(Service, Generic[TChainPeer]):
             if len(final_headers) == 0:
                 break
 
-            await self._chain.coro_validate_chain(
+            await validate_header_chain(
+                self._chain,
                 previous_tail_header,
                 final_headers,
                 SEAL_CHECK_RANDOM_SAMPLE_RATE,
+                self._seal_verification_pool,
             )
             await self._fetched_headers.put(final_headers)
             previous_tail_header = final_headers[-1]
@@ -357,10 +367,12 @@ class SkeletonSyncer(Service, Generic[TChainPeer]):
                     f"First header {new_headers[0]} did not have parent in DB"
                 ) from exc
             # validate new headers against the parent in the database
-            await self._chain.coro_validate_chain(
+            await validate_header_chain(
+                self._chain,
                 launch_parent,
                 new_headers,
                 SEAL_CHECK_RANDOM_SAMPLE_RATE,
+                self._seal_verification_pool,
             )
             return new_headers
 
@@ -413,10 +425,12 @@ class SkeletonSyncer(Service, Generic[TChainPeer]):
         # validate the filled headers
         filled_gap_children = tuple(concatv(gap_headers, pairs[gap_index + 1]))
         try:
-            await self._chain.coro_validate_chain(
+            await validate_header_chain(
+                self._chain,
                 gap_parent,
                 filled_gap_children,
                 SEAL_CHECK_RANDOM_SAMPLE_RATE,
+                self._seal_verification_pool,
             )
         except ValidationError:
             self.logger.warning(
@@ -611,10 +625,12 @@ class HeaderMeatSyncer(Service, PeerSubscriber, Generic[TChainPeer]):
             self,
             chain: AsyncChainAPI,
             peer_pool: BaseChainPeerPool,
-            stitcher: HeaderStitcher) -> None:
+            stitcher: HeaderStitcher,
+            seal_verification_pool: SealVerificationPool = None) -> None:
         self.logger = get_logger('trinity.sync.common.headers.SkeletonSyncer')
         self._chain = chain
         self._stitcher = stitcher
+        self._seal_verification_pool = seal_verification_pool
         max_pending_fillers = 50
         self._filler_header_tasks = TaskQueue(
             max_pending_fillers,
@@ -788,10 +804,12 @@ class HeaderMeatSyncer(Service, PeerSubscriber, Generic[TChainPeer]):
             return tuple()
         else:
             try:
-                await self._chain.coro_validate_chain(
+                await validate_header_chain(
+                    self._chain,
                     parent_header,
                     headers,
                     SEAL_CHECK_RANDOM_SAMPLE_RATE,
+                    self._seal_verification_pool,
                 )
             except ValidationError as e:
                 self.logger.warning(
@@ -872,11 +890,13 @@ class BaseHeaderChainSyncer(Service, HeaderSyncerAPI, Generic[TChainPeer]):
                  chain: AsyncChainAPI,
                  db: BaseAsyncHeaderDB,
                  peer_pool: BaseChainPeerPool,
-                 launch_strategy: SyncLaunchStrategyAPI = None) -> None:
+                 launch_strategy: SyncLaunchStrategyAPI = None,
+                 seal_verification_pool: SealVerificationPool = None) -> None:
         self.logger = get_logger('trinity.sync.common.headers.SkeletonSyncer')
         self._db = db
         self._chain = chain
         self._peer_pool = peer_pool
+        self._seal_verification_pool = seal_verification_pool
         self._tip_monitor = self.tip_monitor_class(peer_pool)
         self._last_target_header_hash: Hash32 = None
         self._skeleton: SkeletonSyncer[TChainPeer] = None
@@ -908,6 +928,7 @@ class BaseHeaderChainSyncer(Service, HeaderSyncerAPI, Generic[TChainPeer]):
             self._chain,
             self._peer_pool,
             self._stitcher,
+            self._seal_verification_pool,
         )
 
         # Queue has reset, so always start with capacity
@@ -986,6 +1007,7 @@ class BaseHeaderChainSyncer(Service, HeaderSyncerAPI, Generic[TChainPeer]):
             self._db,
             peer,
             self._launch_strategy,
+            self._seal_verification_pool,
         )
         async with background_asyncio_service(self._skeleton):
             try:
@@ -1033,10 +1055,12 @@ class BaseHeaderChainSyncer(Service, HeaderSyncerAPI, Generic[TChainPeer]):
                 raise ValidationError(f"Header skeleton gap of {gap_length} > {MAX_HEADERS_FETCH}")
             elif gap_length == 0:
                 # no need to fill in when there is no gap, just verify against previous header
-                await self._chain.coro_validate_chain(
+                await validate_header_chain(
+                    self._chain,
                     previous_segment[-1],
                     segment,
                     SEAL_CHECK_RANDOM_SAMPLE_RATE,
+                    self._seal_verification_pool,
                 )
             elif gap_length < 0:
                 raise ValidationError(
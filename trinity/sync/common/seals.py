@@ -0,0 +1,336 @@
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+import logging
+import mmap
+import os
+from pathlib import Path
+import random
+import tempfile
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    NamedTuple,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from async_service import Service
+from eth_typing import BlockNumber, Hash32
+from eth_utils import (
+    big_endian_to_int,
+    encode_hex,
+    to_tuple,
+    ValidationError,
+)
+from eth_utils.toolz import groupby, partition_all
+from pyethash import (
+    EPOCH_LENGTH,
+    hashimoto_light,
+    mkcache_bytes,
+)
+
+from eth.abc import BlockHeaderAPI
+from eth.consensus.pow import PowConsensus
+from eth.validation import (
+    validate_length,
+    validate_lte,
+)
+
+from trinity.chains.base import AsyncChainAPI
+from trinity.sync.common.constants import (
+    ETHASH_CACHE_MAX_EPOCHS,
+    SEAL_CHECK_BATCH_SIZE,
+)
+
+
+TReturn = TypeVar('TReturn')
+
+
+class PowSeal(NamedTuple):
+    """
+    The parts of a header that its proof of work is checked against.
+    """
+    block_number: BlockNumber
+    mining_hash: Hash32
+    mix_hash: Hash32
+    nonce: bytes
+    difficulty: int
+
+    @classmethod
+    def from_header(cls, header: BlockHeaderAPI) -> 'PowSeal':
+        return cls(
+            header.block_number,
+            header.mining_hash,
+            header.mix_hash,
+            header.nonce,
+            header.difficulty,
+        )
+
+
+def _get_cache_path(cache_dir: Path, epoch: int) -> Path:
+    return cache_dir / f'cache-{epoch}'
+
+
+def prepare_ethash_cache(cache_dir: Path, epoch: int) -> None:
+    """
+    Generate the ethash cache of the given epoch into ``cache_dir``, unless it is already there.
+
+    The cache is written to a temporary file first, so that workers never map a partial cache.
+    """
+    cache_path = _get_cache_path(cache_dir, epoch)
+    if cache_path.exists():
+        return
+
+    cache = mkcache_bytes(epoch * EPOCH_LENGTH)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir)
+    try:
+        with os.fdopen(fd, 'wb') as tmp_file:
+            tmp_file.write(cache)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+# The ethash caches mapped by this (worker) process, by path. The lock is only contended
+# when seals are checked in threads instead.
+_mapped_caches: 'OrderedDict[Path, mmap.mmap]' = OrderedDict()
+_mapped_caches_lock = threading.Lock()
+
+
+def _get_mapped_cache(cache_dir: Path, epoch: int) -> mmap.mmap:
+    cache_path = _get_cache_path(cache_dir, epoch)
+    with _mapped_caches_lock:
+        if cache_path in _mapped_caches:
+            _mapped_caches.move_to_end(cache_path)
+            return _mapped_caches[cache_path]
+
+        # The pool prepares the cache before sending any seals of the epoch, this is a fallback
+        prepare_ethash_cache(cache_dir, epoch)
+        with open(cache_path, 'rb') as cache_file:
+            # The pages of the mapped file are shared by all workers, through the OS page cache
+            cache = mmap.mmap(cache_file.fileno(), 0, access=mmap.ACCESS_READ)
+        _mapped_caches[cache_path] = cache
+
+        # Evicted caches are unmapped once they are no longer in use
+        while len(_mapped_caches) > ETHASH_CACHE_MAX_EPOCHS:
+            _mapped_caches.popitem(last=False)
+
+        return cache
+
+
+def check_pow_seals(cache_dir: Path, seals: Sequence[PowSeal]) -> None:
+    """
+    Check the proof of work of all given seals, typically in a worker process. This is
+    equivalent to :func:`eth.consensus.pow.check_pow`, but with the ethash caches
+    memory-mapped from ``cache_dir``.
+
+    :raise ValidationError: if any of the seals is invalid
+    """
+    for seal in seals:
+        validate_length(seal.mix_hash, 32, title="Mix Hash")
+        validate_length(seal.mining_hash, 32, title="Mining Hash")
+        validate_length(seal.nonce, 8, title="POW Nonce")
+
+        cache = _get_mapped_cache(cache_dir, seal.block_number // EPOCH_LENGTH)
+        mining_output = hashimoto_light(
+            seal.block_number,
+            cache,
+            seal.mining_hash,
+            big_endian_to_int(seal.nonce),
+        )
+        if mining_output[b'mix digest'] != seal.mix_hash:
+            raise ValidationError(
+                f"mix hash mismatch; expected: {encode_hex(mining_output[b'mix digest'])} "
+                f"!= actual: {encode_hex(seal.mix_hash)}. "
+                f"Mix hash calculated from block #{seal.block_number}, "
+                f"mine hash {encode_hex(seal.mining_hash)}, nonce {encode_hex(seal.nonce)}"
+                f", difficulty {seal.difficulty}"
+            )
+        result = big_endian_to_int(mining_output[b'result'])
+        validate_lte(result, 2**256 // seal.difficulty, title="POW Difficulty")
+
+
+@to_tuple
+def _sample_headers(
+        headers: Sequence[BlockHeaderAPI],
+        seal_check_random_sample_rate: int) -> Iterable[BlockHeaderAPI]:
+    # Picks the same sample as ChainAPI.validate_chain
+    if seal_check_random_sample_rate == 1:
+        yield from headers
+    elif seal_check_random_sample_rate == 0:
+        return
+    else:
+        sample_size = len(headers) // seal_check_random_sample_rate
+        for index in sorted(random.sample(range(len(headers)), sample_size)):
+            yield headers[index]
+
+
+class SealVerificationPool(Service):
+    """
+    Check the PoW seals of synced headers in a pool of worker processes.
+
+    Every ethash cache is generated once, into ``cache_dir``, and memory-mapped by the workers
+    from there. Seals are sent to the workers in batches of ``batch_size``.
+
+    If ``seal_check_random_sample_rate`` is given, it overrides the sample rate that is asked
+    for by the header syncers, e.g. ``1`` to check the seal of every header.
+
+    The header syncers are given the pool, and pass it to :func:`validate_header_chain`.
+    """
+    logger = logging.getLogger('trinity.sync.common.seals.SealVerificationPool')
+
+    def __init__(self,
+                 cache_dir: Path = None,
+                 executor: Executor = None,
+                 batch_size: int = SEAL_CHECK_BATCH_SIZE,
+                 seal_check_random_sample_rate: int = None) -> None:
+        self._cache_dir = cache_dir
+        # Unless given an executor, the process pool is only started with the first batch.
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._batch_size = batch_size
+        self._seal_check_random_sample_rate = seal_check_random_sample_rate
+
+        # The preparation of the ethash caches on disk, by epoch, most recently used last
+        self._prepared_epochs: 'OrderedDict[int, asyncio.Future[None]]' = OrderedDict()
+
+    async def run(self) -> None:
+        if self._cache_dir is None:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                self._cache_dir = Path(tmp_dir)
+                await self._serve()
+        else:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            await self._serve()
+
+    async def _serve(self) -> None:
+        try:
+            await self.manager.wait_finished()
+        finally:
+            if self._owns_executor and self._executor is not None:
+                self._executor.shutdown(wait=False)
+
+    async def validate_chain(
+            self,
+            chain: AsyncChainAPI,
+            parent: BlockHeaderAPI,
+            headers: Tuple[BlockHeaderAPI, ...],
+            seal_check_random_sample_rate: int = 1) -> None:
+        """
+        Validate the chain of headers against their parent, like ``chain.coro_validate_chain``,
+        with the PoW seals checked by the workers of the pool.
+        """
+        if self._seal_check_random_sample_rate is not None:
+            seal_check_random_sample_rate = self._seal_check_random_sample_rate
+
+        headers_to_check = _sample_headers(headers, seal_check_random_sample_rate)
+        if not all(_is_pow_header(chain, header) for header in headers_to_check):
+            # Other consensus engines need the chain (and its database) to check a seal
+            await chain.coro_validate_chain(parent, headers, seal_check_random_sample_rate)
+            return
+
+        await chain.coro_validate_chain(parent, headers, seal_check_random_sample_rate=0)
+        await self.verify_seals(headers_to_check)
+
+    async def verify_seals(self, headers: Sequence[BlockHeaderAPI]) -> None:
+        """
+        Check the PoW seals of the given headers in the workers of the pool.
+
+        :raise ValidationError: if any of the seals is invalid
+        """
+        if not headers:
+            return
+
+        seals_by_epoch: Dict[int, Sequence[PowSeal]] = groupby(
+            lambda seal: seal.block_number // EPOCH_LENGTH,
+            (PowSeal.from_header(header) for header in headers),
+        )
+        await asyncio.gather(*(
+            self._prepare_epoch(epoch) for epoch in seals_by_epoch
+        ))
+
+        batches = partition_all(
+            self._batch_size,
+            (seal for seals in seals_by_epoch.values() for seal in seals),
+        )
+        await asyncio.gather(*(
+            self._check_batch(batch) for batch in batches
+        ))
+
+    async def _prepare_epoch(self, epoch: int) -> None:
+        if epoch in self._prepared_epochs:
+            self._prepared_epochs.move_to_end(epoch)
+        else:
+            self._prepared_epochs[epoch] = asyncio.ensure_future(
+                self._run_in_executor(prepare_ethash_cache, self._cache_dir, epoch)
+            )
+            while len(self._prepared_epochs) > ETHASH_CACHE_MAX_EPOCHS:
+                evicted_epoch, preparation = self._prepared_epochs.popitem(last=False)
+                # Workers that still map the cache keep its pages until they evict it too
+                preparation.add_done_callback(
+                    partial(_remove_cache, self._cache_dir, evicted_epoch)
+                )
+
+        try:
+            await asyncio.shield(self._prepared_epochs[epoch])
+        except Exception:
+            # Let the next batch of the epoch retry
+            self._prepared_epochs.pop(epoch, None)
+            raise
+
+    async def _check_batch(self, seals: Sequence[PowSeal]) -> None:
+        await self._run_in_executor(check_pow_seals, self._cache_dir, seals)
+
+    async def _run_in_executor(self, fn: Callable[..., TReturn], *args: Any) -> TReturn:
+        loop = asyncio.get_event_loop()
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor()
+        try:
+            return await loop.run_in_executor(self._executor, fn, *args)
+        except BrokenProcessPool:
+            self.logger.warning("Seal verification worker died, running %s in a thread", fn)
+            if self._owns_executor:
+                # Start a fresh process pool with the next batch.
+                self._executor = None
+            return await loop.run_in_executor(None, fn, *args)
+
+
+async def validate_header_chain(
+        chain: AsyncChainAPI,
+        parent: BlockHeaderAPI,
+        headers: Tuple[BlockHeaderAPI, ...],
+        seal_check_random_sample_rate: int = 1,
+        seal_verification_pool: SealVerificationPool = None) -> None:
+    """
+    Validate the chain of headers against their parent, like ``chain.coro_validate_chain``,
+    but with the seals checked by the ``seal_verification_pool``, if one is given.
+    """
+    if seal_verification_pool is None:
+        await chain.coro_validate_chain(parent, headers, seal_check_random_sample_rate)
+    else:
+        await seal_verification_pool.validate_chain(
+            chain,
+            parent,
+            headers,
+            seal_check_random_sample_rate,
+        )
+
+
+def _remove_cache(cache_dir: Path, epoch: int, _: 'asyncio.Future[None]') -> None:
+    try:
+        _get_cache_path(cache_dir, epoch).unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _is_pow_header(chain: AsyncChainAPI, header: BlockHeaderAPI) -> bool:
+    vm_class = chain.get_vm_class(header)
+    return issubclass(vm_class.consensus_class, PowConsensus)
@@ -58,6 +58,7 @@ from p2p.stats.ema import EMA
 from p2p.token_bucket import TokenBucket
 
 from trinity.chains.base import AsyncChainAPI
+from trinity.constants import FIRE_AND_FORGET_BROADCASTING
 from trinity.db.eth1.chain import BaseAsyncChainDB
 from trinity.protocol.eth.monitors import ETHChainTipMonitor
 from trinity.protocol.eth import commands
@@ -74,13 +75,16 @@ from trinity.sync.common.chain import (
 )
 from trinity.sync.common.constants import (
     BLOCK_IMPORT_QUEUE_SIZE,
+    BLOCK_PERSIST_LATENCY_TARGET,
     BLOCK_QUEUE_SIZE_TARGET,
     EMPTY_PEER_RESPONSE_PENALTY,
     HEADER_QUEUE_SIZE_TARGET,
     PREDICTED_BLOCK_TIME,
 )
+from trinity.sync.common.events import NewCanonicalBlocks
 from trinity.sync.common.headers import HeaderSyncerAPI
 from trinity.sync.common.peers import WaitingPeers
+from trinity.sync.common.seals import SealVerificationPool
 from trinity._utils.datastructures import (
     BaseOrderedTaskPreparation,
     DuplicateTasks,
@@ -479,8 +483,14 @@ class FastChainSyncer(Service):
     def __init__(self,
                  chain: AsyncChainAPI,
                  db: BaseAsyncChainDB,
-                 peer_pool: ETHPeerPool,) -> None:
-        self._header_syncer = ETHHeaderChainSyncer(chain, db, peer_pool)
+                 peer_pool: ETHPeerPool,
+                 seal_verification_pool: SealVerificationPool = None) -> None:
+        self._header_syncer = ETHHeaderChainSyncer(
+            chain,
+            db,
+            peer_pool,
+            seal_verification_pool=seal_verification_pool,
+        )
         self._body_syncer = FastChainBodySyncer(
             chain,
             db,
@@ -588,10 +598,22 @@ class FastChainBodySyncer(BaseBodyChainSyncer):
                  header_syncer: HeaderSyncerAPI,
                  launch_header_fn: Callable[[], Awaitable[BlockHeaderAPI]] = None,
                  should_skip_header_fn: Callable[[BlockHeaderAPI], Awaitable[bool]] = None,
+                 persist_batch_size: int = BLOCK_QUEUE_SIZE_TARGET,
+                 persist_latency: float = BLOCK_PERSIST_LATENCY_TARGET,
                  ) -> None:
         super().__init__(chain, db, peer_pool, header_syncer)
         self.logger = get_logger('trinity.sync.full.chain.FastChainBodySyncer')
 
+        # Blocks are persisted in batches of up to this many blocks, waiting at most
+        # persist_latency seconds for a batch to fill up.
+        self._persist_batch_size = persist_batch_size
+        self._persist_latency = persist_latency
+
+        # Downloaded trie data, by trie root, waiting to be written in the same batch as the
+        # blocks that it belongs to
+        self._pending_transaction_trie_data: Dict[Hash32, Dict[Hash32, bytes]] = {}
+        self._pending_receipt_trie_data: Dict[Hash32, Dict[Hash32, bytes]] = {}
+
         if launch_header_fn is None:
             self._launch_header_fn: Callable[
                 [], Awaitable[BlockHeaderAPI]
@@ -710,32 +732,69 @@ class FastChainBodySyncer(BaseBodyChainSyncer):
         its target hash. If so, shut down this service.
         """
         while self.manager.is_running:
-            # This tracker waits for all prerequisites to be complete, and returns headers in
-            # order, so that each header's parent is already persisted.
-            get_completed_coro = self._block_persist_tracker.ready_tasks(BLOCK_QUEUE_SIZE_TARGET)
-            completed_headers = await get_completed_coro
+            completed_headers = await self._wait_persist_batch()
 
             self.chain.validate_chain_extension(completed_headers)
 
             await self._persist_blocks(completed_headers)
 
-            target_hash = self._header_syncer.get_target_header_hash()
-
-            if target_hash in [header.hash for header in completed_headers]:
+            if self._is_target_reached(completed_headers):
                 # exit the service when reaching the target hash
                 self._mark_complete()
                 break
 
+    async def _wait_persist_batch(self) -> Tuple[BlockHeaderAPI, ...]:
+        """
+        Wait until blocks are ready to be persisted, then keep collecting the blocks that become
+        ready for up to ``persist_latency`` seconds, or until the batch is full.
+
+        :return: headers of the ready blocks, in order, so that each header's parent is already
+            persisted or earlier in the batch
+        """
+        # This tracker waits for all prerequisites to be complete, and returns headers in
+        # order, so that each header's parent is already persisted.
+        completed_headers = await self._block_persist_tracker.ready_tasks(
+            self._persist_batch_size,
+        )
+        deadline = time.monotonic() + self._persist_latency
+        while len(completed_headers) < self._persist_batch_size:
+            if self._is_target_reached(completed_headers):
+                break
+
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+
+            try:
+                completed_headers += await asyncio.wait_for(
+                    self._block_persist_tracker.ready_tasks(
+                        self._persist_batch_size - len(completed_headers),
+                    ),
+                    timeout,
+                )
+            except asyncio.TimeoutError:
+                break
+
+        return completed_headers
+
+    def _is_target_reached(self, headers: Sequence[BlockHeaderAPI]) -> bool:
+        target_hash = self._header_syncer.get_target_header_hash()
+        return target_hash in [header.hash for header in headers]
+
     def _mark_complete(self) -> None:
         self.is_complete = True
         self.manager.cancel()
 
     async def _persist_blocks(self, headers: Sequence[BlockHeaderAPI]) -> None:
         """
-        Persist blocks for the given headers, directly to the database
+        Persist blocks for the given headers, along with their transaction and receipt trie data,
+        directly to the database in a single write batch
 
         :param headers: headers for which block bodies and receipts have been downloaded
         """
+        blocks = []
+        trie_data_dicts = []
+        num_transactions = 0
         for header in headers:
             vm_class = self.chain.get_vm_class(header)
             block_class = vm_class.get_block_class()
@@ -747,17 +806,26 @@ class FastChainBodySyncer(BaseBodyChainSyncer):
                 body = self._pending_bodies.pop(header)
                 uncles = body.uncles
 
-                # transaction data was already persisted in _block_body_bundle_processing, but
-                # we need to include the transactions for them to be added to the hash->txn lookup
+                # transaction trie data is persisted as is, but we need to include the
+                # transactions for them to be added to the hash->txn lookup
                 tx_class = block_class.get_transaction_class()
                 transactions = [tx_class.from_base_transaction(tx) for tx in body.transactions]
+                num_transactions += len(transactions)
+
+            # Blocks may share a trie root, in which case its data is written with the first one
+            for trie_root, pending_trie_data in (
+                    (header.transaction_root, self._pending_transaction_trie_data),
+                    (header.receipt_root, self._pending_receipt_trie_data)):
+                if trie_root in pending_trie_data:
+                    trie_data_dicts.append(pending_trie_data.pop(trie_root))
 
-                # record progress in the tracker
-                self.tracker.record_transactions(len(transactions))
+            blocks.append(block_class(header, transactions, uncles))
 
-            block = block_class(header, transactions, uncles)
-            await self.db.coro_persist_block(block)
-            self.tracker.set_latest_head(header)
+        await self.db.coro_persist_block_chain(blocks, trie_data_dicts)
+
+        # record progress in the tracker
+        self.tracker.record_transactions(num_transactions)
+        self.tracker.set_latest_head(headers[-1])
 
     async def _assign_receipt_download_to_peers(self) -> None:
         """
@@ -823,17 +891,19 @@ class FastChainBodySyncer(BaseBodyChainSyncer):
     async def _block_body_bundle_processing(self, bundles: Tuple[BlockBodyBundle, ...]) -> None:
         """
         Fast sync writes all the block body bundle data directly to the database,
-        in order to make it... fast.
+        in order to make it... fast. It is held until the blocks are persisted, so that it is
+        written in the same batch.
         """
-        for (_, (_, trie_data_dict), _) in bundles:
-            await self.db.coro_persist_trie_data_dict(trie_data_dict)
+        for (_, (transaction_root, trie_data_dict), _) in bundles:
+            self._pending_transaction_trie_data[transaction_root] = trie_data_dict
 
     async def _process_receipts(
             self,
             peer: ETHPeer,
             all_headers: Sequence[BlockHeaderAPI]) -> Tuple[BlockHeaderAPI, ...]:
         """
-        Downloads and persists the receipts for the given set of block headers.
+        Downloads the receipts for the given set of block headers, and holds their trie data
+        until the blocks are persisted.
         Some receipts may be trivial, having a blank root hash, and will not be requested.
 
         :param peer: to issue the receipt request to
@@ -875,12 +945,11 @@ class FastChainBodySyncer(BaseBodyChainSyncer):
             await peer.disconnect(DisconnectReason.BAD_PROTOCOL)
             return trivial_headers
 
-        # process all of the returned receipts, storing their trie data
-        # dicts in the database
+        # process all of the returned receipts, holding their trie data
+        # dicts until the blocks are persisted
         receipts, trie_roots_and_data_dicts = zip(*receipt_bundles)
-        receipt_roots, trie_data_dicts = zip(*trie_roots_and_data_dicts)
-        for trie_data in trie_data_dicts:
-            await self.db.coro_persist_trie_data_dict(trie_data)
+        receipt_roots, _ = zip(*trie_roots_and_data_dicts)
+        self._pending_receipt_trie_data.update(trie_roots_and_data_dicts)
 
         # Identify which headers have the receipt roots that are now complete.
         completed_header_groups = tuple(
@@ -960,8 +1029,14 @@ class RegularChainSyncer(Service):
     def __init__(self,
                  chain: AsyncChainAPI,
                  db: BaseAsyncChainDB,
-                 peer_pool: ETHPeerPool) -> None:
-        self._header_syncer = ETHHeaderChainSyncer(chain, db, peer_pool)
+                 peer_pool: ETHPeerPool,
+                 seal_verification_pool: SealVerificationPool = None) -> None:
+        self._header_syncer = ETHHeaderChainSyncer(
+            chain,
+            db,
+            peer_pool,
+            seal_verification_pool=seal_verification_pool,
+        )
         self._body_syncer = RegularChainBodySyncer(
             chain,
             db,
@@ -1160,6 +1235,12 @@ class RegularChainBodySyncer(BaseBodyChainSyncer):
         new_canonical_blocks = import_result.new_canonical_blocks
         old_canonical_blocks = import_result.old_canonical_blocks
 
+        if new_canonical_blocks and self._peer_pool.has_event_bus:
+            await self._peer_pool.get_event_bus().broadcast(
+                NewCanonicalBlocks(new_canonical_blocks, old_canonical_blocks),
+                FIRE_AND_FORGET_BROADCASTING,
+            )
+
         # How much is the imported block's header behind the current time?
         lag = time.time() - block.header.timestamp
         humanized_lag = humanize_seconds(lag)
@@ -6,6 +6,7 @@ from eth.constants import BLANK_ROOT_HASH
 from trinity.chains.base import AsyncChainAPI
 from trinity.db.eth1.chain import BaseAsyncChainDB
 from trinity.protocol.eth.peer import ETHPeerPool
+from trinity.sync.common.seals import SealVerificationPool
 from trinity._utils.logging import get_logger
 
 from .chain import RegularChainSyncer
@@ -17,12 +18,14 @@ class FullChainSyncer(Service):
                  chain: AsyncChainAPI,
                  chaindb: BaseAsyncChainDB,
                  base_db: AtomicDatabaseAPI,
-                 peer_pool: ETHPeerPool) -> None:
+                 peer_pool: ETHPeerPool,
+                 seal_verification_pool: SealVerificationPool = None) -> None:
         self.logger = get_logger('trinity.sync.full.FullChainSyncer')
         self.chain = chain
         self.chaindb = chaindb
         self.base_db = base_db
         self.peer_pool = peer_pool
+        self.seal_verification_pool = seal_verification_pool
 
     async def run(self) -> None:
         head = await self.chaindb.coro_get_canonical_head()
@@ -35,6 +38,11 @@ class FullChainSyncer(Service):
 
         # Now, loop forever, fetching missing blocks and applying them.
         self.logger.info("Starting regular sync; current head: %s", head)
-        regular_syncer = RegularChainSyncer(self.chain, self.chaindb, self.peer_pool)
+        regular_syncer = RegularChainSyncer(
+            self.chain,
+            self.chaindb,
+            self.peer_pool,
+            self.seal_verification_pool,
+        )
         async with background_asyncio_service(regular_syncer) as manager:
             await manager.wait_finished()
@@ -18,6 +18,7 @@ from trinity.sync.common.constants import (
     MAX_SKELETON_REORG_DEPTH,
 )
 from trinity.sync.common.headers import persist_headers
+from trinity.sync.common.seals import SealVerificationPool
 from trinity.sync.common.strategies import (
     FromCheckpointLaunchStrategy,
     FromGenesisLaunchStrategy,
@@ -32,13 +33,15 @@ class HeaderChainSyncer(Service):
                  db: BaseAsyncChainDB,
                  peer_pool: ETHPeerPool,
                  enable_backfill: bool = True,
-                 checkpoint: Checkpoint = None) -> None:
+                 checkpoint: Checkpoint = None,
+                 seal_verification_pool: SealVerificationPool = None) -> None:
         self.logger = get_logger('trinity.sync.header.chain.HeaderChainSyncer')
         self._db = db
         self._checkpoint = checkpoint
         self._enable_backfill = enable_backfill
         self._chain = chain
         self._peer_pool = peer_pool
+        self._seal_verification_pool = seal_verification_pool
 
         if checkpoint is None:
             self._launch_strategy: SyncLaunchStrategyAPI = FromGenesisLaunchStrategy(db)
@@ -50,7 +53,13 @@ class HeaderChainSyncer(Service):
                 peer_pool,
             )
 
-        self._header_syncer = ETHHeaderChainSyncer(chain, db, peer_pool, self._launch_strategy)
+        self._header_syncer = ETHHeaderChainSyncer(
+            chain,
+            db,
+            peer_pool,
+            self._launch_strategy,
+            seal_verification_pool,
+        )
 
     async def run(self) -> None:
         head = await self._db.coro_get_canonical_head()
@@ -77,7 +86,12 @@ class HeaderChainSyncer(Service):
         # Because checkpoints are only set at startup (for now): once all gaps are filled, no new
         # ones will be created. So we can simply run this service till completion and then exit.
         if self._enable_backfill:
-            backfiller = SequentialHeaderChainGapSyncer(self._chain, self._db, self._peer_pool)
+            backfiller = SequentialHeaderChainGapSyncer(
+                self._chain,
+                self._db,
+                self._peer_pool,
+                self._seal_verification_pool,
+            )
             self.manager.run_child_service(backfiller)
 
         self.manager.run_daemon_child_service(self._header_syncer)
@@ -105,13 +119,15 @@ class HeaderChainGapSyncer(Service):
                  chain: AsyncChainAPI,
                  db: BaseAsyncChainDB,
                  peer_pool: ETHPeerPool,
-                 max_headers: int = None) -> None:
+                 max_headers: int = None,
+                 seal_verification_pool: SealVerificationPool = None) -> None:
 
         self.logger = get_logger('trinity.sync.header.chain.HeaderChainGapSyncer')
         self._chain = chain
         self._db = db
         self._peer_pool = peer_pool
         self._max_headers = max_headers
+        self._seal_verification_pool = seal_verification_pool
 
     async def run(self) -> None:
 
@@ -133,7 +149,12 @@ class HeaderChainGapSyncer(Service):
             final_block_number = gap[1]
 
         self._header_syncer = ETHHeaderChainSyncer(
-            self._chain, self._db, self._peer_pool, launch_strategy)
+            self._chain,
+            self._db,
+            self._peer_pool,
+            launch_strategy,
+            self._seal_verification_pool,
+        )
 
         await launch_strategy.fulfill_prerequisites()
         self.logger.info(
@@ -174,12 +195,14 @@ class SequentialHeaderChainGapSyncer(Service):
     def __init__(self,
                  chain: AsyncChainAPI,
                  db: BaseAsyncChainDB,
-                 peer_pool: ETHPeerPool) -> None:
+                 peer_pool: ETHPeerPool,
+                 seal_verification_pool: SealVerificationPool = None) -> None:
 
         self.logger = get_logger('trinity.sync.header.chain.SequentialHeaderChainGapSyncer')
         self._chain = chain
         self._db = db
         self._peer_pool = peer_pool
+        self._seal_verification_pool = seal_verification_pool
         self._pauser = Pauser()
         self._max_backfill_header_at_once = MAX_BACKFILL_HEADERS_AT_ONCE
 
@@ -218,6 +241,7 @@ class SequentialHeaderChainGapSyncer(Service):
                     self._db,
                     self._peer_pool,
                     max_headers=self._max_backfill_header_at_once,
+                    seal_verification_pool=self._seal_verification_pool,
                 )
             async with background_asyncio_service(syncer) as manager:
                 await manager.wait_finished()
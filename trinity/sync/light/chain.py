@@ -6,13 +6,23 @@ from trinity.protocol.les.peer import LESPeerPool
 from trinity.protocol.les.sync import LightHeaderChainSyncer
 from trinity._utils.logging import get_logger
 from trinity.sync.common.headers import persist_headers
+from trinity.sync.common.seals import SealVerificationPool
 
 
 class LightChainSyncer(Service):
-    def __init__(self, chain: AsyncChainAPI, db: BaseAsyncHeaderDB, peer_pool: LESPeerPool) -> None:
+    def __init__(self,
+                 chain: AsyncChainAPI,
+                 db: BaseAsyncHeaderDB,
+                 peer_pool: LESPeerPool,
+                 seal_verification_pool: SealVerificationPool = None) -> None:
         self.logger = get_logger('trinity.sync.light.chain.LightChainSyncer')
         self._db = db
-        self._header_syncer = LightHeaderChainSyncer(chain, db, peer_pool)
+        self._header_syncer = LightHeaderChainSyncer(
+            chain,
+            db,
+            peer_pool,
+            seal_verification_pool=seal_verification_pool,
+        )
 
     async def run(self) -> None:
         head = await self._db.coro_get_canonical_head()
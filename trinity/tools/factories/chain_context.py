@@ -24,3 +24,4 @@ class ChainContextFactory(factory.Factory):
     vm_configuration = ((0, MAINNET_VM_CONFIGURATION[-1][1]),)
     listen_port = 30303
     p2p_version = 5
+    normalization_pool = None